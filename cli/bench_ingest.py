@@ -0,0 +1,50 @@
+"""Benchmark bulk ingest with serial vs process-pool parsing on a replicated corpus."""
+
+from __future__ import annotations
+import argparse
+import json
+from services import ingest_benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Ingest a replicated recorded corpus with 0..N parse worker processes"
+    )
+    p.add_argument("--corpus", type=str, help="Recorded data directory (default: data dir)")
+    p.add_argument("--replicas", type=int, default=10, help="Copies of each division folder")
+    p.add_argument(
+        "--workers",
+        type=int,
+        action="append",
+        help="Parse worker count to include (repeatable; default: 0 2 4, 0 or 1 = serial)",
+    )
+    p.add_argument(
+        "--target",
+        action="append",
+        dest="targets",
+        choices=ingest_benchmark.TARGETS,
+        help="Ingest implementation to time (repeatable; default: both)",
+    )
+    p.add_argument("--json", action="store_true", help="Output the full result as JSON")
+    return p.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    result = ingest_benchmark.run_ingest_benchmark(
+        args.corpus,
+        replicas=args.replicas,
+        workers=args.workers or ingest_benchmark.DEFAULT_WORKERS,
+        targets=args.targets or ingest_benchmark.TARGETS,
+    )
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for line in ingest_benchmark.format_report(result):
+            print(line)
+    # Non-zero exit when a parallel run stored different rows than the serial run
+    return 0 if all(r["identical"] for r in result["rows"]) else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+"""Benchmark the HTML parser backends per parser and check their output parity."""
+
+from __future__ import annotations
+import argparse
+import json
+from services import parser_benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Time every parser over a recorded corpus with each HTML parser backend"
+    )
+    p.add_argument("--corpus", type=str, help="Recorded data directory (default: data dir)")
+    p.add_argument(
+        "--backend",
+        action="append",
+        dest="backends",
+        help="Backend to include (repeatable; default: all installed)",
+    )
+    p.add_argument("--repeat", type=int, default=3, help="Timed passes per backend (best is kept)")
+    p.add_argument("--json", action="store_true", help="Output the full result as JSON")
+    return p.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    result = parser_benchmark.run_benchmark(args.corpus, backends=args.backends, repeat=args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for line in parser_benchmark.format_report(result):
+            print(line)
+    # Non-zero exit when a backend disagrees with html.parser on any page
+    return 1 if any(r["mismatches"] for r in result["rows"]) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
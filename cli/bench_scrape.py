@@ -0,0 +1,77 @@
+"""Benchmark the full scrape pipeline offline against a replayed corpus."""
+
+from __future__ import annotations
+import argparse
+import json
+from services import scrape_benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Run pipeline.run_full against a local replay of a recorded scrape corpus"
+    )
+    p.add_argument("--corpus", type=str, help="Recorded data directory (default: data dir)")
+    p.add_argument("--club-id", type=int, default=2294, help="Club ID to start from")
+    p.add_argument("--season", type=int, default=2025, help="Season year")
+    p.add_argument(
+        "--async", dest="async_mode", action="store_true", help="Fetch each phase concurrently"
+    )
+    p.add_argument("--max-per-host", type=int, default=None, help="Concurrency limit in --async")
+    p.add_argument(
+        "--parse-workers", type=int, default=None, help="Parser processes (0 parses on a thread)"
+    )
+    p.add_argument("--latency", type=float, default=0.0, help="Simulated latency (seconds)")
+    p.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- latency jitter (seconds)")
+    p.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error"
+    )
+    p.add_argument("--error-status", type=int, default=503, help="HTTP status of injected errors")
+    p.add_argument("--seed", type=int, default=0, help="Seed for jitter and error injection")
+    p.add_argument(
+        "--rps",
+        type=float,
+        default=None,
+        help="Request rate ceiling (defaults to the live-site setting, which bounds throughput)",
+    )
+    p.add_argument("--burst", type=int, default=None, help="Request burst size of the rate limiter")
+    p.add_argument("--repeat", type=int, default=1, help="Number of timed runs")
+    p.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="Share the HTTP cache across runs (default: every run starts cold)",
+    )
+    p.add_argument("--keep-output", action="store_true", help="Keep the scratch output directories")
+    p.add_argument("--json", action="store_true", help="Output the full result as JSON")
+    return p.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    result = scrape_benchmark.run_benchmark(
+        args.corpus,
+        club_id=args.club_id,
+        season=args.season,
+        async_mode=args.async_mode,
+        max_per_host=args.max_per_host,
+        parse_workers=args.parse_workers,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+        rps=args.rps,
+        burst=args.burst,
+        repeat=args.repeat,
+        warm_cache=args.warm_cache,
+        keep_output=args.keep_output,
+    )
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for line in scrape_benchmark.format_report(result):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
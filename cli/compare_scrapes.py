@@ -1,14 +1,18 @@
-"""CLI to compare two scrape directories."""
+"""CLI to compare two scrape directories (or two scrapes of a snapshot archive)."""
 
 from __future__ import annotations
 import argparse, json, sys, os
-from services.compare_scrapes import compare_dirs, unified_diff
+from services.compare_scrapes import compare_dirs, compare_snapshots, snapshot_diff, unified_diff
+from services.snapshot_archive import SnapshotArchive
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Compare two roster scrape output directories")
-    p.add_argument("old", help="Old/original data directory")
-    p.add_argument("new", help="New modular scrape data directory")
+    p.add_argument("old", help="Old/original data directory (scrape id with --archive)")
+    p.add_argument("new", help="New modular scrape data directory (scrape id with --archive)")
+    p.add_argument(
+        "--archive", metavar="DIR", help="Compare two scrapes of this snapshot archive directory"
+    )
     p.add_argument(
         "--diff", metavar="RELFILE", help="Show unified diff for a specific relative file"
     )
@@ -17,6 +21,16 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
+    if args.archive:
+        archive = SnapshotArchive(args.archive)
+        try:
+            print(json.dumps(compare_snapshots(archive, args.old, args.new), indent=2))
+            if args.diff:
+                print("\n=== Unified Diff ===")
+                print(snapshot_diff(archive, args.diff, args.old, args.new))
+        finally:
+            archive.close()
+        return 0
     res = compare_dirs(args.old, args.new)
     print(json.dumps(res, indent=2))
     if args.diff:
@@ -3,7 +3,8 @@
 from __future__ import annotations
 import argparse
 import json
-from services import pipeline
+from services import batch_scrape, pipeline
+from core import rate_limit
 import os
 
 
@@ -14,6 +15,42 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--json", action="store_true", help="Output JSON summary")
     p.add_argument("--full", action="store_true", help="Run full scrape workflow")
     p.add_argument("--output-dir", type=str, help="Override output data directory")
+    p.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Fetch each phase concurrently (full scrape only)",
+    )
+    p.add_argument(
+        "--max-per-host",
+        type=int,
+        default=None,
+        help="Concurrent request limit per host in --async mode",
+    )
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Refresh only divisions with matches since the last scrape",
+    )
+    p.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --incremental: list what would be fetched and why, fetch nothing",
+    )
+    p.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="CLUB[:SEASON]",
+        help="Full scrape of several clubs / seasons sharing fetches and the rate limit",
+    )
+    p.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="With --batch: targets scraped at the same time",
+    )
+    p.add_argument("--rps", type=float, default=None, help="Request rate ceiling (requests/second)")
+    p.add_argument("--burst", type=int, default=None, help="Request burst size of the rate limiter")
     return p.parse_args()
 
 
@@ -22,14 +59,44 @@ def main() -> int:
     data_dir = args.output_dir
     if data_dir:
         os.makedirs(data_dir, exist_ok=True)
-    if args.full:
-        result = pipeline.run_full(club_id=args.club_id, season=args.season, data_dir=data_dir)
+    if args.rps is not None or args.burst is not None:
+        rate_limit.configure_default_governor(rps=args.rps, burst=args.burst)
+    if args.batch:
+        targets = [batch_scrape.parse_target(spec, args.season) for spec in args.batch]
+        result = batch_scrape.run_batch(
+            targets,
+            data_dir,
+            max_concurrent=args.max_concurrent,
+            async_mode=args.async_mode,
+            max_per_host=args.max_per_host,
+        )
+    elif args.incremental:
+        result = pipeline.run_incremental(
+            club_id=args.club_id, season=args.season, data_dir=data_dir, dry_run=args.dry_run
+        )
+        if args.dry_run and not args.json:
+            print("Incremental scrape plan (dry run):")
+            for line in result["plan_lines"]:
+                print(f"  {line}")
+            return 0
+    elif args.full:
+        result = pipeline.run_full(
+            club_id=args.club_id,
+            season=args.season,
+            data_dir=data_dir,
+            async_mode=args.async_mode,
+            max_per_host=args.max_per_host,
+        )
     else:
         result = pipeline.run_basic(club_id=args.club_id, season=args.season, data_dir=data_dir)
     if args.json:
         print(json.dumps(result, indent=2))
     else:
-        mode = "FULL" if args.full else "BASIC"
+        mode = (
+            "BATCH"
+            if args.batch
+            else "INCREMENTAL" if args.incremental else "FULL" if args.full else "BASIC"
+        )
         print(f"Scrape summary ({mode}):")
         for k, v in result.items():
             print(f"  {k}: {v}")
@@ -13,6 +13,66 @@ DEFAULT_USER_AGENT: Final = (
 DEFAULT_TIMEOUT: Final = 15  # seconds
 DEFAULT_RETRIES: Final = 3
 DEFAULT_BACKOFF_FACTOR: Final = 0.6
+# Keep-alive pool used by core.http_client (idle sockets kept per host / max idle seconds)
+HTTP_POOL_SIZE: Final = 4
+HTTP_POOL_IDLE_TIMEOUT: Final = 30.0
+# Store fetched pages with ETag / Last-Modified and revalidate them via conditional requests
+HTTP_CONDITIONAL_CACHE: Final = os.environ.get("ROSTERPLANNER_HTTP_CACHE", "1") != "0"
+# Byte budget of the compressed HTTP cache (least recently used entries evicted beyond it)
+HTTP_CACHE_MAX_BYTES: Final = 256 * 1024 * 1024
+# Upper bound of simultaneous requests per host when the pipeline runs in async mode
+DEFAULT_MAX_CONCURRENCY_PER_HOST: Final = 6
+# URLs the async fetcher schedules ahead of its consumer (bounds responses held in memory)
+ASYNC_FETCH_WINDOW: Final = 32
+# Shared request rate governor (core.rate_limit): ceiling in requests/second, burst size and
+# the floor the adaptive backoff may reduce the rate to
+RATE_LIMIT_RPS: Final = float(os.environ.get("ROSTERPLANNER_RATE_LIMIT_RPS", "8"))
+RATE_LIMIT_BURST: Final = 16
+RATE_LIMIT_MIN_RPS: Final = 0.5
+# Completed fetch results kept by core.fetch_memo for repeat requests (least recently used
+# beyond this are dropped; in-flight fetches are always shared)
+FETCH_MEMO_MAX_COMPLETED: Final = 256
+# Streaming run_full stages (services.stage_pipeline): parser processes (one core is left to
+# fetching / writing; 0 parses on a thread), bounded queue length and the page count below
+# which a phase parses on a thread (process start-up not worth it)
+PIPELINE_PARSE_WORKERS: Final = int(
+    os.environ.get("ROSTERPLANNER_PARSE_WORKERS", str(min(4, (os.cpu_count() or 1) - 1)))
+)
+PIPELINE_QUEUE_SIZE: Final = 16
+PIPELINE_PROCESS_MIN_PAGES: Final = 32
+# Player history crawl (run_full Step 7b.1): simultaneous requests and the age after which a
+# stored history page is fetched again even when the player's LivePZ is unchanged
+PLAYER_HISTORY_WORKERS: Final = 4
+PLAYER_HISTORY_MAX_AGE_DAYS: Final = 14
+# Page writes of run_full (core.filesystem.BatchedWriter): on a background thread, with a
+# bounded queue; fsync each file before its rename (directories are fsynced per phase anyway)
+FS_BACKGROUND_WRITER: Final = True
+FS_WRITE_QUEUE_SIZE: Final = 64
+FS_FSYNC_FILES: Final = False
+# Keep every run's pages in the delta-compressed archive (services.snapshot_archive) under
+# <data dir>/_archive; archived scrapes older than the max age are pruned (0 keeps all)
+SNAPSHOT_ARCHIVE: Final = os.environ.get("ROSTERPLANNER_SNAPSHOT_ARCHIVE", "0") == "1"
+SNAPSHOT_ARCHIVE_MAX_AGE_DAYS: Final = 0
+# Targets (club, season) scraped at the same time by services.batch_scrape; all of them share
+# the fetch memo, HTTP pool and rate limit
+BATCH_SCRAPE_CONCURRENCY: Final = 2
+# Tree builder of the HTML parsers (parsing.html_backend): "html.parser" (pure Python) or
+# "lxml" (much faster; falls back to html.parser when lxml is not installed)
+HTML_PARSER_BACKEND: Final = os.environ.get("ROSTERPLANNER_HTML_PARSER", "html.parser")
+# Build only the subtrees the roster / ranking parsers read (full tree when that finds nothing)
+HTML_RESTRICTED_PARSE: Final = os.environ.get("ROSTERPLANNER_RESTRICTED_PARSE", "1") != "0"
+# Ingest (db.ingest.ingest_path, IngestionCoordinator) extracts roster players / matches with
+# the tree-less parsing.roster_stream extractor instead of building a DOM per page
+INGEST_STREAMING_PARSER: Final = os.environ.get("ROSTERPLANNER_STREAMING_PARSER", "0") == "1"
+# Ingest reuses stored extraction results of unchanged pages (db.parse_cache, keyed by content
+# hash + parser version) instead of parsing them again
+INGEST_PARSE_CACHE: Final = os.environ.get("ROSTERPLANNER_PARSE_CACHE", "1") != "0"
+# Worker processes parsing pages ahead of the single SQLite writer during ingest
+# (db.parallel_parse); 0 or 1 parses in the writer thread
+INGEST_PARSE_WORKERS: Final = int(os.environ.get("ROSTERPLANNER_INGEST_PARSE_WORKERS", "0"))
+# GUI option: ingest each division as soon as the scrape reports it complete
+# (division_complete) instead of in one ingestion pass after the whole scrape
+SCRAPE_STREAM_INGEST: Final = os.environ.get("ROSTERPLANNER_STREAM_INGEST", "0") == "1"
 DATA_DIR: Final = os.environ.get("ROSTERPLANNER_DATA_DIR", "data")
 
 # Seasons can be parameterized later; keep here for centralization
@@ -1,4 +1,15 @@
-"""Async HTTP utilities using httpx with optional caching."""
+"""Async HTTP utilities using httpx with optional caching.
+
+With caching enabled a fresh entry (younger than ``cache_ttl``) is served
+directly; a stale entry is revalidated with If-None-Match / If-Modified-Since
+and its body reused when the server answers ``304 Not Modified``.
+
+httpx negotiates gzip / deflate transfer itself; `fetch_page` exposes the
+decompressed bytes, detected charset and the compressed size on the wire.
+
+Each attempt is paced by a `core.rate_limit.RateGovernor` (the shared default
+unless one is passed) and reports 429 / 5xx / timeouts back to it.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +18,8 @@ import httpx
 from typing import Optional
 from config import settings
 from . import cache
+from .http_client import FetchedPage, detect_charset, routed_url
+from .rate_limit import RateGovernor, default_governor, is_throttle_status, parse_retry_after
 
 
 class AsyncHttpError(RuntimeError):
@@ -21,13 +34,51 @@ async def fetch(
     backoff: float = 0.5,
     use_cache: bool = True,
     cache_ttl: int = 3600,
+    governor: RateGovernor | None = None,
 ) -> str:
+    page = await fetch_page(
+        url,
+        client=client,
+        retries=retries,
+        backoff=backoff,
+        use_cache=use_cache,
+        cache_ttl=cache_ttl,
+        governor=governor,
+    )
+    return page.text()
+
+
+def _cached_page(url: str, body: str, status: int = 200) -> FetchedPage:
+    return FetchedPage(
+        url=url,
+        body=body.encode("utf-8"),
+        charset="utf-8",
+        status=status,
+        from_cache=True,
+        _text=body,
+    )
+
+
+async def fetch_page(
+    url: str,
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+    retries: int | None = None,
+    backoff: float = 0.5,
+    use_cache: bool = True,
+    cache_ttl: int = 3600,
+    governor: RateGovernor | None = None,
+) -> FetchedPage:
     retries = retries if retries is not None else settings.DEFAULT_RETRIES
+    governor = governor if governor is not None else default_governor()
     # Cache lookup
+    entry = None
     if use_cache:
-        cached = cache.get(url, ttl=cache_ttl)
+        cached = cache.get(url, ttl=cache_ttl) if cache_ttl > 0 else None
         if cached is not None:
-            return cached
+            return _cached_page(url, cached)
+        entry = cache.get_entry(url)
+    request_headers = entry.conditional_headers() if entry is not None else {}
     close_client = False
     if client is None:
         headers = {"User-Agent": settings.DEFAULT_USER_AGENT}
@@ -37,13 +88,46 @@ async def fetch(
         attempt = 0
         while True:
             attempt += 1
+            await governor.acquire_async()
             try:
-                resp = await client.get(url)
+                try:
+                    resp = await client.get(routed_url(url), headers=request_headers or None)
+                except httpx.TimeoutException:
+                    governor.on_throttle()
+                    raise
+                if is_throttle_status(resp.status_code):
+                    governor.on_throttle(parse_retry_after(resp.headers.get("retry-after")))
+                elif resp.status_code < 400:
+                    governor.on_success()
+                if resp.status_code == 304 and entry is not None:
+                    cache.touch(url)
+                    return _cached_page(url, entry.body, status=304)
                 resp.raise_for_status()
-                text = resp.text
-                if use_cache:
-                    cache.set(url, text)
-                return text
+                lowered = {k.lower(): v for k, v in resp.headers.items()}
+                page = FetchedPage(
+                    url=url,
+                    body=resp.content,
+                    charset=detect_charset(lowered, resp.content),
+                    status=resp.status_code,
+                    wire_bytes=resp.num_bytes_downloaded,
+                )
+                etag = resp.headers.get("etag")
+                last_modified = resp.headers.get("last-modified")
+                # Without validators an entry is only useful while fresh (cache_ttl > 0)
+                if use_cache and (etag or last_modified or cache_ttl > 0):
+                    # Best effort, like cache.touch: a failed write (full disk, locked
+                    # index) must not discard or re-fetch a page that already arrived
+                    try:
+                        cache.set(
+                            url,
+                            page.text(),
+                            etag=etag,
+                            last_modified=last_modified,
+                            status=resp.status_code,
+                        )
+                    except Exception:  # noqa: BLE001
+                        pass
+                return page
             except (httpx.TimeoutException, httpx.HTTPError) as e:
                 if attempt > retries:
                     raise AsyncHttpError(f"Failed after {retries} attempts: {e}") from e
@@ -1,41 +1,382 @@
-"""Simple filesystem cache for HTTP GET responses."""
+"""Size-bounded, compressed, content-addressed cache for HTTP GET responses.
+
+Layout under ``CACHE_DIR``:
+ - ``blobs/<sha256>.z``: zlib-compressed response bodies, addressed by the hash
+   of the uncompressed body so identical pages (e.g. the same ranking table
+   reached through different URLs) are stored once.
+ - ``index.sqlite``: one row per URL (blob reference, HTTP validators, status,
+   fetch / access times) plus one row per blob (stored and raw size).
+
+Entries are evicted least-recently-used first whenever the total stored blob
+size exceeds ``max_bytes`` (``settings.HTTP_CACHE_MAX_BYTES``). The module-level
+`get` / `set` / `get_entry` / `touch` API is unchanged; ``stats()`` reports hits,
+misses, bytes saved (compression + dedupe) and evictions.
+
+Entries written by the earlier one-file-per-URL layout (``<key>.cache`` +
+``<key>.meta.json``) are imported on first access.
+"""
 
 from __future__ import annotations
 
 import hashlib
+import json
 import os
+import sqlite3
+import threading
 import time
-from typing import Optional
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, Optional
 
 from config import settings
 
 CACHE_DIR = os.path.join(settings.DATA_DIR, "_cache")
 DEFAULT_TTL = 3600  # 1 hour
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs(
+    digest TEXT PRIMARY KEY,
+    stored_size INTEGER NOT NULL,
+    raw_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries(
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs(digest),
+    etag TEXT,
+    last_modified TEXT,
+    status INTEGER NOT NULL DEFAULT 200,
+    fetched_at TEXT,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest);
+"""
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    status: int = 200
+    fetched_at: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
 
 def _key(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
-def _path(url: str) -> str:
-    return os.path.join(CACHE_DIR, _key(url) + ".cache")
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds")
+
+
+class CacheStore:
+    """Content-addressed blob store with an LRU-evicted SQLite index."""
+
+    def __init__(self, root: str, max_bytes: int | None = None) -> None:
+        self.root = root
+        self.max_bytes = max_bytes if max_bytes is not None else settings.HTTP_CACHE_MAX_BYTES
+        self._blob_dir = os.path.join(root, "blobs")
+        os.makedirs(self._blob_dir, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            os.path.join(root, "index.sqlite"), check_same_thread=False, isolation_level=None
+        )
+        self._conn.executescript(_SCHEMA)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "evictions": 0,
+            "bytes_saved_compression": 0,
+            "bytes_saved_dedupe": 0,
+        }
+
+    # Blob helpers -----------------------------------------------------
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blob_dir, f"{digest}.z")
+
+    def _read_blob(self, digest: str) -> Optional[str]:
+        try:
+            with open(self._blob_path(digest), "rb") as fh:
+                return zlib.decompress(fh.read()).decode("utf-8")
+        except Exception:
+            return None
+
+    def _drop_blob_if_orphan(self, digest: str) -> int:
+        row = self._conn.execute("SELECT 1 FROM entries WHERE digest=? LIMIT 1", (digest,))
+        if row.fetchone() is not None:
+            return 0
+        size_row = self._conn.execute(
+            "SELECT stored_size FROM blobs WHERE digest=?", (digest,)
+        ).fetchone()
+        self._conn.execute("DELETE FROM blobs WHERE digest=?", (digest,))
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
+        return int(size_row[0]) if size_row else 0
+
+    def _delete_entry(self, key: str) -> None:
+        row = self._conn.execute("SELECT digest FROM entries WHERE key=?", (key,)).fetchone()
+        self._conn.execute("DELETE FROM entries WHERE key=?", (key,))
+        if row:
+            self._drop_blob_if_orphan(row[0])
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # The connection autocommits (isolation_level=None): group a write's statements
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    # Public API -------------------------------------------------------
+    def put(
+        self,
+        url: str,
+        content: str,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        status: int = 200,
+        fetched_at: Optional[str] = None,
+    ) -> None:
+        raw = content.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        key = _key(url)
+        now = time.time()
+        with self._lock, self._transaction():
+            known = self._conn.execute(
+                "SELECT stored_size FROM blobs WHERE digest=?", (digest,)
+            ).fetchone()
+            if known is not None and os.path.exists(self._blob_path(digest)):
+                self._stats["bytes_saved_dedupe"] += len(raw)
+            else:
+                packed = zlib.compress(raw, 6)
+                tmp = self._blob_path(digest) + ".tmp"
+                with open(tmp, "wb") as fh:
+                    fh.write(packed)
+                os.replace(tmp, self._blob_path(digest))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO blobs(digest, stored_size, raw_size) VALUES (?,?,?)",
+                    (digest, len(packed), len(raw)),
+                )
+                self._stats["bytes_saved_compression"] += len(raw) - len(packed)
+            previous = self._conn.execute(
+                "SELECT digest FROM entries WHERE key=?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries(key, url, digest, etag, last_modified, status,"
+                " fetched_at, stored_at, last_access) VALUES (?,?,?,?,?,?,?,?,?)",
+                (
+                    key,
+                    url,
+                    digest,
+                    etag,
+                    last_modified,
+                    status,
+                    fetched_at or _now_iso(),
+                    now,
+                    now,
+                ),
+            )
+            if previous and previous[0] != digest:
+                self._drop_blob_if_orphan(previous[0])
+            self._evict(keep_key=key)
+
+    def _evict(self, keep_key: str) -> None:
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, digest FROM entries WHERE key != ? ORDER BY last_access ASC", (keep_key,)
+        ).fetchall()
+        for key, digest in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key=?", (key,))
+            total -= self._drop_blob_if_orphan(digest)
+            self._stats["evictions"] += 1
+
+    def lookup(self, url: str, ttl: float | None = None) -> Optional[CacheEntry]:
+        """Return the entry for ``url`` (None if absent or older than ``ttl`` seconds)."""
+        key = _key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, etag, last_modified, status, fetched_at, stored_at"
+                " FROM entries WHERE key=?",
+                (key,),
+            ).fetchone()
+            if row is None or (ttl is not None and time.time() - row[5] > ttl):
+                self._stats["misses"] += 1
+                return None
+            body = self._read_blob(row[0])
+            if body is None:  # blob vanished from disk: drop the dangling entry
+                self._delete_entry(key)
+                self._stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE entries SET last_access=? WHERE key=?", (time.time(), key))
+            self._stats["hits"] += 1
+        return CacheEntry(
+            url=url,
+            body=body,
+            etag=row[1],
+            last_modified=row[2],
+            status=int(row[3]),
+            fetched_at=row[4],
+        )
+
+    def touch(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE entries SET stored_at=?, last_access=?, fetched_at=? WHERE key=?",
+                (now, now, _now_iso(), _key(url)),
+            )
+            if cur.rowcount:
+                self._stats["revalidated"] += 1
+
+    def contains(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM entries WHERE key=?", (_key(url),))
+            return row.fetchone() is not None
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs")
+            return int(row.fetchone()[0])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+            out["bytes_saved"] = out["bytes_saved_compression"] + out["bytes_saved_dedupe"]
+            out["entries"] = int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+            out["blobs"] = int(self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0])
+            out["total_bytes"] = self.total_bytes()
+            out["max_bytes"] = self.max_bytes
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            for (digest,) in self._conn.execute("SELECT digest FROM blobs").fetchall():
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM blobs")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, CacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def store() -> CacheStore:
+    """Return the store for the current ``CACHE_DIR`` (created lazily)."""
+    root = os.path.abspath(CACHE_DIR)
+    with _stores_lock:
+        st = _stores.get(root)
+        if st is None:
+            os.makedirs(root, exist_ok=True)
+            st = CacheStore(root)
+            _stores[root] = st
+        return st
+
+
+def _import_legacy(url: str) -> bool:
+    """Move a pre-content-addressed ``<key>.cache`` entry into the store."""
+    body_path = os.path.join(CACHE_DIR, _key(url) + ".cache")
+    if not os.path.exists(body_path):
+        return False
+    meta_path = os.path.join(CACHE_DIR, _key(url) + ".meta.json")
+    try:
+        with open(body_path, "r", encoding="utf-8") as fh:
+            body = fh.read()
+        meta: dict = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as fh:
+                meta = json.load(fh)
+        store().put(
+            url,
+            body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            status=int(meta.get("status", 200)),
+            fetched_at=meta.get("fetched_at"),
+        )
+        for p in (body_path, meta_path):
+            if os.path.exists(p):
+                os.remove(p)
+        return True
+    except Exception:
+        return False
 
 
 def get(url: str, ttl: int = DEFAULT_TTL) -> Optional[str]:
-    p = _path(url)
-    if not os.path.exists(p):
+    try:
+        st = store()
+        if not st.contains(url):
+            _import_legacy(url)
+        entry = st.lookup(url, ttl=ttl)
+        return entry.body if entry is not None else None
+    except Exception:
         return None
+
+
+def get_entry(url: str) -> Optional[CacheEntry]:
+    """Return the cached body with its metadata regardless of age (None if absent)."""
     try:
-        stat = os.stat(p)
-        if time.time() - stat.st_mtime > ttl:
-            return None
-        with open(p, "r", encoding="utf-8") as fh:
-            return fh.read()
+        st = store()
+        if not st.contains(url):
+            _import_legacy(url)
+        return st.lookup(url)
     except Exception:
         return None
 
 
-def set(url: str, content: str) -> None:
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    with open(_path(url), "w", encoding="utf-8") as fh:
-        fh.write(content)
+def set(
+    url: str,
+    content: str,
+    *,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    status: int = 200,
+) -> None:
+    store().put(url, content, etag=etag, last_modified=last_modified, status=status)
+
+
+def touch(url: str) -> None:
+    """Mark an entry as freshly revalidated (server answered 304 Not Modified)."""
+    try:
+        store().touch(url)
+    except Exception:
+        pass
+
+
+def stats() -> Dict[str, int]:
+    return store().stats()
+
+
+def clear() -> None:
+    store().clear()
@@ -0,0 +1,292 @@
+"""Concurrent fetch engine built on `core.async_http`.
+
+The scraping pipeline is synchronous; this module lets it fan out many GETs
+without becoming async itself. A private event loop runs on a daemon thread and
+owns one shared `httpx.AsyncClient`. Callers submit URLs from any thread and get
+`concurrent.futures.Future` objects (or iterate outcomes in input order).
+
+Concurrency is bounded per host via one `asyncio.Semaphore` per netloc, so a
+large fan-out never opens more than `max_per_host` simultaneous requests to the
+same server. Optional cancel / pause tokens (same duck-typed protocol as
+`services.pipeline.run_full`: `is_cancelled()` / `is_paused()`) are honoured
+before each request starts.
+
+Request pacing is delegated to a `core.rate_limit.RateGovernor` (by default the
+process-wide one, shared with the synchronous `core.http_client` session).
+
+With a `core.fetch_memo.FetchMemo` attached, a URL already requested through
+this fetcher (finished or still in flight) is not requested again; its outcome
+is flagged ``shared`` and carries no latency / byte counts of its own. As the
+memo may be shared with other runs, their requests are released rather than
+cancelled, and `close` lets the requests still in flight finish.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import concurrent.futures
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config import settings
+from . import async_http
+from .fetch_memo import FetchMemo
+from .http_client import FetchedPage
+from .rate_limit import RateGovernor, default_governor
+
+__all__ = ["ConcurrentFetcher", "FetchOutcome", "FetchCancelled"]
+
+
+class FetchCancelled(RuntimeError):
+    """Raised for requests that were skipped because cancellation was requested."""
+
+
+@dataclass
+class FetchOutcome:
+    url: str
+    html: Optional[str]
+    error: Optional[BaseException]
+    elapsed: float
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    shared: bool = False  # served by another request for the same URL (FetchMemo)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ConcurrentFetcher:
+    """Run `async_http.fetch` calls concurrently behind a synchronous facade."""
+
+    def __init__(
+        self,
+        *,
+        max_per_host: int | None = None,
+        timeout: float | None = None,
+        use_cache: bool | None = None,
+        cancel_token: Any | None = None,
+        pause_token: Any | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        governor: RateGovernor | None = None,
+        memo: FetchMemo | None = None,
+    ) -> None:
+        self.memo = memo
+        self.governor = governor if governor is not None else default_governor()
+        self.max_per_host = max(1, max_per_host or settings.DEFAULT_MAX_CONCURRENCY_PER_HOST)
+        self._timeout = timeout or settings.DEFAULT_TIMEOUT
+        self._use_cache = settings.HTTP_CONDITIONAL_CACHE if use_cache is None else use_cache
+        self._cancel_token = cancel_token
+        self._pause_token = pause_token
+        self._transport = transport
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.peak_in_flight = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._in_flight = 0
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="concurrent-fetch", daemon=True)
+        self._thread.start()
+        self._client: httpx.AsyncClient = self._run(self._create_client())
+
+    # Loop plumbing ----------------------------------------------------
+    def _run_loop(self) -> None:  # pragma: no cover - thread body
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _create_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self.max_per_host * 4,
+            max_keepalive_connections=self.max_per_host * 4,
+        )
+        return httpx.AsyncClient(
+            headers={"User-Agent": settings.DEFAULT_USER_AGENT},
+            timeout=self._timeout,
+            limits=limits,
+            follow_redirects=True,
+            transport=self._transport,
+        )
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        sem = self._host_limits.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.max_per_host)
+            self._host_limits[host] = sem
+        return sem
+
+    def _is_cancelled(self) -> bool:
+        tok = self._cancel_token
+        return bool(tok and getattr(tok, "is_cancelled", lambda: False)())
+
+    async def _wait_if_paused(self) -> None:
+        tok = self._pause_token
+        if tok is None or not getattr(tok, "is_paused", None):
+            return
+        try:
+            while tok.is_paused():
+                if self._is_cancelled():
+                    return
+                await asyncio.sleep(0.1)
+        except Exception:
+            pass
+
+    async def _fetch(self, url: str) -> tuple[FetchedPage, float]:
+        async with self._host_semaphore(url):
+            await self._wait_if_paused()
+            if self._is_cancelled():
+                raise FetchCancelled(url)
+            with self._stats_lock:
+                self.requests += 1
+                self._in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            start = time.time()
+            try:
+                # cache_ttl=0: never serve unvalidated; stale entries are revalidated (304 reuse)
+                page = await async_http.fetch_page(
+                    url,
+                    client=self._client,
+                    use_cache=self._use_cache,
+                    cache_ttl=0,
+                    governor=self.governor,
+                )
+            except BaseException:
+                with self._stats_lock:
+                    self.failures += 1
+                raise
+            finally:
+                with self._stats_lock:
+                    self._in_flight -= 1
+            with self._stats_lock:
+                self.wire_bytes += page.wire_bytes
+                self.decoded_bytes += len(page.body)
+            return page, time.time() - start
+
+    async def _drain(self) -> None:
+        """Wait for the requests still running (other runs may wait on them via the memo)."""
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Public API -------------------------------------------------------
+    def _schedule(self, url: str) -> tuple[concurrent.futures.Future, bool]:
+        if self._closed:
+            raise RuntimeError("ConcurrentFetcher is closed")
+        start = lambda: asyncio.run_coroutine_threadsafe(self._fetch(url), self._loop)  # noqa: E731
+        if self.memo is None:
+            return start(), False
+        return self.memo.future(url, start)
+
+    def submit(self, url: str) -> "concurrent.futures.Future[tuple[FetchedPage, float]]":
+        """Schedule a fetch; the future resolves to ``(page, elapsed_seconds)``."""
+        return self._schedule(url)[0]
+
+    def fetch(self, url: str) -> str:
+        """Blocking single fetch through the shared client."""
+        return self.fetch_page(url).text()
+
+    def fetch_page(self, url: str) -> FetchedPage:
+        page, _elapsed = self.submit(url).result()
+        return page
+
+    def iter_fetch(
+        self, urls: Iterable[str], *, window: int | None = None
+    ) -> Iterator[FetchOutcome]:
+        """Fetch ``urls`` concurrently, yielding outcomes in input order.
+
+        At most ``window`` URLs (default ``settings.ASYNC_FETCH_WINDOW``, never fewer
+        than ``max_per_host``) are scheduled ahead of the consumer; the next one is
+        scheduled as an outcome is handed out, so a consumer that stops pulling (e.g.
+        blocked on a full stage queue) also stops the fetching and responses do not
+        pile up in memory. The per-host semaphore bounds actual concurrency. Closing
+        the iterator early cancels requests not yet done, except those another caller
+        of the fetch memo still waits for.
+        """
+        limit = max(1, window or settings.ASYNC_FETCH_WINDOW, self.max_per_host)
+        remaining = iter(urls)
+        pending: Deque[tuple[str, concurrent.futures.Future, bool]] = deque()
+
+        def fill() -> None:
+            while len(pending) < limit:
+                url = next(remaining, None)
+                if url is None:
+                    return
+                pending.append((url, *self._schedule(url)))
+
+        try:
+            fill()
+            while pending:
+                url, fut, shared = pending.popleft()
+                try:
+                    page, elapsed = fut.result()
+                    if shared:
+                        outcome = FetchOutcome(
+                            url=url, html=page.text(), error=None, elapsed=0.0, shared=True
+                        )
+                    else:
+                        outcome = FetchOutcome(
+                            url=url,
+                            html=page.text(),
+                            error=None,
+                            elapsed=elapsed,
+                            wire_bytes=page.wire_bytes,
+                            decoded_bytes=len(page.body),
+                        )
+                except concurrent.futures.CancelledError:
+                    outcome = FetchOutcome(
+                        url=url, html=None, error=FetchCancelled(url), elapsed=0.0
+                    )
+                except Exception as e:  # noqa: BLE001 - surfaced to caller
+                    outcome = FetchOutcome(url=url, html=None, error=e, elapsed=0.0)
+                fill()
+                yield outcome
+        finally:
+            for url, fut, _shared in pending:
+                if self.memo is None:
+                    fut.cancel()
+                else:
+                    self.memo.release(url, fut)
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "failures": self.failures,
+                "peak_in_flight": self.peak_in_flight,
+                "wire_bytes": self.wire_bytes,
+                "decoded_bytes": self.decoded_bytes,
+                "max_per_host": self.max_per_host,
+            }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self.memo is not None:
+                self._run(self._drain())
+            self._run(self._client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+
+    def __enter__(self) -> "ConcurrentFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,176 @@
+"""Run-scoped single-flight memo for page fetches.
+
+Several steps of `services.pipeline.run_full` request the same URL (the
+primary club overview in Step 5 and 7c, roster pages again during the club
+team backfill, ...). A `FetchMemo` lives for one run and deduplicates them: the
+first caller performs the fetch, later callers get the stored result, and
+callers arriving while the fetch is still in flight wait on the same
+`concurrent.futures.Future`.
+
+Only in-flight fetches and the ``max_completed`` most recently used results
+(``settings.FETCH_MEMO_MAX_COMPLETED``) are kept, so the memo does not hold the
+body of every page of a run; a URL requested again after its result was evicted
+is fetched again (repeat requests of a run are close together, see above).
+Results of URLs matching ``pin`` are kept for the memo's lifetime instead, outside
+that window: `services.batch_scrape` pins the league pages every target requests,
+so the player histories of one target cannot evict them before the next starts.
+
+Failed or cancelled fetches are forgotten so a later step may retry them (the
+callers that were already waiting see the same error). The memo may be shared by
+several runs (`services.batch_scrape`), so a caller that gives up on an in-flight
+fetch `release`s it instead of cancelling it: it is cancelled only once no other
+caller waits for it.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import concurrent.futures
+import threading
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from config import settings
+
+__all__ = ["FetchMemo"]
+
+T = TypeVar("T")
+
+
+class FetchMemo:
+    """Per-URL future registry shared by the sequential and concurrent fetch paths."""
+
+    def __init__(
+        self, max_completed: int | None = None, pin: Optional[Callable[[str], bool]] = None
+    ) -> None:
+        self.max_completed = (
+            settings.FETCH_MEMO_MAX_COMPLETED if max_completed is None else max_completed
+        )
+        self.pin = pin
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
+        # Callers waiting for each in-flight future
+        self._waiters: Dict[concurrent.futures.Future, int] = {}
+        # Successful results, least recently used first
+        self._completed: "OrderedDict[str, concurrent.futures.Future]" = OrderedDict()
+        # Successful results of pinned URLs, never evicted
+        self._pinned: Dict[str, concurrent.futures.Future] = {}
+        self.requests = 0
+        self.duplicates_avoided = 0
+        self.evicted = 0
+
+    def _lookup(self, url: str) -> Optional[concurrent.futures.Future]:
+        """Registered future of ``url`` (caller holds the lock)."""
+        fut = self._in_flight.get(url) or self._pinned.get(url)
+        if fut is None:
+            fut = self._completed.get(url)
+            if fut is not None:
+                self._completed.move_to_end(url)
+        return fut
+
+    def _settle(self, url: str, fut: concurrent.futures.Future) -> None:
+        """Move a finished future out of the in-flight set (kept only when it succeeded)."""
+        failed = fut.cancelled() or fut.exception() is not None
+        with self._lock:
+            self._waiters.pop(fut, None)
+            if self._in_flight.get(url) is not fut:
+                return
+            del self._in_flight[url]
+            if failed:
+                return
+            if self.pin is not None and self.pin(url):
+                self._pinned[url] = fut
+                return
+            if self.max_completed <= 0:
+                return
+            self._completed[url] = fut
+            while len(self._completed) > self.max_completed:
+                self._completed.popitem(last=False)
+                self.evicted += 1
+
+    def fetch(self, url: str, loader: Callable[[], T]) -> T:
+        """Return ``loader()`` for the first call per URL, the memoised value afterwards."""
+        with self._lock:
+            existing = self._lookup(url)
+            if existing is not None:
+                self.duplicates_avoided += 1
+                self._wait_for(existing)
+            else:
+                self.requests += 1
+                own: concurrent.futures.Future = concurrent.futures.Future()
+                self._in_flight[url] = own
+                self._waiters[own] = 1  # never released: the loader always settles it
+        if existing is not None:
+            try:
+                return existing.result()
+            finally:
+                self.release(url, existing)
+        try:
+            value = loader()
+        except BaseException as e:
+            own.set_exception(e)
+            self._settle(url, own)
+            raise
+        own.set_result(value)
+        self._settle(url, own)
+        return value
+
+    def future(
+        self, url: str, start: Callable[[], concurrent.futures.Future]
+    ) -> Tuple[concurrent.futures.Future, bool]:
+        """Single-flight for asynchronous fetches.
+
+        Returns ``(future, shared)``: the future already registered for ``url``
+        (``shared=True``) or the one produced by ``start()`` (``shared=False``).
+        """
+        with self._lock:
+            existing = self._lookup(url)
+            if existing is not None:
+                self.duplicates_avoided += 1
+                self._wait_for(existing)
+                return existing, True
+            self.requests += 1
+            fut = start()
+            self._in_flight[url] = fut
+            self._waiters[fut] = 1
+        fut.add_done_callback(lambda f: self._settle(url, f))
+        return fut, False
+
+    def _wait_for(self, fut: concurrent.futures.Future) -> None:
+        """Count one more caller of ``fut`` if it is still in flight (caller holds the lock)."""
+        if fut in self._waiters:
+            self._waiters[fut] += 1
+
+    def release(self, url: str, fut: concurrent.futures.Future) -> None:
+        """Give up waiting for ``fut`` (from `future`); cancel it once nobody else waits.
+
+        A fetch that is abandoned this way is forgotten first, so a caller arriving
+        in the meantime starts a new one rather than getting the cancelled future.
+        """
+        with self._lock:
+            left = self._waiters.get(fut)
+            if left is None:  # already settled
+                return
+            if left > 1:
+                self._waiters[fut] = left - 1
+                return
+            del self._waiters[fut]
+            if self._in_flight.get(url) is fut:
+                del self._in_flight[url]
+        fut.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "unique_requests": self.requests,
+                "duplicates_avoided": self.duplicates_avoided,
+                "memoised": len(self._in_flight) + len(self._completed),
+                "pinned": len(self._pinned),
+                "evicted": self.evicted,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._in_flight.clear()
+            self._waiters.clear()
+            self._completed.clear()
+            self._pinned.clear()
@@ -1,21 +1,61 @@
-"""Filesystem utility helpers."""
+"""Filesystem utility helpers.
+
+`write_text` is atomic: content goes to a temporary file next to the target
+which then replaces it (``os.replace``), so a crash never leaves a half-written
+page behind for ingestion to pick up. `BatchedWriter` runs such writes on a
+background thread (producers only enqueue), fsyncs each touched directory once
+per `flush` (e.g. per scrape phase) and reports bytes written and latencies.
+"""
 
 from __future__ import annotations
 import os
 import glob
-from typing import Iterable
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from config import settings
+
+__all__ = [
+    "ensure_dir",
+    "write_text",
+    "read_text",
+    "glob_files",
+    "fsync_dir",
+    "BatchedWriter",
+]
 
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def write_text(path: str, content: str, encoding: str = "utf-8") -> None:
+def _write_atomic(path: str, content: str, encoding: str, fsync: bool) -> int:
+    """Write via a temp file + rename; return the number of bytes written."""
     dir_part = os.path.dirname(path)
     if dir_part:
         ensure_dir(dir_part)
-    with open(path, "w", encoding=encoding) as fh:
-        fh.write(content)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding=encoding) as fh:
+            fh.write(content)
+            fh.flush()
+            if fsync:
+                os.fsync(fh.fileno())
+            size = fh.tell()
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return size
+
+
+def write_text(path: str, content: str, encoding: str = "utf-8") -> None:
+    _write_atomic(path, content, encoding, fsync=False)
 
 
 def read_text(path: str, encoding: str = "utf-8") -> str:
@@ -25,3 +65,176 @@ def read_text(path: str, encoding: str = "utf-8") -> str:
 
 def glob_files(pattern: str) -> list[str]:
     return glob.glob(pattern, recursive=True)
+
+
+def fsync_dir(path: str) -> bool:
+    """Persist a directory's entries (renames into it); False where unsupported."""
+    try:
+        fd = os.open(path or ".", os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        os.fsync(fd)
+        return True
+    except OSError:  # pragma: no cover - e.g. Windows directories
+        return False
+    finally:
+        os.close(fd)
+
+
+_STOP = object()
+
+
+class BatchedWriter:
+    """Atomic text writes performed by one background thread.
+
+    `write_text` enqueues and returns (it blocks only while ``queue_size`` writes are
+    pending). `flush` waits until everything queued has been written, then fsyncs each
+    directory written to since the previous flush. A failed write is passed to
+    ``on_error(path, error)`` (on the writer thread) so the caller can report it and
+    carry on; without ``on_error`` the first write error is re-raised by `flush` (and
+    `close`). With ``fsync_files`` every file's data is fsynced before its
+    rename as well. ``background=False`` writes synchronously (same stats). A write's
+    ``on_written`` callback runs only after that file was renamed into place (never for a
+    failed write), so e.g. a resume journal records only pages that are on disk.
+    """
+
+    def __init__(
+        self,
+        *,
+        background: bool | None = None,
+        fsync_files: bool | None = None,
+        queue_size: int | None = None,
+        on_error: Callable[[str, BaseException], None] | None = None,
+    ) -> None:
+        self.background = settings.FS_BACKGROUND_WRITER if background is None else background
+        self.fsync_files = settings.FS_FSYNC_FILES if fsync_files is None else fsync_files
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._dirty_dirs: Set[str] = set()
+        self._error: Optional[BaseException] = None
+        self._stats: Dict[str, float] = {
+            "files": 0,
+            "bytes": 0,
+            "write_seconds": 0.0,
+            "max_write_seconds": 0.0,
+            "fsyncs": 0,
+            "fsync_seconds": 0.0,
+            "flushes": 0,
+            "enqueue_wait_seconds": 0.0,
+            "peak_queue_depth": 0,
+            "errors": 0,
+        }
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size or settings.FS_WRITE_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        if self.background:
+            self._thread = threading.Thread(target=self._drain, name="batched-writer", daemon=True)
+            self._thread.start()
+
+    # Writing ----------------------------------------------------------
+    def _fail(self, path: str, error: BaseException) -> None:
+        with self._lock:
+            self._stats["errors"] += 1
+        if self._on_error is not None:
+            try:
+                self._on_error(path, error)
+                return
+            except BaseException as e:  # a failing handler is re-raised by flush
+                error = e
+        with self._lock:
+            if self._error is None:
+                self._error = error
+
+    def _write(
+        self, path: str, content: str, encoding: str, on_written: Callable[[], None] | None
+    ) -> None:
+        t0 = time.perf_counter()
+        try:
+            size = _write_atomic(path, content, encoding, self.fsync_files)
+        except BaseException as e:
+            self._fail(path, e)
+            return
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            self._dirty_dirs.add(os.path.dirname(os.path.abspath(path)))
+            self._stats["files"] += 1
+            self._stats["bytes"] += size
+            self._stats["write_seconds"] += elapsed
+            self._stats["max_write_seconds"] = max(self._stats["max_write_seconds"], elapsed)
+        if on_written is not None:
+            try:
+                on_written()
+            except BaseException as e:
+                self._fail(path, e)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def write_text(
+        self,
+        path: str,
+        content: str,
+        encoding: str = "utf-8",
+        *,
+        on_written: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue a write; ``on_written`` runs (on the writer thread) once the file is in place."""
+        if self._thread is None:
+            self._write(path, content, encoding, on_written)
+            return
+        t0 = time.perf_counter()
+        self._queue.put((path, content, encoding, on_written))
+        waited = time.perf_counter() - t0
+        with self._lock:
+            self._stats["enqueue_wait_seconds"] += waited
+            self._stats["peak_queue_depth"] = max(
+                self._stats["peak_queue_depth"], self._queue.qsize()
+            )
+
+    # Durability -------------------------------------------------------
+    def flush(self) -> None:
+        """Wait for queued writes, fsync the directories written to, raise a pending error."""
+        if self._thread is not None:
+            self._queue.join()
+        with self._lock:
+            dirs, self._dirty_dirs = self._dirty_dirs, set()
+            error, self._error = self._error, None
+        t0 = time.perf_counter()
+        synced = sum(1 for d in sorted(dirs) if fsync_dir(d))
+        with self._lock:
+            self._stats["fsyncs"] += synced
+            self._stats["fsync_seconds"] += time.perf_counter() - t0
+            self._stats["flushes"] += 1
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Flush and stop the writer thread (idempotent)."""
+        try:
+            self.flush()
+        finally:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+
+    def __enter__(self) -> "BatchedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, float]:
+        """Files / bytes written, write and fsync latency (seconds), queue statistics."""
+        with self._lock:
+            out = dict(self._stats)
+        files = out["files"]
+        out["mean_write_ms"] = (out["write_seconds"] / files * 1000.0) if files else 0.0
+        return out
@@ -1,22 +1,544 @@
 """HTTP client utilities with simple retry logic.
 
 Separated from parsing so it can be swapped (e.g., requests, httpx, asyncio) later.
+
+Requests go through an `HttpSession`: a small keep-alive pool of stdlib
+`http.client` connections keyed by (scheme, host). Reusing a socket avoids a
+fresh TCP + TLS handshake for each of the hundreds of pages fetched by a
+pipeline run. `fetch()` keeps its historic signature and delegates to a
+module-level default session shared by all scrapers.
+
+When conditional caching is enabled (``settings.HTTP_CONDITIONAL_CACHE``) every
+successful response carrying an ETag or Last-Modified validator is stored in
+`core.cache` together with it (a response without one could never be
+revalidated, so it is not stored). Subsequent fetches of the same URL send
+If-None-Match / If-Modified-Since and reuse the cached body on a 304, so the
+server is always asked but unchanged pages are not transferred again.
+
+Every request advertises ``Accept-Encoding: gzip, deflate``; compressed bodies
+are decompressed incrementally while streaming off the socket. `fetch_page()`
+returns the raw bytes plus the detected charset (Content-Type header, then a
+``<meta charset>`` sniff) for callers that hash or parse bytes directly;
+`fetch()` decodes that page to text.
+
+Every attempt first takes a slot from the shared `core.rate_limit` governor and
+reports its outcome back (429 / 5xx / timeouts slow the whole run down).
+
+`redirect_origin()` sends the connections for one origin to another server
+(e.g. the offline corpus replay of `services.scrape_replay`) while URLs, cache
+keys and redirects keep the original origin.
 """
 
 from __future__ import annotations
 
+import codecs
+import http.client
+import re
+import socket
+import ssl
+import threading
 import time
-import urllib.request
-import urllib.error
-from typing import Optional
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 from config import settings
+from . import cache
+from .rate_limit import RateGovernor, default_governor, is_throttle_status, parse_retry_after
 
 
 class HttpError(RuntimeError):
     pass
 
 
+class _HttpStatusError(Exception):
+    """Non-success HTTP status (retried like urllib's HTTPError)."""
+
+    def __init__(self, status: int, reason: str, retry_after: float | None = None):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+_MAX_REDIRECTS = 5
+_READ_CHUNK = 64 * 1024
+_ACCEPT_ENCODING = "gzip, deflate"
+_ConnKey = Tuple[str, str]
+
+# (scheme, netloc) -> (scheme, netloc) connections are actually opened to
+_origin_routes: Dict[_ConnKey, _ConnKey] = {}
+
+_CHARSET_HEADER_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_CHARSET_META_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+def redirect_origin(origin: str, target: str | None) -> None:
+    """Open connections for ``origin`` (``scheme://host``) to ``target`` instead.
+
+    Passing ``None`` as target removes the route. Applies to `HttpSession` and
+    `core.async_http` alike; requested URLs are otherwise left untouched.
+    """
+    src = urlsplit(origin)
+    if target is None:
+        _origin_routes.pop((src.scheme, src.netloc), None)
+        return
+    dst = urlsplit(target)
+    _origin_routes[(src.scheme, src.netloc)] = (dst.scheme, dst.netloc)
+
+
+def routed_url(url: str) -> str:
+    """``url`` with its origin replaced according to `redirect_origin` routes."""
+    if not _origin_routes:
+        return url
+    parts = urlsplit(url)
+    route = _origin_routes.get((parts.scheme, parts.netloc))
+    if route is None:
+        return url
+    return urlunsplit((route[0], route[1], parts.path, parts.query, parts.fragment))
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]  # lower-cased names
+    body: bytes  # decompressed
+    wire_bytes: int = 0  # body bytes as received on the socket (compressed size)
+
+
+@dataclass
+class FetchedPage:
+    """Raw page bytes with the detected charset and transfer statistics."""
+
+    url: str
+    body: bytes
+    charset: str
+    status: int = 200
+    wire_bytes: int = 0
+    from_cache: bool = False
+    _text: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.body.decode(self.charset, errors="replace")
+        return self._text
+
+
+def detect_charset(headers: Dict[str, str], body: bytes, default: str = "utf-8") -> str:
+    """Charset from the Content-Type header, else a <meta charset> sniff of the head."""
+    candidate = None
+    m = _CHARSET_HEADER_RE.search(headers.get("content-type", ""))
+    if m:
+        candidate = m.group(1)
+    else:
+        m_meta = _CHARSET_META_RE.search(body[:4096])
+        if m_meta:
+            candidate = m_meta.group(1).decode("ascii", errors="ignore")
+    if candidate:
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            pass
+    return default
+
+
+class _StreamDecoder:
+    """Incremental gzip / deflate decoder (raw deflate tolerated for broken servers)."""
+
+    def __init__(self, encoding: str):
+        self._raw_fallback = encoding == "deflate"
+        # 32 + MAX_WBITS auto-detects zlib and gzip headers
+        self._d = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        self._started = False
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if not self._started:
+            self._started = True
+            try:
+                return self._d.decompress(chunk)
+            except zlib.error:
+                if not self._raw_fallback:
+                    raise
+                self._d = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._d.decompress(chunk)
+
+    def flush(self) -> bytes:
+        return self._d.flush()
+
+
+def _read_body(resp: http.client.HTTPResponse) -> Tuple[bytes, int]:
+    """Read (and decompress) a response body in chunks; returns (body, wire_bytes)."""
+    encoding = (resp.getheader("Content-Encoding") or "").strip().lower()
+    decoder = _StreamDecoder(encoding) if encoding in ("gzip", "x-gzip", "deflate") else None
+    chunks: List[bytes] = []
+    wire = 0
+    while True:
+        chunk = resp.read(_READ_CHUNK)
+        if not chunk:
+            break
+        wire += len(chunk)
+        chunks.append(decoder.decompress(chunk) if decoder else chunk)
+    if decoder is not None:
+        chunks.append(decoder.flush())
+    return b"".join(chunks), wire
+
+
+class HttpSession:
+    """Keep-alive connection pool shared across many GET requests.
+
+    Parameters
+    ----------
+    pool_size: Maximum number of idle connections retained per host. Extra
+        connections opened under concurrent use are closed when released.
+    idle_timeout: Seconds an idle connection may sit in the pool before it is
+        discarded instead of reused (servers drop idle keep-alive sockets).
+    timeout: Default per-request socket timeout in seconds.
+    conditional_cache: Store responses with their validators in `core.cache` and
+        revalidate them with conditional requests (defaults to the setting).
+    governor: Rate governor paced by `fetch_page` (defaults to the process-wide
+        `rate_limit.default_governor()`, resolved per call).
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int | None = None,
+        idle_timeout: float | None = None,
+        timeout: float | None = None,
+        user_agent: str | None = None,
+        conditional_cache: bool | None = None,
+        governor: RateGovernor | None = None,
+    ) -> None:
+        self._governor = governor
+        self.pool_size = max(1, pool_size or settings.HTTP_POOL_SIZE)
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None else settings.HTTP_POOL_IDLE_TIMEOUT
+        )
+        self.timeout = timeout or settings.DEFAULT_TIMEOUT
+        self.user_agent = user_agent or settings.DEFAULT_USER_AGENT
+        self.conditional_cache = (
+            conditional_cache if conditional_cache is not None else settings.HTTP_CONDITIONAL_CACHE
+        )
+        self._idle: Dict[_ConnKey, List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+        self._stats = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "stale_retries": 0,
+            "idle_evicted": 0,
+            "not_modified": 0,
+            "wire_bytes": 0,
+            "decoded_bytes": 0,
+        }
+        self._local = threading.local()  # per-thread meter, see `metered`
+
+    def _count(self, key: str, n: int = 1) -> None:
+        """Add to a counter of `stats` and of the calling thread's meter (lock held)."""
+        self._stats[key] += n
+        meter = getattr(self._local, "meter", None)
+        if meter is not None:
+            meter[key] += n
+
+    @contextmanager
+    def metered(self, meter: "Counter[str] | None" = None) -> Iterator["Counter[str]"]:
+        """Also count the requests made by this thread into ``meter`` while active.
+
+        `stats` covers everyone using the session; a meter covers one caller only
+        (e.g. one of several pipeline runs sharing the default session).
+        """
+        meter = Counter() if meter is None else meter
+        previous = getattr(self._local, "meter", None)
+        self._local.meter = meter
+        try:
+            yield meter
+        finally:
+            self._local.meter = previous
+
+    # Pool management --------------------------------------------------
+    def _new_connection(self, key: _ConnKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                netloc, timeout=timeout, context=self._ssl_context
+            )
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        with self._lock:
+            self._count("connections_opened")
+        return conn
+
+    def _acquire(self, key: _ConnKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._idle.get(key, [])
+            while bucket:
+                conn, released_at = bucket.pop()
+                if now - released_at > self.idle_timeout:
+                    conn.close()
+                    self._count("idle_evicted")
+                    continue
+                self._count("connections_reused")
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.timeout = timeout
+                return conn, True
+        return self._new_connection(key, timeout), False
+
+    def _release(self, key: _ConnKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            bucket = self._idle.setdefault(key, [])
+            if len(bucket) < self.pool_size:
+                bucket.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    # Requests ---------------------------------------------------------
+    def _get_once(
+        self, url: str, headers: Dict[str, str], timeout: float
+    ) -> Tuple[int, str, Dict[str, str], bytes, int]:
+        parts = urlsplit(routed_url(url))
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"unsupported URL: {url}")
+        key: _ConnKey = (parts.scheme, parts.netloc)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn, reused = self._acquire(key, timeout)
+        while True:
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body, wire = _read_body(resp)
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if not reused:
+                    raise
+                # Server closed the idle keep-alive socket; retry once on a fresh connection.
+                with self._lock:
+                    self._count("stale_retries")
+                conn, reused = self._new_connection(key, timeout), False
+        with self._lock:
+            self._count("requests")
+            self._count("wire_bytes", wire)
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        headers_out = {k.lower(): v for k, v in resp.getheaders()}
+        return resp.status, resp.reason, headers_out, body, wire
+
+    def request(
+        self, url: str, *, headers: Optional[Dict[str, str]] = None, timeout: float | None = None
+    ) -> HttpResponse:
+        """Single GET (no retries) following redirects; raises on 4xx/5xx status.
+
+        A ``304 Not Modified`` answer to a conditional request is returned as-is.
+        """
+        hdrs = {
+            "User-Agent": self.user_agent,
+            "Connection": "keep-alive",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
+        if headers:
+            hdrs.update(headers)
+        timeout = timeout or self.timeout
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, reason, resp_headers, body, wire = self._get_once(url, hdrs, timeout)
+            location = resp_headers.get("location")
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            if status >= 400:
+                raise _HttpStatusError(
+                    status, reason, parse_retry_after(resp_headers.get("retry-after"))
+                )
+            return HttpResponse(
+                url=url, status=status, headers=resp_headers, body=body, wire_bytes=wire
+            )
+        raise _HttpStatusError(310, "Too many redirects")
+
+    def get(
+        self, url: str, *, headers: Optional[Dict[str, str]] = None, timeout: float | None = None
+    ) -> bytes:
+        """Single GET returning the response body."""
+        return self.request(url, headers=headers, timeout=timeout).body
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        user_agent: Optional[str] = None,
+        timeout: Optional[int] = None,
+        retries: int | None = None,
+        backoff_factor: float | None = None,
+        verbose: bool = True,
+        use_cache: bool | None = None,
+    ) -> str:
+        return self.fetch_page(
+            url,
+            user_agent=user_agent,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            verbose=verbose,
+            use_cache=use_cache,
+        ).text()
+
+    def fetch_page(
+        self,
+        url: str,
+        *,
+        user_agent: Optional[str] = None,
+        timeout: Optional[int] = None,
+        retries: int | None = None,
+        backoff_factor: float | None = None,
+        verbose: bool = True,
+        use_cache: bool | None = None,
+    ) -> FetchedPage:
+        """Fetch with retries, returning raw (decompressed) bytes and detected charset."""
+        retries = retries if retries is not None else settings.DEFAULT_RETRIES
+        backoff_factor = (
+            backoff_factor if backoff_factor is not None else settings.DEFAULT_BACKOFF_FACTOR
+        )
+        use_cache = self.conditional_cache if use_cache is None else use_cache
+        headers: Dict[str, str] = {"User-Agent": user_agent} if user_agent else {}
+        entry = cache.get_entry(url) if use_cache else None
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        governor = self.governor
+        attempt = 0
+        while True:
+            attempt += 1
+            governor.acquire()
+            try:
+                try:
+                    resp = self.request(url, headers=headers, timeout=timeout)
+                except _HttpStatusError as e:
+                    if is_throttle_status(e.status):
+                        governor.on_throttle(e.retry_after)
+                    raise
+                except (TimeoutError, socket.timeout):  # distinct classes before 3.10
+                    governor.on_throttle()
+                    raise
+                governor.on_success()
+                if resp.status == 304 and entry is not None:
+                    cache.touch(url)
+                    page = FetchedPage(
+                        url=url,
+                        body=entry.body.encode("utf-8"),
+                        charset="utf-8",
+                        status=304,
+                        from_cache=True,
+                        _text=entry.body,
+                    )
+                    with self._lock:
+                        self._count("not_modified")
+                        self._count("decoded_bytes", len(page.body))
+                    return page
+                page = FetchedPage(
+                    url=url,
+                    body=resp.body,
+                    charset=detect_charset(resp.headers, resp.body),
+                    status=resp.status,
+                    wire_bytes=resp.wire_bytes,
+                )
+                with self._lock:
+                    self._count("decoded_bytes", len(page.body))
+                etag = resp.headers.get("etag")
+                last_modified = resp.headers.get("last-modified")
+                if use_cache and (etag or last_modified):
+                    # Best effort, like cache.touch: a failed write (full disk, locked
+                    # index) must not discard or re-fetch a page that already arrived
+                    try:
+                        cache.set(
+                            url,
+                            page.text(),
+                            etag=etag,
+                            last_modified=last_modified,
+                            status=resp.status,
+                        )
+                    except Exception:  # noqa: BLE001
+                        pass
+                return page
+            except (_HttpStatusError, OSError, http.client.HTTPException) as e:
+                if attempt > retries:
+                    raise HttpError(f"Failed to fetch {url} after {retries} retries: {e}") from e
+                sleep_for = backoff_factor * (2 ** (attempt - 1))
+                if verbose:
+                    print(
+                        f"[http] Attempt {attempt}/{retries} failed for {url}: {e}. "
+                        f"Retrying in {sleep_for:.1f}s..."
+                    )
+                time.sleep(sleep_for)
+            except Exception as e:  # noqa: BLE001
+                raise HttpError(f"Unexpected error for {url}: {e}") from e
+
+    @property
+    def governor(self) -> RateGovernor:
+        return self._governor if self._governor is not None else default_governor()
+
+    def stats(self) -> Dict[str, float]:
+        """Return connection reuse statistics (counters plus ``reuse_ratio``)."""
+        with self._lock:
+            out: Dict[str, float] = dict(self._stats)
+            out["idle_connections"] = sum(len(b) for b in self._idle.values())
+        acquired = out["connections_reused"] + out["connections_opened"]
+        out["reuse_ratio"] = (out["connections_reused"] / acquired) if acquired else 0.0
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            buckets = list(self._idle.values())
+            self._idle.clear()
+        for bucket in buckets:
+            for conn, _ts in bucket:
+                conn.close()
+
+    def __enter__(self) -> "HttpSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+_default_session: HttpSession | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_session() -> HttpSession:
+    """Return the process-wide session used by `fetch()` (created lazily)."""
+    global _default_session
+    with _default_lock:
+        if _default_session is None:
+            _default_session = HttpSession()
+        return _default_session
+
+
+def configure_default_session(
+    *,
+    pool_size: int | None = None,
+    idle_timeout: float | None = None,
+    timeout: float | None = None,
+) -> HttpSession:
+    """Replace the default session with one using the given pool settings."""
+    global _default_session
+    with _default_lock:
+        old = _default_session
+        _default_session = HttpSession(
+            pool_size=pool_size, idle_timeout=idle_timeout, timeout=timeout
+        )
+        new = _default_session
+    if old is not None:
+        old.close()
+    return new
+
+
 def fetch(
     url: str,
     *,
@@ -25,31 +547,38 @@ def fetch(
     retries: int | None = None,
     backoff_factor: float | None = None,
     verbose: bool = True,
+    session: HttpSession | None = None,
+    use_cache: bool | None = None,
 ) -> str:
-    ua = user_agent or settings.DEFAULT_USER_AGENT
-    timeout = timeout or settings.DEFAULT_TIMEOUT
-    retries = retries if retries is not None else settings.DEFAULT_RETRIES
-    backoff_factor = (
-        backoff_factor if backoff_factor is not None else settings.DEFAULT_BACKOFF_FACTOR
+    return (session or get_default_session()).fetch(
+        url,
+        user_agent=user_agent,
+        timeout=timeout,
+        retries=retries,
+        backoff_factor=backoff_factor,
+        verbose=verbose,
+        use_cache=use_cache,
     )
 
-    headers = {"User-Agent": ua}
-    attempt = 0
-    while True:
-        attempt += 1
-        try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                content_bytes = resp.read()
-                return content_bytes.decode("utf-8", errors="replace")
-        except (urllib.error.HTTPError, urllib.error.URLError) as e:  # type: ignore[union-attr]
-            if attempt > retries:
-                raise HttpError(f"Failed to fetch {url} after {retries} retries: {e}") from e
-            sleep_for = backoff_factor * (2 ** (attempt - 1))
-            if verbose:
-                print(
-                    f"[http] Attempt {attempt}/{retries} failed for {url}: {e}. Retrying in {sleep_for:.1f}s..."
-                )
-            time.sleep(sleep_for)
-        except Exception as e:  # noqa: BLE001
-            raise HttpError(f"Unexpected error for {url}: {e}") from e
+
+def fetch_page(
+    url: str,
+    *,
+    user_agent: Optional[str] = None,
+    timeout: Optional[int] = None,
+    retries: int | None = None,
+    backoff_factor: float | None = None,
+    verbose: bool = True,
+    session: HttpSession | None = None,
+    use_cache: bool | None = None,
+) -> FetchedPage:
+    """Like `fetch` but returns raw bytes plus the detected charset (no decode)."""
+    return (session or get_default_session()).fetch_page(
+        url,
+        user_agent=user_agent,
+        timeout=timeout,
+        retries=retries,
+        backoff_factor=backoff_factor,
+        verbose=verbose,
+        use_cache=use_cache,
+    )
@@ -0,0 +1,203 @@
+"""Shared request-rate governor for every scrape fetch.
+
+A token bucket (``rps`` tokens per second, at most ``burst`` banked) paces all
+requests issued through `core.http_client` and `core.async_http`, so the phases
+of a pipeline run - sequential or concurrent - share one request budget.
+
+The refill rate adapts AIMD-style: a throttling signal from the server (HTTP
+429, any 5xx, or a timeout) multiplies the current rate by ``decrease_factor``
+(at most once per ``cooldown`` seconds, so a burst of failures from requests
+already in flight counts as one event); every success adds ``increase_step``
+requests/second back until the configured ceiling is reached again.
+
+Callers reserve a slot with `reserve()` and sleep for the returned delay
+(`acquire()` / `acquire_async()` do both), which works for threads and for the
+event loop of `core.concurrent_fetch` alike. `metrics()` reports the current
+rate, throttle events and queue depth (callers currently waiting for a slot).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from config import settings
+
+__all__ = [
+    "RateGovernor",
+    "is_throttle_status",
+    "parse_retry_after",
+    "default_governor",
+    "configure_default_governor",
+]
+
+
+def is_throttle_status(status: int) -> bool:
+    """True for statuses meaning "slow down": 429 Too Many Requests and 5xx."""
+    return status == 429 or status >= 500
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a Retry-After header (the HTTP-date form is ignored)."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class RateGovernor:
+    """Thread-safe token bucket with additive-increase / multiplicative-decrease."""
+
+    def __init__(
+        self,
+        rps: float | None = None,
+        burst: int | None = None,
+        *,
+        min_rps: float | None = None,
+        decrease_factor: float = 0.5,
+        increase_step: float | None = None,
+        cooldown: float = 1.0,
+    ) -> None:
+        self.max_rps = float(rps if rps is not None else settings.RATE_LIMIT_RPS)
+        if self.max_rps <= 0:
+            raise ValueError("rps must be positive")
+        self.burst = max(1, int(burst if burst is not None else settings.RATE_LIMIT_BURST))
+        self.min_rps = min(
+            self.max_rps, float(min_rps if min_rps is not None else settings.RATE_LIMIT_MIN_RPS)
+        )
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else self.max_rps / 20.0
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._rate = self.max_rps
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._last_decrease = float("-inf")
+        self._blocked_until = 0.0
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._wait_seconds = 0.0
+        self._throttle_events = 0
+
+    # Bucket -----------------------------------------------------------
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+            self._last_refill = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait first.
+
+        The bucket may go negative: each queued caller's delay covers the callers
+        reserved before it, which keeps waiting requests in FIFO order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(0.0, -self._tokens / self._rate, self._blocked_until - now)
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._wait_seconds += wait
+            return wait
+
+    def _enter_wait(self) -> None:
+        with self._lock:
+            self._waiting += 1
+            self._peak_waiting = max(self._peak_waiting, self._waiting)
+
+    def _leave_wait(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self) -> float:
+        """Block the calling thread until a request slot is available."""
+        wait = self.reserve()
+        if wait > 0:
+            self._enter_wait()
+            try:
+                time.sleep(wait)
+            finally:
+                self._leave_wait()
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Coroutine variant of `acquire` (sleeps on the running event loop)."""
+        wait = self.reserve()
+        if wait > 0:
+            self._enter_wait()
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._leave_wait()
+        return wait
+
+    # Feedback ---------------------------------------------------------
+    def on_success(self) -> None:
+        with self._lock:
+            if self._rate < self.max_rps:
+                self._rate = min(self.max_rps, self._rate + self.increase_step)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Register a 429 / 5xx / timeout; ``retry_after`` pauses the bucket too."""
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._refill(now)
+            self._last_decrease = now
+            self._throttle_events += 1
+            self._rate = max(self.min_rps, self._rate * self.decrease_factor)
+            # drop banked tokens so the lower rate takes effect immediately
+            self._tokens = min(self._tokens, 1.0)
+
+    # Reporting --------------------------------------------------------
+    @property
+    def current_rate(self) -> float:
+        with self._lock:
+            return self._rate
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "current_rps": round(self._rate, 3),
+                "max_rps": self.max_rps,
+                "burst": self.burst,
+                "throttle_events": self._throttle_events,
+                "queue_depth": self._waiting,
+                "peak_queue_depth": self._peak_waiting,
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "wait_seconds": round(self._wait_seconds, 3),
+            }
+
+
+_default_governor: RateGovernor | None = None
+_default_lock = threading.Lock()
+
+
+def default_governor() -> RateGovernor:
+    """Process-wide governor shared by the default HTTP session and async fetchers."""
+    global _default_governor
+    with _default_lock:
+        if _default_governor is None:
+            _default_governor = RateGovernor()
+        return _default_governor
+
+
+def configure_default_governor(
+    rps: float | None = None, burst: int | None = None, **kwargs
+) -> RateGovernor:
+    """Replace the shared governor (e.g. from CLI flags)."""
+    global _default_governor
+    with _default_lock:
+        _default_governor = RateGovernor(rps, burst, **kwargs)
+        return _default_governor
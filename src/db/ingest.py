@@ -26,14 +26,18 @@ The function returns a dataclass report with counts of inserted/updated/skipped
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 import hashlib
 import sqlite3
 import re
 from typing import Dict, List, Tuple, Optional, Set
 
+from config import settings
+from db.parallel_parse import ParallelParser, ParseJob
+from db.parse_cache import ParseCache, extract_roster, ranking_payload, roster_payload
 from parsing.ranking_parser import parse_ranking_table
-from parsing.roster_parser import extract_players
+from parsing.roster_parser import club_and_team_from_title, extract_players
 
 
 PARSER_VERSION_DEFAULT = "v1"
@@ -44,9 +48,15 @@ PARSER_VERSION_DEFAULT = "v1"
 _ROSTER_ID_RE = re.compile(r"_(\d+)\.html$")
 
 
-def hash_html(content: str) -> str:
-    """Return SHA256 hex digest of raw HTML content."""
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+def hash_html(content: str | bytes) -> str:
+    """Return SHA256 hex digest of raw HTML content.
+
+    Accepts already-encoded bytes (e.g. ``FetchedPage.body``) so callers holding the
+    raw response need not decode and re-encode; text is hashed as UTF-8.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
 
 
 def _normalize_slug(name: str) -> str:
@@ -70,34 +80,9 @@ def _normalize_slug(name: str) -> str:
 def _extract_club_and_team_from_title(html: str) -> Optional[Tuple[str, str]]:
     """Extract (club_name, team_designation) from roster HTML <title>.
 
-    Expected pattern tail: ' - Team <Club Name>, <Team Designation>'
-    Returns None if pattern not found or malformed.
+    Kept for existing callers; see `parsing.roster_parser.club_and_team_from_title`.
     """
-    m = re.search(r" - Team ([^,<]+?),\s*([^<]+)</title>", html, re.IGNORECASE)
-    if not m:
-        # Fallback: parse via simpler split if direct regex fails
-        # Locate ' - Team ' then split on first comma
-        idx = html.lower().rfind(" - team ")
-        if idx == -1:
-            return None
-        after = html[idx + len(" - team ") :]
-        # up to closing title or first '</title>'
-        end_idx = after.lower().find("</title>")
-        if end_idx != -1:
-            after = after[:end_idx]
-        parts = after.split(",", 1)
-        if len(parts) != 2:
-            return None
-        club = parts[0].strip()
-        team = parts[1].strip()
-        if club and team:
-            return club, team
-        return None
-    club = m.group(1).strip()
-    team = m.group(2).strip()
-    if club and team:
-        return club, team
-    return None
+    return club_and_team_from_title(html)
 
 
 @dataclass
@@ -155,6 +140,8 @@ class FileIngestResult:
 @dataclass
 class IngestReport:
     files: List[FileIngestResult] = field(default_factory=list)
+    parse_cache_hits: int = 0
+    parse_cache_misses: int = 0
 
     @property
     def total_players_inserted(self) -> int:
@@ -259,8 +246,41 @@ def _upsert_player(
     return False, False
 
 
+def _schedule_parse(
+    parallel: ParallelParser,
+    ranking_files: List[Path],
+    roster_index: Dict[str, Dict[str, _RosterIndexEntry]],
+    streaming: bool,
+) -> None:
+    """Submit each division's pages in ingest order (rosters assigned as `ingest_path` does)."""
+    planned: Set[Path] = set()
+    for ranking in ranking_files:
+        jobs = [
+            ParseJob(
+                str(ranking), "ranking_parser", partial(ranking_payload, source_hint=ranking.name)
+            )
+        ]
+        div_rosters = roster_index.get(ranking.parent.name, {"by_id": {}})
+        for entry in div_rosters.get("by_id", {}).values():
+            if entry.path in planned:
+                continue
+            planned.add(entry.path)
+            jobs.append(
+                ParseJob(
+                    str(entry.path), "roster_parser", partial(roster_payload, streaming=streaming)
+                )
+            )
+        parallel.schedule(ranking, jobs)
+
+
 def ingest_path(
-    conn: sqlite3.Connection, root_path: str | Path, parser_version: str = PARSER_VERSION_DEFAULT
+    conn: sqlite3.Connection,
+    root_path: str | Path,
+    parser_version: str = PARSER_VERSION_DEFAULT,
+    *,
+    streaming: bool | None = None,
+    parse_cache: bool | None = None,
+    workers: int | None = None,
 ) -> IngestReport:
     """Ingest ranking & roster HTML files.
 
@@ -273,97 +293,141 @@ def ingest_path(
       4. Upsert team + players; provenance recorded for ranking + roster files.
     This guarantees ingested team count equals unique roster file ids per division, removing both deficits and surpluses
     caused by placeholder numeric-leading names or duplicate navigation entries.
+
+    ``streaming`` (default: ``settings.INGEST_STREAMING_PARSER``) extracts roster players with the
+    tree-less `parsing.roster_stream` extractor (same players, no DOM per roster).
+    ``parse_cache`` (default: ``settings.INGEST_PARSE_CACHE``) reuses the `db.parse_cache`
+    results of pages whose content is unchanged; the report carries its hit / miss counts.
+    With ``workers`` > 1 (default: ``settings.INGEST_PARSE_WORKERS``) pages are parsed on a
+    `db.parallel_parse` process pool ahead of this thread, which stays the only writer and
+    applies divisions in the same order with the same transactions.
     """
+    if streaming is None:
+        streaming = settings.INGEST_STREAMING_PARSER
+    if parse_cache is None:
+        parse_cache = settings.INGEST_PARSE_CACHE
+    if workers is None:
+        workers = settings.INGEST_PARSE_WORKERS
+    cache = ParseCache(conn, parser_version) if parse_cache else None
     root = Path(root_path)
     report = IngestReport()
     ranking_files = list(root.rglob("ranking_table_*.html"))
     roster_index = _build_roster_index(root)
     processed_roster_paths: Set[Path] = set()
 
-    for ranking in ranking_files:
-        content = ranking.read_text(encoding="utf-8", errors="ignore")
-        file_hash = hash_html(content)
-        result = FileIngestResult(source_file=str(ranking), hash=file_hash, skipped_unchanged=False)
-        division_name, team_entries = parse_ranking_table(content, source_hint=ranking.name)
-        previously_seen = _provenance_exists(conn, str(ranking), file_hash)
-        if previously_seen:
-            result.skipped_unchanged = True
-        # Build slug -> display name map from ranking
-        ranking_slug_map: Dict[str, str] = {}
-        for t in team_entries:
-            n = t.get("team_name")
-            if n:
-                ranking_slug_map[_normalize_slug(n)] = n
-        with conn:
-            div_id = _upsert_division(conn, division_name)
-            if not previously_seen:
-                for display in set(ranking_slug_map.values()):
-                    _upsert_team(conn, div_id, display)
-                _record_provenance(conn, str(ranking), parser_version, file_hash)
-        division_folder = ranking.parent.name
-        div_rosters = roster_index.get(division_folder, {"by_id": {}, "by_slug": {}})
-        # Ingest each roster file exactly once
-        for team_ext_id, entry in div_rosters.get("by_id", {}).items():
-            if entry.path in processed_roster_paths:
-                continue
-            processed_roster_paths.add(entry.path)
-            slug = entry.slug
-            # Prefer ranking display name; else synthesize
-            display_name = ranking_slug_map.get(slug)
-            if not display_name:
-                display_name = re.sub(r"\s+", " ", slug.replace("_", " ").strip()).title()
-            roster_html = entry.path.read_text(encoding="utf-8", errors="ignore")
-            # Attempt title-based extraction for club + team designation
-            club_team = _extract_club_and_team_from_title(roster_html)
-            combined_name = display_name
-            original_ranking_name = display_name
-            if club_team:
-                club_name, team_designation = club_team
-                # Build combined formatted name
-                combined_name = f"{club_name} | {team_designation}"
-            # If combined differs, try to UPDATE existing ranking-named row to avoid duplicates
-            team_db_id: int
-            if combined_name != original_ranking_name:
-                cur = conn.cursor()
-                cur.execute(
-                    "SELECT team_id FROM team WHERE division_id=? AND name=?",
-                    (div_id, original_ranking_name),
+    parallel: ParallelParser | None = None
+    if workers > 1 and ranking_files:
+        if cache is None:
+            cache = ParseCache(conn, parser_version, persist=False)
+        parallel = ParallelParser(cache, workers)
+        _schedule_parse(parallel, ranking_files, roster_index, streaming)
+    try:
+        for ranking in ranking_files:
+            if parallel is not None:
+                parallel.ready(ranking)
+            content = ranking.read_text(encoding="utf-8", errors="ignore")
+            file_hash = hash_html(content)
+            result = FileIngestResult(
+                source_file=str(ranking), hash=file_hash, skipped_unchanged=False
+            )
+            if cache is not None:
+                division_name, team_entries = cache.ranking(
+                    content, ranking.name, content_hash=file_hash
                 )
-                row = cur.fetchone()
-                if row:
-                    # Ensure no existing row already has combined_name
+            else:
+                division_name, team_entries = parse_ranking_table(content, source_hint=ranking.name)
+            previously_seen = _provenance_exists(conn, str(ranking), file_hash)
+            if previously_seen:
+                result.skipped_unchanged = True
+            # Build slug -> display name map from ranking
+            ranking_slug_map: Dict[str, str] = {}
+            for t in team_entries:
+                n = t.get("team_name")
+                if n:
+                    ranking_slug_map[_normalize_slug(n)] = n
+            with conn:
+                div_id = _upsert_division(conn, division_name)
+                if not previously_seen:
+                    for display in set(ranking_slug_map.values()):
+                        _upsert_team(conn, div_id, display)
+                    _record_provenance(conn, str(ranking), parser_version, file_hash)
+            division_folder = ranking.parent.name
+            div_rosters = roster_index.get(division_folder, {"by_id": {}, "by_slug": {}})
+            # Ingest each roster file exactly once
+            for team_ext_id, entry in div_rosters.get("by_id", {}).items():
+                if entry.path in processed_roster_paths:
+                    continue
+                processed_roster_paths.add(entry.path)
+                slug = entry.slug
+                # Prefer ranking display name; else synthesize
+                display_name = ranking_slug_map.get(slug)
+                if not display_name:
+                    display_name = re.sub(r"\s+", " ", slug.replace("_", " ").strip()).title()
+                roster_html = entry.path.read_text(encoding="utf-8", errors="ignore")
+                roster_hash = hash_html(roster_html)
+                if cache is not None:
+                    roster = cache.roster(
+                        roster_html, streaming=streaming, content_hash=roster_hash
+                    )
+                else:
+                    roster = extract_roster(roster_html, streaming=streaming)
+                # Title-based club + team designation
+                club_team = roster.club_team
+                combined_name = display_name
+                original_ranking_name = display_name
+                if club_team:
+                    club_name, team_designation = club_team
+                    # Build combined formatted name
+                    combined_name = f"{club_name} | {team_designation}"
+                # If combined differs, try to UPDATE existing ranking-named row to avoid duplicates
+                team_db_id: int
+                if combined_name != original_ranking_name:
+                    cur = conn.cursor()
                     cur.execute(
-                        "SELECT 1 FROM team WHERE division_id=? AND name=?",
-                        (div_id, combined_name),
+                        "SELECT team_id FROM team WHERE division_id=? AND name=?",
+                        (div_id, original_ranking_name),
                     )
-                    if cur.fetchone() is None:
+                    row = cur.fetchone()
+                    if row:
+                        # Ensure no existing row already has combined_name
                         cur.execute(
-                            "UPDATE team SET name=? WHERE team_id=?",
-                            (combined_name, row[0]),
+                            "SELECT 1 FROM team WHERE division_id=? AND name=?",
+                            (div_id, combined_name),
                         )
-                        team_db_id = int(row[0])
+                        if cur.fetchone() is None:
+                            cur.execute(
+                                "UPDATE team SET name=? WHERE team_id=?",
+                                (combined_name, row[0]),
+                            )
+                            team_db_id = int(row[0])
+                        else:
+                            team_db_id = _upsert_team(conn, div_id, combined_name)
                     else:
                         team_db_id = _upsert_team(conn, div_id, combined_name)
                 else:
                     team_db_id = _upsert_team(conn, div_id, combined_name)
-            else:
-                team_db_id = _upsert_team(conn, div_id, combined_name)
-            roster_hash = hash_html(roster_html)
-            existing = _provenance_exists(conn, str(entry.path), roster_hash)
-            players = extract_players(roster_html, team_id=str(team_db_id))
-            inserted = updated = 0
-            for p in players:
-                ins, upd = _upsert_player(conn, team_db_id, p.name, p.live_pz)
-                if ins:
-                    inserted += 1
-                if upd:
-                    updated += 1
-            if players:
-                result.inserted_players += inserted
-                result.updated_players += updated
-            if not existing:
-                _record_provenance(conn, str(entry.path), parser_version, roster_hash)
-        report.files.append(result)
+                existing = _provenance_exists(conn, str(entry.path), roster_hash)
+                players = roster.players_for(str(team_db_id))
+                inserted = updated = 0
+                for p in players:
+                    ins, upd = _upsert_player(conn, team_db_id, p.name, p.live_pz)
+                    if ins:
+                        inserted += 1
+                    if upd:
+                        updated += 1
+                if players:
+                    result.inserted_players += inserted
+                    result.updated_players += updated
+                if not existing:
+                    _record_provenance(conn, str(entry.path), parser_version, roster_hash)
+            report.files.append(result)
+    finally:
+        if parallel is not None:
+            parallel.close()
+    if cache is not None:
+        with conn:  # results of pages changed since they were cached
+            cache.prune()
+        report.parse_cache_hits, report.parse_cache_misses = cache.hits, cache.misses
     return report
 
 
@@ -394,6 +458,7 @@ class IncrementalRefreshResult:
         changed_files: Previously seen source files whose content hash changed, triggering re-parse.
         inserted_players: Aggregate inserted player rows (from underlying ingest logic).
         updated_players: Aggregate updated player rows.
+        manifest_hits: Files whose hash was taken from the scrape manifest instead of reading them.
         errors: Mapping of source_file -> error string for any failures while parsing/upserting. Errors do not stop the overall refresh unless critical (future enhancement: severity classification).
     """
 
@@ -404,6 +469,7 @@ class IncrementalRefreshResult:
     changed_files: int = 0
     inserted_players: int = 0
     updated_players: int = 0
+    manifest_hits: int = 0
     errors: Dict[str, str] = field(default_factory=dict)
 
 
@@ -411,6 +477,9 @@ def incremental_refresh(
     conn: sqlite3.Connection,
     root_path: str | Path,
     parser_version: str = PARSER_VERSION_DEFAULT,
+    manifest=None,
+    *,
+    parse_cache: bool | None = None,
 ) -> IncrementalRefreshResult:
     """Perform an incremental refresh of HTML assets under `root_path`.
 
@@ -428,13 +497,34 @@ def incremental_refresh(
     Returns a summary object with counts. Errors for individual files are captured; a failure does not abort
     other file processing (best-effort incremental semantics).
 
-    NOTE: Implementation TBD in subsequent step (Milestone 3.7). Currently returns an empty result placeholder.
+    With a ``manifest`` (`services.scrape_manifest.ScrapeManifest` of `root_path`) the candidate
+    files are the ranking tables and rosters it lists (no tree walk), and files whose size and
+    mtime still match their entry are classified by the recorded sha256 without being read.
+    New and changed files are parsed through `db.parse_cache` unless ``parse_cache`` (default:
+    ``settings.INGEST_PARSE_CACHE``) is off.
     """
     root = Path(root_path)
     result = IncrementalRefreshResult()
-
-    ranking_files = list(root.rglob("ranking_table_*.html"))
-    roster_files = list(root.rglob("team_roster_*.html"))
+    if parse_cache is None:
+        parse_cache = settings.INGEST_PARSE_CACHE
+    cache = ParseCache(conn, parser_version) if parse_cache else None
+
+    # path -> sha256 recorded by the scrape manifest for files unchanged since written
+    manifest_hashes: Dict[str, str] = {}
+    if manifest is None:
+        ranking_files = list(root.rglob("ranking_table_*.html"))
+        roster_files = list(root.rglob("team_roster_*.html"))
+    else:
+        ranking_files, roster_files = [], []
+        for kind, files in (("ranking_table", ranking_files), ("team_roster", roster_files)):
+            for rel in manifest.relpaths(kind):
+                path = root.joinpath(*rel.split("/"))
+                entry = manifest.entry_for(rel, str(path))
+                if entry is not None:
+                    manifest_hashes[str(path)] = entry.sha256
+                elif not path.is_file():
+                    continue
+                files.append(path)
 
     # Build provenance map: source_file -> hash (latest). We assume (source_file, hash) uniqueness, so we fetch latest by insertion order.
     prov_cur = conn.cursor()
@@ -450,12 +540,16 @@ def incremental_refresh(
 
     # Helper classification
     def classify_file(path: Path) -> tuple[str, str]:
-        try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
-        except Exception as e:  # capture IO errors
-            result.errors[str(path)] = f"read_error: {e}"  # will count as processed but not parsed
-            return "error", ""
-        file_hash = hash_html(content)
+        file_hash = manifest_hashes.get(str(path))
+        if file_hash is not None:
+            result.manifest_hits += 1
+        else:
+            try:
+                content = path.read_text(encoding="utf-8", errors="ignore")
+            except Exception as e:  # capture IO errors
+                result.errors[str(path)] = f"read_error: {e}"  # counts as processed, not parsed
+                return "error", ""
+            file_hash = hash_html(content)
         prior = provenance.get(str(path))
         if prior is None:
             prior = provenance.get(path.name)
@@ -519,9 +613,14 @@ def incremental_refresh(
             continue
         try:
             content = ranking_path.read_text(encoding="utf-8", errors="ignore")
-            division_name, team_entries = parse_ranking_table(
-                content, source_hint=ranking_path.name
-            )
+            if cache is not None:
+                division_name, team_entries = cache.ranking(
+                    content, ranking_path.name, content_hash=file_hash or None
+                )
+            else:
+                division_name, team_entries = parse_ranking_table(
+                    content, source_hint=ranking_path.name
+                )
         except Exception as e:  # parsing error
             result.errors[path_str] = f"parse_error: {e}"
             continue
@@ -589,7 +688,12 @@ def incremental_refresh(
                             continue
                         try:
                             roster_html = roster_path.read_text(encoding="utf-8", errors="ignore")
-                            players = extract_players(roster_html, team_id=str(team_id))
+                            if cache is not None:
+                                players = cache.roster(
+                                    roster_html, content_hash=roster_hash or None
+                                ).players_for(str(team_id))
+                            else:
+                                players = extract_players(roster_html, team_id=str(team_id))
                         except Exception as e:
                             result.errors[str(roster_path)] = f"roster_parse_error: {e}"
                             continue
@@ -662,6 +766,9 @@ def incremental_refresh(
                 # Let transaction rollback automatically; continue with next file
                 continue
 
+    if cache is not None:
+        with conn:
+            cache.prune()
     return result
 
 
@@ -0,0 +1,126 @@
+"""Process-pool parsing ahead of a single SQLite writer.
+
+`ParallelParser` parses pages on a ``ProcessPoolExecutor`` into the plain JSON
+records `db.parse_cache` stores (ranking division + teams, roster players + matches,
+ranking rows) and primes them into a `ParseCache`, one group (division) at a time,
+in the order the writer asks for them. The writer is the thread owning the sqlite3
+connection (connections are bound to their thread); it keeps running the serial
+ingest code, so row order, transactions / SAVEPOINTs and per-division error
+handling are unchanged - it just finds each page already parsed.
+
+Workers read and hash the page themselves (with the reader the consumer uses, so
+the content hash matches) and skip pages whose result is already cached. A page a
+worker fails on is not primed: the writer parses it inline and reports the error
+exactly as in serial mode. A broken pool degrades the same way.
+
+Public API:
+ - ParseJob(path, parser, parse, read=read_text)
+ - ParallelParser(cache, workers).schedule(group, jobs) / .ready(group) / .close()
+ - read_text(path): the UTF-8 (errors ignored) reader of `db.ingest`
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from db.parse_cache import ParseCache, content_sha256
+
+__all__ = ["ParseJob", "ParallelParser", "read_text"]
+
+
+def read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="ignore")
+
+
+@dataclass(frozen=True)
+class ParseJob:
+    """One page to parse; ``parse`` and ``read`` must be picklable (module-level / partial)."""
+
+    path: str
+    parser: str  # parse cache entry name
+    parse: Callable[[str], Any]
+    read: Callable[[Path], str] = read_text
+
+
+# (content_hash, parser) already cached when the pool started (set per worker process)
+_CACHED: frozenset = frozenset()
+
+
+def _init_worker(cached: frozenset) -> None:
+    global _CACHED
+    _CACHED = cached
+
+
+def _run_job(job: ParseJob) -> Tuple[Optional[str], Any]:
+    """(content_hash, result) of a job; result None when cached, unreadable or failing."""
+    try:
+        content = job.read(Path(job.path))
+    except Exception:
+        return None, None
+    content_hash = content_sha256(content)
+    if (content_hash, job.parser) in _CACHED:
+        return content_hash, None
+    try:
+        return content_hash, job.parse(content)
+    except Exception:
+        return content_hash, None  # the writer parses inline and reports the error
+
+
+class ParallelParser:
+    """Parse scheduled groups of pages on ``workers`` processes ahead of the writer."""
+
+    def __init__(self, cache: ParseCache, workers: int) -> None:
+        self.cache = cache
+        self.workers = workers
+        # spawn: the writer may run in a worker thread (GUI), where fork is unsafe
+        self._pool: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(cache.cached_keys(),),
+        )
+        self._groups: Dict[Hashable, List[Tuple[ParseJob, Future]]] = {}
+
+    def schedule(self, group: Hashable, jobs: Sequence[ParseJob]) -> None:
+        """Submit the pages of ``group`` (parsed in submission order across groups)."""
+        if self._pool is None:
+            return
+        try:
+            futures = [(job, self._pool.submit(_run_job, job)) for job in jobs]
+        except Exception:  # broken / shut down pool: the writer parses inline
+            self.close()
+            return
+        self._groups.setdefault(group, []).extend(futures)
+
+    def ready(self, group: Hashable) -> int:
+        """Wait for ``group`` and prime its results into the cache; returns pages primed."""
+        primed = 0
+        for job, future in self._groups.pop(group, []):
+            try:
+                content_hash, result = future.result()
+            except Exception:
+                continue
+            if content_hash is not None and result is not None:
+                self.cache.prime(content_hash, job.parser, result)
+                primed += 1
+        return primed
+
+    def close(self) -> None:
+        # Cancel what has not started yet (shutdown(cancel_futures=True) needs Python 3.9)
+        for futures in self._groups.values():
+            for _job, future in futures:
+                future.cancel()
+        self._groups.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "ParallelParser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
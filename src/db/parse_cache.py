@@ -0,0 +1,321 @@
+"""Persistent Parse Cache
+
+Stores the extraction result of a page in the ``parse_cache`` table keyed by
+(content sha256, parser name, parser version), so a page whose bytes did not change
+is never parsed twice - across ingest runs, `incremental_refresh`, and the GUI
+`IngestionCoordinator`, which share the table through the same database.
+
+Results are stored as JSON. The first time a parser version opens the cache
+(recorded in ``parse_cache_version``) the entries of every other version are
+deleted, so bumping ``db.ingest.PARSER_VERSION_DEFAULT`` invalidates the cached
+results once; callers using different versions on one database afterwards keep
+their own entries. `ParseCache.prune` (run at the end of an ingest) deletes the
+results of pages that are no longer current, i.e. whose hash is neither the latest
+``ingest_provenance`` hash of a source file nor used by that ingest. Each cache
+counts its hits and misses (`stats`). A cache with ``persist=False`` keeps its entries in memory
+for one run (used to hand `db.parallel_parse` results to the writer when caching is off).
+
+Public API:
+ - ParseCache(conn, parser_version); ParseCache.prune() -> entries deleted
+ - ParseCache.get_or_parse(content, parser, parse, content_hash=None) -> JSON-able result
+ - ParseCache.roster(html, streaming=False) -> RosterExtract
+ - extract_roster(html, streaming=False) -> RosterExtract (uncached)
+ - roster_payload / ranking_payload: the stored results, computed without a cache
+ - ParseCache.ranking(html, source_hint=None) -> (division_name, teams)
+ - cached_parsers(conn, content_hash, parser_version) -> parsers holding a result (read-only)
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import sqlite3
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from domain.models import Match, Player
+from parsing.ranking_parser import parse_ranking_table
+from parsing.roster_parser import ParsedRoster, club_and_team_from_title
+from parsing.roster_stream import stream_roster
+
+__all__ = [
+    "PARSE_CACHE_DDL",
+    "PARSE_CACHE_VERSION_DDL",
+    "ParseCache",
+    "RosterExtract",
+    "cached_parsers",
+    "content_sha256",
+    "extract_roster",
+    "ranking_payload",
+    "roster_payload",
+]
+
+PARSE_CACHE_DDL = (
+    "CREATE TABLE IF NOT EXISTS parse_cache ("
+    " content_hash TEXT NOT NULL,"
+    " parser TEXT NOT NULL,"
+    " parser_version TEXT NOT NULL,"
+    " payload TEXT NOT NULL,"
+    " created_at TEXT DEFAULT CURRENT_TIMESTAMP,"
+    " PRIMARY KEY(content_hash, parser, parser_version)"
+    ")"
+)
+# Parser versions that have opened the cache (a new one purges the others' entries once)
+PARSE_CACHE_VERSION_DDL = (
+    "CREATE TABLE IF NOT EXISTS parse_cache_version ("
+    " parser_version TEXT PRIMARY KEY,"
+    " first_seen_at TEXT DEFAULT CURRENT_TIMESTAMP"
+    ")"
+)
+# Latest content hash of every ingested source file
+_CURRENT_HASHES_SQL = (
+    "SELECT hash FROM ingest_provenance p WHERE provenance_id ="
+    " (SELECT MAX(provenance_id) FROM ingest_provenance q WHERE q.source_file = p.source_file)"
+)
+
+
+def content_sha256(content: str) -> str:
+    """Same digest as `db.ingest.hash_html` (sha256 of the UTF-8 text)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def cached_parsers(conn: sqlite3.Connection, content_hash: str, parser_version: str) -> List[str]:
+    """Names of the parsers with a cached result for ``content_hash`` (no table: none)."""
+    try:
+        rows = conn.execute(
+            "SELECT parser FROM parse_cache WHERE content_hash=? AND parser_version=?"
+            " ORDER BY parser",
+            (content_hash, parser_version),
+        ).fetchall()
+    except sqlite3.Error:
+        return []
+    return [str(r[0]) for r in rows]
+
+
+@dataclass
+class RosterExtract:
+    """Team-independent result of a roster page (`roster_parser` semantics)."""
+
+    club_team: Optional[Tuple[str, str]] = None
+    players: List[Tuple[str, Optional[int]]] = field(default_factory=list)
+    matches: List[Dict[str, Any]] = field(default_factory=list)  # Match fields minus team_id
+
+    def players_for(self, team_id: str) -> List[Player]:
+        return [Player(team_id=team_id, name=n, live_pz=pz) for n, pz in self.players]
+
+    def matches_for(self, team_id: str) -> List[Match]:
+        return [Match(team_id=team_id, **m) for m in self.matches]
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "club_team": list(self.club_team) if self.club_team else None,
+            "players": [list(p) for p in self.players],
+            "matches": self.matches,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "RosterExtract":
+        club_team = payload.get("club_team")
+        return cls(
+            club_team=(club_team[0], club_team[1]) if club_team else None,
+            players=[(n, pz) for n, pz in payload.get("players", [])],
+            matches=list(payload.get("matches", [])),
+        )
+
+
+def extract_roster(html: str, *, streaming: bool = False) -> RosterExtract:
+    """Uncached `RosterExtract` (``streaming`` uses `parsing.roster_stream`, no tree)."""
+    if streaming:
+        matches, players = stream_roster(html, team_id="")
+        club_team = club_and_team_from_title(html)
+    else:
+        page = ParsedRoster(html)
+        matches, players = page.matches(team_id=""), page.players(team_id="")
+        club_team = page.club_and_team()
+    rows = []
+    for m in matches:
+        row = asdict(m)
+        del row["team_id"]
+        rows.append(row)
+    return RosterExtract(
+        club_team=club_team, players=[(p.name, p.live_pz) for p in players], matches=rows
+    )
+
+
+def roster_payload(html: str, streaming: bool = False) -> Dict[str, Any]:
+    """Stored form of `extract_roster` (entry ``roster_parser``)."""
+    return extract_roster(html, streaming=streaming).to_payload()
+
+
+def ranking_payload(html: str, source_hint: str | None = None) -> Dict[str, Any]:
+    """Stored form of ``parse_ranking_table`` (entry ``ranking_parser``)."""
+    return {"hint": source_hint, "result": parse_ranking_table(html, source_hint)}
+
+
+class ParseCache:
+    """Parse results of one ``parser_version`` in the ``parse_cache`` table of ``conn``.
+
+    Writes join the caller's current transaction (a rolled-back ingest drops its entries);
+    a failing lookup or write (e.g. the table rolled back with a savepoint) only costs a parse.
+    """
+
+    def __init__(
+        self, conn: sqlite3.Connection, parser_version: str, *, persist: bool = True
+    ) -> None:
+        self.conn = conn
+        self.parser_version = parser_version
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[Tuple[str, str], str] = {}  # entries of a persist=False cache
+        self._primed: set[Tuple[str, str]] = set()
+        self._used: set[str] = set()  # content hashes looked up or stored by this cache
+        if persist:
+            conn.execute(PARSE_CACHE_DDL)
+            conn.execute(PARSE_CACHE_VERSION_DDL)
+            first_use = conn.execute(
+                "INSERT OR IGNORE INTO parse_cache_version(parser_version) VALUES (?)",
+                (parser_version,),
+            ).rowcount
+            if first_use:
+                # A new parser version: results of the versions before it are stale
+                conn.execute("DELETE FROM parse_cache WHERE parser_version != ?", (parser_version,))
+
+    def stats(self) -> Dict[str, int]:
+        if not self.persist:
+            entries = len(self._memory)
+        else:
+            (entries,) = self.conn.execute(
+                "SELECT COUNT(*) FROM parse_cache WHERE parser_version=?", (self.parser_version,)
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": int(entries)}
+
+    def cached_keys(self) -> frozenset:
+        """(content_hash, parser) of every stored result."""
+        if not self.persist:
+            return frozenset(self._memory)
+        try:
+            rows = self.conn.execute(
+                "SELECT content_hash, parser FROM parse_cache WHERE parser_version=?",
+                (self.parser_version,),
+            ).fetchall()
+        except sqlite3.Error:
+            return frozenset()
+        return frozenset((str(h), str(p)) for h, p in rows)
+
+    def prime(self, content_hash: str, parser: str, result: Any) -> None:
+        """Store a result parsed elsewhere in this run (its first use counts as a miss)."""
+        self.store(content_hash, parser, result)
+        self._primed.add((content_hash, parser))
+
+    def lookup(self, content_hash: str, parser: str) -> Any | None:
+        if not self.persist:
+            raw = self._memory.get((content_hash, parser))
+            return json.loads(raw) if raw is not None else None
+        try:
+            row = self.conn.execute(
+                "SELECT payload FROM parse_cache"
+                " WHERE content_hash=? AND parser=? AND parser_version=?",
+                (content_hash, parser, self.parser_version),
+            ).fetchone()
+            return json.loads(row[0]) if row is not None else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def store(self, content_hash: str, parser: str, result: Any) -> None:
+        if not self.persist:
+            self._memory[(content_hash, parser)] = json.dumps(result, ensure_ascii=False)
+            return
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO parse_cache(content_hash, parser, parser_version, payload)"
+                " VALUES (?,?,?,?)",
+                (content_hash, parser, self.parser_version, json.dumps(result, ensure_ascii=False)),
+            )
+        except sqlite3.Error:
+            pass
+
+    def prune(self) -> int:
+        """Delete the entries of pages that are no longer current; returns entries deleted.
+
+        Kept are the latest ``ingest_provenance`` hash of each source file and every hash
+        this cache looked up or stored. Without an ``ingest_provenance`` table nothing is
+        deleted (what is current cannot be told).
+        """
+        if not self.persist:
+            return 0
+        try:
+            keep = {str(r[0]) for r in self.conn.execute(_CURRENT_HASHES_SQL)} | self._used
+            stale = [
+                (str(r[0]),)
+                for r in self.conn.execute("SELECT DISTINCT content_hash FROM parse_cache")
+                if str(r[0]) not in keep
+            ]
+            if stale:
+                self.conn.executemany("DELETE FROM parse_cache WHERE content_hash=?", stale)
+        except sqlite3.Error:
+            return 0
+        return len(stale)
+
+    def get_or_parse(
+        self,
+        content: str,
+        parser: str,
+        parse: Callable[[str], Any],
+        *,
+        content_hash: str | None = None,
+        accept: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Cached result of ``parser`` for ``content``; on a miss ``parse(content)`` is stored.
+
+        ``parse`` must return a JSON-serializable value (tuples come back as lists).
+        ``accept`` can reject a cached payload (counted as a miss and re-parsed).
+        """
+        content_hash = content_hash or content_sha256(content)
+        self._used.add(content_hash)
+        cached = self.lookup(content_hash, parser)
+        if cached is not None and (accept is None or accept(cached)):
+            if (content_hash, parser) in self._primed:
+                self._primed.discard((content_hash, parser))
+                self.misses += 1
+            else:
+                self.hits += 1
+            return cached
+        self.misses += 1
+        result = parse(content)
+        self.store(content_hash, parser, result)
+        return result
+
+    # Built-in parsers ---------------------------------------------------
+    def roster(
+        self, html: str, *, streaming: bool = False, content_hash: str | None = None
+    ) -> RosterExtract:
+        """Club/team title, players and matches of a roster page.
+
+        Tree and streaming extraction give identical results and share one entry.
+        """
+        payload = self.get_or_parse(
+            html,
+            "roster_parser",
+            lambda text: roster_payload(text, streaming),
+            content_hash=content_hash,
+        )
+        return RosterExtract.from_payload(payload)
+
+    def ranking(
+        self, html: str, source_hint: str | None = None, *, content_hash: str | None = None
+    ) -> Tuple[str, List[dict]]:
+        """``parse_ranking_table(html, source_hint)``.
+
+        The division name may come from ``source_hint``, so an entry is reused only for
+        the same hint.
+        """
+        payload = self.get_or_parse(
+            html,
+            "ranking_parser",
+            lambda text: ranking_payload(text, source_hint),
+            content_hash=content_hash,
+            accept=lambda cached: cached.get("hint") == source_hint,
+        )
+        division_name, teams = payload["result"]
+        return division_name, teams
@@ -9,6 +9,7 @@ nodes correspond to teams and contain the TeamEntry reference for selection.
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
 from typing import List, Optional, Any, Dict
 from PyQt6.QtCore import Qt, QModelIndex, QAbstractItemModel
@@ -167,6 +168,36 @@ class NavigationTreeModel(QAbstractItemModel):  # pragma: no cover - exercised v
         node._pending_teams = None
         self.endInsertRows()
 
+    def upsert_division(self, division: str, teams: List[TeamEntry]) -> None:
+        """Insert or replace the teams of one division (incremental refresh).
+
+        Used while divisions are ingested one by one during a scrape: other
+        division nodes, their loaded state and the view's expansion state are
+        left untouched. A replaced division that was already loaded is
+        repopulated immediately; otherwise its teams stay pending until accessed.
+        """
+        for row, node in enumerate(self._root.children):
+            if node.label != division:
+                continue
+            was_loaded = node._loaded
+            if node.children:
+                self.beginRemoveRows(self.createIndex(row, 0, node), 0, len(node.children) - 1)
+                node.children = []
+                self.endRemoveRows()
+            node._loaded = False
+            node._pending_teams = list(teams)
+            if was_loaded:
+                self._load_division(node)
+            return
+        labels = [n.label for n in self._root.children]
+        row = bisect.bisect_left(labels, division)
+        div_node = NavNode(label=division, kind="division", parent=self._root)
+        div_node._loaded = False
+        div_node._pending_teams = list(teams)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._root.children.insert(row, div_node)
+        self.endInsertRows()
+
     def _create_index_for(self, node: NavNode) -> QModelIndex:
         if node is self._root:
             return QModelIndex()
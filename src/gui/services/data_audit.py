@@ -11,8 +11,9 @@ support change detection planning and coverage reporting.
 from __future__ import annotations
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import hashlib
+import os
 
 __all__ = [
     "AuditFileInfo",
@@ -83,65 +84,57 @@ class DataAuditService:
         for root, dirs, files in self._walk():  # noqa: B007
             p = Path(root)
             for fname in files:
-                if not fname.endswith(".html"):
-                    continue
-                if fname.startswith(self.RANKING_PREFIX):
-                    # Backward-compatible removal of prefix/suffix (avoid str.removeprefix for <3.9)
-                    base = fname
-                    if base.startswith(self.RANKING_PREFIX):
-                        base = base[len(self.RANKING_PREFIX) :]
-                    if base.endswith(".html"):
-                        base = base[:-5]
-                    division = base
-                    info = self._file_info(p / fname)
-                    audit = divisions.setdefault(
-                        division,
-                        DivisionAudit(division=division, ranking_table=None, team_rosters={}),
-                    )
-                    audit.ranking_table = info
-                elif fname.startswith(self.TEAM_PREFIX):
-                    # Format (observed): team_roster_<division>_<Team_Name_...>_<id>.html
-                    base = fname
-                    if base.endswith(".html"):
-                        base = base[:-5]
-                    if base.startswith(self.TEAM_PREFIX):
-                        base = base[len(self.TEAM_PREFIX) :]
-                    stem = base
-                    tokens = stem.split("_")
-                    if len(tokens) < 3:  # need at least division + name + id
-                        continue
-                    team_id = tokens[-1]
-                    # Reconstruct division by matching longest prefix that appears as a ranking_table_<division>.html in same dir (if present)
-                    ranking_candidates = set()
-                    for dn in files:
-                        if not dn.startswith(self.RANKING_PREFIX):
-                            continue
-                        rbase = dn
-                        if rbase.startswith(self.RANKING_PREFIX):
-                            rbase = rbase[len(self.RANKING_PREFIX) :]
-                        if rbase.endswith(".html"):
-                            rbase = rbase[:-5]
-                        ranking_candidates.add(rbase)
-                    division = None
-                    for i in range(
-                        len(tokens) - 2, 0, -1
-                    ):  # leave at least one token for team name + id
-                        candidate = "_".join(tokens[:i])
-                        if candidate in ranking_candidates:
-                            division = candidate
-                            team_name_tokens = tokens[i:-1]
-                            break
-                    if division is None:
-                        # Fallback: first token as division
-                        division = tokens[0]
-                        team_name_tokens = tokens[1:-1]
-                    team_name = " ".join(t.replace("-", " ") for t in team_name_tokens) or stem
-                    info = self._file_info(p / fname)
-                    audit = divisions.setdefault(
-                        division,
-                        DivisionAudit(division=division, ranking_table=None, team_rosters={}),
-                    )
-                    audit.team_rosters[team_name] = info
+                self._add_file(divisions, p, fname, files)
+        return self._result(divisions)
+
+    def run_files(self, paths: Iterable[str]) -> DataAuditResult:
+        """Audit only ``paths`` (e.g. the files the scraper wrote for one division).
+
+        Roster files are assigned to divisions exactly as in `run`: the ranking tables
+        next to them are listed (one directory listing per folder, no tree walk).
+        """
+        divisions: Dict[str, DivisionAudit] = {}
+        by_dir: Dict[Path, List[str]] = {}
+        for raw in paths:
+            path = Path(raw)
+            by_dir.setdefault(path.parent, []).append(path.name)
+        for folder, names in by_dir.items():
+            try:
+                siblings = [f for f in os.listdir(folder) if f.startswith(self.RANKING_PREFIX)]
+            except OSError:
+                siblings = []
+            listing = sorted(set(siblings) | set(names))
+            for fname in names:
+                if (folder / fname).exists():
+                    self._add_file(divisions, folder, fname, listing)
+        return self._result(divisions)
+
+    def run_manifest(self, manifest) -> DataAuditResult:
+        """Audit the ranking tables and rosters listed in a `services.scrape_manifest` manifest.
+
+        No tree walk and no directory listings: files are taken from the manifest, and
+        their recorded sha1 is reused while size and mtime still match (others are
+        hashed as in `run`). Files the manifest does not list are not discovered.
+        """
+        divisions: Dict[str, DivisionAudit] = {}
+        by_dir: Dict[Path, List[str]] = {}
+        known: Dict[str, AuditFileInfo] = {}
+        for rel in manifest.relpaths("ranking_table", "team_roster"):
+            path = self.base_dir.joinpath(*rel.split("/"))
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entry = manifest.entries[rel]
+            if entry.matches(st):
+                known[str(path)] = AuditFileInfo(path=str(path), size=entry.size, sha1=entry.sha1)
+            by_dir.setdefault(path.parent, []).append(path.name)
+        for folder, names in by_dir.items():
+            for fname in names:
+                self._add_file(divisions, folder, fname, names, known)
+        return self._result(divisions)
+
+    def _result(self, divisions: Dict[str, DivisionAudit]) -> DataAuditResult:
         # Aggregate stats
         ranking_count = sum(1 for d in divisions.values() if d.ranking_table)
         roster_count = sum(len(d.team_rosters) for d in divisions.values())
@@ -151,6 +144,72 @@ class DataAuditService:
             total_team_rosters=roster_count,
         )
 
+    def _add_file(
+        self,
+        divisions: Dict[str, DivisionAudit],
+        p: Path,
+        fname: str,
+        files: List[str],
+        known: Optional[Dict[str, AuditFileInfo]] = None,
+    ) -> None:
+        if not fname.endswith(".html"):
+            return
+        if fname.startswith(self.RANKING_PREFIX):
+            # Backward-compatible removal of prefix/suffix (avoid str.removeprefix for <3.9)
+            base = fname
+            if base.startswith(self.RANKING_PREFIX):
+                base = base[len(self.RANKING_PREFIX) :]
+            if base.endswith(".html"):
+                base = base[:-5]
+            division = base
+            info = (known or {}).get(str(p / fname)) or self._file_info(p / fname)
+            audit = divisions.setdefault(
+                division,
+                DivisionAudit(division=division, ranking_table=None, team_rosters={}),
+            )
+            audit.ranking_table = info
+        elif fname.startswith(self.TEAM_PREFIX):
+            # Format (observed): team_roster_<division>_<Team_Name_...>_<id>.html
+            base = fname
+            if base.endswith(".html"):
+                base = base[:-5]
+            if base.startswith(self.TEAM_PREFIX):
+                base = base[len(self.TEAM_PREFIX) :]
+            stem = base
+            tokens = stem.split("_")
+            if len(tokens) < 3:  # need at least division + name + id
+                return
+            team_id = tokens[-1]
+            # Reconstruct division by matching longest prefix that appears as a ranking_table_<division>.html in same dir (if present)
+            ranking_candidates = set()
+            for dn in files:
+                if not dn.startswith(self.RANKING_PREFIX):
+                    continue
+                rbase = dn
+                if rbase.startswith(self.RANKING_PREFIX):
+                    rbase = rbase[len(self.RANKING_PREFIX) :]
+                if rbase.endswith(".html"):
+                    rbase = rbase[:-5]
+                ranking_candidates.add(rbase)
+            division = None
+            for i in range(len(tokens) - 2, 0, -1):  # leave at least one token for team name + id
+                candidate = "_".join(tokens[:i])
+                if candidate in ranking_candidates:
+                    division = candidate
+                    team_name_tokens = tokens[i:-1]
+                    break
+            if division is None:
+                # Fallback: first token as division
+                division = tokens[0]
+                team_name_tokens = tokens[1:-1]
+            team_name = " ".join(t.replace("-", " ") for t in team_name_tokens) or stem
+            info = (known or {}).get(str(p / fname)) or self._file_info(p / fname)
+            audit = divisions.setdefault(
+                division,
+                DivisionAudit(division=division, ranking_table=None, team_rosters={}),
+            )
+            audit.team_rosters[team_name] = info
+
     # Internal ------------------------------------------------------
     def _walk(self):  # pragma: no cover - simple passthrough
         return [(str(p), dirs, files) for p, dirs, files in self._os_walk(self.base_dir)]
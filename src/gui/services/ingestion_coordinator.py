@@ -13,8 +13,8 @@ import sqlite3
 import json
 import time
 from typing import Optional
-import re
 
+from config import settings
 from .data_audit import DataAuditService
 from .event_bus import EventBus, Event  # type: ignore
 import threading
@@ -42,26 +42,49 @@ class IngestionSummary:
     skipped_files: int = 0
     processed_files: int = 0
     errors: list[IngestError] = field(default_factory=list)
+    parse_cache_hits: int = 0
+    parse_cache_misses: int = 0
 
 
 class IngestionCoordinator:
     def __init__(
-        self, base_dir: str, conn: sqlite3.Connection, event_bus: Optional[EventBus] = None
+        self,
+        base_dir: str,
+        conn: sqlite3.Connection,
+        event_bus: Optional[EventBus] = None,
+        *,
+        streaming_parser: bool | None = None,
+        parse_cache: bool | None = None,
+        parse_workers: int | None = None,
     ):
         self.base_dir = Path(base_dir)
         self.conn = conn
         self.event_bus = event_bus
+        # Extract roster players / matches with parsing.roster_stream instead of a parsed tree
+        self.streaming_parser = (
+            settings.INGEST_STREAMING_PARSER if streaming_parser is None else streaming_parser
+        )
+        # Reuse db.parse_cache results of unchanged pages (shared with db.ingest via the DB)
+        self.use_parse_cache = settings.INGEST_PARSE_CACHE if parse_cache is None else parse_cache
+        self._cache = None
+        # Worker processes parsing division pages ahead of this (writer) thread
+        self.parse_workers = (
+            settings.INGEST_PARSE_WORKERS if parse_workers is None else parse_workers
+        )
         self._singular_mode = True
         self._table_division = "division"
         self._table_team = "team"
         self._table_club = "club"
         self._table_player = "player"
         self._table_ranking = "division_ranking"
+        # division -> {path: sha1} ingested by `ingest_division` (streamed while scraping);
+        # `run` skips those divisions while their files are unchanged
+        self._streamed: dict[str, dict[str, str]] = {}
         self._detect_schema()
 
-    def run(self, *, force: bool = False) -> IngestionSummary:
-        start_ts = time.time()
+    def _prepare_tables(self) -> None:
         self._ensure_provenance_table()
+        self._parse_cache()
         self._ensure_normalized_provenance_view()
         if self._singular_mode:
             self._ensure_id_map_table()
@@ -71,7 +94,42 @@ class IngestionCoordinator:
             self._table_team = "teams"
             self._table_club = "clubs"
             self._table_player = "players"
-        audit = DataAuditService(str(self.base_dir)).run()
+
+    def _parse_cache(self):
+        """The `db.parse_cache.ParseCache` of ``conn`` (None when disabled or unavailable)."""
+        if self._cache is None and self.use_parse_cache:
+            try:
+                from db.ingest import PARSER_VERSION_DEFAULT
+                from db.parse_cache import ParseCache
+
+                self._cache = ParseCache(self.conn, PARSER_VERSION_DEFAULT)
+            except Exception:
+                self.use_parse_cache = False
+        return self._cache
+
+    def parse_cache_stats(self) -> dict[str, int]:
+        """Hit / miss counts of this coordinator's parse cache (zeros when disabled)."""
+        cache = self._parse_cache()
+        return cache.stats() if cache is not None else {"hits": 0, "misses": 0, "entries": 0}
+
+    @staticmethod
+    def _division_files(d) -> dict[str, str]:
+        files = {info.path: info.sha1 for info in d.team_rosters.values()}
+        if d.ranking_table:
+            files[d.ranking_table.path] = d.ranking_table.sha1
+        return files
+
+    def run(self, *, force: bool = False, manifest=None) -> IngestionSummary:
+        """Ingest every audited division (unchanged files are skipped by provenance hash).
+
+        ``manifest`` (a `services.scrape_manifest.ScrapeManifest` of ``base_dir``) replaces
+        the directory walk: only the ranking tables and rosters it lists are audited, with
+        their recorded hashes reused for files unchanged since the scrape wrote them.
+        """
+        start_ts = time.time()
+        self._prepare_tables()
+        auditor = DataAuditService(str(self.base_dir))
+        audit = auditor.run() if manifest is None else auditor.run_manifest(manifest)
         logger = _IngestEventLogger.try_create(self.base_dir)
         if logger:
             logger.emit(
@@ -81,58 +139,31 @@ class IngestionCoordinator:
                     "divisions_discovered": len(audit.divisions),
                     "total_rosters": audit.total_team_rosters,
                     "total_rankings": audit.total_ranking_tables,
+                    "manifest": manifest is not None,
                 },
             )
-        divisions_ingested = teams_ingested = players_ingested = 0
-        skipped_files = processed_files = 0
-        errors: list[IngestError] = []
-        for idx, d in enumerate(audit.divisions, start=1):
-            sp = f"div_ingest_{idx}"
-            try:
-                self.conn.execute(f"SAVEPOINT {sp}")
-                if logger:
-                    logger.emit("division.start", {"division": d.division, "index": idx})
-                # Some test subclasses override _ingest_single_division without a force kwarg.
-                try:
-                    result = self._ingest_single_division(d, force=force)  # type: ignore[arg-type]
-                except TypeError:
-                    # Retry without keyword for backward compatibility in tests
-                    result = self._ingest_single_division(d)  # type: ignore[call-arg]
-                if result is None:
-                    self.conn.execute(f"RELEASE SAVEPOINT {sp}")
-                    if logger:
-                        logger.emit("division.skipped", {"division": d.division})
+        divisions = audit.divisions
+        streamed_skipped = 0
+        if self._streamed and not force:
+            pending = []
+            for d in divisions:
+                files = self._division_files(d)
+                if self._streamed.get(d.division) == files:
+                    streamed_skipped += len(files)
                     continue
-                div_add, team_add, player_add, skip_delta, proc_delta = result
-                divisions_ingested += div_add
-                teams_ingested += team_add
-                players_ingested += player_add
-                skipped_files += skip_delta
-                processed_files += proc_delta
-                self.conn.execute(f"RELEASE SAVEPOINT {sp}")
-                if logger:
-                    logger.emit(
-                        "division.success",
-                        {
-                            "division": d.division,
-                            "teams": team_add,
-                            "players": player_add,
-                            "processed": proc_delta,
-                            "skipped": skip_delta,
-                        },
-                    )
-            except Exception as e:  # noqa: BLE001
-                try:
-                    self.conn.execute(f"ROLLBACK TO {sp}")
-                    self.conn.execute(f"RELEASE SAVEPOINT {sp}")
-                except Exception:
-                    pass
-                err = IngestError(division=d.division, message=str(e))
-                errors.append(err)
-                self._persist_error(err)
-                if logger:
-                    logger.emit("division.error", {"division": d.division, "message": str(e)})
-                continue
+                pending.append(d)
+            divisions = pending
+        totals, errors = self._ingest_divisions(divisions, force=force, logger=logger)
+        divisions_ingested, teams_ingested, players_ingested, skipped_files, processed_files = (
+            totals
+        )
+        if self._cache is not None:
+            try:  # results of pages changed since they were cached
+                self._cache.prune()
+                self.conn.commit()
+            except Exception:
+                pass
+        skipped_files += streamed_skipped
         summary = IngestionSummary(
             divisions_ingested=divisions_ingested,
             teams_ingested=teams_ingested,
@@ -141,6 +172,9 @@ class IngestionCoordinator:
             processed_files=processed_files,
             errors=errors,
         )
+        if self._cache is not None:
+            summary.parse_cache_hits = self._cache.hits
+            summary.parse_cache_misses = self._cache.misses
         if logger:
             logger.emit("ingest.complete", {**asdict(summary), "error_count": len(errors)})
         # Post-pass cleanup (best effort): normalize any duplicated or legacy formatted team names.
@@ -211,6 +245,163 @@ class IngestionCoordinator:
                 pass
         return summary
 
+    def _ingest_divisions(
+        self, divisions, *, force: bool, logger
+    ) -> tuple[tuple[int, int, int, int, int], list[IngestError]]:
+        """Ingest audited divisions, each in its own SAVEPOINT (a failing one is rolled back).
+
+        Each division is committed once its savepoint is released or rolled back.
+
+        With ``parse_workers`` > 1 their pages are parsed on a process pool ahead of the
+        loop, which still applies every division here, in order (single writer).
+        """
+        divisions_ingested = teams_ingested = players_ingested = 0
+        skipped_files = processed_files = 0
+        errors: list[IngestError] = []
+        parallel = self._schedule_parse(divisions)
+        try:
+            for idx, d in enumerate(divisions, start=1):
+                if parallel is not None:
+                    parallel.ready(idx)
+                sp = f"div_ingest_{idx}"
+                try:
+                    self.conn.execute(f"SAVEPOINT {sp}")
+                    if logger:
+                        logger.emit("division.start", {"division": d.division, "index": idx})
+                    # Some test subclasses override _ingest_single_division without a force kwarg.
+                    try:
+                        result = self._ingest_single_division(  # type: ignore[arg-type]
+                            d, force=force
+                        )
+                    except TypeError:
+                        # Retry without keyword for backward compatibility in tests
+                        result = self._ingest_single_division(d)  # type: ignore[call-arg]
+                    if result is None:
+                        self.conn.execute(f"RELEASE SAVEPOINT {sp}")
+                        if logger:
+                            logger.emit("division.skipped", {"division": d.division})
+                        continue
+                    div_add, team_add, player_add, skip_delta, proc_delta = result
+                    divisions_ingested += div_add
+                    teams_ingested += team_add
+                    players_ingested += player_add
+                    skipped_files += skip_delta
+                    processed_files += proc_delta
+                    self.conn.execute(f"RELEASE SAVEPOINT {sp}")
+                    if logger:
+                        logger.emit(
+                            "division.success",
+                            {
+                                "division": d.division,
+                                "teams": team_add,
+                                "players": player_add,
+                                "processed": proc_delta,
+                                "skipped": skip_delta,
+                            },
+                        )
+                except Exception as e:  # noqa: BLE001
+                    try:
+                        self.conn.execute(f"ROLLBACK TO {sp}")
+                        self.conn.execute(f"RELEASE SAVEPOINT {sp}")
+                    except Exception:
+                        pass
+                    err = IngestError(division=d.division, message=str(e))
+                    errors.append(err)
+                    self._persist_error(err)
+                    if logger:
+                        logger.emit("division.error", {"division": d.division, "message": str(e)})
+                    continue
+                finally:
+                    # The division's SAVEPOINT is closed: commit it (inner phases never commit,
+                    # which would end the savepoint mid-division)
+                    try:
+                        self.conn.commit()
+                    except Exception:
+                        pass
+        finally:
+            if parallel is not None:
+                parallel.close()
+        return (
+            divisions_ingested,
+            teams_ingested,
+            players_ingested,
+            skipped_files,
+            processed_files,
+        ), errors
+
+    def _schedule_parse(self, divisions):
+        """A `db.parallel_parse.ParallelParser` working on ``divisions`` (None when serial)."""
+        if self.parse_workers <= 1 or not divisions:
+            return None
+        from functools import partial
+        from db.ingest import PARSER_VERSION_DEFAULT
+        from db.parallel_parse import ParallelParser, ParseJob, read_text
+        from db.parse_cache import ParseCache, ranking_payload, roster_payload
+
+        if self._parse_cache() is None:
+            # Caching off: hand the results over in memory for this coordinator only
+            self._cache = ParseCache(self.conn, PARSER_VERSION_DEFAULT, persist=False)
+        if self.streaming_parser:
+            roster_job = ("roster_parser", partial(roster_payload, streaming=True))
+        else:
+            roster_job = ("coordinator_roster", IngestionCoordinator._roster_payload)
+        parallel = ParallelParser(self._cache, self.parse_workers)
+        for idx, d in enumerate(divisions, start=1):
+            jobs = []
+            if d.ranking_table:
+                path = d.ranking_table.path
+                hint = partial(ranking_payload, source_hint=Path(path).name)
+                jobs.append(ParseJob(path, "ranking_parser", hint, read_text))
+                if self._singular_mode:
+                    jobs.append(
+                        ParseJob(
+                            path,
+                            "coordinator_ranking",
+                            IngestionCoordinator._ranking_rows,
+                            IngestionCoordinator._read_html,
+                        )
+                    )
+            for info in d.team_rosters.values():
+                jobs.append(ParseJob(info.path, *roster_job, IngestionCoordinator._read_html))
+            parallel.schedule(idx, jobs)
+        return parallel
+
+    def ingest_division(
+        self, files, *, division: str | None = None, force: bool = False
+    ) -> IngestionSummary:
+        """Ingest the division(s) of ``files`` while a scrape is still running.
+
+        ``files`` are the ranking table and roster pages the pipeline reported in a
+        ``division_complete`` event; only they are hashed and parsed (no tree walk).
+        Each division is ingested in its own SAVEPOINT and remembered, so the
+        following full `run` skips it while its files are unchanged. Publishes
+        ``DIVISION_INGESTED`` (payload: division, divisions, summary) on the main
+        thread so views can refresh just that part of the navigation tree.
+        ``division`` is the scraper's display name, passed through to the event.
+        """
+        self._prepare_tables()
+        audit = DataAuditService(str(self.base_dir)).run_files(files)
+        totals, errors = self._ingest_divisions(audit.divisions, force=force, logger=None)
+        failed = {e.division for e in errors}
+        for d in audit.divisions:
+            if d.division not in failed:
+                # A division may span several scrape folders (streamed one at a time)
+                self._streamed.setdefault(d.division, {}).update(self._division_files(d))
+        summary = IngestionSummary(*totals, errors=errors)
+        if self.event_bus is not None and threading.current_thread() is threading.main_thread():
+            try:  # pragma: no cover
+                self.event_bus.publish(
+                    "DIVISION_INGESTED",
+                    {
+                        "division": division,
+                        "divisions": [d.division for d in audit.divisions],
+                        "summary": summary,
+                    },
+                )
+            except Exception:
+                pass
+        return summary
+
     # ---- Ingestion inner phases -------------------------------------------------
     def _ingest_single_division(
         self, d, *, force: bool = False
@@ -271,9 +462,14 @@ class IngestionCoordinator:
                     from parsing.ranking_parser import parse_ranking_table  # type: ignore
 
                     html = Path(d.ranking_table.path).read_text(encoding="utf-8", errors="ignore")
-                    _div_name_from_html, nav_entries = parse_ranking_table(
-                        html, source_hint=Path(d.ranking_table.path).name
-                    )
+                    cache = self._parse_cache()
+                    hint = Path(d.ranking_table.path).name
+                    if cache is not None:
+                        _div_name_from_html, nav_entries = cache.ranking(html, hint)
+                    else:
+                        _div_name_from_html, nav_entries = parse_ranking_table(
+                            html, source_hint=hint
+                        )
                     ranking_teams = nav_entries
             except Exception:
                 ranking_teams = []
@@ -311,38 +507,17 @@ class IngestionCoordinator:
                 norm_key = _norm_name(team_name)
 
                 # If we have a roster file, attempt to extract refined Club | Team designation
-                # mirroring the logic in db.ingest._extract_club_and_team_from_title so that
-                # GUI-triggered ingestion produces identical canonical team names.
+                # (shared with db.ingest) so that GUI-triggered ingestion produces identical
+                # canonical team names.
                 if roster_path and roster_path.exists():
                     try:
                         html_txt = roster_path.read_text(encoding="utf-8", errors="ignore")
                     except Exception:
                         html_txt = ""
                     if html_txt:
-                        m = re.search(
-                            r" - Team ([^,<]+?),\s*([^<]+)</title>", html_txt, re.IGNORECASE
-                        )
-                        club_team: tuple[str, str] | None = None
-                        if m:
-                            club = m.group(1).strip()
-                            team_designation = m.group(2).strip()
-                            if club and team_designation:
-                                club_team = (club, team_designation)
-                        else:
-                            # Fallback heuristic (find last occurrence of ' - Team ')
-                            lower = html_txt.lower()
-                            idx_t = lower.rfind(" - team ")
-                            if idx_t != -1:
-                                after = html_txt[idx_t + len(" - team ") :]
-                                end_idx = after.lower().find("</title>")
-                                if end_idx != -1:
-                                    after = after[:end_idx]
-                                parts = after.split(",", 1)
-                                if len(parts) == 2:
-                                    c_candidate = parts[0].strip()
-                                    t_candidate = parts[1].strip()
-                                    if c_candidate and t_candidate:
-                                        club_team = (c_candidate, t_candidate)
+                        from parsing.roster_parser import club_and_team_from_title
+
+                        club_team = club_and_team_from_title(html_txt)
                         if club_team:
                             club_name, team_designation = club_team
                             combined_name = f"{club_name} | {team_designation}"
@@ -710,10 +885,6 @@ class IngestionCoordinator:
         *,
         roster_paths: list[Path] | None = None,
     ) -> int:
-        try:
-            from bs4 import BeautifulSoup  # type: ignore
-        except Exception:
-            return 0
         # Limit roster file search strictly to provided paths (exact team association)
         # falling back to heuristic content search only if explicit paths omitted.
         roster_files: list[Path] = []
@@ -740,116 +911,25 @@ class IngestionCoordinator:
             ).fetchall()
         )
         for rf in roster_files:
-            try:
-                soup = BeautifulSoup(self._read_html(rf), "html.parser")
-            except Exception:
-                continue
-            gathered: list[tuple[str, int | None]] = []
-            # --- Match table parsing ------------------------------------------------
-            # Look for rows containing a MidBigScreenCell pattern with date dd.mm.yy and a match number (digits)
-            for tr in soup.find_all("tr"):
-                cells = tr.find_all("td")
-                if len(cells) < 9:
-                    continue
+            if self.streaming_parser:
                 try:
-                    raw_cells = [c.get_text(strip=True) for c in cells]
+                    gathered = self._stream_roster_records(rf, match_records)
                 except Exception:
                     continue
-                # Heuristic: second cell (index 1) numeric (match number) & date pattern present in cell index 4
-                match_no = raw_cells[1]
-                date_str = raw_cells[4]
-                weekday = raw_cells[3]
-                time_str = raw_cells[6]
-                home_team = raw_cells[7]
-                guest_team = raw_cells[8]
-                if not (
-                    match_no.isdigit()
-                    and len(date_str) == 8
-                    and date_str[2] == "."
-                    and date_str[5] == "."
-                ):
+            else:
+                try:
+                    html = self._read_html(rf)
+                    cache = self._parse_cache()
+                    if cache is not None:
+                        payload = cache.get_or_parse(
+                            html, "coordinator_roster", self._roster_payload
+                        )
+                    else:
+                        payload = self._roster_payload(html)
+                except Exception:
                     continue
-                score_cell = cells[9] if len(cells) > 9 else None
-                score_text = ""
-                future_flag = False
-                if score_cell:
-                    # Detect 'Vorbericht' => future match
-                    st = score_cell.get_text(strip=True)
-                    if st:
-                        if "Vorbericht" in st:
-                            future_flag = True
-                            score_text = ""
-                        else:
-                            score_text = st
-                # Store match one time (by number) – last one wins if duplicates
-                match_records[match_no] = {
-                    "weekday": weekday,
-                    "date": date_str,
-                    "time": time_str or None,
-                    "home": home_team,
-                    "guest": guest_team,
-                    "score": score_text,
-                    "future": future_flag,
-                }
-            # -------------------------------------------------------------------------
-            target_table = None
-            for tbl in soup.find_all("table"):
-                text_sample = " ".join(c.get_text(" ").lower() for c in tbl.find_all("td")[:30])
-                if "spieler" in text_sample and "livepz" in text_sample:
-                    target_table = tbl
-                    break
-            if target_table:
-                for tr in target_table.find_all("tr"):
-                    cells = [c.get_text(" ").strip() for c in tr.find_all("td")]
-                    if len(cells) < 6:
-                        continue
-                    pos_token = cells[1]
-                    if not (
-                        pos_token.rstrip(".").isdigit()
-                        or "Er/" in pos_token
-                        or pos_token.endswith(".")
-                    ):
-                        continue
-                    name_candidate = cells[3].strip() if len(cells) > 3 else ""
-                    if not name_candidate or len(name_candidate) < 3:
-                        continue
-                    live_pz = None
-                    for token in reversed(cells):
-                        t = token.replace("\xa0", "").strip()
-                        if t.isdigit():
-                            if ":" in t:
-                                continue
-                            try:
-                                live_pz = int(t)
-                            except Exception:
-                                live_pz = None
-                            break
-                    gathered.append((name_candidate, live_pz))
-            if len(gathered) < 2:
-                generic_candidates: list[str] = []
-                for tbl in soup.find_all("table")[:3]:
-                    header = []
-                    for row in tbl.find_all("tr"):
-                        cells = [c.get_text(" ").strip() for c in row.find_all(["td", "th"])]
-                        if not cells:
-                            continue
-                        if not header and any(h.lower() in {"spieler", "name"} for h in cells):
-                            header = [h.lower() for h in cells]
-                            continue
-                        name_idx = None
-                        for i, h in enumerate(header):
-                            if h in {"spieler", "name"}:
-                                name_idx = i
-                                break
-                        if name_idx is not None and name_idx < len(cells):
-                            cand = cells[name_idx].strip()
-                            if " " in cand and 3 <= len(cand) <= 80:
-                                generic_candidates.append(cand)
-                noise = {"aktuelle tabelle", "allgemeine ligastatistiken"}
-                for c in generic_candidates:
-                    if c.lower() in noise:
-                        continue
-                    gathered.append((c, None))
+                match_records.update(payload["matches"])
+                gathered = [(name, lpz) for name, lpz in payload["players"]]
             seen_local = set()
             for name, lpz in gathered:
                 norm = name.strip()
@@ -882,6 +962,160 @@ class IngestionCoordinator:
             )
         return inserted
 
+    def _stream_roster_records(
+        self, path: Path, match_records: dict[str, dict]
+    ) -> list[tuple[str, int | None]]:
+        """(name, live_pz) pairs of a roster via `parsing.roster_stream` (no tree built).
+
+        Players and matches are those of `roster_parser` (shared with `db.ingest` through
+        the parse cache); matches are added to ``match_records`` in the shape
+        `_upsert_matches_for_team` expects.
+        """
+        from db.parse_cache import extract_roster
+
+        html = self._read_html(path)
+        cache = self._parse_cache()
+        if cache is not None:
+            roster = cache.roster(html, streaming=True)
+        else:
+            roster = extract_roster(html, streaming=True)
+        for m in roster.matches:
+            if not m["match_number"]:
+                continue
+            completed = m["status"] == "completed"
+            score = f"{m['home_score']}:{m['guest_score']}" if completed else ""
+            match_records[m["match_number"]] = {
+                "weekday": m["weekday"],
+                "date": m["date"],
+                "time": m["time"] or None,
+                "home": m["home_team"],
+                "guest": m["guest_team"],
+                "score": score,
+                "future": not completed,
+            }
+        return list(roster.players)
+
+    @staticmethod
+    def _roster_payload(html: str) -> dict:
+        """JSON-able result of the heuristic roster scan (``players`` pairs, ``matches``)."""
+        from parsing.html_backend import make_soup
+
+        match_records: dict[str, dict] = {}
+        gathered = IngestionCoordinator._soup_roster_records(make_soup(html), match_records)
+        return {"players": gathered, "matches": match_records}
+
+    @staticmethod
+    def _soup_roster_records(soup, match_records: dict[str, dict]) -> list[tuple[str, int | None]]:
+        """(name, live_pz) pairs of a parsed roster page (heuristic table scan).
+
+        Match rows found on the page are added to ``match_records`` (by match number).
+        """
+        gathered: list[tuple[str, int | None]] = []
+        # --- Match table parsing ------------------------------------------------
+        # Look for rows containing a MidBigScreenCell pattern with date dd.mm.yy and a match number (digits)
+        for tr in soup.find_all("tr"):
+            cells = tr.find_all("td")
+            if len(cells) < 9:
+                continue
+            try:
+                raw_cells = [c.get_text(strip=True) for c in cells]
+            except Exception:
+                continue
+            # Heuristic: second cell (index 1) numeric (match number) & date pattern present in cell index 4
+            match_no = raw_cells[1]
+            date_str = raw_cells[4]
+            weekday = raw_cells[3]
+            time_str = raw_cells[6]
+            home_team = raw_cells[7]
+            guest_team = raw_cells[8]
+            if not (
+                match_no.isdigit()
+                and len(date_str) == 8
+                and date_str[2] == "."
+                and date_str[5] == "."
+            ):
+                continue
+            score_cell = cells[9] if len(cells) > 9 else None
+            score_text = ""
+            future_flag = False
+            if score_cell:
+                # Detect 'Vorbericht' => future match
+                st = score_cell.get_text(strip=True)
+                if st:
+                    if "Vorbericht" in st:
+                        future_flag = True
+                        score_text = ""
+                    else:
+                        score_text = st
+            # Store match one time (by number) – last one wins if duplicates
+            match_records[match_no] = {
+                "weekday": weekday,
+                "date": date_str,
+                "time": time_str or None,
+                "home": home_team,
+                "guest": guest_team,
+                "score": score_text,
+                "future": future_flag,
+            }
+        # -------------------------------------------------------------------------
+        target_table = None
+        for tbl in soup.find_all("table"):
+            text_sample = " ".join(c.get_text(" ").lower() for c in tbl.find_all("td")[:30])
+            if "spieler" in text_sample and "livepz" in text_sample:
+                target_table = tbl
+                break
+        if target_table:
+            for tr in target_table.find_all("tr"):
+                cells = [c.get_text(" ").strip() for c in tr.find_all("td")]
+                if len(cells) < 6:
+                    continue
+                pos_token = cells[1]
+                if not (
+                    pos_token.rstrip(".").isdigit() or "Er/" in pos_token or pos_token.endswith(".")
+                ):
+                    continue
+                name_candidate = cells[3].strip() if len(cells) > 3 else ""
+                if not name_candidate or len(name_candidate) < 3:
+                    continue
+                live_pz = None
+                for token in reversed(cells):
+                    t = token.replace("\xa0", "").strip()
+                    if t.isdigit():
+                        if ":" in t:
+                            continue
+                        try:
+                            live_pz = int(t)
+                        except Exception:
+                            live_pz = None
+                        break
+                gathered.append((name_candidate, live_pz))
+        if len(gathered) < 2:
+            generic_candidates: list[str] = []
+            for tbl in soup.find_all("table")[:3]:
+                header = []
+                for row in tbl.find_all("tr"):
+                    cells = [c.get_text(" ").strip() for c in row.find_all(["td", "th"])]
+                    if not cells:
+                        continue
+                    if not header and any(h.lower() in {"spieler", "name"} for h in cells):
+                        header = [h.lower() for h in cells]
+                        continue
+                    name_idx = None
+                    for i, h in enumerate(header):
+                        if h in {"spieler", "name"}:
+                            name_idx = i
+                            break
+                    if name_idx is not None and name_idx < len(cells):
+                        cand = cells[name_idx].strip()
+                        if " " in cand and 3 <= len(cand) <= 80:
+                            generic_candidates.append(cand)
+            noise = {"aktuelle tabelle", "allgemeine ligastatistiken"}
+            for c in generic_candidates:
+                if c.lower() in noise:
+                    continue
+                gathered.append((c, None))
+        return gathered
+
     def _upsert_matches_for_team(
         self, team_numeric_id: int, full_team_name: str, matches: list[dict]
     ):
@@ -949,10 +1183,6 @@ class IngestionCoordinator:
                     )
             except Exception:
                 continue
-        try:
-            self.conn.commit()
-        except Exception:
-            pass
 
     def _ensure_ranking_table(self):
         try:
@@ -964,36 +1194,17 @@ class IngestionCoordinator:
 
     def _parse_and_upsert_ranking(self, division_id: int | str, path: str):
         try:
-            from bs4 import BeautifulSoup  # type: ignore
-        except Exception:
-            return
-        try:
-            html = Path(path).read_text(errors="ignore")
+            html = self._read_html(Path(path))
         except Exception:
             return
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            cache = self._parse_cache()
+            if cache is not None:
+                rows = cache.get_or_parse(html, "coordinator_ranking", self._ranking_rows)
+            else:
+                rows = self._ranking_rows(html)
         except Exception:
             return
-        table = None
-        for t in soup.find_all("table"):
-            cls = " ".join(t.get("class", [])).lower() if t.get("class") else ""
-            if any(k in cls for k in ["ranking", "tabelle", "standings", "tabelle"]):
-                table = t
-                break
-        if table is None:
-            tables = soup.find_all("table")
-            table = tables[0] if tables else None
-        if table is None:
-            return
-        rows = []
-        for tr in table.find_all("tr"):
-            cells = [c.get_text(" ").strip() for c in tr.find_all(["td", "th"])]
-            if len(cells) < 2:
-                continue
-            rows.append(cells)
-        if rows and any("team" in c.lower() or "mann" in c.lower() for c in rows[0]):
-            rows = rows[1:]
         for r in rows:
             pos_candidate = r[0]
             if not pos_candidate.isdigit():
@@ -1013,6 +1224,33 @@ class IngestionCoordinator:
             except Exception:
                 pass
 
+    @staticmethod
+    def _ranking_rows(html: str) -> list[list[str]]:
+        """Cell texts of the rows of a page's ranking table (header row dropped)."""
+        from parsing.html_backend import make_soup
+
+        soup = make_soup(html)
+        table = None
+        for t in soup.find_all("table"):
+            cls = " ".join(t.get("class", [])).lower() if t.get("class") else ""
+            if any(k in cls for k in ["ranking", "tabelle", "standings", "tabelle"]):
+                table = t
+                break
+        if table is None:
+            tables = soup.find_all("table")
+            table = tables[0] if tables else None
+        if table is None:
+            return []
+        rows = []
+        for tr in table.find_all("tr"):
+            cells = [c.get_text(" ").strip() for c in tr.find_all(["td", "th"])]
+            if len(cells) < 2:
+                continue
+            rows.append(cells)
+        if rows and any("team" in c.lower() or "mann" in c.lower() for c in rows[0]):
+            rows = rows[1:]
+        return rows
+
     def _ensure_id_map_table(self):
         try:
             self.conn.execute(
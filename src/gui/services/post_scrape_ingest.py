@@ -10,6 +10,19 @@ Design choices:
 - Uses service locator to retrieve shared `event_bus` and a registered
   SQLite connection (optional). If connection not present, ingestion is
   skipped gracefully (logged via event bus ERROR_OCCURRED placeholder).
+- Also listens for the pipeline's ``partial_ready`` progress event (the
+  primary club's slice is persisted) and ingests just the files it lists
+  (`IngestionCoordinator.ingest_division`), so the user's own teams are
+  browsable while the rest of the league is scraped. The final ingestion then
+  only processes divisions changed since.
+- With streaming enabled (``settings.SCRAPE_STREAM_INGEST``) every
+  ``division_complete`` event is ingested right away, one division per
+  SAVEPOINT, through the same coordinator; its final `run` skips divisions
+  whose files are unchanged since they were streamed, so there is no large
+  ingestion spike when the scrape ends.
+- When the finished scrape reports a ``manifest`` (files it wrote, persisted as
+  ``scrape_manifest.json``), the final ingestion audits from that manifest
+  instead of walking and hashing the data directory.
 """
 
 from __future__ import annotations
@@ -17,6 +30,9 @@ from __future__ import annotations
 from typing import Optional, Any
 import sqlite3
 
+from config import settings
+from services import scrape_manifest
+
 from .service_locator import services
 from .event_bus import GUIEvent, EventBus
 from .ingestion_coordinator import IngestionCoordinator
@@ -25,7 +41,14 @@ __all__ = ["PostScrapeIngestionHook"]
 
 
 class PostScrapeIngestionHook:
-    def __init__(self, scrape_runner, data_dir_provider):
+    def __init__(
+        self,
+        scrape_runner,
+        data_dir_provider,
+        *,
+        ingest_partial: bool = True,
+        stream_divisions: bool | None = None,
+    ):
         """Attach to a `ScrapeRunner` instance.
 
         Parameters
@@ -34,17 +57,28 @@ class PostScrapeIngestionHook:
             Instance whose `scrape_finished` signal we observe.
         data_dir_provider: callable returning current data directory string.
             Indirection allows dynamic path changes (user switching project directory).
+        ingest_partial: bool
+            Ingest the primary club slice as soon as the runner reports ``partial_ready``.
+        stream_divisions: bool | None
+            Ingest each ``division_complete`` division while scraping (default
+            ``settings.SCRAPE_STREAM_INGEST``).
         """
         self._runner = scrape_runner
+        self._ingest_partial = ingest_partial
         self._data_dir_provider = data_dir_provider
         self._bus: EventBus | None = services.try_get("event_bus")
+        self._stream = (
+            settings.SCRAPE_STREAM_INGEST if stream_divisions is None else stream_divisions
+        )
+        # One coordinator per scrape, so the final run knows which divisions were streamed
+        self._coordinator: IngestionCoordinator | None = None
         self._runner.scrape_finished.connect(self._on_scrape_finished)  # type: ignore
+        progress_signal = getattr(self._runner, "scrape_progress", None)
+        if (ingest_partial or self._stream) and progress_signal is not None:
+            progress_signal.connect(self._on_scrape_progress)  # type: ignore
 
     # ------------------------------------------------------------------
-    def _on_scrape_finished(
-        self, result: dict
-    ):  # pragma: no cover - Qt signal wiring minimal logic
-        data_dir = self._data_dir_provider()
+    def _coordinator_for(self, data_dir: str) -> IngestionCoordinator | None:
         conn: sqlite3.Connection | None = services.try_get("sqlite_conn")
         if conn is None:
             if self._bus:
@@ -52,9 +86,53 @@ class PostScrapeIngestionHook:
                     GUIEvent.ERROR_OCCURRED,
                     payload={"source": "post_scrape_ingest", "error": "Missing sqlite_conn"},
                 )
+            return None
+        current = self._coordinator
+        if current is None or current.conn is not conn or str(current.base_dir) != str(data_dir):
+            current = IngestionCoordinator(base_dir=data_dir, conn=conn, event_bus=self._bus)
+            self._coordinator = current
+        return current
+
+    def _ingest(self, data_dir: str, manifest=None):
+        coordinator = self._coordinator_for(data_dir)
+        return coordinator.run(manifest=manifest) if coordinator is not None else None
+
+    def _on_scrape_progress(self, event: str, payload: dict):
+        payload = payload or {}
+        if event == "division_complete" and self._stream:
+            data_dir = payload.get("data_dir") or self._data_dir_provider()
+            coordinator = self._coordinator_for(data_dir)
+            if coordinator is not None and payload.get("files"):
+                coordinator.ingest_division(payload["files"], division=payload.get("division"))
+            return
+        if event != "partial_ready" or not self._ingest_partial or not payload.get("files"):
+            return
+        # Only the slice's files (this handler runs on the GUI thread): no walk of the data dir
+        data_dir = payload.get("data_dir") or self._data_dir_provider()
+        coordinator = self._coordinator_for(data_dir)
+        if coordinator is None:
+            return
+        summary = coordinator.ingest_division(payload["files"])
+        if self._bus:
+            self._bus.publish(
+                GUIEvent.DATA_REFRESH_COMPLETED, payload={"ingestion": summary, "partial": True}
+            )
+
+    # ------------------------------------------------------------------
+    def _on_scrape_finished(
+        self, result: dict
+    ):  # pragma: no cover - Qt signal wiring minimal logic
+        data_dir = self._data_dir_provider()
+        manifest = None
+        if isinstance(result, dict) and result.get("manifest") is not None:
+            loaded = scrape_manifest.load(data_dir)
+            manifest = loaded if loaded.entries else None  # not persisted here: walk as before
+        try:
+            summary = self._ingest(data_dir, manifest)
+        finally:
+            self._coordinator = None
+        if summary is None:
             return
-        coordinator = IngestionCoordinator(base_dir=data_dir, conn=conn, event_bus=self._bus)
-        summary = coordinator.run()
         # IngestionCoordinator already emits DATA_REFRESHED; we can optionally also publish a completed event for UI to pick up ingestion summary specifically.
         if self._bus:
             self._bus.publish(GUIEvent.DATA_REFRESH_COMPLETED, payload={"ingestion": summary})
@@ -3,6 +3,10 @@
 Provides an asynchronous wrapper around `services.pipeline.run_full` so the
 GUI can trigger a full scrape without blocking the UI thread. Emits progress
 lightly (placeholder) and completion signals.
+
+An interrupted scrape (cancelled, failed or crashed) leaves a checkpoint journal
+in its data directory; `resumable_scrape` describes it and `resume_last` continues
+it via ``run_full(resume=True)``.
 """
 
 from __future__ import annotations
@@ -27,13 +31,19 @@ class ScrapeWorker(QThread):  # pragma: no cover - thread orchestration
     progress_event = pyqtSignal(str, dict)
 
     def __init__(
-        self, club_id: int, season: int | None, data_dir: str, runner: Callable[..., dict]
+        self,
+        club_id: int,
+        season: int | None,
+        data_dir: str,
+        runner: Callable[..., dict],
+        resume: bool = False,
     ):
         super().__init__()
         self._club_id = club_id
         self._season = season
         self._data_dir = data_dir
         self._runner = runner
+        self._resume = resume
         self._cancel_token = _CancelToken()
 
     def run(self):  # noqa: D401
@@ -42,12 +52,14 @@ class ScrapeWorker(QThread):  # pragma: no cover - thread orchestration
             def _progress(event: str, payload: dict):
                 self.progress_event.emit(event, payload)
 
+            extra = {"resume": True} if self._resume else {}
             result = self._runner(
                 self._club_id,
                 season=self._season,
                 data_dir=self._data_dir,
                 progress=_progress,
                 cancel_token=self._cancel_token,
+                **extra,
             )
             self.finished_ok.emit(result)
         except Exception as e:  # pragma: no cover - defensive
@@ -74,7 +86,7 @@ class ScrapeRunner(QObject):
             pipeline_func = pipeline.run_full
         self._pipeline = pipeline_func
         self._worker: ScrapeWorker | None = None
-        self._queue: List[Tuple[int, int | None, str]] = []
+        self._queue: List[Tuple[int, int | None, str, bool]] = []
         self._pause = False
 
     # Queue management -------------------------------------------------
@@ -84,9 +96,9 @@ class ScrapeRunner(QObject):
     def is_running(self) -> bool:
         return self._worker is not None and self._worker.isRunning()
 
-    def start(self, club_id: int, season: int | None, data_dir: str):
+    def start(self, club_id: int, season: int | None, data_dir: str, resume: bool = False):
         if self.is_running():  # already running; queue next
-            self._queue.append((club_id, season, data_dir))
+            self._queue.append((club_id, season, data_dir, resume))
             self.scrape_progress.emit("queue_update", {"queued": len(self._queue)})  # type: ignore
             return
 
@@ -105,13 +117,33 @@ class ScrapeRunner(QObject):
             kwargs.setdefault("pause_token", pause_token)
             return self._pipeline(club_id, season=season, data_dir=data_dir, **kwargs)
 
-        self._worker = ScrapeWorker(club_id, season, data_dir, _runner_wrapper)
+        self._worker = ScrapeWorker(club_id, season, data_dir, _runner_wrapper, resume=resume)
         self._worker.finished_ok.connect(self._on_ok)  # type: ignore
         self._worker.failed.connect(self._on_failed)  # type: ignore
         self._worker.progress_event.connect(self._on_progress)  # type: ignore
         self.scrape_started.emit()
         self._worker.start()
 
+    # Resume -----------------------------------------------------------
+    @staticmethod
+    def resumable_scrape(data_dir: str) -> Optional[dict]:
+        """Summary of the interrupted scrape in ``data_dir`` (None if there is none).
+
+        Keys: club_id, season, started_at, status, completed_phases, fetched_urls.
+        """
+        from services import scrape_journal
+
+        state = scrape_journal.resumable(data_dir)
+        return state.summary() if state is not None else None
+
+    def resume_last(self, data_dir: str) -> bool:
+        """Continue the interrupted scrape recorded in ``data_dir``; False if none."""
+        info = self.resumable_scrape(data_dir)
+        if info is None or info.get("club_id") is None:
+            return False
+        self.start(int(info["club_id"]), info.get("season"), data_dir, resume=True)
+        return True
+
     def cancel(self):  # pragma: no cover
         if self._worker and self._worker.isRunning():
             self._worker.cancel()
@@ -134,9 +166,9 @@ class ScrapeRunner(QObject):
         self._cleanup()
         # Dequeue next job if present
         if self._queue:
-            next_club, next_season, next_dir = self._queue.pop(0)
+            next_club, next_season, next_dir, next_resume = self._queue.pop(0)
             self.scrape_progress.emit("queue_update", {"queued": len(self._queue)})  # type: ignore
-            self.start(next_club, next_season, next_dir)
+            self.start(next_club, next_season, next_dir, resume=next_resume)
 
     def _on_failed(self, msg: str):  # pragma: no cover - signal path
         self.scrape_failed.emit(msg)
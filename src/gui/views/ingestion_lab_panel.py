@@ -712,6 +712,9 @@ class IngestionLabPanel(QWidget, ThemeAwareMixin):
                 meta.append(f"Last Ingested: {last_ingested}")
             if parser_ver:
                 meta.append(f"Parser Version: {parser_ver}")
+            cached = self._cached_parsers(fpath)
+            if cached:
+                meta.append(f"Parse Cache: {', '.join(cached)}")
             meta.extend(["--- Snippet ---", snippet])
             self.preview_area.setPlainText("\n".join(meta))
             try:
@@ -738,6 +741,26 @@ class IngestionLabPanel(QWidget, ThemeAwareMixin):
 
     # ------------------------------------------------------------------
     # Batch preview with loading skeleton (7.10.46)
+    def _cached_parsers(self, fpath: str) -> list[str]:
+        """Parsers holding a `db.parse_cache` result for the file's current content."""
+        conn = None
+        if _services is not None:
+            try:
+                conn = _services.try_get("sqlite_conn")  # type: ignore[attr-defined]
+            except Exception:  # pragma: no cover - defensive
+                conn = None
+        if conn is None:
+            return []
+        try:
+            from db.ingest import PARSER_VERSION_DEFAULT
+            from db.parse_cache import cached_parsers, content_sha256
+
+            with open(fpath, "r", encoding="utf-8", errors="ignore") as fh:
+                content_hash = content_sha256(fh.read())
+            return cached_parsers(conn, content_hash, PARSER_VERSION_DEFAULT)
+        except Exception:  # pragma: no cover - preview must not fail on cache lookups
+            return []
+
     def _batch_preview(self, targets: list) -> None:
         start = self._now()
         count = len(targets)
@@ -169,6 +169,8 @@ class MainWindow(QMainWindow):  # Dock-based
             self._event_bus = services.try_get("event_bus")
             if self._event_bus and hasattr(self._event_bus, "subscribe"):
                 self._event_bus.subscribe("DATA_REFRESHED", self._on_data_refreshed)
+                # Divisions ingested while a scrape is running (streaming ingestion)
+                self._event_bus.subscribe("DIVISION_INGESTED", self._on_division_ingested)
         except Exception:
             self._event_bus = None
         # Skip auto-loading landing data when in test mode to avoid asynchronous workers.
@@ -503,6 +505,8 @@ class MainWindow(QMainWindow):  # Dock-based
         # Scrape action in Data menu
         self._act_scrape = data_menu.addAction("Run Full Scrape")
         self._act_scrape.triggered.connect(self._trigger_full_scrape)  # type: ignore[attr-defined]
+        self._act_resume_scrape = data_menu.addAction("Resume Last Scrape")
+        self._act_resume_scrape.triggered.connect(self._trigger_resume_scrape)  # type: ignore[attr-defined]
         # Force Re-Ingest (bypass provenance, reuse existing HTML assets)
         self._act_force_reingest = data_menu.addAction("Force Re-Ingest (HTML Assets)")
         self._act_force_reingest.triggered.connect(self._trigger_force_reingest)  # type: ignore[attr-defined]
@@ -1578,6 +1582,13 @@ class MainWindow(QMainWindow):  # Dock-based
         # (Original confirmation prompt removed per user request)
         self._scrape_runner.start(self.club_id, self.season, self.data_dir)
 
+    def _trigger_resume_scrape(self):  # pragma: no cover - GUI event
+        if self._scrape_runner.is_running():
+            QMessageBox.information(self, "Scrape", "A scrape is already running.")
+            return
+        if not self._scrape_runner.resume_last(self.data_dir):
+            QMessageBox.information(self, "Scrape", "No interrupted scrape to resume.")
+
     def _trigger_force_reingest(self):  # pragma: no cover - GUI event
         """Force re-run ingestion on existing HTML assets bypassing provenance skips.
 
@@ -1973,6 +1984,33 @@ class MainWindow(QMainWindow):  # Dock-based
         except Exception:
             pass
 
+    def _on_division_ingested(self, evt):  # pragma: no cover - Qt/event path
+        """Refresh only the navigation nodes of divisions ingested during a scrape."""
+        try:
+            from gui.workers import team_entries_from_db
+
+            payload = getattr(evt, "payload", None) or {}
+            names = {n.replace("_", " ") for n in payload.get("divisions", [])}
+            conn = services.try_get("sqlite_conn")
+            if conn is None or not names:
+                return
+            teams = team_entries_from_db(conn, names)
+            proxy = getattr(self, "team_filter_proxy", None)
+            model = proxy.sourceModel() if proxy is not None else None
+            if not isinstance(model, NavigationTreeModel):
+                # First data of this session: build the tree from what is ingested so far
+                self._on_landing_loaded(team_entries_from_db(conn), "")
+                return
+            by_division: dict[str, list[TeamEntry]] = {name: [] for name in names}
+            for team in teams:
+                by_division.setdefault(team.division, []).append(team)
+            for division, division_teams in by_division.items():
+                if division_teams:
+                    model.upsert_division(division, division_teams)
+            self.teams = [t for t in self.teams if t.division not in by_division] + teams
+        except Exception:
+            pass
+
     def _update_ingest_trend(self):
         if getattr(self, "_status_bar_widget", None) is None:
             return
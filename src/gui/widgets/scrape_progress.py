@@ -37,8 +37,7 @@ class ScrapePhase:
 PHASES: list[ScrapePhase] = [
     ScrapePhase("landing", "Landing Page", 5),
     ScrapePhase("ranking_tables", "Ranking Tables", 15),
-    ScrapePhase("division_rosters", "Division Rosters", 25),
-    ScrapePhase("club_overviews", "Club Overviews", 10),
+    ScrapePhase("division_rosters", "Division Rosters", 35),
     ScrapePhase("club_team_pages", "Club Team Pages", 10),
     ScrapePhase("player_histories", "Player History Pages", 25),
     ScrapePhase("tracking_state", "Tracking State", 10),
@@ -17,6 +17,37 @@ import re
 from tracking import tracking_store
 
 
+def team_entries_from_db(conn, divisions: set[str] | None = None) -> list[TeamEntry]:
+    """Navigation entries of the ingested teams (optionally only of the named divisions)."""
+    from gui.repositories.sqlite_impl import create_sqlite_repositories
+
+    repos = create_sqlite_repositories(conn)
+    club_map = {c.id: c.name for c in repos.clubs.list_clubs()}
+    teams: list[TeamEntry] = []
+    for d in repos.divisions.list_divisions():
+        if divisions is not None and d.name not in divisions:
+            continue
+        for t in repos.teams.list_teams_in_division(d.id):
+            club_name = club_map.get(t.club_id) if getattr(t, "club_id", None) else None
+            # Detect roster_pending: team has 0 players or only placeholder player
+            player_rows = repos.players.list_players_for_team(t.id)
+            roster_pending = False
+            if not player_rows:
+                roster_pending = True
+            elif len(player_rows) == 1 and player_rows[0].name == "Placeholder Player":
+                roster_pending = True
+            teams.append(
+                TeamEntry(
+                    team_id=t.id,
+                    name=t.name,
+                    division=d.name,
+                    club_name=club_name,
+                    roster_pending=roster_pending,
+                )
+            )
+    return teams
+
+
 class LandingLoadWorker(QThread):
     finished = pyqtSignal(list, str)  # teams, error
 
@@ -192,32 +223,10 @@ class LandingLoadWorker(QThread):
 
     def _load_teams_from_db(self, conn):
         """Attempt to load teams from either singular or legacy plural schema."""
-        from gui.repositories.sqlite_impl import create_sqlite_repositories
         import sqlite3
 
         try:
-            repos = create_sqlite_repositories(conn)
-            club_map = {c.id: c.name for c in repos.clubs.list_clubs()}
-            teams: list[TeamEntry] = []
-            for d in repos.divisions.list_divisions():
-                for t in repos.teams.list_teams_in_division(d.id):
-                    club_name = club_map.get(t.club_id) if getattr(t, "club_id", None) else None
-                    # Detect roster_pending: team has 0 players or only placeholder player
-                    player_rows = repos.players.list_players_for_team(t.id)
-                    roster_pending = False
-                    if not player_rows:
-                        roster_pending = True
-                    elif len(player_rows) == 1 and player_rows[0].name == "Placeholder Player":
-                        roster_pending = True
-                    teams.append(
-                        TeamEntry(
-                            team_id=t.id,
-                            name=t.name,
-                            division=d.name,
-                            club_name=club_name,
-                            roster_pending=roster_pending,
-                        )
-                    )
+            teams = team_entries_from_db(conn)
             if teams:
                 teams.sort(key=lambda t: (t.division, t.display_name.lower()))
                 return teams
@@ -302,8 +311,9 @@ class RosterLoadWorker(QThread):
                     f"Roster HTML not found for team {self.team.name}. Run full scrape first.",
                 )
                 return
-            players_raw = roster_parser.extract_players(roster_html, team_id=self.team.team_id)
-            matches_raw = roster_parser.extract_matches(roster_html, team_id=self.team.team_id)
+            page = roster_parser.ParsedRoster(roster_html)
+            players_raw = page.players(team_id=self.team.team_id)
+            matches_raw = page.matches(team_id=self.team.team_id)
             players = [
                 PlayerEntry(team_id=self.team.team_id, name=p.name, live_pz=p.live_pz)
                 for p in players_raw
@@ -3,8 +3,8 @@
 from __future__ import annotations
 import re
 from typing import Dict
-from bs4 import BeautifulSoup  # type: ignore
 from domain.models import Team
+from parsing.html_backend import make_soup
 from utils import html_utils
 
 # Roster link template: We explicitly request the 'Vorrunde' page variant because the default
@@ -16,14 +16,14 @@ ROSTER_LINK_TEMPLATE = (
 )
 
 
-def extract_club_teams(html: str, *, club_id: str) -> Dict[str, Team]:
+def extract_club_teams(html: str, *, club_id: str, backend: str | None = None) -> Dict[str, Team]:
     """Extract teams for a club.
 
     Heuristic: rows with classes ContentText or CONTENTTABLETEXT2ndLine contain columns:
         (ignored index) | team name | division | link with L2P=team_id
     We parse anchor href to obtain team id (L2P param). Fallback: attempt regex extraction if href missing.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html, backend)
     teams: Dict[str, Team] = {}
     for tr in soup.find_all(
         "tr",
@@ -0,0 +1,137 @@
+"""Pluggable HTML tree builder shared by all parsers.
+
+Every parser builds its tree through `make_soup`, which picks the BeautifulSoup
+builder named by ``settings.HTML_PARSER_BACKEND`` (or an explicit ``backend``):
+``"html.parser"`` (pure Python, always available) or ``"lxml"`` (C parser, several
+times faster; optional dependency). A configured backend that is not installed
+falls back to ``"html.parser"`` (logged once as a warning) so a missing wheel never
+breaks scraping or ingest. ``lxml`` is the ``html`` extra of the project.
+
+``parse_only`` restricts the tree to the top-level elements a `TagFilter` keeps
+(SoupStrainer semantics: a kept element brings its whole subtree, everything
+else is dropped while tokenizing). `measure_parse` reports the resulting tree
+size and allocation peak in the style of ``ParsePreview.node_count`` /
+``memory_delta_kb``.
+"""
+
+from __future__ import annotations
+import logging
+import time
+import tracemalloc
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Mapping, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
+from bs4.builder import builder_registry  # type: ignore
+
+from config import settings
+
+__all__ = [
+    "BACKENDS",
+    "DEFAULT_BACKEND",
+    "available_backends",
+    "resolve_backend",
+    "TagFilter",
+    "make_soup",
+    "ParseFootprint",
+    "measure_parse",
+]
+
+DEFAULT_BACKEND = "html.parser"
+BACKENDS: Tuple[str, ...] = (DEFAULT_BACKEND, "lxml")
+
+_log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _installed(name: str) -> bool:
+    return builder_registry.lookup(name) is not None
+
+
+@lru_cache(maxsize=None)
+def _warn_fallback(name: str) -> None:
+    _log.warning(
+        "HTML parser backend %r is not installed; falling back to %r", name, DEFAULT_BACKEND
+    )
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Known backends whose builder is installed, default first."""
+    return tuple(b for b in BACKENDS if _installed(b))
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """Backend actually used for ``backend`` (default: the configured one).
+
+    Raises ValueError for an unknown name; an uninstalled one resolves to the default.
+    """
+    name = backend or settings.HTML_PARSER_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"unknown HTML parser backend {name!r} (expected one of {BACKENDS})")
+    if _installed(name):
+        return name
+    _warn_fallback(name)
+    return DEFAULT_BACKEND
+
+
+class TagFilter(SoupStrainer):
+    """SoupStrainer deciding on (tag name, attributes) with a plain predicate.
+
+    Implements both the bs4 >= 4.13 hooks (``allow_tag_creation`` /
+    ``allow_string_creation``) and the older ``search_tag``, so the same filter works
+    with the pinned and newer BeautifulSoup releases. Top-level text is dropped.
+    """
+
+    def __init__(self, keep: Callable[[str, Mapping[str, str]], bool]) -> None:
+        super().__init__()
+        self._keep = keep
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:  # bs4 >= 4.13
+        return bool(self._keep(name, attrs or {}))
+
+    def allow_string_creation(self, string) -> bool:  # bs4 >= 4.13
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs={}):  # bs4 < 4.13
+        return bool(self._keep(markup_name, dict(markup_attrs or {})))
+
+
+def make_soup(
+    html: str, backend: str | None = None, parse_only: TagFilter | None = None
+) -> BeautifulSoup:
+    """Parse ``html`` with the resolved backend, optionally restricted to ``parse_only``."""
+    return BeautifulSoup(html, resolve_backend(backend), parse_only=parse_only)
+
+
+@dataclass
+class ParseFootprint:
+    parse_time_ms: float
+    node_count: int
+    memory_delta_kb: float
+
+
+def measure_parse(
+    html: str, backend: str | None = None, parse_only: TagFilter | None = None
+) -> ParseFootprint:
+    """Build one tree under tracemalloc: time, node count and allocation peak (KB)."""
+    # A trace already running (e.g. HealthMetricsService) is left as it is; without
+    # reset_peak (Python 3.9+) its peak may predate this parse
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    soup = make_soup(html, backend, parse_only)
+    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    peak = tracemalloc.get_traced_memory()[1]
+    if not tracing:
+        tracemalloc.stop()
+    node_count = len(list(soup.descendants))
+    return ParseFootprint(
+        parse_time_ms=elapsed_ms,
+        node_count=node_count,
+        memory_delta_kb=max(0, peak - base) / 1024.0,
+    )
@@ -1,14 +1,14 @@
 """Initial link extraction from landing page HTML (BeautifulSoup version)."""
 
 from __future__ import annotations
-from bs4 import BeautifulSoup
+from parsing.html_backend import make_soup
 from utils.html_utils import dedupe
 
 ROOT_URL = "https://leipzig.tischtennislive.de/"
 
 
-def extract_team_roster_links(html: str) -> list[str]:
-    soup = BeautifulSoup(html, "html.parser")
+def extract_team_roster_links(html: str, *, backend: str | None = None) -> list[str]:
+    soup = make_soup(html, backend)
     links: list[str] = []
     for a in soup.find_all("a", href=True):
         href = a["href"]
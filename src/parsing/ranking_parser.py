@@ -3,12 +3,24 @@
 from __future__ import annotations
 import re
 from typing import Dict, List, Tuple
-from bs4 import BeautifulSoup
+from config import settings
 from domain.models import Team, Division
+from parsing.html_backend import TagFilter, make_soup
 
 
-def extract_team_overview(html: str) -> Dict[str, Team]:
-    soup = BeautifulSoup(html, "html.parser")
+def _keep_ranking_element(name: str, attrs) -> bool:
+    if name == "table":
+        return "PageHeadline" in str(attrs.get("class") or "")
+    return name in ("title", "li")
+
+
+# parse_ranking_table reads only the <title>, the PageHeadline table and the navigation
+# list items (Mannschaften entry with its team list)
+RANKING_PARSE_ONLY = TagFilter(_keep_ranking_element)
+
+
+def extract_team_overview(html: str, *, backend: str | None = None) -> Dict[str, Team]:
+    soup = make_soup(html, backend)
     teams: Dict[str, Team] = {}
     # Heuristic: rows with class ContentText / CONTENTTABLETEXT2ndLine and links containing L2P
     for tr in soup.find_all("tr"):
@@ -48,7 +60,13 @@ def build_divisions(teams: Dict[str, Team]) -> Dict[str, Division]:
     return divisions
 
 
-def parse_ranking_table(html: str, source_hint: str | None = None) -> Tuple[str, List[dict]]:
+def parse_ranking_table(
+    html: str,
+    source_hint: str | None = None,
+    *,
+    backend: str | None = None,
+    restricted: bool | None = None,
+) -> Tuple[str, List[dict]]:
     """Parse a ranking table page and return (division_name, teams).
 
     division_name extraction strategy (in order):
@@ -56,7 +74,16 @@ def parse_ranking_table(html: str, source_hint: str | None = None) -> Tuple[str,
       2. Headline table (td within table.PageHeadline) textual content (excluding season year pattern '20xx/yy').
       3. Fallback to source_hint sanitized (legacy behaviour using filename) with underscores replaced by spaces.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    restricted = settings.HTML_RESTRICTED_PARSE if restricted is None else restricted
+    if restricted:
+        # Restricted tree first; a page it finds no teams in is parsed in full
+        parsed = _parse_ranking_tree(make_soup(html, backend, RANKING_PARSE_ONLY), source_hint)
+        if parsed[1]:
+            return parsed
+    return _parse_ranking_tree(make_soup(html, backend), source_hint)
+
+
+def _parse_ranking_tree(soup, source_hint: str | None) -> Tuple[str, List[dict]]:
     division_name: str | None = None
 
     # Strategy 1: title tag
@@ -1,24 +1,150 @@
-"""Parsing of team roster pages for matches, players, club links (BeautifulSoup refactor)."""
+"""Parsing of team roster pages for matches, players, club links (BeautifulSoup refactor).
+
+`ParsedRoster` parses a page once (with the configured `parsing.html_backend` builder)
+and serves every extraction (matches, players, club link, title-derived club/team) from
+that single tree; callers needing more than one of them should build it once. The
+module-level ``extract_*`` functions are thin wrappers accepting either the raw HTML or
+a `ParsedRoster`.
+
+With ``HTML_RESTRICTED_PARSE`` the tree holds only what the extractors read
+(`ROSTER_PARSE_ONLY`: the <title>, the ``Spiel*`` match / ``Spieler_*`` player rows and
+the club anchors). An extraction finding nothing there is repeated on the
+full tree, so pages deviating from the site layout still parse as before.
+"""
 
 from __future__ import annotations
 import re
-from typing import List
+from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup  # type: ignore
+from config import settings
 from domain.models import Match, Player
+from parsing.html_backend import TagFilter, make_soup
 from utils import html_utils
 
+_ROW_ID = re.compile(r"^Spiel", re.IGNORECASE)  # Spiel<n> match rows, Spieler_<team>_<n> players
+
+
+def _keep_roster_element(name: str, attrs) -> bool:
+    if name == "tr":
+        return bool(_ROW_ID.match(attrs.get("id") or ""))
+    if name == "a":
+        return "Verein" in (attrs.get("href") or "")
+    return name == "title"
+
+
+ROSTER_PARSE_ONLY = TagFilter(_keep_roster_element)
+
 
 def _cell_text(cell) -> str:
     return html_utils.clean_cell(cell.get_text(" ", strip=True)) if cell else ""
 
 
-def extract_matches(html: str, *, team_id: str) -> List[Match]:
+def club_and_team_from_title(html: str) -> Optional[Tuple[str, str]]:
+    """Extract (club_name, team_designation) from roster HTML <title>.
+
+    Expected pattern tail: ' - Team <Club Name>, <Team Designation>'
+    Returns None if pattern not found or malformed.
+    """
+    m = re.search(r" - Team ([^,<]+?),\s*([^<]+)</title>", html, re.IGNORECASE)
+    if not m:
+        # Fallback: parse via simpler split if direct regex fails
+        # Locate ' - Team ' then split on first comma
+        idx = html.lower().rfind(" - team ")
+        if idx == -1:
+            return None
+        after = html[idx + len(" - team ") :]
+        # up to closing title or first '</title>'
+        end_idx = after.lower().find("</title>")
+        if end_idx != -1:
+            after = after[:end_idx]
+        parts = after.split(",", 1)
+        if len(parts) != 2:
+            return None
+        club = parts[0].strip()
+        team = parts[1].strip()
+        if club and team:
+            return club, team
+        return None
+    club = m.group(1).strip()
+    team = m.group(2).strip()
+    if club and team:
+        return club, team
+    return None
+
+
+class ParsedRoster:
+    """One roster page, parsed at most once.
+
+    The tree is built lazily on the first tree-based extraction, so title-only use
+    (`club_and_team`, a regex over the raw text) never parses the page. ``restricted``
+    (default: ``settings.HTML_RESTRICTED_PARSE``) builds the `ROSTER_PARSE_ONLY` tree
+    first; `soup` is always the full tree.
+    """
+
+    def __init__(
+        self, html: str, *, backend: str | None = None, restricted: bool | None = None
+    ) -> None:
+        self.html = html
+        self.backend = backend
+        self.restricted = settings.HTML_RESTRICTED_PARSE if restricted is None else restricted
+        self._soup: BeautifulSoup | None = None
+        self._restricted_soup: BeautifulSoup | None = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = make_soup(self.html, self.backend)
+        return self._soup
+
+    def _extract(self, extractor):
+        if not self.restricted:
+            return extractor(self.soup)
+        if self._restricted_soup is None:
+            self._restricted_soup = make_soup(self.html, self.backend, ROSTER_PARSE_ONLY)
+        found = extractor(self._restricted_soup)
+        return found if found else extractor(self.soup)
+
+    def matches(self, *, team_id: str) -> List[Match]:
+        return self._extract(lambda soup: _matches_from_tree(soup, team_id))
+
+    def players(self, *, team_id: str) -> List[Player]:
+        return self._extract(lambda soup: _players_from_tree(soup, team_id))
+
+    def club_link(self) -> str | None:
+        return self._extract(_club_link_from_tree)
+
+    def club_and_team(self) -> Optional[Tuple[str, str]]:
+        return club_and_team_from_title(self.html)
+
+
+def _parsed(html: "str | ParsedRoster") -> ParsedRoster:
+    return html if isinstance(html, ParsedRoster) else ParsedRoster(html)
+
+
+def extract_matches(html: "str | ParsedRoster", *, team_id: str) -> List[Match]:
     """Extract match rows from a roster page.
 
     Heuristics: rows with an id attribute starting with 'Spiel' contain match data.
     We rely on positional columns similar to legacy mapping; if the structure shifts, we skip incomplete rows.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    return _parsed(html).matches(team_id=team_id)
+
+
+def extract_players(html: "str | ParsedRoster", *, team_id: str) -> List[Player]:
+    """Extract player rows with LivePZ values.
+
+    Primary approach: iterate over rows containing an anchor to a Spieler page and a tooltip cell with title containing 'LivePZ-Wert'.
+    Fallback: separate collection of anchors and tooltip cells if row pairing fails.
+    """
+    return _parsed(html).players(team_id=team_id)
+
+
+def extract_club_link(html: "str | ParsedRoster") -> str | None:
+    """Return the first club link (anchor text 'Verein')."""
+    return _parsed(html).club_link()
+
+
+def _matches_from_tree(soup, team_id: str) -> List[Match]:
     matches: List[Match] = []
     # Find all tr elements whose id matches Spiel\d+
     for tr in soup.find_all("tr", id=re.compile(r"Spiel\d+", re.IGNORECASE)):
@@ -57,13 +183,7 @@ def extract_matches(html: str, *, team_id: str) -> List[Match]:
     return matches
 
 
-def extract_players(html: str, *, team_id: str) -> List[Player]:
-    """Extract player rows with LivePZ values.
-
-    Primary approach: iterate over rows containing an anchor to a Spieler page and a tooltip cell with title containing 'LivePZ-Wert'.
-    Fallback: separate collection of anchors and tooltip cells if row pairing fails.
-    """
-    soup = BeautifulSoup(html, "html.parser")
+def _players_from_tree(soup, team_id: str) -> List[Player]:
     players: List[Player] = []
 
     # Row-based extraction
@@ -116,9 +236,7 @@ def extract_players(html: str, *, team_id: str) -> List[Player]:
     return deduped
 
 
-def extract_club_link(html: str) -> str | None:
-    """Return the first club link (anchor text 'Verein')."""
-    soup = BeautifulSoup(html, "html.parser")
+def _club_link_from_tree(soup) -> str | None:
     # First attempt: existing strict pattern
     a = soup.find(
         "a",
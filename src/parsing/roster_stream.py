@@ -0,0 +1,299 @@
+"""Tree-less, event-driven extraction of roster pages (stdlib ``HTMLParser``).
+
+`RosterStreamParser` reproduces `roster_parser.extract_matches` / `extract_players`
+without building a DOM: it keeps only the stack of open elements plus the text of
+the cells / anchors it still needs, and hands out each `Match` / `Player` as soon
+as its row closes. Memory per file is bounded by the open rows and the player
+names seen, not by the document size, which is what bulk re-ingest of thousands
+of stored roster and club-team pages wants. Records come out in document order and equal
+the BeautifulSoup extractors' output (verified against the data/ corpus):
+
+* matches: rows whose id matches ``Spiel\\d+`` with at least ten ``td`` cells;
+* players: every ``Spieler`` anchor inside a row, with the LivePZ of that row's
+  first ``tooltip`` / ``LivePZ-Wert`` cell; when no anchor sits in a row, the
+  anchors and tooltip cells of the page are paired by position (decided at EOF);
+  names are de-duplicated keeping the first occurrence.
+
+Element nesting follows BeautifulSoup's ``html.parser`` tree builder (an end tag
+closes everything up to the matching open element, stray end tags are ignored,
+void elements never open), so cell text matches ``get_text(" ", strip=True)``.
+"""
+
+from __future__ import annotations
+import re
+from collections import deque
+from html.parser import HTMLParser
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from domain.models import Match, Player
+from utils import html_utils
+
+__all__ = [
+    "CHUNK_SIZE",
+    "RosterStreamParser",
+    "iter_roster_records",
+    "iter_roster_file",
+    "stream_roster",
+]
+
+CHUNK_SIZE = 64 * 1024
+
+_MATCH_ROW_ID = re.compile(r"Spiel\d+", re.IGNORECASE)
+# Elements BeautifulSoup closes immediately (never have children)
+_VOID = frozenset(
+    "area base br col embed hr img input keygen link menuitem meta param source track wbr "
+    "basefont bgsound command frame image isindex nextid spacer".split()
+)
+# Text inside these is not part of get_text() (Script / Stylesheet / ... strings)
+_NON_TEXT = frozenset(("script", "style", "template", "rt", "rp"))
+
+
+def _cell_text(parts: List[str]) -> str:
+    return html_utils.clean_cell(" ".join(parts))
+
+
+def _live_pz(cell: Optional[List[str]]) -> int | None:
+    if cell is None:
+        return None
+    num = html_utils.extract_last_number(_cell_text(cell))
+    return int(num) if num else None
+
+
+class _Row:
+    __slots__ = ("match", "cells", "anchors", "tooltip")
+
+    def __init__(self, match: Optional[list]) -> None:
+        self.match = match  # pending match entry ([record | None, resolved]) or None
+        self.cells: List[List[str]] = []  # text of every td below the row (match rows only)
+        self.anchors: List[list] = []  # pending player entries whose nearest row this is
+        self.tooltip: Optional[List[str]] = None  # first LivePZ tooltip cell below the row
+
+
+class _Frame:
+    __slots__ = ("name", "row", "text")
+
+    def __init__(self, name: str, row: Optional[_Row] = None, text: Optional[List[str]] = None):
+        self.name = name
+        self.row = row
+        self.text = text  # collected stripped strings (tracked cells / anchors only)
+
+
+class RosterStreamParser(HTMLParser):
+    """Incremental roster extractor; `feed` text, then `close`, draining `records`."""
+
+    def __init__(self, *, team_id: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.team_id = team_id
+        self.records: Deque[Union[Match, Player]] = deque()
+        self._stack: List[_Frame] = []
+        self._open: Dict[str, int] = {}
+        self._data: List[str] = []
+        self._non_text = 0
+        self._rows: List[_Row] = []  # open rows, innermost last
+        self._collecting: List[List[str]] = []  # text lists of open tracked elements
+        self._matches: Deque[list] = deque()
+        self._players: Deque[list] = deque()
+        self._seen: set[str] = set()
+        self._row_players = False
+        # positional fallback material, kept only until an anchor inside a row shows up
+        self._fallback_names: List[List[str]] = []
+        self._fallback_pz: List[List[str]] = []
+
+    # Text -------------------------------------------------------------
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def _flush(self) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data).strip()
+        self._data = []
+        if text and not self._non_text:
+            for target in self._collecting:
+                target.append(text)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+
+    # Elements ---------------------------------------------------------
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self._flush()
+        if tag in _VOID:
+            return
+        a = dict(attrs)
+        frame = _Frame(tag)
+        if tag == "tr":
+            match = None
+            if _MATCH_ROW_ID.search(a.get("id") or ""):
+                match = [None, False]
+                self._matches.append(match)
+            frame.row = _Row(match)
+            self._rows.append(frame.row)
+        elif tag == "td":
+            tooltip = "tooltip" in (a.get("class") or "").split() and "LivePZ-Wert" in (
+                a.get("title") or ""
+            )
+            if tooltip or any(r.match is not None for r in self._rows):
+                frame.text = []
+                for row in self._rows:
+                    if row.match is not None:
+                        row.cells.append(frame.text)
+                    if tooltip and row.tooltip is None:
+                        row.tooltip = frame.text
+                if tooltip and not self._row_players:
+                    self._fallback_pz.append(frame.text)
+        elif tag == "a" and "Spieler" in (a.get("href") or ""):
+            frame.text = []
+            if self._rows:
+                entry = [frame.text, False, None]  # name parts, resolved, live_pz
+                self._rows[-1].anchors.append(entry)
+                self._players.append(entry)
+                if not self._row_players:
+                    self._row_players = True
+                    self._fallback_names = []
+                    self._fallback_pz = []
+            elif not self._row_players:
+                self._fallback_names.append(frame.text)
+        if tag in _NON_TEXT:
+            self._non_text += 1
+        if frame.text is not None:
+            self._collecting.append(frame.text)
+        self._stack.append(frame)
+        self._open[tag] = self._open.get(tag, 0) + 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if not self._open.get(tag):
+            return  # stray end tag (or a void element's)
+        while self._stack:
+            frame = self._pop()
+            if frame.name == tag:
+                break
+
+    def _pop(self) -> _Frame:
+        frame = self._stack.pop()
+        self._open[frame.name] -= 1
+        if frame.name in _NON_TEXT:
+            self._non_text -= 1
+        if frame.text is not None:
+            self._collecting.pop()  # tracked elements close innermost first
+        if frame.row is not None:
+            self._rows.pop()
+            self._finish_row(frame.row)
+        return frame
+
+    # Records ----------------------------------------------------------
+    def _finish_row(self, row: _Row) -> None:
+        if row.match is not None:
+            row.match[0] = self._match(row.cells)
+            row.match[1] = True
+            while self._matches and self._matches[0][1]:
+                record = self._matches.popleft()[0]
+                if record is not None:
+                    self.records.append(record)
+        if row.anchors:
+            pz = _live_pz(row.tooltip)
+            for entry in row.anchors:
+                entry[1], entry[2] = True, pz
+            while self._players and self._players[0][1]:
+                parts, _resolved, live_pz = self._players.popleft()
+                self._emit_player(html_utils.clean_cell("".join(parts)), live_pz)
+
+    def _emit_player(self, name: str, live_pz: int | None) -> None:
+        if name not in self._seen:
+            self._seen.add(name)
+            self.records.append(Player(team_id=self.team_id, name=name, live_pz=live_pz))
+
+    def _match(self, cells: List[List[str]]) -> Optional[Match]:
+        if len(cells) < 10:
+            return None
+        clean = [_cell_text(c) for c in cells]
+        status = "upcoming"
+        home_score = guest_score = None
+        m = re.search(r"(\d+):(\d+)", clean[9])
+        if m:
+            status = "completed"
+            home_score = int(m.group(1))
+            guest_score = int(m.group(2))
+        return Match(
+            team_id=self.team_id,
+            match_number=clean[1],
+            date=clean[4],
+            time=clean[6],
+            weekday=clean[3],
+            home_team=clean[7],
+            guest_team=clean[8],
+            home_score=home_score,
+            guest_score=guest_score,
+            status=status,
+        )
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        while self._stack:
+            self._pop()
+        if not self._row_players:
+            names = [html_utils.clean_cell("".join(p)) for p in self._fallback_names]
+            pz_values = [_live_pz(cell) for cell in self._fallback_pz]
+            for idx, name in enumerate(n for n in names if n):
+                self._emit_player(name, pz_values[idx] if idx < len(pz_values) else None)
+            self._fallback_names, self._fallback_pz = [], []
+
+
+def iter_roster_records(
+    source: Union[str, Iterable[str]], *, team_id: str
+) -> Iterator[Union[Match, Player]]:
+    """Yield `Match` / `Player` records of a roster page as their rows complete.
+
+    ``source`` is the page text or an iterable of text chunks (e.g. `iter_roster_file`).
+    """
+    chunks = (
+        (source[i : i + CHUNK_SIZE] for i in range(0, len(source), CHUNK_SIZE))
+        if isinstance(source, str)
+        else source
+    )
+    parser = RosterStreamParser(team_id=team_id)
+    for chunk in chunks:
+        parser.feed(chunk)
+        while parser.records:
+            yield parser.records.popleft()
+    parser.close()
+    while parser.records:
+        yield parser.records.popleft()
+
+
+def iter_roster_file(
+    path: str, *, team_id: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Union[Match, Player]]:
+    """`iter_roster_records` over a stored page read ``chunk_size`` characters at a time."""
+
+    def chunks() -> Iterator[str]:
+        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+            while True:
+                chunk = fh.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    return iter_roster_records(chunks(), team_id=team_id)
+
+
+def stream_roster(
+    source: Union[str, Iterable[str]], *, team_id: str
+) -> Tuple[List[Match], List[Player]]:
+    """(matches, players) of a roster page, equal to the BeautifulSoup extractors."""
+    matches: List[Match] = []
+    players: List[Player] = []
+    for record in iter_roster_records(source, team_id=team_id):
+        (matches if isinstance(record, Match) else players).append(record)
+    return matches, players
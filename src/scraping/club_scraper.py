@@ -5,14 +5,14 @@ import os
 from typing import Dict
 from core import http_client, filesystem
 from parsing import club_parser
-from bs4 import BeautifulSoup  # type: ignore
+from parsing.html_backend import make_soup
 from domain.models import Team
 from utils import naming
 
 
 def _extract_club_name(html: str) -> str | None:
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         title = soup.find("title")
         if title and title.text:
             # Look for 'Vereinsinformation ' and take substring after it
@@ -28,14 +28,24 @@ def fetch_and_parse_club(
     url: str, club_id: str, data_dir: str
 ) -> tuple[str | None, Dict[str, Team]]:
     html = http_client.fetch(url)
-    club_name = _extract_club_name(html)
-    # Persist using club name if available else fallback to id-based
+    return parse_and_persist_club(html, club_id, data_dir)
+
+
+def club_overview_path(club_name: str | None, club_id: str, data_dir: str) -> str:
+    """Path of a persisted club overview (named by club name if known, else by id)."""
     if club_name:
         filename = naming.club_overview_by_name_filename(club_name)
     else:
         filename = naming.club_overview_filename(club_id)
-    clubs_dir = os.path.join(data_dir, "clubs")
-    filesystem.write_text(os.path.join(clubs_dir, filename), html)
+    return os.path.join(data_dir, "clubs", filename)
+
+
+def parse_and_persist_club(
+    html: str, club_id: str, data_dir: str
+) -> tuple[str | None, Dict[str, Team]]:
+    """Persist an already fetched club overview page and extract its teams."""
+    club_name = _extract_club_name(html)
+    filesystem.write_text(club_overview_path(club_name, club_id, data_dir), html)
     teams = club_parser.extract_club_teams(html, club_id=club_id)
     # If club name available, patch team objects with normalized name via attribute if present
     if club_name:
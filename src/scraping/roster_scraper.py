@@ -19,6 +19,13 @@ def fetch_roster(
     behavior nested division twice).
     """
     html = http_client.fetch(url)
+    return save_roster(html, division, team_name, team_id, division_dir)
+
+
+def save_roster(
+    html: str, division: str, team_name: str, team_id: str | None, division_dir: str
+) -> str:
+    """Persist already fetched roster HTML using the canonical roster filename."""
     filename = naming.team_roster_filename(division, team_name, team_id)
     path = os.path.join(division_dir, filename)
     filesystem.write_text(path, html)
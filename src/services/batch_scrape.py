@@ -0,0 +1,167 @@
+"""Batch `pipeline.run_full` over several (club, season) targets.
+
+Clubs of one league share most of their divisions, so scraping them one after
+another requests the same ranking tables and rosters again. `run_batch` runs
+the targets concurrently (``max_concurrent`` at a time) and shares everything
+that deduplicates requests between them:
+
+ - one `core.fetch_memo.FetchMemo`: a URL requested by several targets is fetched
+   once (targets arriving while it is in flight wait for the same result). League
+   pages (club overviews, ranking tables, rosters) are kept for the whole batch, as
+   every target requests them; of other pages (player histories) it keeps
+   ``settings.FETCH_MEMO_MAX_COMPLETED`` recent results per concurrently running
+   target, so that part of its memory follows ``max_concurrent``;
+ - the process-wide HTTP session (keep-alive pool), its conditional cache and the
+   default `core.rate_limit.RateGovernor`, so the request rate ceiling applies to
+   the batch as a whole rather than per target.
+
+Each target is written to its own data dir (``<base_dir>/<season>/<club_id>``
+unless given explicitly) and a consolidated summary of all targets is written
+to ``batch_summary.json`` in ``base_dir``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config import settings
+from core import filesystem, http_client
+from core.fetch_memo import FetchMemo
+from services import pipeline
+
+__all__ = ["SUMMARY_FILENAME", "BatchTarget", "parse_target", "run_batch"]
+
+SUMMARY_FILENAME = "batch_summary.json"
+
+
+@dataclass
+class BatchTarget:
+    club_id: int
+    season: int
+    data_dir: Optional[str] = None  # default: <base_dir>/<season>/<club_id>
+
+    @property
+    def label(self) -> str:
+        return f"{self.club_id}@{self.season}"
+
+
+def _league_page(url: str) -> bool:
+    """Club overview, ranking table or roster: pages requested by every target of a league."""
+    return any(key in url for key in ("L2=Verein", "L3=Tabelle", "L3=Mannschaften"))
+
+
+def parse_target(spec: str, default_season: int | None = None) -> BatchTarget:
+    """Parse ``CLUB`` or ``CLUB:SEASON`` (as given on the command line)."""
+    club, _, season = spec.partition(":")
+    return BatchTarget(int(club), int(season or default_season or settings.DEFAULT_SEASON))
+
+
+def _target_summary(result: dict) -> dict:
+    return {
+        "status": "completed",
+        "players_total": result.get("players_total", 0),
+        "divisions_discovered": result.get("divisions_discovered", 0),
+        "total_matches": result.get("total_matches", 0),
+        "files_written": len(result.get("manifest", [])),
+        "errors": len(result.get("errors", [])),
+        "net_bytes": result.get("net_bytes", {}),
+    }
+
+
+def run_batch(
+    targets: Iterable[BatchTarget],
+    base_dir: str | None = None,
+    *,
+    max_concurrent: int | None = None,
+    progress: Callable[[str, dict], Any] | None = None,
+    cancel_token: Any | None = None,
+    parse_workers: int | None = None,
+    async_mode: bool = False,
+    max_per_host: int | None = None,
+) -> dict:
+    """Scrape every target, ``max_concurrent`` (``settings.BATCH_SCRAPE_CONCURRENCY``) at once.
+
+    ``progress`` receives the pipeline events of every target with a ``target`` label
+    (``"<club>@<season>"``) added to the payload, plus ``target_start`` and
+    ``target_complete`` ({target, status}). A failing or cancelled target does not stop
+    the others. Returns the consolidated summary that is also written to
+    ``<base_dir>/batch_summary.json``.
+    """
+    base_dir = base_dir or settings.DATA_DIR
+    target_list = list(targets)
+    workers = max(1, max_concurrent or settings.BATCH_SCRAPE_CONCURRENCY)
+    # League pages are pinned for later targets; other pages shared by targets running side
+    # by side are requested at about the same time: a window per running target covers them
+    memo = FetchMemo(max_completed=settings.FETCH_MEMO_MAX_COMPLETED * workers, pin=_league_page)
+    session = http_client.get_default_session()
+    pool_start = session.stats()
+    progress_lock = threading.Lock()
+    started = time.perf_counter()
+
+    def _emit(event: str, payload: dict) -> None:
+        if progress:
+            with progress_lock:  # targets report from their own threads
+                progress(event, payload)
+
+    def _run(target: BatchTarget) -> dict:
+        data_dir = target.data_dir or os.path.join(
+            base_dir, str(target.season), str(target.club_id)
+        )
+        entry: Dict[str, Any] = {**asdict(target), "data_dir": data_dir}
+        _emit("target_start", {"target": target.label, "data_dir": data_dir})
+        t0 = time.perf_counter()
+        try:
+            result = pipeline.run_full(
+                target.club_id,
+                season=target.season,
+                data_dir=data_dir,
+                progress=(lambda e, p: _emit(e, {**p, "target": target.label})),
+                cancel_token=cancel_token,
+                parse_workers=parse_workers,
+                async_mode=async_mode,
+                max_per_host=max_per_host,
+                memo=memo,
+            )
+            entry.update(_target_summary(result))
+        except pipeline.PipelineCancelled:
+            entry["status"] = "cancelled"
+        except Exception as e:  # one failing target must not abort the batch
+            entry.update(status="failed", error=str(e))
+        entry["duration_seconds"] = time.perf_counter() - t0
+        _emit("target_complete", {"target": target.label, "status": entry["status"]})
+        return entry
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-scrape") as pool:
+        entries: List[dict] = list(pool.map(_run, target_list))
+
+    pool_end = session.stats()
+    statuses = [e["status"] for e in entries]
+    summary = {
+        "finished_at": datetime.utcnow().isoformat(),
+        "base_dir": base_dir,
+        "max_concurrent": workers,
+        "targets": entries,
+        "completed": statuses.count("completed"),
+        "failed": statuses.count("failed"),
+        "cancelled": statuses.count("cancelled"),
+        "players_total": sum(e.get("players_total", 0) for e in entries),
+        "fetch_dedup": memo.stats(),
+        "http_pool": {
+            k: pool_end.get(k, 0) - pool_start.get(k, 0)
+            for k in ("requests", "connections_opened", "connections_reused")
+        },
+        "rate_limit": session.governor.metrics(),
+        "wall_seconds": time.perf_counter() - started,
+    }
+    memo.clear()  # release the retained pages
+    filesystem.write_text(
+        os.path.join(base_dir, SUMMARY_FILENAME), json.dumps(summary, indent=2, default=str)
+    )
+    return summary
@@ -1,4 +1,8 @@
-"""Utilities to compare two scrape output directories and report discrepancies."""
+"""Utilities to compare two scrape output directories and report discrepancies.
+
+`compare_snapshots` / `snapshot_diff` compare two scrapes kept in a
+`services.snapshot_archive.SnapshotArchive` instead of two directory trees.
+"""
 
 from __future__ import annotations
 import os
@@ -58,3 +62,31 @@ def unified_diff(old_file: str, new_file: str, n: int = 3) -> str:
         return "".join(diff)
     except Exception as e:
         return f"Error generating diff: {e}"
+
+
+def compare_snapshots(archive, old_scrape: str, new_scrape: str) -> Dict[str, List[str]]:
+    """`compare_dirs` for two scrapes of a snapshot archive (digests compared, nothing decoded)."""
+    old_tree = archive.tree(old_scrape)
+    new_tree = archive.tree(new_scrape)
+    old_set = set(old_tree)
+    new_set = set(new_tree)
+    return {
+        "missing_in_new": sorted(old_set - new_set),
+        "extra_in_new": sorted(new_set - old_set),
+        "changed": sorted(p for p in old_set & new_set if old_tree[p] != new_tree[p]),
+        "total_old": [str(len(old_tree))],
+        "total_new": [str(len(new_tree))],
+    }
+
+
+def snapshot_diff(archive, path: str, old_scrape: str, new_scrape: str, n: int = 3) -> str:
+    """Unified diff of one archived page between two scrapes."""
+    try:
+        old_lines = archive.get(path, old_scrape).splitlines(keepends=True)
+        new_lines = archive.get(path, new_scrape).splitlines(keepends=True)
+    except KeyError as e:
+        return f"Error generating diff: {e}"
+    diff = difflib.unified_diff(
+        old_lines, new_lines, fromfile=f"{old_scrape}/{path}", tofile=f"{new_scrape}/{path}", n=n
+    )
+    return "".join(diff)
@@ -0,0 +1,81 @@
+"""Priority ordering of `pipeline.run_full` work: the primary club first.
+
+The landing page of a full scrape is the primary club's overview, so its roster
+links name the club's own teams. `CrawlFrontier` orders each phase's jobs so
+that the primary club's items are fetched and persisted before the rest of the
+league, and tells the roster writer when the last high-priority roster has been
+written. The pipeline then completes the primary slice (club overview and club
+team pages) and emits ``partial_ready`` while other clubs, their team pages and
+player histories follow at low priority. What the slice persisted is recorded
+here (`record_slice`) so the later club steps do not fetch and write it again.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional, Set, TypeVar
+
+from utils import naming
+
+__all__ = ["HIGH", "LOW", "CrawlFrontier"]
+
+HIGH = 0
+LOW = 1
+
+T = TypeVar("T")
+
+
+@dataclass
+class CrawlFrontier:
+    """Priorities of one run (primary club id, its team ids and, once known, its name)."""
+
+    primary_club_id: str
+    primary_team_ids: Set[str] = field(default_factory=set)
+    primary_club_name: Optional[str] = None
+    high_pending: int = 0
+    # Club overviews and club team pages already persisted by the primary slice
+    slice_club_ids: Set[str] = field(default_factory=set)
+    slice_team_ids: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_landing(cls, club_id: int | str, roster_links: Iterable[str]) -> "CrawlFrontier":
+        team_ids = set()
+        for link in roster_links:
+            m = re.search(r"L3P=(\d+)", link)
+            if m:
+                team_ids.add(m.group(1))
+        return cls(str(club_id), team_ids)
+
+    def team_priority(self, team_id: str) -> int:
+        return HIGH if team_id in self.primary_team_ids else LOW
+
+    def club_priority(self, club_id: str) -> int:
+        return HIGH if str(club_id) == self.primary_club_id else LOW
+
+    def club_team_file_priority(self, filename: str) -> int:
+        """Priority of a ``club_team_<club>_<team>_<id>.html`` file (player history sets)."""
+        if self.primary_club_name:
+            prefix = f"club_team_{naming.sanitize(self.primary_club_name)}_"
+            if filename.startswith(prefix):
+                return HIGH
+        m = re.search(r"_(\d+)\.html$", filename)
+        return self.team_priority(m.group(1)) if m else LOW
+
+    def order_teams(self, jobs: Iterable[T], team_id: Callable[[T], str]) -> List[T]:
+        """Stable sort of ``jobs`` with the primary club's teams first; counts them as pending."""
+        ordered = sorted(jobs, key=lambda job: self.team_priority(team_id(job)))
+        self.high_pending = sum(1 for job in ordered if self.team_priority(team_id(job)) == HIGH)
+        return ordered
+
+    def record_slice(self, club_id: int | str, team_ids: Iterable[str]) -> None:
+        """Note the club overview and club team pages written by the primary slice."""
+        self.slice_club_ids.add(str(club_id))
+        self.slice_team_ids.update(team_ids)
+
+    def complete(self, team_id: str) -> bool:
+        """Mark a team job done; True exactly when it was the last high-priority one."""
+        if self.high_pending and self.team_priority(team_id) == HIGH:
+            self.high_pending -= 1
+            return self.high_pending == 0
+        return False
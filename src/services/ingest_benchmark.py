@@ -0,0 +1,167 @@
+"""Bulk ingest benchmark: serial vs process-pool parsing (`db.parallel_parse`).
+
+`replicate_corpus` copies the division folders of a recorded corpus ``factor``
+times (folder and file names prefixed ``x<k>_``, so every replica is audited and
+ingested as its own set of pages). `run_ingest_benchmark` ingests the replicated
+corpus into a fresh in-memory database per run with ``db.ingest.ingest_path`` and /
+or the GUI `IngestionCoordinator`, once per worker count, with the
+parse cache off so every page is parsed. Per target and worker count it reports
+wall time, errors and the speed-up over the serial run, and whether the
+resulting rows (timestamps excluded) are identical to the serial run's. Both
+ingest paths only start a pool for more than one worker, so counts of 0 and 1
+are the same serial run and reported once, as ``workers=0``.
+
+Ranking pages carry their division name in the page itself, so replicas of a
+division write to the same division / team / player rows: the parse work scales
+with ``factor`` while the stored row counts stay those of the original corpus.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+import sqlite3
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+from config import settings
+from db.ingest import ingest_path
+from db.migration_manager import apply_pending_migrations
+from db.schema import apply_schema
+
+__all__ = [
+    "TARGETS",
+    "DEFAULT_WORKERS",
+    "replicate_corpus",
+    "run_ingest_benchmark",
+    "format_report",
+]
+
+TARGETS = ("ingest_path", "coordinator")
+# Worker counts timed by default (0 = serial reference)
+DEFAULT_WORKERS = (0, 2, 4)
+# Tables compared between runs (columns ending in "_at" are timestamps and skipped)
+_COMPARED_TABLES = ("division", "team", "player", "match", "division_ranking")
+
+
+def replicate_corpus(src: str | Path, dest: str | Path, factor: int = 10) -> int:
+    """Copy the division folders of ``src`` ``factor`` times into ``dest``; returns pages."""
+    src, dest = Path(src), Path(dest)
+    pages = 0
+    for folder in sorted(p for p in src.iterdir() if p.is_dir() and not p.name.startswith("_")):
+        html = sorted(folder.glob("*.html"))
+        if not html:
+            continue
+        for k in range(factor):
+            name = f"x{k}_{folder.name}"
+            target = dest / name
+            target.mkdir(parents=True, exist_ok=True)
+            for page in html:
+                shutil.copyfile(page, target / page.name.replace(folder.name, name, 1))
+                pages += 1
+    return pages
+
+
+def _db() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    apply_pending_migrations(conn)
+    return conn
+
+
+def _rows(conn: sqlite3.Connection) -> Dict[str, List[tuple]]:
+    out: Dict[str, List[tuple]] = {}
+    for table in _COMPARED_TABLES:
+        try:
+            cols = [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+            cols = [c for c in cols if not c.endswith("_at")]
+            if cols:
+                out[table] = conn.execute(
+                    f"SELECT {', '.join(cols)} FROM {table} ORDER BY {', '.join(cols)}"
+                ).fetchall()
+        except sqlite3.Error:
+            continue
+    return out
+
+
+def _run_once(target: str, corpus_dir: str, workers: int) -> Dict[str, Any]:
+    conn = _db()
+    t0 = time.perf_counter()
+    if target == "ingest_path":
+        ingest_path(conn, corpus_dir, parse_cache=False, workers=workers)
+        errors = 0  # ingest_path raises on failures
+    else:
+        from gui.services.ingestion_coordinator import IngestionCoordinator
+
+        summary = IngestionCoordinator(
+            corpus_dir, conn, parse_cache=False, parse_workers=workers
+        ).run(force=True)
+        errors = len(summary.errors)
+    seconds = time.perf_counter() - t0
+    rows = _rows(conn)
+    conn.close()
+    return {"seconds": seconds, "errors": errors, "rows": rows}
+
+
+def run_ingest_benchmark(
+    corpus_dir: str | None = None,
+    *,
+    replicas: int = 10,
+    workers: Sequence[int] = DEFAULT_WORKERS,
+    targets: Sequence[str] = TARGETS,
+) -> Dict[str, Any]:
+    """Ingest ``corpus_dir`` replicated ``replicas`` times once per target and worker count."""
+    corpus_dir = corpus_dir or settings.DATA_DIR
+    # The serial run is the reference; a single worker is that same serial run
+    counts = [0] + sorted({w for w in workers if w > 1})
+    result_rows: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="rp_ingest_bench_") as tmp:
+        pages = replicate_corpus(corpus_dir, tmp, replicas)
+        for target in targets:
+            if target not in TARGETS:
+                raise ValueError(f"unknown ingest target: {target}")
+            reference: Dict[str, List[tuple]] = {}
+            baseline = 0.0
+            for count in counts:
+                run = _run_once(target, tmp, count)
+                if count == 0:
+                    reference, baseline = run["rows"], run["seconds"]
+                result_rows.append(
+                    {
+                        "target": target,
+                        "workers": count,
+                        "seconds": run["seconds"],
+                        "errors": run["errors"],
+                        "speedup": (baseline / run["seconds"]) if run["seconds"] else 0.0,
+                        "identical": run["rows"] == reference,
+                    }
+                )
+    return {
+        "config": {
+            "corpus_dir": corpus_dir,
+            "replicas": replicas,
+            "corpus_pages": pages,
+            "cpu_count": os.cpu_count() or 1,
+        },
+        "rows": result_rows,
+    }
+
+
+def format_report(result: Dict[str, Any]) -> List[str]:
+    """Plain-text table of a `run_ingest_benchmark` result (one row per target and workers)."""
+    cfg = result["config"]
+    lines = [
+        f"corpus {cfg['corpus_dir']} x{cfg['replicas']}: {cfg['corpus_pages']} pages,"
+        f" {cfg['cpu_count']} CPUs",
+        "",
+        f"{'target':<13}{'workers':>8}{'errors':>7}{'total s':>9}{'speedup':>9}{'rows':>11}",
+    ]
+    for r in result["rows"]:
+        lines.append(
+            f"{r['target']:<13}{r['workers']:>8}{r['errors']:>7}"
+            f"{r['seconds']:>9.2f}{r['speedup']:>8.2f}x"
+            f"{'identical' if r['identical'] else 'DIFFER':>11}"
+        )
+    return lines
@@ -0,0 +1,186 @@
+"""Per-parser benchmark and parity check of the HTML parser backends.
+
+`run_benchmark` classifies the pages of a recorded corpus by filename (landing
+page, ranking tables, team rosters / club team pages, club overviews), runs the
+matching parser over every page with each requested `parsing.html_backend`
+backend and reports, per parser and backend, pages parsed, total / mean time and
+the speed-up over ``html.parser``. Each page's output is compared with the
+``html.parser`` output; differing pages are counted as mismatches and listed, so
+switching ``HTML_PARSER_BACKEND`` can be validated on real data before it ships.
+
+Parsers with a restricted-parse mode (``HTML_RESTRICTED_PARSE``) get a second
+``restricted`` row per backend. Every row also reports the mean tree size and
+allocation peak of one parse per page (``node_count`` / ``memory_delta_kb``, as in
+``ParsePreview``), so full and restricted trees can be compared directly.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from config import settings
+from parsing import club_parser, html_backend, link_extractor, ranking_parser
+from parsing.roster_parser import ROSTER_PARSE_ONLY, ParsedRoster
+
+__all__ = ["PARSERS", "corpus_files", "parse_corpus", "run_benchmark", "format_report"]
+
+
+def _roster(html: str, backend: str, restricted: bool) -> Tuple[Any, ...]:
+    page = ParsedRoster(html, backend=backend, restricted=restricted)
+    return (page.matches(team_id="t"), page.players(team_id="t"), page.club_link())
+
+
+def _ranking(html: str, name: str, backend: str, restricted: bool) -> Any:
+    return ranking_parser.parse_ranking_table(html, name, backend=backend, restricted=restricted)
+
+
+# parser name -> (filename prefixes, parse function(html, filename, backend, restricted),
+# restricted-parse filter or None when the parser always builds the full tree)
+PARSERS: Dict[str, Tuple[Tuple[str, ...], Callable[[str, str, str, bool], Any], Any]] = {
+    "link_extractor": (
+        ("website_source_",),
+        lambda html, name, b, r: link_extractor.extract_team_roster_links(html, backend=b),
+        None,
+    ),
+    "ranking_parser": (("ranking_table_",), _ranking, ranking_parser.RANKING_PARSE_ONLY),
+    "roster_parser": (
+        ("team_roster_", "club_team_"),
+        lambda html, name, b, r: _roster(html, b, r),
+        ROSTER_PARSE_ONLY,
+    ),
+    "club_parser": (
+        ("club_overview_",),
+        lambda html, name, b, r: club_parser.extract_club_teams(html, club_id="0", backend=b),
+        None,
+    ),
+}
+
+
+def corpus_files(corpus_dir: str) -> Dict[str, List[str]]:
+    """Corpus pages (sorted paths) grouped by the parser that handles them."""
+    groups: Dict[str, List[str]] = {name: [] for name in PARSERS}
+    for root, _dirs, files in os.walk(corpus_dir):
+        for fname in files:
+            if not fname.endswith(".html"):
+                continue
+            for name, (prefixes, _fn, _only) in PARSERS.items():
+                if fname.startswith(prefixes):
+                    groups[name].append(os.path.join(root, fname))
+                    break
+    for paths in groups.values():
+        paths.sort()
+    return groups
+
+
+def _read(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+        return fh.read()
+
+
+def parse_corpus(corpus_dir: str, backend: str, *, restricted: bool = False) -> Dict[str, Any]:
+    """Output of every corpus page parsed with ``backend``, keyed by relative path."""
+    out: Dict[str, Any] = {}
+    for name, paths in corpus_files(corpus_dir).items():
+        fn = PARSERS[name][1]
+        for path in paths:
+            rel = os.path.relpath(path, corpus_dir)
+            out[rel] = fn(_read(path), os.path.basename(path), backend, restricted)
+    return out
+
+
+def run_benchmark(
+    corpus_dir: str | None = None,
+    *,
+    backends: Sequence[str] | None = None,
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    """Time every parser over the corpus per installed backend and mode (best of ``repeat``)."""
+    corpus_dir = corpus_dir or settings.DATA_DIR
+    requested = list(backends or html_backend.BACKENDS)
+    installed = set(html_backend.available_backends())
+    # html.parser first: its full-tree output is the parity reference
+    used = [html_backend.DEFAULT_BACKEND] + [
+        b for b in requested if b in installed and b != html_backend.DEFAULT_BACKEND
+    ]
+    groups = corpus_files(corpus_dir)
+    pages = {path: _read(path) for paths in groups.values() for path in paths}
+    rows: List[Dict[str, Any]] = []
+    for name, paths in groups.items():
+        if not paths:
+            continue
+        _prefixes, fn, parse_only = PARSERS[name]
+        modes = [("full", False)] + ([("restricted", True)] if parse_only is not None else [])
+        reference: Dict[str, Any] = {}
+        baseline = 0.0
+        for backend in used:
+            for mode, restricted in modes:
+                best = float("inf")
+                outputs: Dict[str, Any] = {}
+                for _ in range(max(1, repeat)):
+                    t0 = time.perf_counter()
+                    for path in paths:
+                        outputs[path] = fn(pages[path], os.path.basename(path), backend, restricted)
+                    best = min(best, time.perf_counter() - t0)
+                if not reference:
+                    reference, baseline = outputs, best
+                footprints = [
+                    html_backend.measure_parse(
+                        pages[path], backend, parse_only if restricted else None
+                    )
+                    for path in paths
+                ]
+                mismatches = sorted(
+                    os.path.relpath(p, corpus_dir) for p in paths if outputs[p] != reference[p]
+                )
+                rows.append(
+                    {
+                        "parser": name,
+                        "backend": backend,
+                        "mode": mode,
+                        "pages": len(paths),
+                        "total_seconds": best,
+                        "mean_ms": best / len(paths) * 1000.0,
+                        "speedup": (baseline / best) if best else 0.0,
+                        "node_count": sum(f.node_count for f in footprints) // len(paths),
+                        "memory_delta_kb": sum(f.memory_delta_kb for f in footprints) / len(paths),
+                        "mismatches": mismatches,
+                    }
+                )
+    return {
+        "config": {
+            "corpus_dir": corpus_dir,
+            "corpus_pages": len(pages),
+            "repeat": repeat,
+            "backends": used,
+            "unavailable": [b for b in requested if b not in installed],
+        },
+        "rows": rows,
+    }
+
+
+def format_report(result: Dict[str, Any]) -> List[str]:
+    """Plain-text table of a `run_benchmark` result (one row per parser and backend)."""
+    cfg = result["config"]
+    lines = [
+        f"corpus {cfg['corpus_dir']}: {cfg['corpus_pages']} pages, best of {cfg['repeat']}",
+    ]
+    if cfg["unavailable"]:
+        lines.append(f"not installed: {', '.join(cfg['unavailable'])}")
+    lines.append("")
+    lines.append(
+        f"{'parser':<16}{'backend':<13}{'mode':<11}{'pages':>6}{'total s':>9}{'mean ms':>9}"
+        f"{'speedup':>9}{'nodes':>8}{'mem KB':>9}{'mismatch':>9}"
+    )
+    for r in result["rows"]:
+        lines.append(
+            f"{r['parser']:<16}{r['backend']:<13}{r['mode']:<11}{r['pages']:>6}"
+            f"{r['total_seconds']:>9.3f}{r['mean_ms']:>9.2f}{r['speedup']:>8.2f}x"
+            f"{r['node_count']:>8}{r['memory_delta_kb']:>9.1f}{len(r['mismatches']):>9}"
+        )
+    lines.append("(nodes / mem KB: mean tree size and allocation peak of one parse per page)")
+    for r in result["rows"]:
+        for path in r["mismatches"]:
+            lines.append(f"  mismatch {r['parser']} [{r['backend']}, {r['mode']}]: {path}")
+    return lines
@@ -1,19 +1,26 @@
 """High-level orchestration pipeline (extended)."""
 
 from __future__ import annotations
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Callable, Any, Iterable, Iterator, Tuple
+from collections import Counter
 from datetime import datetime
+from functools import partial
 import os
+import re
 
 from config import settings
-from scraping import ranking_scraper, roster_scraper, club_scraper
+from scraping import ranking_scraper, club_scraper
 from parsing import link_extractor, ranking_parser, roster_parser, club_parser
-from core import filesystem
+from core import filesystem, http_client
+from core.fetch_memo import FetchMemo
+from services import scrape_manifest, snapshot_archive
+from services.scrape_journal import ScrapeJournal
+from services.crawl_frontier import CrawlFrontier
+from services.stage_pipeline import ParseFailed, StagedPipeline
 from utils import naming
 from domain.models import Team, Match, Player, TrackingState, Division
 from domain import mapping as domain_mapping
-from tracking import tracking_store, rescrape_policy, upcoming_matches
-
+from tracking import tracking_store, rescrape_policy, upcoming_matches, history_freshness
 
 LANDING_URL_TEMPLATE = (
     "https://leipzig.tischtennislive.de/"
@@ -21,6 +28,26 @@ LANDING_URL_TEMPLATE = (
 )
 
 
+def _parse_ranking_page(html: str, source_hint: str):
+    """Parse stage worker: (division name, team rows) of a ranking table."""
+    return ranking_parser.parse_ranking_table(html, source_hint=source_hint)
+
+
+def _parse_roster_page(html: str, team_id: str):
+    """Parse stage worker: (matches, players, club link) of a team roster page."""
+    page = roster_parser.ParsedRoster(html)
+    return (
+        page.matches(team_id=team_id),
+        page.players(team_id=team_id),
+        page.club_link(),
+    )
+
+
+def _failed_stage(error: BaseException) -> str:
+    """Stage a streamed page failed in (its parse or its fetch)."""
+    return "parse" if isinstance(error, ParseFailed) else "fetch"
+
+
 def run_basic(club_id: int, season: int | None = None, data_dir: str | None = None) -> dict:
     """Run lightweight discovery only scrape.
 
@@ -32,7 +59,8 @@ def run_basic(club_id: int, season: int | None = None, data_dir: str | None = No
     html = ranking_scraper.http_client.fetch(url)  # type: ignore[attr-defined]
     roster_links = link_extractor.extract_team_roster_links(html)
     ranking_links = link_extractor.derive_ranking_table_links(roster_links)
-    teams_overview = ranking_scraper.fetch_and_parse_overview(url)
+    # parse the page already in hand (fetch_and_parse_overview would request it again)
+    teams_overview = ranking_parser.extract_team_overview(html)
     state = tracking_store.load_state(target_dir)
     return {
         "landing_url": url,
@@ -55,6 +83,11 @@ def run_full(
     progress: Callable[[str, dict], Any] | None = None,
     cancel_token: Any | None = None,
     pause_token: Any | None = None,
+    async_mode: bool = False,
+    max_per_host: int | None = None,
+    resume: bool = False,
+    parse_workers: int | None = None,
+    memo: FetchMemo | None = None,
 ) -> dict:
     """Run full scrape pipeline writing HTML assets to data_dir (or default).
 
@@ -64,7 +97,107 @@ def run_full(
         phase_start: payload {key}
         phase_progress: payload {key, fraction, detail?}
         phase_complete: payload {key}
+        partial_ready: payload {club_id, club_name, divisions, rosters, club_team_pages,
+            files, data_dir} - the primary club's pages are on disk
+        division_complete: payload {division, files, teams, data_dir} - a division's
+            ranking table and rosters are on disk
+    async_mode, max_per_host: fetch each phase concurrently (`core.concurrent_fetch`).
+    resume: continue an interrupted run of the same club / season
+        (`services.scrape_journal`).
+    parse_workers: parser processes of the streaming stages (`services.stage_pipeline`).
+    memo: fetch memo shared with other runs (`core.fetch_memo`, `services.batch_scrape`).
+
+    Fetches are paced by `core.rate_limit` and ordered by `services.crawl_frontier`;
+    player histories are refetched as `tracking.history_freshness` decides. Pages are
+    written by `core.filesystem.BatchedWriter`, recorded in `services.scrape_manifest`
+    and, with ``settings.SNAPSHOT_ARCHIVE``, archived in `services.snapshot_archive`.
+    See those modules for the result entries they add.
     """
+    season = season or settings.DEFAULT_SEASON
+    data_dir = data_dir or settings.DATA_DIR
+    memo = memo if memo is not None else FetchMemo()
+    journal = ScrapeJournal(data_dir, club_id, season, resume=resume)
+    manifest = scrape_manifest.load(data_dir)
+    # Page writes that failed on the writer thread; reported as recoverable errors
+    write_failures: List[Tuple[str, BaseException]] = []
+    writer = filesystem.BatchedWriter(
+        on_error=lambda path, error: write_failures.append((path, error))
+    )
+    stages = StagedPipeline(parse_workers=parse_workers, progress=progress)
+    fetcher = None
+    status = "completed"
+    try:
+        if async_mode:
+            from core.concurrent_fetch import ConcurrentFetcher
+
+            fetcher = ConcurrentFetcher(
+                max_per_host=max_per_host,
+                cancel_token=cancel_token,
+                pause_token=pause_token,
+                memo=memo,
+            )
+        result = _run_full(
+            club_id,
+            season,
+            data_dir,
+            progress=progress,
+            cancel_token=cancel_token,
+            pause_token=pause_token,
+            fetcher=fetcher,
+            memo=memo,
+            journal=journal,
+            stages=stages,
+            manifest=manifest,
+            writer=writer,
+            write_failures=write_failures,
+        )
+        writer.flush()
+        if fetcher is not None:
+            result["fetch_stats"] = fetcher.stats()
+        result["stage_stats"] = stages.phase_stats
+        result["write_stats"] = writer.stats()
+        result["manifest"] = manifest.written_entries()
+        if settings.SNAPSHOT_ARCHIVE:
+            result["snapshot_archive"] = snapshot_archive.archive_scrape(
+                data_dir, manifest, max_age_days=settings.SNAPSHOT_ARCHIVE_MAX_AGE_DAYS
+            )
+    except PipelineCancelled:
+        status = "cancelled"
+        raise
+    except BaseException:
+        status = "failed"
+        raise
+    finally:
+        stages.close()
+        if fetcher is not None:
+            fetcher.close()
+        try:
+            # Pages are journaled as their writes land, so drain the writer before finishing
+            writer.close()
+        except Exception:  # pragma: no cover - already surfaced by the flush above
+            pass
+        if os.path.isdir(data_dir):  # also after a cancel: the recorded files are on disk
+            manifest.save()
+        journal.finish(status)
+    return result
+
+
+def _run_full(
+    club_id: int,
+    season: int | None,
+    data_dir: str | None,
+    *,
+    progress: Callable[[str, dict], Any] | None,
+    cancel_token: Any | None,
+    pause_token: Any | None,
+    fetcher: Any | None,
+    memo: FetchMemo,
+    journal: ScrapeJournal,
+    stages: StagedPipeline,
+    manifest: scrape_manifest.ScrapeManifest,
+    writer: filesystem.BatchedWriter,
+    write_failures: List[Tuple[str, BaseException]],
+) -> dict:
     import time
 
     season = season or settings.DEFAULT_SEASON
@@ -72,6 +205,12 @@ def run_full(
     os.makedirs(data_dir, exist_ok=True)
     landing_url = LANDING_URL_TEMPLATE.format(club_id=club_id, season=season)
 
+    # Counters of the default session for this run's own requests (several runs of a
+    # batch share the session, so deltas of its totals would include the others')
+    traffic: Counter = Counter()
+    governor = (
+        fetcher.governor if fetcher is not None else http_client.get_default_session().governor
+    )
     phase_start_times: Dict[str, float] = {}
     phase_durations: Dict[str, float] = {}
     errors: List[str] = []
@@ -79,9 +218,26 @@ def run_full(
     def _mark_start(phase_key: str):
         phase_start_times[phase_key] = time.time()
 
+    failed_writes: set[str] = set()
+
+    def _flush(phase_key: str) -> None:
+        """Wait for queued writes; report the ones that failed as recoverable errors."""
+        writer.flush()
+        while write_failures:
+            path, error = write_failures.pop(0)
+            failed_writes.add(path)
+            manifest.discard(path)
+            message = f"write failed: {path}: {error}"
+            errors.append(message)
+            if progress:
+                progress("recoverable_error", {"phase": phase_key, "message": message})
+
     def _mark_end(phase_key: str):
         if phase_key in phase_start_times:
             phase_durations[phase_key] = time.time() - phase_start_times[phase_key]
+        # the phase's pages are on disk (directories fsynced) before it is journaled
+        _flush(phase_key)
+        journal.phase_complete(phase_key)
 
     def _maybe_pause():
         if pause_token is not None and getattr(pause_token, "is_paused", None):
@@ -104,14 +260,159 @@ def run_full(
         ]
     }
 
+    net_bytes: Dict[str, Dict[str, int]] = {k: {"wire": 0, "decoded": 0} for k in net_latency}
+
+    def _add_bytes(phase: str, wire: int, decoded: int) -> None:
+        net_bytes[phase]["wire"] += wire
+        net_bytes[phase]["decoded"] += decoded
+
+    def _emit_net_update(phase: str) -> None:
+        if progress:
+            progress(
+                "net_update",
+                {
+                    "phase": phase,
+                    "latency_total": net_latency[phase],
+                    "wire_bytes": net_bytes[phase]["wire"],
+                    "decoded_bytes": net_bytes[phase]["decoded"],
+                },
+            )
+            progress("rate_update", {"phase": phase, **governor.metrics()})
+
     def _timed_fetch(phase: str, fetch_callable: Callable[[], str]):
         start = time.time()
         html = fetch_callable()
         net_latency[phase] += time.time() - start
-        if progress:
-            progress("net_update", {"phase": phase, "latency_total": net_latency[phase]})
+        _emit_net_update(phase)
         return html
 
+    def _count_traffic(phase: str, used: Counter) -> None:
+        traffic.update(used)
+        _add_bytes(phase, used["wire_bytes"], used["decoded_bytes"])
+
+    def _sync_fetch(phase: str, url: str) -> str:
+        with http_client.get_default_session().metered() as used:
+            try:
+                return ranking_scraper.http_client.fetch(url)  # type: ignore[attr-defined]
+            finally:
+                _count_traffic(phase, used)
+
+    def _async_fetch(phase: str, url: str) -> str:
+        outcome = next(fetcher.iter_fetch([url]))
+        if outcome.error is not None:
+            raise outcome.error
+        _add_bytes(phase, outcome.wire_bytes, outcome.decoded_bytes)
+        return outcome.html
+
+    def _fetch(phase: str, url: str) -> str:
+        restored = journal.restore(url)
+        if restored is not None:
+            return restored
+        if fetcher is not None:
+            return _timed_fetch(phase, lambda: _async_fetch(phase, url))
+        return memo.fetch(url, lambda: _timed_fetch(phase, lambda: _sync_fetch(phase, url)))
+
+    def _pooled_fetch(url: str) -> tuple[str, float, Counter]:
+        start = time.time()
+        with http_client.get_default_session().metered() as used:
+            html = memo.fetch(
+                url, lambda: ranking_scraper.http_client.fetch(url)  # type: ignore[attr-defined]
+            )
+        return html, time.time() - start, used
+
+    def _fetch_window(phase: str, urls: Iterable[str], workers: int) -> Iterator[tuple]:
+        """Sequential-mode fan-out: keep up to ``workers`` requests in flight on threads.
+
+        Results, latency accounting and progress events stay on the calling thread and
+        in input order. On cancellation no new request is started; requests already in
+        flight are still yielded before `PipelineCancelled` is raised. Each request is
+        metered on its worker thread.
+        """
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending: deque = deque()
+        it = iter(urls)
+        exhausted = cancelled = False
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"fetch-{phase}") as pool:
+            try:
+                while True:
+                    while not exhausted and len(pending) < workers:
+                        _maybe_pause()
+                        if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
+                            exhausted = cancelled = True
+                            break
+                        url = next(it, None)
+                        if url is None:
+                            exhausted = True
+                            break
+                        restored = journal.restore(url)
+                        if restored is None:
+                            pending.append((url, pool.submit(_pooled_fetch, url)))
+                        else:
+                            pending.append((url, restored))
+                    if not pending:
+                        break
+                    url, item = pending.popleft()
+                    if isinstance(item, str):
+                        yield url, item, None
+                        continue
+                    try:
+                        html, elapsed, used = item.result()
+                    except Exception as e:  # pragma: no cover - network resilience
+                        yield url, None, e
+                        continue
+                    _count_traffic(phase, used)
+                    net_latency[phase] += elapsed
+                    _emit_net_update(phase)
+                    yield url, html, None
+            finally:
+                for _url, item in pending:
+                    if not isinstance(item, str):
+                        item.cancel()
+        if cancelled:
+            raise PipelineCancelled()
+
+    def _fetch_phase(phase: str, urls: Iterable[str], *, workers: int = 1) -> Iterator[tuple]:
+        """Yield (url, html, error) per url in input order.
+
+        Sequential mode fetches lazily as the caller iterates (``workers`` > 1 keeps that
+        many requests in flight, see `_fetch_window`); async mode schedules the whole
+        batch up-front on the concurrent fetcher. Cancellation is checked before each
+        item so skipped (cancelled) requests never surface as fetch errors. Pages
+        checkpointed by an interrupted run (resume) are served from disk.
+        """
+        if fetcher is None and workers > 1:
+            yield from _fetch_window(phase, urls, workers)
+            return
+        if fetcher is None:
+            for url in urls:
+                _maybe_pause()
+                if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
+                    raise PipelineCancelled()
+                try:
+                    html = _fetch(phase, url)
+                except Exception as e:  # pragma: no cover - network resilience
+                    yield url, None, e
+                    continue
+                yield url, html, None
+            return
+        url_list = list(urls)
+        restored = {u: journal.restore(u) for u in url_list} if journal.resumed else {}
+        outcomes = fetcher.iter_fetch([u for u in url_list if restored.get(u) is None])
+        for url in url_list:
+            if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
+                raise PipelineCancelled()
+            if restored.get(url) is not None:
+                yield url, restored[url], None
+                continue
+            outcome = next(outcomes)
+            net_latency[phase] += outcome.elapsed
+            _add_bytes(phase, outcome.wire_bytes, outcome.decoded_bytes)
+            if outcome.ok:
+                _emit_net_update(phase)
+            yield outcome.url, outcome.html, outcome.error
+
     # Step 1: Landing page fetch & initial extraction
     if progress:
         progress("phase_start", {"key": "landing"})
@@ -119,7 +420,7 @@ def run_full(
     if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
         raise PipelineCancelled()
     try:
-        landing_html = _timed_fetch("landing", lambda: ranking_scraper.http_client.fetch(landing_url))  # type: ignore[attr-defined]
+        landing_html = _fetch("landing", landing_url)
     except Exception as e:  # pragma: no cover - network resilience
         errors.append(f"landing fetch failed: {e}")
         if progress:
@@ -128,10 +429,23 @@ def run_full(
     # Snapshot archive of landing page for parity (timestamped)
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     snapshot_name = f"website_source_{timestamp}.html"
-    filesystem.write_text(os.path.join(data_dir, snapshot_name), landing_html)
+    writer.write_text(
+        os.path.join(data_dir, snapshot_name),
+        landing_html,
+        on_written=(
+            partial(journal.record_fetch, landing_url, os.path.join(data_dir, snapshot_name))
+            if landing_html
+            else None
+        ),
+    )
+    manifest.record(
+        os.path.join(data_dir, snapshot_name), landing_html, kind=scrape_manifest.LANDING
+    )
     initial_roster_links = link_extractor.extract_team_roster_links(landing_html)
     ranking_links = link_extractor.derive_ranking_table_links(initial_roster_links)
     teams_overview = ranking_parser.extract_team_overview(landing_html)
+    # The landing page is the primary club's overview: its teams are crawled first
+    frontier = CrawlFrontier.from_landing(club_id, initial_roster_links)
 
     if progress:
         progress("phase_complete", {"key": "landing"})
@@ -144,29 +458,49 @@ def run_full(
         progress("phase_start", {"key": "ranking_tables"})
     _mark_start("ranking_tables")
     division_team_lists: dict[str, list[dict]] = {}
+    # division name -> files persisted for it (ranking table, then rosters; division_complete)
+    division_files: dict[str, list[str]] = {}
     # Map team_id -> division_id (distinct) gathered from ranking tables for later repair of legacy incorrect files
     team_division_map: dict[str, str] = {}
     total_ranking = len(ranking_links) or 1
-    for idx, rlink in enumerate(ranking_links, start=1):
-        # Fetch ranking table HTML directly (do not persist with generic name first)
-        try:
-            ranking_html = _timed_fetch(
-                "ranking_tables", lambda: ranking_scraper.http_client.fetch(rlink)  # type: ignore[attr-defined]
-            )
-        except Exception as e:  # pragma: no cover
-            errors.append(f"ranking table fetch failed: {e}")
+    # Fetch ranking table HTML directly (do not persist with generic name first)
+    # Fetch -> parse -> write stages; this loop is the writer (parsed results arrive in order)
+    ranking_fetches = _fetch_phase("ranking_tables", ranking_links)
+    ranking_stream = stages.run(
+        "ranking_tables",
+        (((url, i), html, err) for i, (url, html, err) in enumerate(ranking_fetches, start=1)),
+        _parse_ranking_page,
+        lambda job: (f"division_{job[1]}",),
+        expected=len(ranking_links),
+    )
+    for (rlink, idx), ranking_html, fetch_error, parsed_ranking in ranking_stream:
+        if fetch_error is not None:  # pragma: no cover
+            errors.append(f"ranking table {_failed_stage(fetch_error)} failed: {fetch_error}")
             if progress:
-                progress("recoverable_error", {"phase": "ranking_tables", "message": str(e)})
+                progress(
+                    "recoverable_error", {"phase": "ranking_tables", "message": str(fetch_error)}
+                )
             continue
-        division_name, teams = ranking_parser.parse_ranking_table(
-            ranking_html, source_hint=f"division_{idx}"
-        )
+        division_name, teams = parsed_ranking
         # Persist under division directory using real division name
         div_dir = os.path.join(data_dir, naming.sanitize(division_name))
         os.makedirs(div_dir, exist_ok=True)
         ranking_filename = naming.ranking_table_filename(division_name)
-        filesystem.write_text(os.path.join(div_dir, ranking_filename), ranking_html)
+        writer.write_text(
+            os.path.join(div_dir, ranking_filename),
+            ranking_html,
+            on_written=partial(
+                journal.record_fetch, rlink, os.path.join(div_dir, ranking_filename)
+            ),
+        )
+        manifest.record(
+            os.path.join(div_dir, ranking_filename),
+            ranking_html,
+            kind=scrape_manifest.RANKING_TABLE,
+            division=division_name,
+        )
         division_team_lists[division_name] = teams
+        division_files[division_name] = [os.path.join(div_dir, ranking_filename)]
         for t in teams:
             tid = t.get("team_id") or None
             did = t.get("division_id") or None
@@ -175,9 +509,6 @@ def run_full(
         if progress:
             frac = idx / total_ranking
             progress("phase_progress", {"key": "ranking_tables", "fraction": frac})
-        if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
-            raise PipelineCancelled()
-        _maybe_pause()
 
     if progress:
         progress("phase_complete", {"key": "ranking_tables"})
@@ -190,10 +521,16 @@ def run_full(
     _mark_start("division_rosters")
     all_matches: dict[str, list[Match]] = {}
     all_players: dict[str, list[Player]] = {}
+    # Club links found in this run's rosters (club id -> link), collected while parsing them
+    club_links: dict[str, str] = {}
+    # Roster files written by this run -> their HTML (Steps 7c / 7d consult this instead of
+    # rescanning and re-reading data_dir)
+    written_rosters: dict[str, str] = {}
 
     # Pre-compute total teams for fractional progress
     total_teams = sum(len(v) for v in division_team_lists.values()) or 1
     processed_teams = 0
+    roster_jobs: list[tuple[str, dict, str, str]] = []
     for division_name, teams in division_team_lists.items():
         for team in teams:
             roster_link = team["roster_link"]
@@ -203,106 +540,207 @@ def run_full(
                 else f"{settings.ROOT_URL}{roster_link}"
             )
             # Extract team id from link
-            team_id_match = None
-            import re
-
             m = re.search(r"L3P=(\d+)", roster_link)
             team_id = m.group(1) if m else f"unknown_{team['team_name']}"
-            # Division id (L2P) distinct from team id
-            m_div = re.search(r"L2P=(\d+)", roster_link)
-            division_id = m_div.group(1) if m_div else None
-            # Ensure division dir
-            div_dir = os.path.join(data_dir, naming.sanitize(division_name))
-            os.makedirs(div_dir, exist_ok=True)
-            try:
-                path = roster_scraper.fetch_roster(
-                    full_url, division_name, team["team_name"], team_id, div_dir
-                )
-            except Exception as e:  # pragma: no cover
-                errors.append(f"roster fetch failed: {e}")
-                if progress:
-                    progress("recoverable_error", {"phase": "division_rosters", "message": str(e)})
+            roster_jobs.append((division_name, team, team_id, full_url))
+    # Primary club rosters first; once the last one is written the primary slice is completed
+    roster_jobs = frontier.order_teams(roster_jobs, lambda job: job[2])
+
+    def _persist_club(html: str, cid: str) -> tuple[str | None, dict]:
+        name, teams = club_scraper.parse_and_persist_club(html, cid, data_dir)
+        manifest.record(
+            club_scraper.club_overview_path(name, cid, data_dir),
+            html,
+            kind=scrape_manifest.CLUB_OVERVIEW,
+        )
+        return name, teams
+
+    # Primary club's (name, teams) and club team page HTML, reused by the later club steps
+    slice_club: dict[str, tuple[str | None, dict]] = {}
+    slice_team_html: dict[str, str] = {}
+
+    def _primary_slice() -> None:
+        """Persist the primary club's overview and team pages, then emit ``partial_ready``."""
+        primary_url = LANDING_URL_TEMPLATE.format(club_id=club_id, season=season)
+        try:
+            name, teams = _persist_club(_fetch("club_overviews", primary_url), str(club_id))
+        except PipelineCancelled:
+            raise
+        except Exception as e:  # pragma: no cover - network resilience
+            errors.append(f"primary club fetch failed: {e}")
+            name, teams = None, {}
+        else:
+            slice_club[str(club_id)] = (name, teams)
+        frontier.primary_club_name = name
+        display = name or str(club_id)
+        team_urls = []
+        for tid, t in teams.items():
+            roster_url = club_parser.build_roster_link(tid, getattr(t, "division_id", None))
+            team_urls.append(
+                roster_url if roster_url.startswith("http") else f"{settings.ROOT_URL}{roster_url}"
+            )
+        team_paths: dict[str, str] = {}
+        for t, (team_url, html, fetch_error) in zip(
+            teams.values(), _fetch_phase("club_team_pages", team_urls)
+        ):
+            if fetch_error is not None:
                 continue
-            roster_html = filesystem.read_text(path)
-            matches = roster_parser.extract_matches(roster_html, team_id=team_id)
-            players = roster_parser.extract_players(roster_html, team_id=team_id)
-            all_matches[team_id] = matches
-            all_players[team_id] = players
-            processed_teams += 1
+            path = os.path.join(
+                data_dir, "club_teams", naming.club_team_by_name_filename(display, t.name, t.id)
+            )
+            writer.write_text(path, html, on_written=partial(journal.record_fetch, team_url, path))
+            manifest.record(
+                path,
+                html,
+                kind=scrape_manifest.CLUB_TEAM,
+                division=getattr(t, "division_name", None),
+                team_id=t.id,
+            )
+            team_paths[t.id] = path
+            slice_team_html[t.id] = html
+        _flush("division_rosters")
+        written = [tid for tid, path in team_paths.items() if path not in failed_writes]
+        if slice_club:
+            frontier.record_slice(club_id, written)
+        pages = len(written)
+        if progress:
+            progress(
+                "partial_ready",
+                {
+                    "club_id": club_id,
+                    "club_name": name,
+                    "divisions": sorted(division_team_lists),
+                    "rosters": len(written_rosters),
+                    "club_team_pages": pages,
+                    # ranking table + rosters of every division with rosters on disk so far
+                    "files": [
+                        path
+                        for division in sorted(division_files)
+                        if len(division_files[division]) > 1
+                        for path in division_files[division]
+                        if path not in failed_writes
+                    ],
+                    "data_dir": data_dir,
+                },
+            )
+
+    # Rosters still to be written per division; at zero the division's files are announced
+    division_pending: dict[str, int] = {name: 0 for name in division_team_lists}
+    for job in roster_jobs:
+        division_pending[job[0]] += 1
+
+    def _division_complete(division_name: str) -> None:
+        if progress:
+            _flush("division_rosters")
+            progress(
+                "division_complete",
+                {
+                    "division": division_name,
+                    "files": [
+                        path
+                        for path in division_files.get(division_name, [])
+                        if path not in failed_writes
+                    ],
+                    "teams": len(division_team_lists.get(division_name, [])),
+                    "data_dir": data_dir,
+                },
+            )
+
+    def _roster_done(division_name: str, team_id: str) -> None:
+        if frontier.complete(team_id):
+            _primary_slice()
+        division_pending[division_name] -= 1
+        if division_pending[division_name] == 0:
+            _division_complete(division_name)
+
+    if not frontier.high_pending:
+        _primary_slice()
+    for division_name, pending in division_pending.items():
+        if not pending:  # no rosters to wait for
+            _division_complete(division_name)
+    roster_fetches = _fetch_phase("division_rosters", [job[3] for job in roster_jobs])
+    roster_stream = stages.run(
+        "division_rosters",
+        ((job, html, err) for job, (_u, html, err) in zip(roster_jobs, roster_fetches)),
+        _parse_roster_page,
+        lambda job: (job[2],),
+        expected=len(roster_jobs),
+    )
+    for (
+        (division_name, team, team_id, roster_url),
+        fetched_html,
+        fetch_error,
+        parsed_roster,
+    ) in roster_stream:
+        # Ensure division dir
+        div_dir = os.path.join(data_dir, naming.sanitize(division_name))
+        os.makedirs(div_dir, exist_ok=True)
+        if fetch_error is not None:  # pragma: no cover
+            errors.append(f"roster {_failed_stage(fetch_error)} failed: {fetch_error}")
             if progress:
                 progress(
-                    "phase_progress",
-                    {
-                        "key": "division_rosters",
-                        "fraction": processed_teams / total_teams,
-                        "detail": f"{processed_teams}/{total_teams} rosters",
-                    },
+                    "recoverable_error",
+                    {"phase": "division_rosters", "message": str(fetch_error)},
                 )
-                # Live counts update (teams, players, matches)
-                try:
-                    team_count = len(all_players)
-                    player_total = sum(len(v) for v in all_players.values())
-                    match_total = sum(len(v) for v in all_matches.values())
-                    progress(
-                        "counts_update",
-                        {
-                            "teams": team_count,
-                            "players": player_total,
-                            "matches": match_total,
-                            "phase": "division_rosters",
-                        },
-                    )
-                except Exception:
-                    pass
-            if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
-                raise PipelineCancelled()
-            _maybe_pause()
-
-    if progress:
-        progress("phase_complete", {"key": "division_rosters"})
-    _mark_end("division_rosters")
-    if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
-        raise PipelineCancelled()
-    # Step 4: Extract club links from rosters
-    if progress:
-        progress("phase_start", {"key": "club_overviews"})
-    _mark_start("club_overviews")
-    club_links: dict[str, str] = {}
-    # We can emit coarse progress across division folders
-    div_folders = [d for d in os.listdir(data_dir) if os.path.isdir(os.path.join(data_dir, d))]
-    div_total = len(div_folders) or 1
-    div_processed = 0
-    for division_name in os.listdir(data_dir):
-        div_path = os.path.join(data_dir, division_name)
-        if not os.path.isdir(div_path):
+            _roster_done(division_name, team_id)
             continue
-        for fname in os.listdir(div_path):
-            if fname.startswith("team_roster_") and fname.endswith(".html"):
-                html = filesystem.read_text(os.path.join(div_path, fname))
-                link = roster_parser.extract_club_link(html)
-                if link:
-                    import re
-
-                    cid_match = re.search(r"L2P=([^&]+)", link)
-                    if cid_match:
-                        club_links[cid_match.group(1)] = link
-        div_processed += 1
+        path = os.path.join(
+            div_dir, naming.team_roster_filename(division_name, team["team_name"], team_id)
+        )
+        writer.write_text(
+            path, fetched_html, on_written=partial(journal.record_fetch, roster_url, path)
+        )
+        manifest.record(
+            path,
+            fetched_html,
+            kind=scrape_manifest.TEAM_ROSTER,
+            division=division_name,
+            team_id=team_id,
+        )
+        written_rosters[os.path.normpath(path)] = fetched_html
+        division_files[division_name].append(path)
+        # Parsed from the fetched page by the parse stage; the persisted copy is not read back
+        all_matches[team_id], all_players[team_id], link = parsed_roster
+        if link:
+            cid_match = re.search(r"L2P=([^&]+)", link)
+            if cid_match:
+                club_links[cid_match.group(1)] = link
+        _roster_done(division_name, team_id)
+        processed_teams += 1
         if progress:
             progress(
                 "phase_progress",
                 {
-                    "key": "club_overviews",
-                    "fraction": div_processed / div_total,
-                    "detail": f"{div_processed}/{div_total} divisions",
+                    "key": "division_rosters",
+                    "fraction": processed_teams / total_teams,
+                    "detail": f"{processed_teams}/{total_teams} rosters",
                 },
             )
-        if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
-            raise PipelineCancelled()
-        _maybe_pause()
+            # Live counts update (teams, players, matches)
+            try:
+                team_count = len(all_players)
+                player_total = sum(len(v) for v in all_players.values())
+                match_total = sum(len(v) for v in all_matches.values())
+                progress(
+                    "counts_update",
+                    {
+                        "teams": team_count,
+                        "players": player_total,
+                        "matches": match_total,
+                        "phase": "division_rosters",
+                    },
+                )
+            except Exception:
+                pass
 
+    # Step 4: club links were extracted from the rosters while parsing them above
     if progress:
-        progress("phase_complete", {"key": "club_overviews"})
-    _mark_end("club_overviews")
+        progress(
+            "phase_progress",
+            {"key": "division_rosters", "fraction": 1.0, "detail": f"{len(club_links)} clubs"},
+        )
+        progress("phase_complete", {"key": "division_rosters"})
+    _mark_end("division_rosters")
     if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
         raise PipelineCancelled()
     # Step 5: Fetch club overviews & extract additional teams
@@ -320,10 +758,13 @@ def run_full(
     club_id_to_name: dict[str, str] = {}
     # Always ensure the primary club_id requested is included even if not discovered via roster links yet
     discovered_club_ids.add(str(club_id))
-    sorted_clubs = sorted(discovered_club_ids)
+    sorted_clubs = sorted(discovered_club_ids, key=lambda c: (frontier.club_priority(c), c))
     club_total = len(sorted_clubs) or 1
     club_processed = 0
+    club_urls: list[str] = []
     for club_id_key in sorted_clubs:
+        if club_id_key in frontier.slice_club_ids:  # overview already written by the slice
+            continue
         # If we already have a full club link use it; otherwise synthesize typical pattern (landing Verein page)
         club_link = club_links.get(club_id_key)
         if club_link:
@@ -333,12 +774,24 @@ def run_full(
         else:
             # Synthesize landing Verein page for the given season
             full_url = LANDING_URL_TEMPLATE.format(club_id=club_id_key, season=season)
-        try:
-            club_name, teams = club_scraper.fetch_and_parse_club(full_url, club_id_key, data_dir)
-            if club_name:
-                club_id_to_name[club_id_key] = club_name
-        except Exception:
-            continue
+        club_urls.append(full_url)
+    club_fetches = _fetch_phase("club_overviews", club_urls)
+    for club_id_key in sorted_clubs:
+        if club_id_key in frontier.slice_club_ids:
+            club_name, teams = slice_club[club_id_key]
+        else:
+            club_url, club_html, fetch_error = next(club_fetches)
+            if fetch_error is not None:
+                continue
+            try:
+                club_name, teams = _persist_club(club_html, club_id_key)
+                journal.record_fetch(
+                    club_url, club_scraper.club_overview_path(club_name, club_id_key, data_dir)
+                )
+            except Exception:
+                continue
+        if club_name:
+            club_id_to_name[club_id_key] = club_name
         for tid, t in teams.items():
             club_extra_teams[tid] = t
         club_processed += 1
@@ -364,15 +817,24 @@ def run_full(
     # Step 7b: Fetch club team detail pages (parity with legacy dataset)
     club_team_dir = os.path.join(data_dir, "club_teams")
     os.makedirs(club_team_dir, exist_ok=True)
+    club_team_urls: list[str] = []
     for team_id, team in club_extra_teams.items():
+        if team_id in frontier.slice_team_ids:  # page already written by the primary slice
+            continue
         # Construct roster detail URL using known template; if division id (L2P) is unknown leave blank
         roster_url = club_parser.build_roster_link(team_id, getattr(team, "division_id", None))
-        full_url = (
+        club_team_urls.append(
             roster_url if roster_url.startswith("http") else f"{settings.ROOT_URL}{roster_url}"
         )
-        try:
-            html = ranking_scraper.http_client.fetch(full_url)  # type: ignore[attr-defined]
-        except Exception:
+    club_team_fetches = _fetch_phase("club_team_pages", club_team_urls)
+    # file name -> HTML of the club team pages fetched by this run (player links parsed from memory)
+    club_team_html: dict[str, str] = {}
+    for team in club_extra_teams.values():
+        if team.id in frontier.slice_team_ids:
+            team_url, html, fetch_error = None, slice_team_html[team.id], None
+        else:
+            team_url, html, fetch_error = next(club_team_fetches)
+        if fetch_error is not None:
             continue
         # Determine club display name (prefer mapped name by original numeric id; team.club_id may already be name if patched)
         raw_club_ref = getattr(team, "club_id", "unknown_club") or "unknown_club"
@@ -382,7 +844,21 @@ def run_full(
             club_display = club_id_to_name[raw_club_ref]
         # Use name-based filename utility
         fname = naming.club_team_by_name_filename(club_display, team.name, team.id)
-        filesystem.write_text(os.path.join(club_team_dir, fname), html)
+        club_team_html[fname] = html
+        if team_url is None:
+            continue
+        writer.write_text(
+            os.path.join(club_team_dir, fname),
+            html,
+            on_written=partial(journal.record_fetch, team_url, os.path.join(club_team_dir, fname)),
+        )
+        manifest.record(
+            os.path.join(club_team_dir, fname),
+            html,
+            kind=scrape_manifest.CLUB_TEAM,
+            division=getattr(team, "division_name", None),
+            team_id=team.id,
+        )
 
     if progress:
         progress("phase_complete", {"key": "club_team_pages"})
@@ -402,7 +878,8 @@ def run_full(
     def _extract_player_links(html: str):
         # Matches anchor tags with Spieler profile (L3=Spieler & L3P=<id>) capturing href and visible name
         pattern = _re_history.compile(
-            r'<a\s+href="(\?L1=[^"]*?L3=Spieler&L3P=\d+[^"#>]*)"[^>]*>(.*?)</a>', re.IGNORECASE
+            r'<a\s+href="(\?L1=[^"]*?L3=Spieler&L3P=\d+[^"#>]*)"[^>]*>(.*?)</a>',
+            _re_history.IGNORECASE,
         )
         results = []
         for m in pattern.finditer(html):
@@ -415,11 +892,35 @@ def run_full(
             results.append((href, name_txt))
         return results
 
-    club_team_files = [
-        f for f in os.listdir(club_team_dir) if f.startswith("club_team_") and f.endswith(".html")
-    ]
+    # Primary club team sets first (lower priority than every page fetched before)
+    club_team_files = sorted(
+        (
+            f
+            for f in os.listdir(club_team_dir)
+            if f.startswith("club_team_") and f.endswith(".html")
+        ),
+        key=lambda f: (frontier.club_team_file_priority(f), f),
+    )
     total_hist_sets = len(club_team_files) or 1
     processed_hist_sets = 0
+    # Freshness: a stored history is refetched when older than PLAYER_HISTORY_MAX_AGE_DAYS or
+    # when the player's LivePZ differs from the one recorded at its last fetch
+    history_index = history_freshness.load_index(player_history_root)
+    roster_live_pz = {
+        p.name: p.live_pz
+        for players in all_players.values()
+        for p in players
+        if p.live_pz is not None
+    }
+    history_counts = dict.fromkeys(
+        ("fetched", "skipped", "new", "stale", "livepz_changed", "failed"), 0
+    )
+    # Collect (history_url, out_path, index key, current LivePZ, team id) jobs per team set first
+    # so the whole phase can fan out
+    history_sets: list[list[tuple[str, str, str, int | None, str | None]]] = []
+    queued_paths: set[str] = set()
+    # (index key, LivePZ, path) of histories written; indexed once the write has landed
+    fetched_histories: list[tuple[str, int | None, str]] = []
     for team_html_name in club_team_files:
         if not team_html_name.startswith("club_team_") or not team_html_name.endswith(".html"):
             continue
@@ -431,8 +932,17 @@ def run_full(
             continue
         folder_path = os.path.join(player_history_root, folder)
         os.makedirs(folder_path, exist_ok=True)
-        team_html = filesystem.read_text(os.path.join(club_team_dir, team_html_name))
+        team_html = club_team_html.get(team_html_name)
+        if team_html is None:  # page kept from an earlier run
+            team_html = filesystem.read_text(os.path.join(club_team_dir, team_html_name))
         links = _extract_player_links(team_html)
+        team_live_pz: dict[str, int] = {}
+        if links:
+            for p in roster_parser.extract_players(team_html, team_id=base):
+                if p.live_pz is not None:
+                    team_live_pz[p.name] = p.live_pz
+        set_team_id = _re_history.search(r"_(\d+)$", base)
+        jobs: list[tuple[str, str, str, int | None, str | None]] = []
         for rel_link, player_name in links:
             # Build history URL by replacing Page=Vorrunde (or any Page=...) with Page=EntwicklungTTR
             if "Page=" in rel_link:
@@ -448,31 +958,81 @@ def run_full(
             )
             safe_player = naming.sanitize(player_name.replace(" ", "_"))
             out_path = os.path.join(folder_path, f"{safe_player}.html")
-            if os.path.exists(out_path):  # skip existing to avoid refetch noise
-                continue
-            try:
-                hist_html = _timed_fetch(
-                    "player_histories", lambda: ranking_scraper.http_client.fetch(history_url)  # type: ignore[attr-defined]
-                )
-                filesystem.write_text(out_path, hist_html)
-            except Exception as e:
-                errors.append(f"history fetch failed: {e}")
-                if progress:
-                    progress("recoverable_error", {"phase": "player_histories", "message": str(e)})
+            if out_path in queued_paths:  # same player listed in several team sets
                 continue
-        processed_hist_sets += 1
-        if progress:
-            progress(
-                "phase_progress",
-                {
-                    "key": "player_histories",
-                    "fraction": processed_hist_sets / total_hist_sets,
-                    "detail": f"{processed_hist_sets}/{total_hist_sets} team sets",
-                },
+            queued_paths.add(out_path)
+            key = os.path.relpath(out_path, player_history_root).replace(os.sep, "/")
+            live_pz = team_live_pz.get(player_name, roster_live_pz.get(player_name))
+            previous = history_index.get(key, {})
+            reason = history_freshness.refresh_reason(
+                out_path, previous_live_pz=previous.get("live_pz"), current_live_pz=live_pz
             )
-            if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
-                raise PipelineCancelled()
-            _maybe_pause()
+            if reason is None:
+                history_counts["skipped"] += 1
+                if live_pz is not None and previous.get("live_pz") is None:
+                    # page from before the index existed: remember the LivePZ it reflects
+                    history_index[key] = {**previous, "live_pz": live_pz}
+                continue
+            history_counts[reason] += 1
+            jobs.append((history_url, out_path, key, live_pz, set_team_id and set_team_id.group(1)))
+        history_sets.append(jobs)
+    history_fetches = _fetch_phase(
+        "player_histories",
+        [url for jobs in history_sets for url, *_rest in jobs],
+        workers=settings.PLAYER_HISTORY_WORKERS,
+    )
+    try:
+        for jobs in history_sets:
+            for (hist_url, out_path, key, live_pz, set_tid), (_u, hist_html, fetch_error) in zip(
+                jobs, history_fetches
+            ):
+                if fetch_error is not None:
+                    history_counts["failed"] += 1
+                    errors.append(f"history fetch failed: {fetch_error}")
+                    if progress:
+                        progress(
+                            "recoverable_error",
+                            {"phase": "player_histories", "message": str(fetch_error)},
+                        )
+                    continue
+                writer.write_text(
+                    out_path,
+                    hist_html,
+                    on_written=partial(journal.record_fetch, hist_url, out_path),
+                )
+                manifest.record(
+                    out_path, hist_html, kind=scrape_manifest.PLAYER_HISTORY, team_id=set_tid
+                )
+                fetched_histories.append((key, live_pz, out_path))
+                history_counts["fetched"] += 1
+            processed_hist_sets += 1
+            if progress:
+                progress(
+                    "phase_progress",
+                    {
+                        "key": "player_histories",
+                        "fraction": processed_hist_sets / total_hist_sets,
+                        "detail": (
+                            f"{processed_hist_sets}/{total_hist_sets} team sets, "
+                            f"{history_counts['fetched']} fetched, "
+                            f"{history_counts['skipped']} skipped, "
+                            f"{history_counts['stale']} stale"
+                        ),
+                    },
+                )
+                if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
+                    raise PipelineCancelled()
+                _maybe_pause()
+    finally:
+        # Only pages that reached the disk count as fetched (a failed one is refetched)
+        _flush("player_histories")
+        for key, live_pz, out_path in fetched_histories:
+            if out_path in failed_writes:
+                history_counts["fetched"] -= 1
+                history_counts["failed"] += 1
+            else:
+                history_freshness.record(history_index, key, live_pz)
+        history_freshness.save_index(player_history_root, history_index)
     if progress:
         progress("phase_complete", {"key": "player_histories"})
     _mark_end("player_histories")
@@ -481,26 +1041,27 @@ def run_full(
 
     # Step 7c (updated): Deterministic primary club backfill ensuring club_team_* files exist.
     # Rationale: Earlier logic attempted to infer primary club teams from merged extras; this could fail in heavily mocked
-    # test environments where team.club_id mutation differs. We now always (re)fetch the primary club overview explicitly.
-    try:
-        primary_club_url = LANDING_URL_TEMPLATE.format(club_id=club_id, season=season)
-        primary_name, primary_teams = club_scraper.fetch_and_parse_club(
-            primary_club_url, str(club_id), data_dir
-        )
-        if primary_name:
-            club_id_to_name[str(club_id)] = primary_name
-    except Exception:  # pragma: no cover - defensive
-        primary_name, primary_teams = None, {}
+    # test environments where team.club_id mutation differs. We now always resolve the primary club overview explicitly
+    # (reusing the primary slice's overview; fetched and persisted again only if the slice failed).
+    if str(club_id) in slice_club:
+        primary_name, primary_teams = slice_club[str(club_id)]
+    else:
+        try:
+            primary_club_url = LANDING_URL_TEMPLATE.format(club_id=club_id, season=season)
+            primary_name, primary_teams = _persist_club(
+                _fetch("club_overviews", primary_club_url), str(club_id)
+            )
+        except Exception:  # pragma: no cover - defensive
+            primary_name, primary_teams = None, {}
+    if primary_name:
+        club_id_to_name[str(club_id)] = primary_name
 
-    # Existing file inventories
+    # Existing file inventories: club_teams/ is listed once; division rosters are looked up by
+    # their canonical path (this run's writes are tracked in written_rosters) instead of walking
+    # the whole data dir
     club_team_dir = os.path.join(data_dir, "club_teams")
     os.makedirs(club_team_dir, exist_ok=True)
     existing_club_team_files = set(os.listdir(club_team_dir))
-    existing_division_rosters: set[str] = set()
-    for root, dirs, files in os.walk(data_dir):  # pragma: no cover - traversal
-        for f in files:
-            if f.startswith("team_roster_") and f.endswith(".html"):
-                existing_division_rosters.add(f)
 
     for tid, t in primary_teams.items():
         # Determine display club name preference order: explicit primary_name -> mapped name -> numeric id fallback
@@ -513,19 +1074,26 @@ def run_full(
                 roster_url if roster_url.startswith("http") else f"{settings.ROOT_URL}{roster_url}"
             )
             try:
-                html = ranking_scraper.http_client.fetch(full_url)  # type: ignore[attr-defined]
+                html = _fetch("club_team_pages", full_url)
                 # Fallback: if player anchors missing, attempt alternate page variants
                 if "?L1=" in full_url and "Page=Vorrunde" in full_url and "Spieler" not in html:
                     for alt in ("Gesamt", "Rueckrunde"):
                         alt_url = full_url.replace("Page=Vorrunde", f"Page={alt}")
                         try:
-                            alt_html = ranking_scraper.http_client.fetch(alt_url)  # type: ignore[attr-defined]
+                            alt_html = _fetch("club_team_pages", alt_url)
                             if "Spieler" in alt_html:
                                 html = alt_html
                                 break
                         except Exception:
                             continue
-                filesystem.write_text(os.path.join(club_team_dir, club_team_filename), html)
+                writer.write_text(os.path.join(club_team_dir, club_team_filename), html)
+                manifest.record(
+                    os.path.join(club_team_dir, club_team_filename),
+                    html,
+                    kind=scrape_manifest.CLUB_TEAM,
+                    division=getattr(t, "division_name", None),
+                    team_id=t.id,
+                )
                 existing_club_team_files.add(club_team_filename)
             except Exception:  # pragma: no cover - network/parse resilience
                 pass
@@ -534,70 +1102,96 @@ def run_full(
         div_dir = os.path.join(data_dir, naming.sanitize(div_name))
         os.makedirs(div_dir, exist_ok=True)
         roster_filename = naming.team_roster_filename(div_name, t.name, t.id)
-        if roster_filename not in existing_division_rosters:
+        roster_path = os.path.normpath(os.path.join(div_dir, roster_filename))
+        if roster_path not in written_rosters and not os.path.exists(roster_path):
             roster_url = club_parser.build_roster_link(tid, getattr(t, "division_id", None))
             full_url = (
                 roster_url if roster_url.startswith("http") else f"{settings.ROOT_URL}{roster_url}"
             )
             try:
-                html = ranking_scraper.http_client.fetch(full_url)  # type: ignore[attr-defined]
+                html = _fetch("club_team_pages", full_url)
                 if "?L1=" in full_url and "Page=Vorrunde" in full_url and "Spieler" not in html:
                     for alt in ("Gesamt", "Rueckrunde"):
                         alt_url = full_url.replace("Page=Vorrunde", f"Page={alt}")
                         try:
-                            alt_html = ranking_scraper.http_client.fetch(alt_url)  # type: ignore[attr-defined]
+                            alt_html = _fetch("club_team_pages", alt_url)
                             if "Spieler" in alt_html:
                                 html = alt_html
                                 break
                         except Exception:
                             continue
-                filesystem.write_text(os.path.join(div_dir, roster_filename), html)
-                existing_division_rosters.add(roster_filename)
+                writer.write_text(roster_path, html)
+                manifest.record(
+                    roster_path,
+                    html,
+                    kind=scrape_manifest.TEAM_ROSTER,
+                    division=div_name,
+                    team_id=t.id,
+                )
+                written_rosters[roster_path] = html
             except Exception:  # pragma: no cover
                 pass
 
     # Step 7d: Repair previously fetched incorrect roster files where L2P (division) and L3P (team) were the same
     # (Only when we have a distinct division id captured for that team.)
-    for team_id, division_id in team_division_map.items():
-        if team_id == division_id:
-            continue
-        # Look for roster files ending with this team id
-        for root_dir, _dirs, files in os.walk(data_dir):
-            for f in files:
-                if not f.startswith("team_roster_") or not f.endswith(f"_{team_id}.html"):
-                    continue
-                fpath = os.path.join(root_dir, f)
+    repair_ids = {tid: did for tid, did in team_division_map.items() if tid != did}
+    roster_index: dict[str, list[str]] = {}  # team id -> roster file paths
+    if repair_ids:
+        # One listing of the division folders (roster files live directly in them)
+        roster_paths = set(written_rosters)
+        for entry in os.scandir(data_dir):
+            if not entry.is_dir():
+                continue
+            for f in os.listdir(entry.path):
+                if f.startswith("team_roster_") and f.endswith(".html"):
+                    roster_paths.add(os.path.normpath(os.path.join(entry.path, f)))
+        for fpath in roster_paths:
+            m = re.search(r"_(\d+)\.html$", fpath)
+            if m and m.group(1) in repair_ids:
+                roster_index.setdefault(m.group(1), []).append(fpath)
+    for team_id, division_id in repair_ids.items():
+        for fpath in sorted(roster_index.get(team_id, [])):
+            html_existing = written_rosters.get(fpath)
+            if html_existing is None:
                 try:
                     html_existing = filesystem.read_text(fpath)
                 except Exception:
                     continue
-                # If already correct (contains distinct division id) skip
-                if f"L2P={division_id}" in html_existing and f"L3P={team_id}" in html_existing:
+            # If already correct (contains distinct division id) skip
+            if f"L2P={division_id}" in html_existing and f"L3P={team_id}" in html_existing:
+                continue
+            # If shows legacy duplicated pattern attempt refetch
+            if f"L2P={team_id}" in html_existing and f"L3P={team_id}" in html_existing:
+                try:
+                    repair_url = club_parser.build_roster_link(team_id, division_id)
+                    full_url = (
+                        repair_url
+                        if repair_url.startswith("http")
+                        else f"{settings.ROOT_URL}{repair_url}"
+                    )
+                    new_html = _fetch("division_rosters", full_url)
+                    # Fallback to alternate pages if still missing players
+                    if "Spieler" not in new_html and "Page=Vorrunde" in full_url:
+                        for alt in ("Gesamt", "Rueckrunde"):
+                            alt_url = full_url.replace("Page=Vorrunde", f"Page={alt}")
+                            try:
+                                alt_html = _fetch("division_rosters", alt_url)
+                                if "Spieler" in alt_html:
+                                    new_html = alt_html
+                                    break
+                            except Exception:
+                                continue
+                    writer.write_text(fpath, new_html)
+                    previous = manifest.entries.get(manifest.relpath(fpath))
+                    manifest.record(
+                        fpath,
+                        new_html,
+                        kind=scrape_manifest.TEAM_ROSTER,
+                        division=previous.division if previous else None,
+                        team_id=team_id,
+                    )
+                except Exception:
                     continue
-                # If shows legacy duplicated pattern attempt refetch
-                if f"L2P={team_id}" in html_existing and f"L3P={team_id}" in html_existing:
-                    try:
-                        repair_url = club_parser.build_roster_link(team_id, division_id)
-                        full_url = (
-                            repair_url
-                            if repair_url.startswith("http")
-                            else f"{settings.ROOT_URL}{repair_url}"
-                        )
-                        new_html = ranking_scraper.http_client.fetch(full_url)  # type: ignore[attr-defined]
-                        # Fallback to alternate pages if still missing players
-                        if "Spieler" not in new_html and "Page=Vorrunde" in full_url:
-                            for alt in ("Gesamt", "Rueckrunde"):
-                                alt_url = full_url.replace("Page=Vorrunde", f"Page={alt}")
-                                try:
-                                    alt_html = ranking_scraper.http_client.fetch(alt_url)  # type: ignore[attr-defined]
-                                    if "Spieler" in alt_html:
-                                        new_html = alt_html
-                                        break
-                                except Exception:
-                                    continue
-                        filesystem.write_text(fpath, new_html)
-                    except Exception:
-                        continue
 
     # Step 8: Build divisions structure for tracking state (used by GUI tree) and persist
     if progress:
@@ -639,10 +1233,280 @@ def run_full(
         "total_matches": sum(len(v) for v in all_matches.values()),
         "upcoming_matches": len(upcoming),
         "players_total": sum(len(v) for v in all_players.values()),
+        "player_histories": history_counts,
         "tracking_saved": True,
         "output_dir": data_dir,
         "phase_durations": phase_durations,
         "errors": errors,
         "net_latency": net_latency,
+        "net_bytes": net_bytes,
+        "rate_limit": governor.metrics(),
+        "fetch_dedup": memo.stats(),
+        "resume": journal.stats(),
+        "http_pool": _pool_stats(traffic),
         "duration_seconds": total_duration,
     }
+
+
+def _pool_stats(counts: Counter) -> dict:
+    """Connection reuse statistics of one run's requests (`HttpSession.metered` counters)."""
+    keys = ("requests", "connections_opened", "connections_reused", "stale_retries")
+    stats = {k: counts.get(k, 0) for k in keys}
+    acquired = stats["connections_opened"] + stats["connections_reused"]
+    stats["reuse_ratio"] = (stats["connections_reused"] / acquired) if acquired else 0.0
+    return stats
+
+
+def run_incremental(
+    club_id: int,
+    season: int | None = None,
+    data_dir: str | None = None,
+    *,
+    dry_run: bool = False,
+    now: datetime | None = None,
+    progress: Callable[[str, dict], Any] | None = None,
+    cancel_token: Any | None = None,
+) -> dict:
+    """Refresh only the divisions likely to have changed since the last scrape.
+
+    The plan comes from `services.scrape_planner.build_plan` (tracking state, last-fetch
+    times, upcoming matches judged by `tracking.rescrape_policy`). With ``dry_run`` the
+    plan is returned (``plan`` / ``plan_lines``) without any request. Without a previous
+    scrape to build on this falls back to `run_full`.
+
+    Otherwise the landing page is fetched to discover ranking tables of divisions not on
+    disk yet, then the planned ranking tables and rosters. Upcoming matches of refreshed
+    teams replace their entries in ``match_tracking.json``; skipped divisions keep theirs.
+    Pages are written, journaled and recorded in the scrape manifest as `run_full` does,
+    so manifest-driven ingestion picks up refreshed and new divisions.
+    """
+    from services import scrape_planner
+
+    season = season or settings.DEFAULT_SEASON
+    data_dir = data_dir or settings.DATA_DIR
+    landing_url = LANDING_URL_TEMPLATE.format(club_id=club_id, season=season)
+    plan = scrape_planner.build_plan(data_dir, landing_url, now=now)
+    if dry_run:
+        return {
+            "mode": "incremental",
+            "dry_run": True,
+            "full_scrape": plan.is_full,
+            "planned_fetches": len([f for f in plan.fetches if f.url]),
+            "plan": plan.to_dict(),
+            "plan_lines": plan.describe(),
+        }
+    if plan.is_full:
+        result = run_full(club_id, season, data_dir, progress=progress, cancel_token=cancel_token)
+        result["mode"] = "full"
+        result["incremental_fallback_reason"] = plan.full_scrape_reason
+        return result
+
+    journal = ScrapeJournal(data_dir, club_id, season)
+    manifest = scrape_manifest.load(data_dir)
+    write_failures: List[Tuple[str, BaseException]] = []
+    writer = filesystem.BatchedWriter(
+        on_error=lambda path, error: write_failures.append((path, error))
+    )
+    status = "completed"
+    try:
+        result = _run_incremental(
+            plan,
+            data_dir,
+            landing_url,
+            progress=progress,
+            cancel_token=cancel_token,
+            journal=journal,
+            manifest=manifest,
+            writer=writer,
+            write_failures=write_failures,
+        )
+        result["manifest"] = manifest.written_entries()
+    except PipelineCancelled:
+        status = "cancelled"
+        raise
+    except BaseException:
+        status = "failed"
+        raise
+    finally:
+        try:
+            writer.close()
+        except Exception:  # pragma: no cover - already surfaced by the flush in the run
+            pass
+        manifest.save()
+        journal.finish(status)
+    return result
+
+
+def _run_incremental(
+    plan: Any,
+    data_dir: str,
+    landing_url: str,
+    *,
+    progress: Callable[[str, dict], Any] | None,
+    cancel_token: Any | None,
+    journal: ScrapeJournal,
+    manifest: scrape_manifest.ScrapeManifest,
+    writer: filesystem.BatchedWriter,
+    write_failures: List[Tuple[str, BaseException]],
+) -> dict:
+    from services import scrape_planner
+
+    memo = FetchMemo()
+    errors: List[str] = []
+    fetched = 0
+
+    def _write(url: str, path: str, html: str, **record: Any) -> None:
+        writer.write_text(path, html, on_written=partial(journal.record_fetch, url, path))
+        manifest.record(path, html, **record)
+
+    def _fetch(url: str) -> str:
+        nonlocal fetched
+        if cancel_token and getattr(cancel_token, "is_cancelled", lambda: False)():
+            raise PipelineCancelled()
+        before = memo.requests
+        html = memo.fetch(
+            url, lambda: ranking_scraper.http_client.fetch(url)  # type: ignore[attr-defined]
+        )
+        fetched += memo.requests - before
+        return html
+
+    if progress:
+        progress("phase_start", {"key": "incremental"})
+    by_sanitized = {naming.sanitize(d.name): d for d in plan.divisions}
+    due = {d.name for d in plan.divisions if d.reason is not None}
+    known_ranking_urls = {d.ranking_url for d in plan.divisions if d.ranking_url}
+    # roster url -> PlannedFetch (planned rosters plus teams found in fetched ranking tables)
+    roster_jobs: Dict[str, Any] = {f.url: f for f in plan.fetches if f.kind == "roster" and f.url}
+    ranking_urls = [f.url for f in plan.fetches if f.kind == "ranking_table" and f.url]
+    new_divisions: List[str] = []
+    new_division_teams: Dict[str, List[Team]] = {}
+
+    try:
+        landing_html = _fetch(landing_url)
+        landing_rankings = link_extractor.derive_ranking_table_links(
+            link_extractor.extract_team_roster_links(landing_html)
+        )
+        ranking_urls += [u for u in landing_rankings if u not in known_ranking_urls]
+    except PipelineCancelled:
+        raise
+    except Exception as e:  # pragma: no cover - network resilience
+        errors.append(f"landing fetch failed: {e}")
+
+    for rurl in dict.fromkeys(ranking_urls):
+        try:
+            ranking_html = _fetch(rurl)
+        except PipelineCancelled:
+            raise
+        except Exception as e:  # pragma: no cover
+            errors.append(f"ranking table fetch failed: {e}")
+            continue
+        division_name, teams = ranking_parser.parse_ranking_table(ranking_html)
+        known = by_sanitized.get(naming.sanitize(division_name))
+        if known is not None:
+            division_name = known.name
+        div_dir = os.path.join(data_dir, naming.sanitize(division_name))
+        _write(
+            rurl,
+            os.path.join(div_dir, naming.ranking_table_filename(division_name)),
+            ranking_html,
+            kind=scrape_manifest.RANKING_TABLE,
+            division=division_name,
+        )
+        if known is None:
+            new_divisions.append(division_name)
+            new_division_teams[division_name] = []
+            reason = "new division"
+        elif division_name in due:
+            reason = known.reason
+        else:
+            continue  # ranking table only fetched to learn its URL; division unchanged
+        for t in teams:
+            tid = t.get("team_id")
+            if not tid:
+                continue
+            if known is None:
+                new_division_teams[division_name].append(
+                    Team(
+                        id=tid,
+                        name=t["team_name"],
+                        division_name=division_name,
+                        division_id=t.get("division_id"),
+                    )
+                )
+            link = t["roster_link"]
+            url = link if link.startswith("http") else f"{settings.ROOT_URL}{link}"
+            if url not in roster_jobs:
+                roster_jobs[url] = scrape_planner.PlannedFetch(
+                    "roster", url, reason, division_name, tid, t["team_name"]
+                )
+
+    refreshed_matches: Dict[str, List[Match]] = {}
+    total = len(roster_jobs) or 1
+    for idx, job in enumerate(roster_jobs.values(), start=1):
+        try:
+            html = _fetch(job.url)
+        except PipelineCancelled:
+            raise
+        except Exception as e:  # pragma: no cover
+            errors.append(f"roster fetch failed: {e}")
+            continue
+        division = job.division or "unknown_division"
+        path = job.path or os.path.join(
+            data_dir,
+            naming.sanitize(division),
+            naming.team_roster_filename(division, job.team_name or job.team_id, job.team_id),
+        )
+        _write(
+            job.url,
+            path,
+            html,
+            kind=scrape_manifest.TEAM_ROSTER,
+            division=job.division,
+            team_id=job.team_id,
+        )
+        refreshed_matches[job.team_id] = roster_parser.extract_matches(html, team_id=job.team_id)
+        if progress:
+            progress(
+                "phase_progress",
+                {
+                    "key": "incremental",
+                    "fraction": idx / total,
+                    "detail": f"{idx}/{total} rosters",
+                },
+            )
+
+    writer.flush()
+    for path, error in write_failures:
+        manifest.discard(path)
+        errors.append(f"write failed: {path}: {error}")
+        if progress:
+            progress("recoverable_error", {"phase": "incremental", "message": errors[-1]})
+    write_failures.clear()
+    journal.phase_complete("incremental")
+
+    state = tracking_store.load_state(data_dir)
+    upcoming = [m for m in state.upcoming_matches if m.team_id not in refreshed_matches]
+    upcoming += upcoming_matches.build_upcoming(refreshed_matches, {})
+    divisions = dict(state.divisions)
+    for name, teams in new_division_teams.items():
+        divisions[name] = Division(name=name, teams=sorted(teams, key=lambda t: t.name))
+    new_state = TrackingState(
+        last_scrape=datetime.utcnow(), divisions=divisions, upcoming_matches=upcoming
+    )
+    tracking_store.save_state(new_state, data_dir)
+    if progress:
+        progress("phase_complete", {"key": "incremental"})
+    return {
+        "mode": "incremental",
+        "dry_run": False,
+        "landing_url": landing_url,
+        "requests": fetched,
+        "rosters_refreshed": len(refreshed_matches),
+        "divisions_refreshed": sorted(due) + new_divisions,
+        "divisions_skipped": plan.skipped_divisions,
+        "new_divisions": new_divisions,
+        "upcoming_matches": len(upcoming),
+        "errors": errors,
+        "plan": plan.to_dict(),
+        "output_dir": data_dir,
+    }
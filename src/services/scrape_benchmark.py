@@ -0,0 +1,214 @@
+"""End-to-end `pipeline.run_full` benchmark against an offline replay.
+
+`run_benchmark` indexes a recorded corpus (`services.scrape_replay`), serves it
+with the requested latency / jitter / error injection and runs the unchanged
+pipeline against it ``repeat`` times, each into a scratch output directory with
+its own HTTP cache (shared across runs with ``warm_cache`` to measure cache
+reuse). Per run it reports wall time, the pipeline's per-phase durations and
+``net_latency`` breakdown, request counts (server side, connection pool and
+fetch de-duplication) and throughput, so the effect of concurrency, pooling and
+caching changes can be compared offline and reproducibly.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from config import settings
+from core import cache, rate_limit
+from services import pipeline
+from services.scrape_replay import ReplayCorpus, ReplayServer
+
+__all__ = ["run_benchmark", "format_report"]
+
+
+def _run_once(
+    server: ReplayServer,
+    club_id: int,
+    season: int,
+    output_dir: str,
+    *,
+    async_mode: bool,
+    max_per_host: int | None,
+    parse_workers: int | None,
+) -> Dict[str, Any]:
+    before = server.stats()
+    start = time.perf_counter()
+    result = pipeline.run_full(
+        club_id,
+        season,
+        output_dir,
+        async_mode=async_mode,
+        max_per_host=max_per_host,
+        parse_workers=parse_workers,
+    )
+    wall = time.perf_counter() - start
+    after = server.stats()
+    served = {k: after[k] - before[k] for k in after}
+    pages = served["hits"]
+    return {
+        "wall_seconds": round(wall, 4),
+        "phase_durations": {k: round(v, 4) for k, v in result["phase_durations"].items()},
+        "net_latency": {k: round(v, 4) for k, v in result["net_latency"].items()},
+        "requests": {
+            "server": served,
+            "http_pool": result["http_pool"],
+            "fetch_dedup": result["fetch_dedup"],
+        },
+        "throughput": {
+            "pages_per_second": round(pages / wall, 2) if wall else 0.0,
+            "kib_per_second": round(served["bytes_sent"] / 1024 / wall, 2) if wall else 0.0,
+        },
+        "rate_limit": result["rate_limit"],
+        "stages": result.get("stage_stats", {}),
+        "errors": len(result["errors"]),
+        "players_total": result["players_total"],
+        "divisions_discovered": result["divisions_discovered"],
+    }
+
+
+def run_benchmark(
+    corpus_dir: str | None = None,
+    *,
+    club_id: int = 2294,
+    season: int | None = None,
+    async_mode: bool = False,
+    max_per_host: int | None = None,
+    parse_workers: int | None = None,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    seed: int = 0,
+    rps: float | None = None,
+    burst: int | None = None,
+    repeat: int = 1,
+    warm_cache: bool = False,
+    keep_output: bool = False,
+) -> Dict[str, Any]:
+    """Replay ``corpus_dir`` (default ``settings.DATA_DIR``) and time ``repeat`` full scrapes.
+
+    ``rps`` / ``burst`` reconfigure the process-wide rate governor (its default
+    ceiling would otherwise dominate the timings). Unknown URLs are answered
+    with an empty page and counted as ``misses``.
+    """
+    corpus_dir = corpus_dir or settings.DATA_DIR
+    season = season or settings.DEFAULT_SEASON
+    landing_url = pipeline.LANDING_URL_TEMPLATE.format(club_id=club_id, season=season)
+    corpus = ReplayCorpus.from_dir(corpus_dir, landing_url=landing_url)
+    if rps is not None or burst is not None:
+        rate_limit.configure_default_governor(rps=rps, burst=burst)
+    server = ReplayServer(
+        corpus,
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        error_status=error_status,
+        miss_status=200,
+        seed=seed,
+    )
+    scratch = tempfile.mkdtemp(prefix="rosterplanner_bench_")
+    previous_cache_dir = cache.CACHE_DIR
+    runs: List[Dict[str, Any]] = []
+    try:
+        with server, server.redirect():
+            for idx in range(max(1, repeat)):
+                cache.CACHE_DIR = os.path.join(scratch, "_cache" if warm_cache else f"_cache{idx}")
+                output_dir = os.path.join(scratch, f"run{idx}")
+                runs.append(
+                    _run_once(
+                        server,
+                        club_id,
+                        season,
+                        output_dir,
+                        async_mode=async_mode,
+                        max_per_host=max_per_host,
+                        parse_workers=parse_workers,
+                    )
+                )
+    finally:
+        cache.CACHE_DIR = previous_cache_dir
+        if not keep_output:
+            shutil.rmtree(scratch, ignore_errors=True)
+    walls = [r["wall_seconds"] for r in runs]
+    return {
+        "config": {
+            "corpus_dir": corpus_dir,
+            "corpus_pages": len(corpus),
+            "corpus_sources": corpus.sources(),
+            "club_id": club_id,
+            "season": season,
+            "async_mode": async_mode,
+            "max_per_host": max_per_host,
+            "parse_workers": parse_workers,
+            "latency": latency,
+            "jitter": jitter,
+            "error_rate": error_rate,
+            "seed": seed,
+            "rps": rate_limit.default_governor().max_rps,
+            "repeat": len(runs),
+            "warm_cache": warm_cache,
+            "output_dir": scratch if keep_output else None,
+        },
+        "runs": runs,
+        "wall_seconds": {
+            "min": min(walls),
+            "median": round(statistics.median(walls), 4),
+            "max": max(walls),
+        },
+        "missed_urls": sorted(set(server.missed_urls)),
+    }
+
+
+def format_report(result: Dict[str, Any]) -> List[str]:
+    """Plain-text table of a `run_benchmark` result (one column per run)."""
+    runs = result["runs"]
+    cfg = result["config"]
+    lines = [
+        f"corpus {cfg['corpus_dir']}: {cfg['corpus_pages']} pages {cfg['corpus_sources']}",
+        f"mode {'async' if cfg['async_mode'] else 'sync'}, latency {cfg['latency']}s "
+        f"+/-{cfg['jitter']}s, error rate {cfg['error_rate']}, rps {cfg['rps']}, "
+        f"{'warm' if cfg['warm_cache'] else 'cold'} cache",
+        "",
+    ]
+    header = f"{'':<28}" + "".join(f"{f'run {i + 1}':>12}" for i in range(len(runs)))
+    lines.append(header)
+
+    def row(label: str, values: List[Any]) -> None:
+        cells = "".join(f"{v:>12.3f}" if isinstance(v, float) else f"{v!s:>12}" for v in values)
+        lines.append(f"{label:<28}{cells}")
+
+    row("wall seconds", [r["wall_seconds"] for r in runs])
+    phases = list(dict.fromkeys(k for r in runs for k in r["phase_durations"]))
+    for phase in phases:
+        row(f"  phase {phase}", [r["phase_durations"].get(phase, 0.0) for r in runs])
+    for phase in runs[0]["net_latency"]:
+        row(f"  net {phase}", [r["net_latency"].get(phase, 0.0) for r in runs])
+    staged = list(dict.fromkeys(k for r in runs for k in r["stages"]))
+    for phase in staged:
+        for stage in ("fetch", "parse", "write"):
+            row(
+                f"  {phase[:14]} {stage} util",
+                [r["stages"].get(phase, {}).get("utilisation", {}).get(stage, 0.0) for r in runs],
+            )
+        peaks = [r["stages"].get(phase, {}).get("peak_queue_depth", {}) for r in runs]
+        row(
+            f"  {phase[:14]} peak queue",
+            [f"{p.get('fetched', 0)}/{p.get('parsed', 0)}" for p in peaks],
+        )
+    for key in ("requests", "hits", "misses", "not_modified", "injected_errors"):
+        row(f"server {key}", [r["requests"]["server"][key] for r in runs])
+    row("pool connections opened", [r["requests"]["http_pool"]["connections_opened"] for r in runs])
+    row("duplicates avoided", [r["requests"]["fetch_dedup"]["duplicates_avoided"] for r in runs])
+    row("pages / second", [float(r["throughput"]["pages_per_second"]) for r in runs])
+    row("KiB / second", [float(r["throughput"]["kib_per_second"]) for r in runs])
+    row("pipeline errors", [r["errors"] for r in runs])
+    wall = result["wall_seconds"]
+    lines.append("")
+    lines.append(f"wall seconds min {wall['min']} / median {wall['median']} / max {wall['max']}")
+    return lines
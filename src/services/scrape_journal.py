@@ -0,0 +1,164 @@
+"""Checkpoint journal for resumable `pipeline.run_full` scrapes.
+
+The journal is an append-only JSON-lines file (``scrape_journal.jsonl``) in the
+data directory. Each line is one record:
+
+ - ``{"type": "start", "club_id", "season", "resumed", "at"}``
+ - ``{"type": "fetched", "url", "path"}`` once the page for ``url`` was fetched
+   and persisted to ``path`` (relative to the data dir)
+ - ``{"type": "phase", "key"}`` when a pipeline phase completed
+ - ``{"type": "end", "status"}`` with ``completed`` / ``cancelled`` / ``failed``
+
+Appending a line per event keeps checkpointing O(1) per page and survives a
+crash mid-run (a torn last line is ignored on load). A run that did not end
+with ``completed`` can be resumed: `run_full(resume=True)` serves every URL
+recorded here from its persisted file instead of the network, so the ranking
+tables, rosters (and with them ``division_team_lists``, ``all_matches`` and
+``all_players``) are rebuilt from disk and fetching continues with the first
+URL not yet journaled.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from core import filesystem
+
+__all__ = ["FILENAME", "JournalState", "ScrapeJournal", "load", "resumable"]
+
+FILENAME = "scrape_journal.jsonl"
+
+
+@dataclass
+class JournalState:
+    """Replayed content of a journal file."""
+
+    club_id: Optional[int] = None
+    season: Optional[int] = None
+    started_at: Optional[str] = None
+    status: str = "none"  # none | running | completed | cancelled | failed
+    completed_phases: List[str] = field(default_factory=list)
+    fetched: Dict[str, str] = field(default_factory=dict)  # url -> relative path
+
+    @property
+    def resumable(self) -> bool:
+        return self.status in ("running", "cancelled", "failed")
+
+    def summary(self) -> dict:
+        return {
+            "club_id": self.club_id,
+            "season": self.season,
+            "started_at": self.started_at,
+            "status": self.status,
+            "completed_phases": list(self.completed_phases),
+            "fetched_urls": len(self.fetched),
+        }
+
+
+def _path(data_dir: str) -> str:
+    return os.path.join(data_dir, FILENAME)
+
+
+def load(data_dir: str) -> JournalState:
+    """Replay the journal of ``data_dir`` (empty state if there is none)."""
+    state = JournalState()
+    try:
+        fh = open(_path(data_dir), "r", encoding="utf-8")
+    except OSError:
+        return state
+    with fh:
+        for line in fh:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue  # torn write from a crash
+            kind = rec.get("type")
+            if kind == "start":
+                if not rec.get("resumed"):
+                    state = JournalState()
+                state.club_id = rec.get("club_id")
+                state.season = rec.get("season")
+                state.started_at = state.started_at or rec.get("at")
+                state.status = "running"
+            elif kind == "fetched" and rec.get("url") and rec.get("path"):
+                state.fetched[rec["url"]] = rec["path"]
+            elif kind == "phase" and rec.get("key") not in state.completed_phases:
+                state.completed_phases.append(rec.get("key"))
+            elif kind == "end":
+                state.status = rec.get("status") or "completed"
+    return state
+
+
+def resumable(data_dir: str) -> Optional[JournalState]:
+    """Return the interrupted run recorded in ``data_dir`` (None if nothing to resume)."""
+    state = load(data_dir)
+    return state if state.resumable else None
+
+
+class ScrapeJournal:
+    """Writer for one run; ``restore(url)`` serves pages checkpointed by a prior attempt."""
+
+    def __init__(self, data_dir: str, club_id: int, season: int, *, resume: bool = False):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        previous = load(data_dir) if resume else JournalState()
+        same_run = previous.resumable and (previous.club_id, previous.season) == (club_id, season)
+        self.resumed = bool(resume and same_run)
+        self.previous = previous if self.resumed else JournalState()
+        self.restored = 0
+        os.makedirs(data_dir, exist_ok=True)
+        mode = "a" if self.resumed else "w"
+        self._fh = open(_path(data_dir), mode, encoding="utf-8")
+        self._append(
+            {
+                "type": "start",
+                "club_id": club_id,
+                "season": season,
+                "resumed": self.resumed,
+                "at": datetime.utcnow().isoformat(timespec="seconds"),
+            }
+        )
+
+    def _append(self, record: dict) -> None:
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._fh.flush()
+
+    def record_fetch(self, url: str, path: str) -> None:
+        rel = os.path.relpath(path, self.data_dir)
+        self._append({"type": "fetched", "url": url, "path": rel})
+
+    def phase_complete(self, key: str) -> None:
+        self._append({"type": "phase", "key": key})
+
+    def restore(self, url: str) -> Optional[str]:
+        """Persisted HTML for ``url`` from the interrupted run, if still on disk."""
+        rel = self.previous.fetched.get(url)
+        if rel is None:
+            return None
+        try:
+            html = filesystem.read_text(os.path.join(self.data_dir, rel))
+        except OSError:
+            return None
+        with self._lock:
+            self.restored += 1
+        return html
+
+    def finish(self, status: str) -> None:
+        self._append({"type": "end", "status": status})
+        with self._lock:
+            self._fh.close()
+
+    def stats(self) -> dict:
+        return {
+            "resumed": self.resumed,
+            "restored_fetches": self.restored,
+            "previous_phases": list(self.previous.completed_phases),
+        }
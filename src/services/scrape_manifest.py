@@ -0,0 +1,210 @@
+"""Manifest of the files persisted by `pipeline.run_full` (``scrape_manifest.json``).
+
+Every page the pipeline writes is recorded with its path (relative to the data
+dir), content hashes, size, mtime and - where known - division and team id.
+Both hashes are computed from the in-memory HTML at write time:
+
+ - ``sha1`` of the bytes on disk, as `DataAuditService` (ingestion coordinator
+   provenance) hashes files;
+ - ``sha256`` of the text as read back, as `db.ingest.hash_html` hashes it for
+   ``ingest_provenance``.
+
+The manifest is cumulative: entries of earlier runs are kept while their file
+exists, so it inventories the whole data dir. Consumers
+(`IngestionCoordinator.run(manifest=...)`, `db.ingest.incremental_refresh`) list
+ranking tables and rosters from it instead of walking the tree, and reuse the
+recorded hashes for files whose size and mtime still match (a ``stat`` instead of
+a read); anything else is hashed from disk as before. Files never recorded in a
+manifest are not discovered - run without one for a full audit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from core import filesystem
+
+__all__ = [
+    "FILENAME",
+    "LANDING",
+    "RANKING_TABLE",
+    "TEAM_ROSTER",
+    "CLUB_OVERVIEW",
+    "CLUB_TEAM",
+    "PLAYER_HISTORY",
+    "ManifestEntry",
+    "ScrapeManifest",
+    "load",
+]
+
+FILENAME = "scrape_manifest.json"
+
+# Entry kinds
+LANDING = "landing"
+RANKING_TABLE = "ranking_table"
+TEAM_ROSTER = "team_roster"
+CLUB_OVERVIEW = "club_overview"
+CLUB_TEAM = "club_team"
+PLAYER_HISTORY = "player_history"
+
+
+@dataclass
+class ManifestEntry:
+    path: str  # relative to the data dir, "/"-separated
+    sha1: str
+    sha256: str
+    size: int
+    mtime_ns: int
+    kind: str
+    division: Optional[str] = None
+    team_id: Optional[str] = None
+    written_at: Optional[str] = None
+
+    def matches(self, st: os.stat_result) -> bool:
+        """True while the file still has the size and mtime recorded at write time."""
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+
+def _disk_bytes(content: str) -> bytes:
+    # What `filesystem.write_text` (text mode, UTF-8) puts on disk
+    data = content.encode("utf-8")
+    if os.linesep != "\n":  # pragma: no cover - platform specific
+        data = data.replace(b"\n", os.linesep.encode("ascii"))
+    return data
+
+
+class ScrapeManifest:
+    """Files of one data dir; `record` the pages of a run, then `save` the merged inventory."""
+
+    def __init__(self, data_dir: str, entries: Optional[Dict[str, ManifestEntry]] = None):
+        self.data_dir = data_dir
+        self.entries: Dict[str, ManifestEntry] = dict(entries or {})
+        self.written: List[str] = []  # relative paths recorded by this run, in write order
+        self._written_set: set[str] = set()
+        # recorded before the (possibly queued) write landed: mtime read on `settle`
+        self._unsettled: set[str] = set()
+        # entry each path had before this run first recorded it (None: new path)
+        self._replaced: Dict[str, Optional[ManifestEntry]] = {}
+
+    def relpath(self, path: str) -> str:
+        return os.path.relpath(path, self.data_dir).replace(os.sep, "/")
+
+    def record(
+        self,
+        path: str,
+        content: str,
+        *,
+        kind: str,
+        division: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> ManifestEntry:
+        """Record ``content`` written (or queued for writing) to ``path``.
+
+        Hashes and size come from memory; the file's mtime is read by `settle` once the
+        write has landed (`save` and `written_entries` settle first).
+        """
+        data = _disk_bytes(content)
+        # Universal-newline text as `Path.read_text` returns it (db.ingest hashes that)
+        text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        rel = self.relpath(path)
+        entry = ManifestEntry(
+            path=rel,
+            sha1=hashlib.sha1(data).hexdigest(),
+            sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            size=len(data),
+            mtime_ns=0,
+            kind=kind,
+            division=division,
+            team_id=team_id,
+            written_at=datetime.utcnow().isoformat(),
+        )
+        if rel not in self._written_set:
+            self._written_set.add(rel)
+            self.written.append(rel)
+            self._replaced[rel] = self.entries.get(rel)
+        self.entries[rel] = entry
+        self._unsettled.add(rel)
+        return entry
+
+    def discard(self, path: str) -> None:
+        """Forget the recording of a write that failed (the file keeps its earlier entry)."""
+        rel = self.relpath(path)
+        if rel not in self._written_set:
+            return
+        self._written_set.discard(rel)
+        self.written.remove(rel)
+        self._unsettled.discard(rel)
+        previous = self._replaced.pop(rel, None)
+        if previous is not None:
+            self.entries[rel] = previous
+        else:
+            self.entries.pop(rel, None)
+
+    def settle(self) -> None:
+        """Read the mtime of entries recorded since the last call (their writes must be done)."""
+        for rel in sorted(self._unsettled):
+            try:
+                st = os.stat(os.path.join(self.data_dir, *rel.split("/")))
+            except OSError:  # the write failed: forget the entry
+                self.entries.pop(rel, None)
+                continue
+            self.entries[rel].mtime_ns = st.st_mtime_ns
+        self._unsettled.clear()
+
+    def relpaths(self, *kinds: str) -> List[str]:
+        """Relative paths of the entries of ``kinds`` (all entries when none given), sorted."""
+        return sorted(rel for rel, e in self.entries.items() if not kinds or e.kind in kinds)
+
+    def entry_for(self, rel: str, path: str) -> Optional[ManifestEntry]:
+        """Entry of ``rel`` when the file at ``path`` is unchanged since it was recorded."""
+        entry = self.entries.get(rel)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return entry if entry.matches(st) else None
+
+    def written_entries(self) -> List[dict]:
+        """The entries recorded by this run (JSON-serialisable, in write order)."""
+        self.settle()
+        return [asdict(self.entries[rel]) for rel in self.written if rel in self.entries]
+
+    def save(self) -> str:
+        """Persist the manifest (entries whose file disappeared are dropped); return its path."""
+        self.settle()
+        for rel in list(self.entries):
+            if rel not in self._written_set and not os.path.exists(
+                os.path.join(self.data_dir, *rel.split("/"))
+            ):
+                del self.entries[rel]
+        path = os.path.join(self.data_dir, FILENAME)
+        payload = {
+            "saved_at": datetime.utcnow().isoformat(),
+            "entries": [asdict(self.entries[rel]) for rel in sorted(self.entries)],
+        }
+        filesystem.write_text(path, json.dumps(payload, indent=1, ensure_ascii=False))
+        return path
+
+
+def load(data_dir: str) -> ScrapeManifest:
+    """Load the manifest of ``data_dir`` (empty when missing or unreadable)."""
+    manifest = ScrapeManifest(data_dir)
+    try:
+        with open(os.path.join(data_dir, FILENAME), "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+    except (OSError, ValueError):
+        return manifest
+    for item in raw.get("entries", []) if isinstance(raw, dict) else []:
+        try:
+            entry = ManifestEntry(**item)
+        except TypeError:
+            continue
+        manifest.entries[entry.path] = entry
+    return manifest
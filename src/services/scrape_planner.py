@@ -0,0 +1,210 @@
+"""Incremental scrape planning driven by `tracking.rescrape_policy`.
+
+`build_plan` inspects what a previous full scrape left in the data directory -
+``match_tracking.json`` (divisions, teams, upcoming matches), the persisted
+ranking tables / rosters (their modification time is the last-fetch time) and
+the checkpoint journal (original URL of each persisted page) - and decides per
+division whether it is likely to have changed since it was last fetched.
+
+The resulting `ScrapePlan` lists every page an incremental run would request,
+each with the reason, so it can be printed as a dry run. Executing it is done by
+`services.pipeline.run_incremental`.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config import settings
+from parsing import club_parser, link_extractor, ranking_parser
+from services import scrape_journal
+from tracking import rescrape_policy, tracking_store
+from utils import naming
+
+__all__ = ["PlannedFetch", "DivisionPlan", "ScrapePlan", "build_plan"]
+
+_TEAM_ID_SUFFIX = re.compile(r"_(\d+)\.html$")
+
+
+@dataclass
+class PlannedFetch:
+    kind: str  # landing | ranking_table | roster
+    url: str
+    reason: str
+    division: Optional[str] = None
+    team_id: Optional[str] = None
+    team_name: Optional[str] = None
+    path: Optional[str] = None  # existing file the page is persisted to (rosters)
+
+
+@dataclass
+class DivisionPlan:
+    name: str
+    directory: str
+    team_ids: List[str]
+    last_fetch: Optional[datetime]
+    reason: Optional[str]  # None -> division skipped
+    ranking_url: Optional[str] = None
+
+
+@dataclass
+class ScrapePlan:
+    full_scrape_reason: Optional[str] = None  # set when no usable previous scrape exists
+    fetches: List[PlannedFetch] = field(default_factory=list)
+    divisions: List[DivisionPlan] = field(default_factory=list)
+
+    @property
+    def is_full(self) -> bool:
+        return self.full_scrape_reason is not None
+
+    @property
+    def skipped_divisions(self) -> List[str]:
+        return [d.name for d in self.divisions if d.reason is None]
+
+    def describe(self) -> List[str]:
+        """Human readable dry-run lines (what would be fetched and why)."""
+        if self.is_full:
+            return [f"full scrape: {self.full_scrape_reason}"]
+        lines = [
+            f"{f.kind:<13} {f.division or '-'} {f.team_name or ''}".rstrip()
+            + f"  <- {f.reason}\n    {f.url or '(url taken from landing page)'}"
+            for f in self.fetches
+        ]
+        for name in self.skipped_divisions:
+            lines.append(f"skip          {name}  <- no match since last fetch")
+        return lines
+
+    def to_dict(self) -> dict:
+        return {
+            "full_scrape_reason": self.full_scrape_reason,
+            "fetches": [asdict(f) for f in self.fetches],
+            "divisions": [
+                {
+                    "name": d.name,
+                    "ranking_url": d.ranking_url,
+                    "team_ids": d.team_ids,
+                    "last_fetch": d.last_fetch.isoformat() if d.last_fetch else None,
+                    "reason": d.reason,
+                }
+                for d in self.divisions
+            ],
+            "skipped_divisions": self.skipped_divisions,
+        }
+
+
+def _absolute(link: str) -> str:
+    return link if link.startswith("http") else f"{settings.ROOT_URL}{link}"
+
+
+def _mtime(path: str) -> Optional[datetime]:
+    try:
+        return datetime.fromtimestamp(os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+def build_plan(data_dir: str, landing_url: str, *, now: datetime | None = None) -> ScrapePlan:
+    """Plan an incremental refresh of ``data_dir`` (no network access)."""
+    now = now or datetime.now()
+    state = tracking_store.load_state(data_dir)
+    if state.last_scrape is None:
+        return ScrapePlan(full_scrape_reason="no previous scrape recorded (match_tracking.json)")
+    journal = scrape_journal.load(data_dir)
+    url_by_path = {os.path.normpath(p): u for u, p in journal.fetched.items()}
+
+    def _known_url(path: str) -> Optional[str]:
+        return url_by_path.get(os.path.normpath(os.path.relpath(path, data_dir)))
+
+    # Division directories on disk, keyed by sanitized name; tracking names win for display
+    display_names: Dict[str, str] = {naming.sanitize(n): n for n in state.divisions}
+    dirs = sorted(
+        d
+        for d in os.listdir(data_dir)
+        if os.path.isdir(os.path.join(data_dir, d))
+        and any(
+            f.startswith(("team_roster_", "ranking_table_"))
+            for f in os.listdir(os.path.join(data_dir, d))
+        )
+    )
+    if not dirs:
+        return ScrapePlan(full_scrape_reason="no persisted divisions in data dir")
+
+    plan = ScrapePlan()
+    plan.fetches.append(
+        PlannedFetch("landing", landing_url, "discover ranking tables of new divisions")
+    )
+    for d in dirs:
+        div_dir = os.path.join(data_dir, d)
+        files = os.listdir(div_dir)
+        name = display_names.get(d, d.replace("_", " "))
+        ranking_file = next((f for f in files if f.startswith("ranking_table_")), None)
+        ranking_path = os.path.join(div_dir, ranking_file) if ranking_file else None
+        # team_id -> (team_name, roster url)
+        teams: Dict[str, tuple[str, Optional[str]]] = {}
+        ranking_url: Optional[str] = None
+        if ranking_path:
+            try:
+                with open(ranking_path, "r", encoding="utf-8") as fh:
+                    parsed_name, ranking_teams = ranking_parser.parse_ranking_table(
+                        fh.read(), source_hint=ranking_file
+                    )
+                name = display_names.get(naming.sanitize(parsed_name), parsed_name)
+                for t in ranking_teams:
+                    if t.get("team_id"):
+                        teams[t["team_id"]] = (t["team_name"], _absolute(t["roster_link"]))
+                derived = link_extractor.derive_ranking_table_links(
+                    [t["roster_link"] for t in ranking_teams]
+                )
+                ranking_url = _known_url(ranking_path) or (derived[0] if derived else None)
+            except OSError:
+                ranking_path = None
+        roster_files = {
+            m.group(1): f
+            for f in files
+            if f.startswith("team_roster_") and (m := _TEAM_ID_SUFFIX.search(f))
+        }
+        tracked = state.divisions.get(name)
+        for t in getattr(tracked, "teams", []) or []:
+            if t.id and t.id not in teams:
+                teams[t.id] = (t.name, None)
+        for tid in roster_files:
+            teams.setdefault(tid, (tid, None))
+        # Resolve roster urls not given by a ranking table: journal, then tracked division id
+        resolved: Dict[str, tuple[str, Optional[str]]] = {}
+        for tid, (tname, url) in teams.items():
+            if url is None and tid in roster_files:
+                url = _known_url(os.path.join(div_dir, roster_files[tid]))
+            if url is None and tracked is not None:
+                div_id = next(
+                    (getattr(t, "division_id", None) for t in tracked.teams if t.id == tid), None
+                )
+                if div_id and div_id != tid:  # equal ids are the legacy combined form
+                    url = _absolute(club_parser.build_roster_link(tid, div_id))
+            resolved[tid] = (tname, url)
+
+        fetch_times = [
+            t
+            for t in [_mtime(ranking_path) if ranking_path else None]
+            + [_mtime(os.path.join(div_dir, f)) for f in roster_files.values()]
+            if t is not None
+        ]
+        last_fetch = min(fetch_times) if fetch_times else None
+        reason = rescrape_policy.rescrape_reason(
+            name, state, team_ids=list(resolved), last_fetch=last_fetch, now=now
+        )
+        plan.divisions.append(
+            DivisionPlan(name, div_dir, sorted(resolved), last_fetch, reason, ranking_url)
+        )
+        if reason is not None:
+            # without a known URL the ranking table is matched among the landing page links
+            plan.fetches.append(PlannedFetch("ranking_table", ranking_url or "", reason, name))
+        for tid, (tname, url) in sorted(resolved.items()):
+            existing = os.path.join(div_dir, roster_files[tid]) if tid in roster_files else None
+            why = reason if reason is not None else (None if existing else "roster file missing")
+            if why and url:
+                plan.fetches.append(PlannedFetch("roster", url, why, name, tid, tname, existing))
+    return plan
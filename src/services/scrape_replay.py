@@ -0,0 +1,361 @@
+"""Offline replay of a recorded scrape corpus over local HTTP.
+
+`ReplayCorpus` maps the original query-string URLs to the HTML persisted under
+a data directory:
+
+ - pages journaled by `pipeline.run_full` (``scrape_journal.jsonl``) are served
+   under the exact URL they were fetched from;
+ - corpora without a journal (such as the checked-in ``data/``) are indexed by
+   file name: ``team_roster_*_<team id>.html`` and
+   ``club_teams/club_team_*_<team id>.html`` answer the roster URL of that team
+   (the division id is read from the page's own links), ``ranking_table_*.html``
+   the ranking table URL of its division. When a landing URL is given but no
+   ``website_source_*.html`` snapshot exists, a landing page linking one roster
+   per division is synthesized so `run_full` discovers every division.
+
+URLs are matched on their query parameters only (order, the ``LogIn`` flag and
+the default ``Page=Vorrunde`` are ignored), as every page of the site is
+addressed by query string.
+
+`ReplayServer` serves a corpus from a background thread (keep-alive HTTP/1.1,
+gzip when accepted, ETag revalidation) with configurable latency, jitter and
+error injection. ``with server.redirect():`` routes requests for
+``settings.ROOT_URL`` to it via `http_client.redirect_origin`, so the unchanged
+pipeline runs offline and reproducibly (see `services.scrape_benchmark`).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from config import settings
+from core import http_client
+from services import scrape_journal
+
+__all__ = ["ReplayCorpus", "ReplayPage", "ReplayServer", "url_key"]
+
+_IGNORED_PARAMS = frozenset({"LogIn"})
+_DEFAULT_PARAMS = frozenset({("Page", "Vorrunde")})
+_TEAM_ID_SUFFIX = re.compile(r"_(\d+)\.html$")
+_DIVISION_LINK = re.compile(r"L2=TTStaffeln&(?:amp;)?L2P=(\d+)")
+
+UrlKey = Tuple[Tuple[str, str], ...]
+
+
+def url_key(url: str) -> UrlKey:
+    """Normalized identity of a site URL (its significant query parameters)."""
+    params = parse_qsl(urlsplit(url).query, keep_blank_values=True)
+    kept = (p for p in params if p[0] not in _IGNORED_PARAMS and p not in _DEFAULT_PARAMS)
+    return tuple(sorted(kept))
+
+
+def _roster_query(division_id: str, team_id: str) -> str:
+    return f"?L1=Ergebnisse&L2=TTStaffeln&L2P={division_id}&L3=Mannschaften&L3P={team_id}"
+
+
+def _ranking_query(division_id: str) -> str:
+    return f"?L1=Ergebnisse&L2=TTStaffeln&L2P={division_id}&L3=Tabelle"
+
+
+def _division_id(html: str) -> Optional[str]:
+    counts = Counter(_DIVISION_LINK.findall(html))
+    return counts.most_common(1)[0][0] if counts else None
+
+
+@dataclass
+class ReplayPage:
+    """One servable page: a file of the corpus or a synthesized body."""
+
+    source: str  # journal | file_name | synthesized
+    path: Optional[str] = None
+    body: Optional[bytes] = None
+
+    def read(self) -> bytes:
+        if self.body is not None:
+            return self.body
+        with open(self.path, "rb") as fh:  # type: ignore[arg-type]
+            return fh.read()
+
+
+class ReplayCorpus:
+    """URL -> page index over a scrape output directory."""
+
+    def __init__(self) -> None:
+        self.pages: Dict[UrlKey, ReplayPage] = {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def add(self, url: str, page: ReplayPage) -> bool:
+        """Register ``page`` for ``url`` unless the URL is already known."""
+        key = url_key(url)
+        if key in self.pages:
+            return False
+        self.pages[key] = page
+        return True
+
+    def lookup(self, url: str) -> Optional[ReplayPage]:
+        return self.pages.get(url_key(url))
+
+    def sources(self) -> Dict[str, int]:
+        return dict(Counter(p.source for p in self.pages.values()))
+
+    @classmethod
+    def from_dir(cls, data_dir: str, *, landing_url: str | None = None) -> "ReplayCorpus":
+        """Index ``data_dir`` (journal first, then file names; see module docstring)."""
+        corpus = cls()
+        journal = scrape_journal.load(data_dir)
+        for url, rel in journal.fetched.items():
+            path = os.path.join(data_dir, rel)
+            if os.path.isfile(path):
+                corpus.add(url, ReplayPage("journal", path=path))
+
+        # division id -> one team id (for a synthesized landing page)
+        division_teams: Dict[str, str] = {}
+        snapshots: List[str] = []
+        for root, dirs, files in os.walk(data_dir):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("_"))  # skip _cache etc.
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                if name.startswith("website_source_") and name.endswith(".html"):
+                    snapshots.append(path)
+                    continue
+                is_roster = name.startswith(("team_roster_", "club_team_"))
+                if not (is_roster or name.startswith("ranking_table_")) or not name.endswith(
+                    ".html"
+                ):
+                    continue
+                try:
+                    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+                        division_id = _division_id(fh.read())
+                except OSError:
+                    continue
+                if division_id is None:
+                    continue
+                if is_roster:
+                    m = _TEAM_ID_SUFFIX.search(name)
+                    if not m:
+                        continue
+                    team_id = m.group(1)
+                    corpus.add(_roster_query(division_id, team_id), ReplayPage("file_name", path))
+                    division_teams.setdefault(division_id, team_id)
+                else:
+                    corpus.add(_ranking_query(division_id), ReplayPage("file_name", path))
+
+        if landing_url and corpus.lookup(landing_url) is None:
+            if snapshots:
+                corpus.add(landing_url, ReplayPage("file_name", path=max(snapshots)))
+            else:
+                links = "".join(
+                    f'<a href="{_roster_query(div, tid)}">{div}</a>\n'
+                    for div, tid in sorted(division_teams.items())
+                )
+                body = f"<html><body>\n{links}</body></html>\n".encode("utf-8")
+                corpus.add(landing_url, ReplayPage("synthesized", body=body))
+        return corpus
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "RosterPlannerReplay/1.0"
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self.server.replay._serve(self)  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - silence stderr logging
+        pass
+
+
+class ReplayServer:
+    """Serve a `ReplayCorpus` on localhost with simulated network conditions.
+
+    Parameters
+    ----------
+    latency: Seconds added to every response.
+    jitter: Uniform +/- spread around ``latency`` (never below zero).
+    error_rate: Fraction of requests answered with ``error_status`` instead.
+    error_status: Status of injected errors (503 by default; 429 exercises throttling).
+    retry_after: ``Retry-After`` seconds sent with injected errors (None omits it).
+    miss_status: Status for URLs not in the corpus. 200 answers an empty page,
+        which keeps pipeline runs over partial corpora from stalling in retries.
+    seed: Seed of the random generator behind jitter and error injection.
+    """
+
+    def __init__(
+        self,
+        corpus: ReplayCorpus,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: float | None = None,
+        miss_status: int = 404,
+        compress: bool = True,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.corpus = corpus
+        self.latency = max(0.0, latency)
+        self.jitter = max(0.0, jitter)
+        self.error_rate = min(1.0, max(0.0, error_rate))
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.miss_status = miss_status
+        self.compress = compress
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies: Dict[UrlKey, Tuple[bytes, str]] = {}  # key -> (body, etag)
+        self._host = host
+        self._port = port
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._stats = {
+            "requests": 0,
+            "hits": 0,
+            "misses": 0,
+            "injected_errors": 0,
+            "not_modified": 0,
+            "bytes_sent": 0,
+        }
+        self.missed_urls: List[str] = []
+
+    # Lifecycle --------------------------------------------------------
+    def start(self) -> "ReplayServer":
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self._host, self._port), _Handler)
+            self._httpd.daemon_threads = True
+            self._httpd.replay = self  # type: ignore[attr-defined]
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="scrape-replay", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("replay server not started")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @contextmanager
+    def redirect(self, origin: str | None = None) -> Iterator["ReplayServer"]:
+        """Route requests for ``origin`` (default ``settings.ROOT_URL``) here."""
+        origin = origin or settings.ROOT_URL
+        http_client.redirect_origin(origin, self.url)
+        try:
+            yield self
+        finally:
+            http_client.redirect_origin(origin, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    # Request handling -------------------------------------------------
+    def _delay(self) -> float:
+        with self._lock:
+            spread = self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + spread)
+
+    def _inject_error(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def _page(self, url: str) -> Optional[Tuple[bytes, str]]:
+        key = url_key(url)
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is not None:
+            return cached
+        page = self.corpus.pages.get(key)
+        if page is None:
+            return None
+        body = page.read()
+        entry = (body, '"%s"' % hashlib.sha1(body).hexdigest())
+        with self._lock:
+            self._bodies[key] = entry
+        return entry
+
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self._stats["requests"] += 1
+        headers: Dict[str, str] = {"Content-Type": "text/html; charset=utf-8"}
+        if self._inject_error():
+            with self._lock:
+                self._stats["injected_errors"] += 1
+            if self.retry_after is not None:
+                headers["Retry-After"] = f"{self.retry_after:g}"
+            self._respond(handler, self.error_status, b"", headers)
+            return
+        found = self._page(handler.path)
+        if found is None:
+            with self._lock:
+                self._stats["misses"] += 1
+                self.missed_urls.append(handler.path)
+            status = self.miss_status
+            self._respond(handler, status, b"<html></html>" if status < 400 else b"", headers)
+            return
+        body, etag = found
+        headers["ETag"] = etag
+        if handler.headers.get("If-None-Match") == etag:
+            with self._lock:
+                self._stats["hits"] += 1
+                self._stats["not_modified"] += 1
+            self._respond(handler, 304, b"", headers)
+            return
+        if self.compress and "gzip" in (handler.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        with self._lock:
+            self._stats["hits"] += 1
+        self._respond(handler, 200, body, headers)
+
+    def _respond(
+        self, handler: BaseHTTPRequestHandler, status: int, body: bytes, headers: Dict[str, str]
+    ) -> None:
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        if status != 304:
+            handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if body and status != 304:
+            handler.wfile.write(body)
+            with self._lock:
+                self._stats["bytes_sent"] += len(body)
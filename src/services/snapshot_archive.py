@@ -0,0 +1,391 @@
+"""Delta-compressed archive of scraped pages across runs (``<data_dir>/_archive``).
+
+`pipeline.run_full` overwrites rosters and ranking tables in place and writes a
+new full ``website_source_<timestamp>.html`` per run. The archive keeps every
+version of each page at a fraction of the size:
+
+ - content is addressed by the sha256 of its text (the manifest / `db.ingest.hash_html`
+   digest), so identical content across versions or paths is stored once;
+ - the first version of a page is stored in full (zlib); later versions are stored
+   as a zlib-compressed line delta against the page's latest full version, or in full
+   again (a new keyframe) when the delta would not be much smaller. Reconstructing
+   a version therefore applies at most one delta;
+ - every landing snapshot is archived under the single key ``website_source.html``,
+   so the near-identical snapshots delta against each other.
+
+Versions are grouped by scrape (one id per archived run). `tree` returns the
+pages as of a scrape, `get` reconstructs any version, and `prune` drops scrapes
+older than a given age while keeping whatever the remaining scrapes need.
+`services.compare_scrapes.compare_snapshots` compares two archived scrapes
+without two full directory trees on disk.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+__all__ = [
+    "DIRNAME",
+    "LANDING_KEY",
+    "ArchivedVersion",
+    "PruneResult",
+    "SnapshotArchive",
+    "archive_key",
+    "archive_scrape",
+]
+
+DIRNAME = "_archive"
+LANDING_KEY = "website_source.html"
+_LANDING_RE = re.compile(r"(^|/)website_source_[^/]*\.html$")
+
+# A delta is only kept when it is smaller than this share of the full compressed page
+_DELTA_MAX_RATIO = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs(
+    digest TEXT PRIMARY KEY,
+    base_digest TEXT,
+    data BLOB NOT NULL,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scrapes(
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    scrape_id TEXT UNIQUE NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions(
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs(digest),
+    archived_at REAL NOT NULL,
+    PRIMARY KEY(path, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_versions_seq ON versions(seq);
+"""
+
+
+@dataclass
+class ArchivedVersion:
+    path: str
+    scrape_id: Optional[str]  # None once the scrape was pruned (version kept for later scrapes)
+    seq: int
+    digest: str
+    archived_at: float
+
+
+@dataclass
+class PruneResult:
+    scrapes_removed: int = 0
+    versions_removed: int = 0
+    blobs_removed: int = 0
+    bytes_freed: int = 0
+
+
+def archive_key(relpath: str) -> str:
+    """Archive path of a data dir file (landing snapshots share one key)."""
+    relpath = relpath.replace(os.sep, "/")
+    return LANDING_KEY if _LANDING_RE.search(relpath) else relpath
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(text: str) -> str:
+    # Universal newlines, as pages are read back with `read_text` (matches manifest digests)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _encode_delta(base: str, text: str) -> bytes:
+    """Line delta: ``[i, j]`` copies base lines ``i:j``, a string inserts itself."""
+    a = base.splitlines(keepends=True)
+    b = text.splitlines(keepends=True)
+    ops: List[object] = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(b[j1:j2]))
+    return zlib.compress(json.dumps(ops, ensure_ascii=False).encode("utf-8"), 9)
+
+
+def _apply_delta(base: str, data: bytes) -> str:
+    lines = base.splitlines(keepends=True)
+    out = []
+    for op in json.loads(zlib.decompress(data).decode("utf-8")):
+        out.append("".join(lines[op[0] : op[1]]) if isinstance(op, list) else op)
+    return "".join(out)
+
+
+class SnapshotArchive:
+    """SQLite-backed version store of one data dir's pages."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            os.path.join(root, "archive.sqlite"), check_same_thread=False, isolation_level=None
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Blobs --------------------------------------------------------------
+    def _blob(self, digest: str) -> str:
+        row = self._conn.execute(
+            "SELECT base_digest, data FROM blobs WHERE digest=?", (digest,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        base_digest, data = row
+        if base_digest is None:
+            return zlib.decompress(data).decode("utf-8")
+        return _apply_delta(self._blob(base_digest), data)
+
+    def _store(self, path: str, text: str, digest: str) -> None:
+        if self._conn.execute("SELECT 1 FROM blobs WHERE digest=?", (digest,)).fetchone():
+            return  # identical content already archived (any path)
+        full = zlib.compress(text.encode("utf-8"), 9)
+        base_digest, data = None, full
+        keyframe = self._conn.execute(
+            "SELECT v.digest FROM versions v JOIN blobs b ON b.digest = v.digest "
+            "WHERE v.path=? AND b.base_digest IS NULL ORDER BY v.seq DESC LIMIT 1",
+            (path,),
+        ).fetchone()
+        if keyframe is not None:
+            delta = _encode_delta(self._blob(keyframe[0]), text)
+            if len(delta) < len(full) * _DELTA_MAX_RATIO:
+                base_digest, data = keyframe[0], delta
+        self._conn.execute(
+            "INSERT INTO blobs(digest, base_digest, data, raw_size, stored_size) VALUES(?,?,?,?,?)",
+            (digest, base_digest, data, len(text.encode("utf-8")), len(data)),
+        )
+
+    # Scrapes and versions -----------------------------------------------
+    def begin_scrape(self, scrape_id: str | None = None) -> str:
+        """Register a scrape (id defaults to the UTC timestamp) and return its id."""
+        scrape_id = scrape_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO scrapes(scrape_id, created_at) VALUES(?, ?)",
+                (scrape_id, time.time()),
+            )
+        return scrape_id
+
+    def _seq(self, scrape_id: str) -> int:
+        row = self._conn.execute(
+            "SELECT seq FROM scrapes WHERE scrape_id=?", (scrape_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"unknown scrape {scrape_id!r}")
+        return int(row[0])
+
+    def latest_digest(self, path: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM versions WHERE path=? ORDER BY seq DESC LIMIT 1", (path,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, text: str, scrape_id: str, *, digest: str | None = None) -> bool:
+        """Archive ``text`` as the version of ``path`` in ``scrape_id``.
+
+        Returns False (nothing stored) when it equals the path's latest version.
+        """
+        text = _normalize(text)
+        digest = digest or _digest(text)
+        with self._lock:
+            if self.latest_digest(path) == digest:
+                return False
+            seq = self._seq(scrape_id)
+            self._conn.execute("BEGIN")
+            try:
+                self._store(path, text, digest)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO versions(path, seq, digest, archived_at) "
+                    "VALUES(?,?,?,?)",
+                    (path, seq, digest, time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def scrapes(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT scrape_id FROM scrapes ORDER BY seq").fetchall()
+        return [r[0] for r in rows]
+
+    def versions(self, path: str) -> List[ArchivedVersion]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT v.seq, s.scrape_id, v.digest, v.archived_at FROM versions v "
+                "LEFT JOIN scrapes s ON s.seq = v.seq WHERE v.path=? ORDER BY v.seq",
+                (path,),
+            ).fetchall()
+        return [ArchivedVersion(path, sid, seq, dg, at) for seq, sid, dg, at in rows]
+
+    def get(self, path: str, scrape_id: str | None = None) -> str:
+        """Content of ``path`` as of ``scrape_id`` (latest version when None)."""
+        with self._lock:
+            if scrape_id is None:
+                digest = self.latest_digest(path)
+            else:
+                row = self._conn.execute(
+                    "SELECT digest FROM versions WHERE path=? AND seq<=? "
+                    "ORDER BY seq DESC LIMIT 1",
+                    (path, self._seq(scrape_id)),
+                ).fetchone()
+                digest = row[0] if row else None
+            if digest is None:
+                raise KeyError(f"{path!r} not archived as of {scrape_id!r}")
+            return self._blob(digest)
+
+    def tree(self, scrape_id: str) -> Dict[str, str]:
+        """``{path: digest}`` of every archived page as of ``scrape_id``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, digest FROM versions v WHERE seq = ("
+                "SELECT MAX(seq) FROM versions WHERE path = v.path AND seq <= ?)",
+                (self._seq(scrape_id),),
+            ).fetchall()
+        return dict(rows)
+
+    # Maintenance --------------------------------------------------------
+    def prune(self, max_age_days: float, *, now: float | None = None) -> PruneResult:
+        """Drop scrapes older than ``max_age_days`` (never the newest one).
+
+        Versions still visible from a remaining scrape (a page's latest version before
+        the oldest kept scrape) and the keyframes of kept deltas are retained.
+        """
+        result = PruneResult()
+        cutoff = (now if now is not None else time.time()) - max_age_days * 86400
+        with self._lock:
+            rows = self._conn.execute("SELECT seq, created_at FROM scrapes ORDER BY seq").fetchall()
+            kept_from = 0
+            while kept_from < len(rows) - 1 and rows[kept_from][1] < cutoff:
+                kept_from += 1
+            if not kept_from:
+                return result
+            oldest_kept = rows[kept_from][0]
+            self._conn.execute("BEGIN")
+            try:
+                # per path, the newest version before the oldest kept scrape stays visible
+                cur = self._conn.execute(
+                    "DELETE FROM versions WHERE seq < ? AND seq NOT IN ("
+                    "SELECT MAX(v2.seq) FROM versions v2 WHERE v2.path = versions.path "
+                    "AND v2.seq < ?)",
+                    (oldest_kept, oldest_kept),
+                )
+                result.versions_removed = cur.rowcount
+                cur = self._conn.execute("DELETE FROM scrapes WHERE seq < ?", (oldest_kept,))
+                result.scrapes_removed = cur.rowcount
+                orphans = self._conn.execute(
+                    "SELECT digest, stored_size FROM blobs WHERE digest NOT IN "
+                    "(SELECT digest FROM versions) AND digest NOT IN ("
+                    "SELECT b.base_digest FROM blobs b JOIN versions v ON v.digest = b.digest "
+                    "WHERE b.base_digest IS NOT NULL)"
+                ).fetchall()
+                for digest, size in orphans:
+                    self._conn.execute("DELETE FROM blobs WHERE digest=?", (digest,))
+                    result.blobs_removed += 1
+                    result.bytes_freed += int(size)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            blobs, deltas, raw, stored = self._conn.execute(
+                "SELECT COUNT(*), COUNT(base_digest), COALESCE(SUM(raw_size), 0), "
+                "COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+            versions = self._conn.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+            scrapes = self._conn.execute("SELECT COUNT(*) FROM scrapes").fetchone()[0]
+        return {
+            "scrapes": scrapes,
+            "versions": versions,
+            "blobs": blobs,
+            "delta_blobs": deltas,
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+        }
+
+
+def archive_scrape(
+    data_dir: str,
+    manifest,
+    *,
+    scrape_id: str | None = None,
+    max_age_days: float | None = None,
+) -> dict:
+    """Archive the files a `run_full` recorded in ``manifest`` as one scrape.
+
+    Pages whose manifest digest equals their latest archived version are skipped
+    without being read. Older ``website_source_*.html`` snapshots in ``data_dir``
+    whose content is archived are removed, so only the newest full snapshot stays
+    on disk. With ``max_age_days`` older scrapes are pruned afterwards.
+    """
+    archive = SnapshotArchive(os.path.join(data_dir, DIRNAME))
+    try:
+        scrape_id = archive.begin_scrape(scrape_id)
+        stored = unchanged = 0
+        for rel in manifest.written:
+            entry = manifest.entries.get(rel)
+            key = archive_key(rel)
+            if entry is None:
+                continue
+            if archive.latest_digest(key) == entry.sha256:
+                unchanged += 1
+                continue
+            try:
+                with open(os.path.join(data_dir, *rel.split("/")), encoding="utf-8") as fh:
+                    text = fh.read()
+            except OSError:
+                continue
+            if archive.put(key, text, scrape_id):
+                stored += 1
+            else:
+                unchanged += 1
+        removed = 0
+        snapshots = sorted(f for f in os.listdir(data_dir) if _LANDING_RE.search(f))
+        archived = {v.digest for v in archive.versions(LANDING_KEY)}
+        for name in snapshots[:-1]:
+            path = os.path.join(data_dir, name)
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    digest = _digest(_normalize(fh.read()))
+            except OSError:
+                continue
+            if digest in archived:
+                os.remove(path)
+                removed += 1
+        pruned = archive.prune(max_age_days) if max_age_days else PruneResult()
+        return {
+            "scrape_id": scrape_id,
+            "stored": stored,
+            "unchanged": unchanged,
+            "snapshots_removed": removed,
+            "scrapes_pruned": pruned.scrapes_removed,
+            **archive.stats(),
+        }
+    finally:
+        archive.close()
@@ -0,0 +1,299 @@
+"""Streaming fetch -> parse -> write stages used by `pipeline.run_full`.
+
+A fetch-heavy phase runs as three stages connected by bounded queues:
+
+ - fetch: a producer thread drains the phase's fetch iterator (sequential
+   fetches or `ConcurrentFetcher` outcomes) into the ``fetched`` queue;
+ - parse: a dispatcher thread hands each page to a worker pool and queues the
+   pending result in submission order. Large phases use processes
+   (``ProcessPoolExecutor``, spawn context) so BeautifulSoup parses in
+   parallel; phases below ``settings.PIPELINE_PROCESS_MIN_PAGES`` pages parse
+   on one thread, as process start-up would cost more than it saves;
+ - write: the consuming thread (the caller) receives ``(job, html, error,
+   parsed)`` in input order, persists files and aggregates results.
+
+Both queues hold at most ``settings.PIPELINE_QUEUE_SIZE`` items: a slow parser
+blocks the fetcher and a slow writer blocks the parser. In async mode
+`ConcurrentFetcher.iter_fetch` schedules at most ``settings.ASYNC_FETCH_WINDOW``
+URLs ahead of the fetch stage, so the pages held in memory are bounded by the
+window plus the two queues (pending parse results included). Queue depths and
+the busy share of each stage are reported as ``stage_stats`` progress events
+during a phase and once at its end, showing whether network, parsing or writing
+is the bottleneck.
+
+An exception raised by the fetch iterator (e.g. cancellation) reaches the
+writer after every page fetched before it, so nothing fetched is dropped. A page
+whose parse raises is yielded with a `ParseFailed` error (reported like a failed
+fetch); if the process pool breaks, the remaining pages parse on the writer
+thread and later phases use threads.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from config import settings
+
+__all__ = ["ParseFailed", "StageStats", "StagedPipeline"]
+
+_DONE = object()
+_POLL = 0.1  # seconds between stop checks of blocked queue operations
+
+
+class ParseFailed(Exception):
+    """A page could not be parsed; yielded as the item's error."""
+
+
+class _Raised:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _timed(fn: Callable[..., Any], html: str, args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """Worker entry point: run ``fn(html, *args)`` and report its duration."""
+    start = time.perf_counter()
+    result = fn(html, *args)
+    return result, time.perf_counter() - start
+
+
+@dataclass
+class StageStats:
+    """Counters of one staged phase (busy seconds per stage, queue depth peaks)."""
+
+    phase: str
+    mode: str  # process | thread
+    workers: int
+    started: float = field(default_factory=time.perf_counter)
+    items: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+    peak_fetched: int = 0
+    peak_parsed: int = 0
+
+    def snapshot(self, fetched_depth: int = 0, parsed_depth: int = 0) -> Dict[str, Any]:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        self.peak_fetched = max(self.peak_fetched, fetched_depth)
+        self.peak_parsed = max(self.peak_parsed, parsed_depth)
+        return {
+            "phase": self.phase,
+            "mode": self.mode,
+            "workers": self.workers,
+            "items": self.items,
+            "elapsed": round(elapsed, 4),
+            "queue_depth": {"fetched": fetched_depth, "parsed": parsed_depth},
+            "peak_queue_depth": {"fetched": self.peak_fetched, "parsed": self.peak_parsed},
+            "utilisation": {
+                "fetch": round(min(1.0, self.fetch_seconds / elapsed), 3),
+                "parse": round(min(1.0, self.parse_seconds / (elapsed * self.workers)), 3),
+                "write": round(min(1.0, self.write_seconds / elapsed), 3),
+            },
+        }
+
+
+class StagedPipeline:
+    """Run phases as fetch / parse / write stages; one instance per `run_full`.
+
+    The parser process pool is created on first use and reused by later phases
+    until `close()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        parse_workers: int | None = None,
+        queue_size: int | None = None,
+        process_min_pages: int | None = None,
+        progress: Callable[[str, dict], Any] | None = None,
+        report_interval: float = 0.5,
+    ) -> None:
+        workers = settings.PIPELINE_PARSE_WORKERS if parse_workers is None else parse_workers
+        self.parse_workers = max(0, workers)
+        self.queue_size = max(1, queue_size or settings.PIPELINE_QUEUE_SIZE)
+        self.process_min_pages = (
+            settings.PIPELINE_PROCESS_MIN_PAGES if process_min_pages is None else process_min_pages
+        )
+        self._progress = progress
+        self._report_interval = report_interval
+        self._pool: ProcessPoolExecutor | None = None
+        # Parse futures not yet finished (cancelled on phase end / close)
+        self._pending: Set[Future] = set()
+        self.phase_stats: Dict[str, Dict[str, Any]] = {}
+
+    def _executor(self, expected: int) -> Tuple[Executor, str, int]:
+        if self.parse_workers > 0 and expected >= self.process_min_pages:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool, "process", self.parse_workers
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="stage-parse"), "thread", 1
+
+    def _report(self, stats: StageStats, fetched: queue.Queue, parsed: queue.Queue) -> None:
+        snap = stats.snapshot(fetched.qsize(), parsed.qsize())
+        self.phase_stats[stats.phase] = snap
+        if self._progress:
+            self._progress("stage_stats", snap)
+
+    def run(
+        self,
+        phase: str,
+        items: Iterable[Tuple[Any, Optional[str], Optional[BaseException]]],
+        parse: Callable[..., Any],
+        parse_args: Callable[[Any], Tuple[Any, ...]] = lambda job: (),
+        *,
+        expected: int = 0,
+    ) -> Iterator[Tuple[Any, Optional[str], Optional[BaseException], Any]]:
+        """Stream ``(job, html, error)`` items through ``parse(html, *parse_args(job))``.
+
+        ``parse`` must be a picklable module-level function. Failed fetches
+        (``error`` set or no HTML) skip parsing and yield ``parsed=None``.
+        ``expected`` (number of items) selects process or thread parsing.
+        """
+        executor, mode, workers = self._executor(expected)
+        owns_executor = executor is not self._pool
+        stats = StageStats(phase, mode, workers)
+        fetched: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        parsed: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def _put(q: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=_POLL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _get(q: queue.Queue) -> Any:
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=_POLL)
+                except queue.Empty:
+                    continue
+            return None
+
+        def _produce() -> None:
+            it = iter(items)
+            try:
+                while not stop.is_set():
+                    start = time.perf_counter()
+                    try:
+                        item = next(it)
+                    except StopIteration:
+                        break
+                    stats.fetch_seconds += time.perf_counter() - start
+                    if not _put(fetched, item):
+                        return
+            except BaseException as e:  # delivered to the writer in order
+                _put(fetched, _Raised(e))
+                return
+            _put(fetched, _DONE)
+
+        def _dispatch() -> None:
+            try:
+                while True:
+                    item = _get(fetched)
+                    if item is None:
+                        return
+                    if item is _DONE or isinstance(item, _Raised):
+                        _put(parsed, item)
+                        return
+                    job, html, error = item
+                    future: Future | None = None
+                    if error is None and html is not None:
+                        try:
+                            future = executor.submit(_timed, parse, html, parse_args(job))
+                        except BrokenProcessPool as e:  # parsed on the writer thread
+                            future = Future()
+                            future.set_exception(e)
+                        else:
+                            self._pending.add(future)
+                            future.add_done_callback(self._pending.discard)
+                    if not _put(parsed, (job, html, error, future)):
+                        return
+            except BaseException as e:  # pragma: no cover - defensive
+                _put(parsed, _Raised(e))
+
+        threads = [
+            threading.Thread(target=_produce, name=f"stage-fetch-{phase}", daemon=True),
+            threading.Thread(target=_dispatch, name=f"stage-parse-{phase}", daemon=True),
+        ]
+        for t in threads:
+            t.start()
+        last_report = 0.0
+        try:
+            while True:
+                item = parsed.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Raised):
+                    raise item.exc
+                job, html, error, future = item
+                result = None
+                if future is not None:
+                    try:
+                        try:
+                            result, seconds = future.result()
+                        except BrokenProcessPool:
+                            self._pool_broken()
+                            result, seconds = _timed(parse, html, parse_args(job))
+                        stats.parse_seconds += seconds
+                    except Exception as e:  # one bad page must not abort the phase
+                        error = ParseFailed(f"{type(e).__name__}: {e}")
+                        error.__cause__ = e
+                stats.items += 1
+                now = time.perf_counter()
+                if now - last_report >= self._report_interval:
+                    last_report = now
+                    self._report(stats, fetched, parsed)
+                start = time.perf_counter()
+                yield job, html, error, result
+                stats.write_seconds += time.perf_counter() - start
+        finally:
+            stop.set()
+            for q in (fetched, parsed):
+                while True:
+                    try:
+                        q.get_nowait()
+                    except queue.Empty:
+                        break
+            for t in threads:
+                t.join(timeout=5)
+            self._cancel_pending()
+            if owns_executor:
+                executor.shutdown(wait=False)
+            self._report(stats, fetched, parsed)
+
+    def _pool_broken(self) -> None:
+        """Drop a broken process pool; later phases parse on threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self.parse_workers = 0
+
+    def _cancel_pending(self) -> None:
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(self._pending):
+            future.cancel()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._cancel_pending()
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "StagedPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
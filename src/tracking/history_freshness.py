@@ -0,0 +1,75 @@
+"""Freshness bookkeeping for persisted player history pages (``club_players/``).
+
+``history_index.json`` in the history root maps each history file (path relative
+to the root) to the player's LivePZ when the page was fetched. `refresh_reason`
+decides per player whether `pipeline.run_full` must fetch the page again.
+"""
+
+from __future__ import annotations
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import settings
+from core import filesystem
+
+INDEX_FILENAME = "history_index.json"
+
+
+def _path(root: str) -> str:
+    return os.path.join(root, INDEX_FILENAME)
+
+
+def load_index(root: str) -> Dict[str, dict]:
+    """Return ``{relpath: {"live_pz", "fetched_at"}}`` (empty when missing or unreadable)."""
+    p = _path(root)
+    if not os.path.exists(p):
+        return {}
+    try:
+        with open(p, "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+    except Exception:
+        return {}
+    return raw if isinstance(raw, dict) else {}
+
+
+def save_index(root: str, index: Dict[str, dict]) -> None:
+    filesystem.write_text(_path(root), json.dumps(index, indent=2, sort_keys=True))
+
+
+def record(index: Dict[str, dict], relpath: str, live_pz: Optional[int]) -> None:
+    index[relpath] = {"live_pz": live_pz, "fetched_at": datetime.utcnow().isoformat()}
+
+
+def refresh_reason(
+    path: str,
+    *,
+    previous_live_pz: Optional[int],
+    current_live_pz: Optional[int],
+    max_age_days: float | None = None,
+    now: float | None = None,
+) -> Optional[str]:
+    """Return why the history at ``path`` must be fetched (None when it can be skipped).
+
+    ``"new"`` when no file exists, ``"stale"`` when the file is older than
+    ``max_age_days`` (default ``settings.PLAYER_HISTORY_MAX_AGE_DAYS``) and
+    ``"livepz_changed"`` when the roster shows a LivePZ different from the one
+    recorded at the last fetch (unknown values on either side never count as a change).
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return "new"
+    max_age = settings.PLAYER_HISTORY_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    now = time.time() if now is None else now
+    if now - mtime > max_age * 86400:
+        return "stale"
+    if (
+        previous_live_pz is not None
+        and current_live_pz is not None
+        and previous_live_pz != current_live_pz
+    ):
+        return "livepz_changed"
+    return None
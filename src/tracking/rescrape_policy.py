@@ -2,26 +2,90 @@
 
 from __future__ import annotations
 from datetime import datetime, timedelta
+from typing import Iterable, Optional
 from domain.models import TrackingState
 
 
 WINDOW_HOURS = 2
+# Divisions not refreshed for this long are rescraped even without a match in the window
+MAX_AGE_HOURS = 7 * 24
 
 
-def should_rescrape(division_name: str, state: TrackingState) -> bool:
+# Scraped match dates are dd.mm.yy; four-digit years are accepted as well
+_MATCH_TIME_FORMATS = ("%d.%m.%y %H:%M", "%d.%m.%Y %H:%M")
+
+
+def _match_datetime(m) -> Optional[datetime]:
+    if m.date and m.time:
+        text = f"{m.date.strip()} {m.time.strip()}"
+        for fmt in _MATCH_TIME_FORMATS:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"unparseable match time: {text}")
+    return None
+
+
+def rescrape_reason(
+    division_name: str,
+    state: TrackingState,
+    *,
+    team_ids: Iterable[str] | None = None,
+    last_fetch: datetime | None = None,
+    now: datetime | None = None,
+) -> Optional[str]:
+    """Return why ``division_name`` should be rescraped (None when it can be skipped).
+
+    Without ``now`` this is the original heuristic: any tracked match starting within
+    ``WINDOW_HOURS`` after the last scrape. With ``now`` (incremental planning) a
+    division is due when one of its matches kicked off between ``last_fetch`` (minus
+    the window, so games still running at that fetch count) and ``now``, i.e. results
+    may have been entered since, or when the division is older than ``MAX_AGE_HOURS``.
+    ``team_ids`` restricts the matches considered to the division's teams.
+    """
     if not state.upcoming_matches:
-        return True
-    if not state.last_scrape:
-        return True
-    last = state.last_scrape
+        return "no upcoming matches tracked"
+    last = last_fetch or state.last_scrape
+    if not last:
+        return "never scraped"
+    if now is not None and now - last > timedelta(hours=MAX_AGE_HOURS):
+        return f"last fetched {last:%d.%m.%Y %H:%M}, older than {MAX_AGE_HOURS}h"
+    ids = set(team_ids) if team_ids is not None else None
     for m in state.upcoming_matches:
-        if m.team_id and division_name in (m.team_id, getattr(m, "division_name", division_name)):
-            # Placeholder logic; real division association needed later
-            try:
-                if m.date and m.time:
-                    dt = datetime.strptime(f"{m.date} {m.time}", "%d.%m.%Y %H:%M")
-                    if last <= dt <= last + timedelta(hours=WINDOW_HOURS):
-                        return True
-            except Exception:
-                return True
-    return False
+        if ids is not None:
+            if m.team_id not in ids:
+                continue
+        elif not (
+            m.team_id and division_name in (m.team_id, getattr(m, "division_name", division_name))
+        ):
+            continue
+        try:
+            dt = _match_datetime(m)
+        except Exception:
+            return f"unparseable match time {m.date} {m.time}"
+        if dt is None:
+            continue
+        if now is None:
+            if last <= dt <= last + timedelta(hours=WINDOW_HOURS):
+                return f"match {m.home_team} - {m.guest_team} at {dt:%d.%m.%Y %H:%M}"
+        elif last - timedelta(hours=WINDOW_HOURS) <= dt <= now:
+            return (
+                f"match {m.home_team} - {m.guest_team} at {dt:%d.%m.%Y %H:%M}"
+                " played since last fetch"
+            )
+    return None
+
+
+def should_rescrape(
+    division_name: str,
+    state: TrackingState,
+    *,
+    team_ids: Iterable[str] | None = None,
+    last_fetch: datetime | None = None,
+    now: datetime | None = None,
+) -> bool:
+    return (
+        rescrape_reason(division_name, state, team_ids=team_ids, last_fetch=last_fetch, now=now)
+        is not None
+    )
@@ -37,12 +37,32 @@ def load_state(base: str | None = None) -> TrackingState:
                                 id=tobj.get("id"),
                                 name=tobj.get("name"),
                                 division_name=tobj.get("division_name") or dname,
+                                division_id=tobj.get("division_id"),
                             )
                         )
                     divisions[dname] = Division(name=dname, teams=teams_list)
                 except Exception:
                     continue
-        return TrackingState(last_scrape=last, divisions=divisions, upcoming_matches=[])
+        upcoming: list[Match] = []
+        for mobj in raw.get("upcoming_matches", []) or []:
+            try:
+                upcoming.append(
+                    Match(
+                        team_id=mobj.get("team_id"),
+                        match_number=mobj.get("match_number"),
+                        date=mobj.get("date"),
+                        time=mobj.get("time"),
+                        weekday=mobj.get("weekday"),
+                        home_team=mobj.get("home_team") or "",
+                        guest_team=mobj.get("guest_team") or "",
+                        home_score=mobj.get("home_score"),
+                        guest_score=mobj.get("guest_score"),
+                        status=mobj.get("status") or "upcoming",
+                    )
+                )
+            except Exception:
+                continue
+        return TrackingState(last_scrape=last, divisions=divisions, upcoming_matches=upcoming)
     except Exception:
         return TrackingState.empty()
 
@@ -75,7 +95,12 @@ def save_state(state: TrackingState, base: str | None = None) -> None:
             serialized_divisions[dname] = {
                 "name": division.name,
                 "teams": [
-                    {"id": t.id, "name": t.name, "division_name": t.division_name}
+                    {
+                        "id": t.id,
+                        "name": t.name,
+                        "division_name": t.division_name,
+                        "division_id": getattr(t, "division_id", None),
+                    }
                     for t in getattr(division, "teams", [])  # type: ignore[attr-defined]
                 ],
             }
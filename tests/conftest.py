@@ -4,6 +4,7 @@
 
 import sys
 import os
+import threading
 import types
 import contextlib
 import pytest
@@ -58,6 +59,45 @@ def _rp_test_mode_env(monkeypatch):
     yield
 
 
+# Keep the HTTP page cache (core.cache) out of the repository's data/ directory
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path, monkeypatch):
+    from core import cache
+
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "_cache"))
+
+
+# HTTP tests: a shared rate governor that does not pace local test servers
+# (use via pytestmark = pytest.mark.usefixtures(...))
+@pytest.fixture
+def isolated_http_state(monkeypatch):
+    from core import rate_limit
+
+    monkeypatch.setattr(
+        rate_limit, "_default_governor", rate_limit.RateGovernor(rps=1000, burst=1000)
+    )
+
+
+# Local HTTP test servers: http_server(handler_cls) starts one on a free port and returns
+# its base URL; the servers a test started are shut down after it
+@pytest.fixture
+def http_server():
+    from http.server import ThreadingHTTPServer
+
+    servers = []
+
+    def _start(handler_cls) -> str:
+        srv = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return f"http://127.0.0.1:{srv.server_address[1]}"
+
+    yield _start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
+
+
 # Global Qt exec() failsafe: ensure any Q(Core)Application.exec() call during tests
 # cannot hang indefinitely. We patch only under pytest environment.
 try:  # pragma: no cover - infrastructure
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+from collections import Counter
+
+from config import settings
+from core import http_client
+from services import batch_scrape, pipeline
+
+from tests.test_crawl_frontier import CLUB_ID, OTHER_CLUB_ID, _fake_fetch
+
+
+class _CountingSite:
+    def __init__(self):
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str) -> str:
+        with self._lock:
+            self.requests[url] += 1
+        return _fake_fetch(url)
+
+
+def test_batch_fetches_shared_pages_once_and_writes_summary(tmp_path, monkeypatch):
+    separate = _CountingSite()
+    monkeypatch.setattr(http_client, "fetch", separate.fetch)
+    for club in (CLUB_ID, OTHER_CLUB_ID):
+        pipeline.run_full(club, season=2025, data_dir=str(tmp_path / "separate" / str(club)))
+
+    site = _CountingSite()
+    monkeypatch.setattr(http_client, "fetch", site.fetch)
+    events = []
+    base = str(tmp_path / "batch")
+    summary = batch_scrape.run_batch(
+        [batch_scrape.BatchTarget(CLUB_ID, 2025), batch_scrape.BatchTarget(OTHER_CLUB_ID, 2025)],
+        base,
+        max_concurrent=2,
+        progress=lambda e, p: events.append((e, p)),
+    )
+
+    assert summary["completed"] == 2 and summary["failed"] == 0
+    assert max(site.requests.values()) == 1  # the shared division is fetched once
+    assert sum(site.requests.values()) < sum(separate.requests.values())
+    assert summary["fetch_dedup"]["duplicates_avoided"] > 0
+    for target in summary["targets"]:
+        assert target["data_dir"] == os.path.join(base, "2025", str(target["club_id"]))
+        assert target["players_total"] == 0 and target["files_written"] > 0
+        assert os.path.exists(os.path.join(target["data_dir"], "Stadtliga"))
+    labels = {p["target"] for e, p in events if e == "phase_start"}
+    assert labels == {f"{CLUB_ID}@2025", f"{OTHER_CLUB_ID}@2025"}
+    with open(os.path.join(base, batch_scrape.SUMMARY_FILENAME), encoding="utf-8") as fh:
+        assert json.load(fh)["completed"] == 2
+
+
+def test_failing_target_does_not_abort_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    blocker = tmp_path / "blocked"
+    blocker.write_text("not a directory", encoding="utf-8")
+    summary = batch_scrape.run_batch(
+        [
+            batch_scrape.BatchTarget(CLUB_ID, 2025, data_dir=str(blocker)),
+            batch_scrape.parse_target(f"{OTHER_CLUB_ID}:2024"),
+        ],
+        str(tmp_path),
+        max_concurrent=1,
+    )
+    assert [t["status"] for t in summary["targets"]] == ["failed", "completed"]
+    assert summary["targets"][1]["season"] == 2024
+
+
+def test_batch_memo_is_bounded_by_running_targets(tmp_path, monkeypatch):
+    site = _CountingSite()
+    monkeypatch.setattr(http_client, "fetch", site.fetch)
+    monkeypatch.setattr(settings, "FETCH_MEMO_MAX_COMPLETED", 1)
+    summary = batch_scrape.run_batch(
+        [batch_scrape.BatchTarget(CLUB_ID, 2025), batch_scrape.BatchTarget(OTHER_CLUB_ID, 2024)],
+        str(tmp_path),
+        max_concurrent=2,
+    )
+    assert summary["completed"] == 2
+    dedup = summary["fetch_dedup"]
+    # only league pages in this site: all pinned, nothing left in the bounded window
+    assert dedup["memoised"] <= 2 and dedup["pinned"] == len(site.requests)
+
+
+def test_later_targets_reuse_league_pages_of_finished_ones(tmp_path, monkeypatch):
+    site = _CountingSite()
+    monkeypatch.setattr(http_client, "fetch", site.fetch)
+    monkeypatch.setattr(settings, "FETCH_MEMO_MAX_COMPLETED", 1)
+    summary = batch_scrape.run_batch(
+        [
+            batch_scrape.BatchTarget(CLUB_ID, 2025),
+            batch_scrape.BatchTarget(OTHER_CLUB_ID, 2025),
+            batch_scrape.BatchTarget(CLUB_ID, 2024),  # starts once an earlier target is done
+        ],
+        str(tmp_path),
+        max_concurrent=2,
+    )
+    assert summary["completed"] == 3
+    assert max(site.requests.values()) == 1
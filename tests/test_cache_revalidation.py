@@ -0,0 +1,126 @@
+import asyncio
+import sqlite3
+from http.server import BaseHTTPRequestHandler
+
+import httpx
+import pytest
+
+from core import async_http, cache, http_client
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Sat, 04 Oct 2025 10:00:00 GMT"
+BODY = "<html>roster</html>"
+
+
+class _ValidatingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses: list = []
+
+    def do_GET(self):  # noqa: N802 - stdlib naming
+        if self.headers.get("If-None-Match") == ETAG:
+            type(self).statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        body = BODY.encode("utf-8")
+        type(self).statuses.append(200)
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    _ValidatingHandler.statuses = []
+    return http_server(_ValidatingHandler)
+
+
+def test_sidecar_metadata_roundtrip():
+    cache.set("https://x/a", "<p>a</p>", etag='"e"', last_modified=LAST_MODIFIED)
+    entry = cache.get_entry("https://x/a")
+    assert entry.body == "<p>a</p>" and entry.status == 200 and entry.fetched_at
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"e"',
+        "If-Modified-Since": LAST_MODIFIED,
+    }
+    assert cache.get("https://x/a") == "<p>a</p>"
+
+
+def test_sync_fetch_serves_cached_body_on_304(server):
+    url = f"{server}/roster"
+    with http_client.HttpSession(conditional_cache=True) as session:
+        assert session.fetch(url) == BODY
+        assert session.fetch(url) == BODY
+        assert session.stats()["not_modified"] == 1
+    assert _ValidatingHandler.statuses == [200, 304]
+    assert cache.get_entry(url).etag == ETAG
+
+
+def test_async_fetch_revalidates_stale_entry():
+    url = "https://example.invalid/roster"
+    cache.set(url, BODY, etag=ETAG)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        return httpx.Response(304)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await async_http.fetch(url, client=client, cache_ttl=0)
+
+    assert asyncio.run(_run()) == BODY
+    assert seen == [ETAG]
+
+
+def test_sync_fetch_does_not_store_pages_without_validators(monkeypatch):
+    class _Response:
+        status = 200
+        body = BODY.encode("utf-8")
+        headers = {"content-type": "text/html; charset=utf-8"}
+        wire_bytes = len(body)
+
+    url = "http://example.invalid/plain"
+    with http_client.HttpSession(conditional_cache=True) as session:
+        monkeypatch.setattr(session, "request", lambda *a, **k: _Response())
+        assert session.fetch(url) == BODY
+    assert cache.get_entry(url) is None
+
+
+def test_async_fetch_does_not_store_unrevalidatable_pages():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=BODY))
+
+    async def _run(url, ttl):
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await async_http.fetch(url, client=client, cache_ttl=ttl)
+
+    # ConcurrentFetcher's cache_ttl=0: never served without validators, so not stored
+    assert asyncio.run(_run("https://example.invalid/plain", 0)) == BODY
+    assert cache.get_entry("https://example.invalid/plain") is None
+    assert asyncio.run(_run("https://example.invalid/fresh", 3600)) == BODY
+    assert cache.get_entry("https://example.invalid/fresh").body == BODY
+
+
+@pytest.mark.parametrize("error", [OSError("disk full"), sqlite3.OperationalError("locked")])
+def test_cache_write_failure_still_returns_page(server, monkeypatch, error):
+    def fail(*_a, **_k):
+        raise error
+
+    monkeypatch.setattr(cache, "set", fail)
+    with http_client.HttpSession(conditional_cache=True) as session:
+        assert session.fetch(f"{server}/roster", retries=2) == BODY
+    assert _ValidatingHandler.statuses == [200]
+
+    async def _run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=BODY))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await async_http.fetch("https://example.invalid/a", client=client)
+
+    assert asyncio.run(_run()) == BODY
@@ -0,0 +1,74 @@
+import os
+import zlib
+
+import pytest
+
+from core import cache
+
+
+def _blob_files():
+    blob_dir = os.path.join(cache.CACHE_DIR, "blobs")
+    return [f for f in os.listdir(blob_dir) if f.endswith(".z")]
+
+
+def test_identical_bodies_stored_once_and_compressed():
+    body = "<html>" + ("<tr><td>Spieler</td></tr>" * 200) + "</html>"
+    cache.set("https://x/?a=1", body)
+    cache.set("https://x/?a=2", body)
+    files = _blob_files()
+    assert len(files) == 1
+    with open(os.path.join(cache.CACHE_DIR, "blobs", files[0]), "rb") as fh:
+        packed = fh.read()
+    assert len(packed) < len(body) and zlib.decompress(packed).decode("utf-8") == body
+    assert cache.get("https://x/?a=1") == body
+    assert cache.get("https://x/?a=2") == body
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["blobs"] == 1
+    assert stats["bytes_saved_dedupe"] == len(body.encode("utf-8"))
+    assert stats["bytes_saved"] > stats["bytes_saved_dedupe"]
+    assert stats["hits"] == 2
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path):
+    st = cache.CacheStore(str(tmp_path / "lru"), max_bytes=250)
+    payloads = {f"https://x/{i}": os.urandom(60).hex() for i in range(4)}  # ~120B packed each
+    st.put("https://x/0", payloads["https://x/0"])
+    st.put("https://x/1", payloads["https://x/1"])
+    assert st.lookup("https://x/0") is not None  # touch 0 so 1 becomes least recently used
+    st.put("https://x/2", payloads["https://x/2"])
+    assert st.total_bytes() <= 250
+    assert st.lookup("https://x/1") is None
+    assert st.lookup("https://x/0").body == payloads["https://x/0"]
+    assert st.stats()["evictions"] == 1
+
+
+def test_overwrite_drops_orphan_blob_and_misses_counted():
+    assert cache.get("https://x/missing") is None
+    cache.set("https://x/p", "old")
+    cache.set("https://x/p", "new")
+    assert len(_blob_files()) == 1
+    assert cache.get("https://x/p") == "new"
+    assert cache.get("https://x/p", ttl=-1) is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_legacy_entry_is_imported():
+    os.makedirs(cache.CACHE_DIR, exist_ok=True)
+    legacy = os.path.join(cache.CACHE_DIR, cache._key("https://x/legacy") + ".cache")
+    with open(legacy, "w", encoding="utf-8") as fh:
+        fh.write("<p>legacy</p>")
+    assert cache.get("https://x/legacy") == "<p>legacy</p>"
+    assert not os.path.exists(legacy)
+
+
+def test_failed_put_leaves_no_partial_entry(tmp_path, monkeypatch):
+    st = cache.CacheStore(str(tmp_path / "tx"))
+
+    def fail(keep_key):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(st, "_evict", fail)
+    with pytest.raises(OSError):
+        st.put("https://x/a", "<p>a</p>", etag='"e"')
+    assert st.lookup("https://x/a") is None
+    assert st.stats()["blobs"] == 0
@@ -0,0 +1,109 @@
+import os
+
+from core import http_client
+from scraping import club_scraper
+from services import pipeline
+from services.crawl_frontier import HIGH, LOW, CrawlFrontier
+
+CLUB_ID = 9999
+OTHER_CLUB_ID = 4242
+DIVISION_ID = 700
+PRIMARY_TEAM, OTHER_TEAMS = "5000", ["6000", "6001"]
+TEAM_NAMES = {"5000": "Fuechse I", "6000": "Gegner I", "6001": "Dritte I"}
+
+
+def _roster_link(team_id: str) -> str:
+    return f"?L1=Ergebnisse&L2=TTStaffeln&L2P={DIVISION_ID}&L3=Mannschaften&L3P={team_id}"
+
+
+def _club_overview(club_id: int, name: str, team_id: str) -> str:
+    return (
+        f"<html><title>Vereinsinformation {name}</title><table>"
+        f"<tr class='ContentText'><td>1</td><td>{name} I</td><td>Stadtliga</td>"
+        f"<td><a href='{_roster_link(team_id)}'>Roster</a></td></tr></table></html>"
+    )
+
+
+def _fake_fetch(url: str) -> str:
+    if "L2=Verein" in url and f"L2P={CLUB_ID}" in url:
+        return _club_overview(CLUB_ID, "Fuechse", PRIMARY_TEAM)
+    if "L2=Verein" in url and f"L2P={OTHER_CLUB_ID}" in url:
+        return _club_overview(OTHER_CLUB_ID, "Gegner", OTHER_TEAMS[0])
+    if "L3=Tabelle" in url:
+        items = "".join(
+            f'<li><a href="{_roster_link(t)}">T</a><span>{TEAM_NAMES[t]}</span></li>'
+            for t in OTHER_TEAMS + [PRIMARY_TEAM]
+        )
+        return (
+            "<html><head><title>TischtennisLive - Stadtliga - Tabelle</title></head>"
+            f"<body><a>Teams</a><ul>{items}</ul></body></html>"
+        )
+    if "L3=Mannschaften" in url:
+        club = OTHER_CLUB_ID if "L3P=600" in url else CLUB_ID
+        return (
+            f'<html><a href="?L1=Public&L2=Verein&L2P={club}&Page=Spielbetrieb">Verein</a></html>'
+        )
+    return "<html></html>"
+
+
+def _files(data_dir: str, prefix: str) -> list[str]:
+    return [f for _r, _d, fs in os.walk(data_dir) for f in fs if f.startswith(prefix)]
+
+
+def test_primary_club_slice_is_persisted_first(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    data_dir = str(tmp_path / "data")
+    events = []
+    persisted = []
+    persist_club = club_scraper.parse_and_persist_club
+
+    def _persist(html, cid, out_dir):
+        persisted.append(cid)
+        return persist_club(html, cid, out_dir)
+
+    monkeypatch.setattr(club_scraper, "parse_and_persist_club", _persist)
+
+    def progress(event, payload):
+        if event == "partial_ready":
+            # snapshot of what is on disk when the event fires
+            payload = dict(
+                payload,
+                rosters_on_disk=sorted(_files(data_dir, "team_roster_")),
+                club_teams_on_disk=_files(data_dir, "club_team_"),
+            )
+        events.append((event, payload))
+
+    result = pipeline.run_full(CLUB_ID, season=2025, data_dir=data_dir, progress=progress)
+
+    partial = [p for e, p in events if e == "partial_ready"]
+    assert len(partial) == 1
+    ready = partial[0]
+    assert ready["club_name"] == "Fuechse" and ready["divisions"] == ["Stadtliga"]
+    assert [f.rsplit("_", 1)[-1] for f in ready["rosters_on_disk"]] == [f"{PRIMARY_TEAM}.html"]
+    assert ready["club_team_pages"] == 1
+    assert [os.path.basename(f) for f in ready["files"]] == [
+        "ranking_table_Stadtliga.html",
+        *[os.path.basename(f) for f in ready["rosters_on_disk"]],
+    ]
+    assert ready["club_teams_on_disk"] == [f"club_team_Fuechse_Fuechse_I_{PRIMARY_TEAM}.html"]
+    order = [e if e != "phase_complete" else p["key"] for e, p in events]
+    assert order.index("partial_ready") < order.index("division_rosters")
+    # the rest of the league follows
+    assert len(_files(data_dir, "team_roster_")) == 3
+    assert f"club_team_Gegner_Gegner_I_{OTHER_TEAMS[0]}.html" in _files(data_dir, "club_team_")
+    assert result["errors"] == []
+    # the later club steps reuse the slice instead of writing it again
+    assert sorted(persisted) == sorted([str(CLUB_ID), str(OTHER_CLUB_ID)])
+
+
+def test_frontier_orders_primary_teams_first():
+    frontier = CrawlFrontier.from_landing(1, [_roster_link("2"), _roster_link("3")])
+    jobs = frontier.order_teams(["9", "3", "8", "2"], lambda job: job)
+    assert jobs == ["3", "2", "9", "8"] and frontier.high_pending == 2
+    assert frontier.complete("3") is False and frontier.complete("9") is False
+    assert frontier.complete("2") is True
+    assert frontier.club_priority("1") == HIGH and frontier.club_priority("7") == LOW
+    frontier.primary_club_name = "Fuechse Leipzig"
+    assert frontier.club_team_file_priority("club_team_Fuechse_Leipzig_A_11.html") == HIGH
+    assert frontier.club_team_file_priority("club_team_Other_A_2.html") == HIGH
+    assert frontier.club_team_file_priority("club_team_Other_A_12.html") == LOW
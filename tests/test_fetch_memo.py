@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from core import http_client
+from core.fetch_memo import FetchMemo
+from services import pipeline
+
+from tests.test_pipeline_club_team_coverage import PRIMARY_CLUB_ID, _fake_http_fetch
+
+
+def test_memo_returns_stored_value_and_counts_duplicates():
+    memo = FetchMemo()
+    calls = []
+    loader = lambda: calls.append(1) or "<html/>"  # noqa: E731
+    assert memo.fetch("u", loader) == "<html/>"
+    assert memo.fetch("u", loader) == "<html/>"
+    assert len(calls) == 1
+    assert memo.stats() == {
+        "unique_requests": 1,
+        "duplicates_avoided": 1,
+        "memoised": 1,
+        "pinned": 0,
+        "evicted": 0,
+    }
+
+
+def test_only_the_most_recent_results_are_kept():
+    memo = FetchMemo(max_completed=2)
+    calls = []
+    loader = lambda url: (lambda: calls.append(url) or f"<html>{url}</html>")  # noqa: E731
+    for url in ("a", "b", "a", "c"):  # "a" used again, so "b" is the least recent
+        memo.fetch(url, loader(url))
+    assert memo.stats()["memoised"] == 2 and memo.stats()["evicted"] == 1
+    assert memo.fetch("a", loader("a")) == "<html>a</html>"
+    assert memo.fetch("b", loader("b")) == "<html>b</html>"  # evicted: fetched again
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_pinned_results_are_kept_outside_the_window():
+    memo = FetchMemo(max_completed=1, pin=lambda url: url.startswith("league"))
+    calls = []
+    loader = lambda url: (lambda: calls.append(url) or url)  # noqa: E731
+    for url in ("league/a", "h1", "h2", "league/a", "h1"):
+        memo.fetch(url, loader(url))
+    assert calls == ["league/a", "h1", "h2", "h1"]
+    assert memo.stats()["pinned"] == 1 and memo.stats()["memoised"] == 1
+
+
+def test_concurrent_callers_share_one_in_flight_fetch():
+    memo = FetchMemo()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "body"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(memo.fetch("u", slow_loader)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["body"] * 5
+    assert len(calls) == 1
+    assert memo.stats()["duplicates_avoided"] == 4
+
+
+def test_failed_fetch_is_forgotten():
+    memo = FetchMemo()
+
+    def boom():
+        raise OSError("down")
+
+    with pytest.raises(OSError):
+        memo.fetch("u", boom)
+    assert memo.fetch("u", lambda: "ok") == "ok"
+    assert memo.stats()["unique_requests"] == 2
+
+
+def test_run_full_requests_each_url_once(tmp_path, monkeypatch):
+    requested = Counter()
+
+    def counting_fetch(url):
+        requested[url] += 1
+        return _fake_http_fetch(url)
+
+    monkeypatch.setattr(http_client, "fetch", counting_fetch)
+    result = pipeline.run_full(PRIMARY_CLUB_ID, season=2025, data_dir=str(tmp_path / "data"))
+    assert requested and max(requested.values()) == 1
+    dedup = result["fetch_dedup"]
+    assert dedup["unique_requests"] == len(requested)
+    assert dedup["duplicates_avoided"] > 0
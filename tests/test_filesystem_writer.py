@@ -0,0 +1,150 @@
+import os
+import threading
+
+import pytest
+
+from core import filesystem, http_client
+from services import pipeline, scrape_journal
+
+from tests.test_crawl_frontier import CLUB_ID, _fake_fetch
+
+
+class _Boom(RuntimeError):
+    pass
+
+
+def test_write_text_is_atomic_when_the_write_fails(tmp_path, monkeypatch):
+    target = tmp_path / "page.html"
+    filesystem.write_text(str(target), "<html>old</html>")
+    real_open = open
+
+    class _FailingFile:
+        def __init__(self, fh):
+            self._fh = fh
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._fh.close()
+
+        def write(self, content):
+            self._fh.write(content[:5])  # half of the page reached the disk
+            raise _Boom("disk full")
+
+    def failing_open(path, mode="r", *args, **kwargs):
+        fh = real_open(path, mode, *args, **kwargs)
+        return _FailingFile(fh) if "w" in mode else fh
+
+    monkeypatch.setattr("builtins.open", failing_open)
+    with pytest.raises(_Boom):
+        filesystem.write_text(str(target), "<html>new</html>")
+    monkeypatch.undo()
+    assert target.read_text(encoding="utf-8") == "<html>old</html>"
+    assert os.listdir(tmp_path) == ["page.html"]  # no temp file left behind
+
+
+def test_batched_writer_writes_in_background_and_fsyncs_per_directory(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(filesystem, "fsync_dir", lambda d: synced.append(d) or True)
+    writer_threads = set()
+    real_write = filesystem._write_atomic
+
+    def recording_write(*args):
+        writer_threads.add(threading.current_thread().name)
+        return real_write(*args)
+
+    monkeypatch.setattr(filesystem, "_write_atomic", recording_write)
+    with filesystem.BatchedWriter(background=True, queue_size=4) as writer:
+        for i in range(20):
+            writer.write_text(str(tmp_path / f"d{i % 2}" / f"f{i}.html"), "x" * 10)
+        writer.flush()
+        stats = writer.stats()
+    assert writer_threads == {"batched-writer"}
+    assert stats["files"] == 20 and stats["bytes"] == 200
+    assert stats["fsyncs"] == 2 and sorted(os.path.basename(d) for d in synced) == ["d0", "d1"]
+    assert stats["peak_queue_depth"] <= 4
+    assert stats["mean_write_ms"] > 0
+    assert len(os.listdir(tmp_path / "d0")) == 10
+
+
+def test_batched_writer_reraises_write_errors_on_flush(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("x", encoding="utf-8")
+    writer = filesystem.BatchedWriter(background=True)
+    writer.write_text(str(blocker / "child.html"), "x")  # parent is a file
+    writer.write_text(str(tmp_path / "ok.html"), "x")
+    with pytest.raises(OSError):
+        writer.flush()
+    writer.close()
+    assert writer.stats()["errors"] == 1 and (tmp_path / "ok.html").exists()
+
+
+def test_on_written_runs_only_once_the_file_is_in_place(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("x", encoding="utf-8")
+    ok = tmp_path / "ok.html"
+    landed = []
+    writer = filesystem.BatchedWriter(background=True)
+    writer.write_text(str(ok), "x", on_written=lambda: landed.append(ok.exists()))
+    writer.write_text(str(blocker / "child.html"), "x", on_written=lambda: landed.append("bad"))
+    with pytest.raises(OSError):
+        writer.flush()
+    writer.close()
+    assert landed == [True]
+
+
+def test_pages_whose_write_failed_are_not_journaled(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    real_write = filesystem._write_atomic
+
+    def failing_roster_write(path, *args, **kwargs):
+        if os.path.basename(path).startswith("team_roster_"):
+            raise _Boom("disk full")
+        return real_write(path, *args, **kwargs)
+
+    monkeypatch.setattr(filesystem, "_write_atomic", failing_roster_write)
+    data_dir = str(tmp_path / "data")
+    events = []
+    result = pipeline.run_full(
+        CLUB_ID, season=2025, data_dir=data_dir, progress=lambda e, p: events.append((e, p))
+    )
+    # each failed write is a recoverable error; the run itself completes
+    failed = [e for e in result["errors"] if e.startswith("write failed:")]
+    assert len(failed) == 3 and all("disk full" in e for e in failed)
+    assert [p["phase"] for e, p in events if e == "recoverable_error"] == ["division_rosters"] * 3
+    assert not [e for e in result["manifest"] if e["kind"] == "team_roster"]
+    assert not [p for e, p in events if e == "division_complete" and len(p["files"]) > 1]
+    state = scrape_journal.load(data_dir)
+    assert state.status == "completed" and state.fetched
+    assert not [p for p in state.fetched.values() if "team_roster_" in p]
+    assert all(os.path.exists(os.path.join(data_dir, p)) for p in state.fetched.values())
+
+
+def test_on_error_receives_failed_writes_and_flush_carries_on(tmp_path, monkeypatch):
+    real_write = filesystem._write_atomic
+
+    def failing_write(path, *args, **kwargs):
+        if path.endswith("bad.html"):
+            raise _Boom("disk full")
+        return real_write(path, *args, **kwargs)
+
+    monkeypatch.setattr(filesystem, "_write_atomic", failing_write)
+    failures = []
+    with filesystem.BatchedWriter(on_error=lambda path, e: failures.append((path, e))) as w:
+        w.write_text(str(tmp_path / "bad.html"), "x")
+        w.write_text(str(tmp_path / "good.html"), "y")
+        w.flush()
+    assert [(os.path.basename(p), str(e)) for p, e in failures] == [("bad.html", "disk full")]
+    assert (tmp_path / "good.html").read_text() == "y"
+    assert w.stats()["errors"] == 1
+
+
+def test_run_full_reports_write_stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    result = pipeline.run_full(CLUB_ID, season=2025, data_dir=str(tmp_path / "data"))
+    stats = result["write_stats"]
+    rosters = [e for e in result["manifest"] if e["kind"] == "team_roster"]
+    assert stats["files"] >= len(rosters) == 3
+    assert stats["bytes"] >= sum(e["size"] for e in rosters)
+    assert stats["errors"] == 0 and stats["flushes"] > 0
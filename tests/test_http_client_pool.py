@@ -0,0 +1,106 @@
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from core import http_client
+
+pytestmark = pytest.mark.usefixtures("isolated_http_state")
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+    hits = 0
+
+    def do_GET(self):  # noqa: N802 - stdlib naming
+        type(self).connections.add(self.client_address)
+        type(self).hits += 1
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/page?n=redirected")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/fail"):
+            body = b"nope"
+            self.send_response(500)
+        else:
+            body = f"<html>{self.path}</html>".encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # silence test output
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    _KeepAliveHandler.connections = set()
+    _KeepAliveHandler.hits = 0
+    return http_server(_KeepAliveHandler)
+
+
+def test_session_reuses_connection(server):
+    with http_client.HttpSession(pool_size=2) as session:
+        for i in range(5):
+            assert session.fetch(f"{server}/page?n={i}") == f"<html>/page?n={i}</html>"
+        stats = session.stats()
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+    assert len(_KeepAliveHandler.connections) == 1
+
+
+def test_idle_timeout_evicts_connection(server):
+    with http_client.HttpSession(idle_timeout=0.0) as session:
+        session.fetch(f"{server}/a")
+        session.fetch(f"{server}/b")
+        stats = session.stats()
+    assert stats["connections_opened"] == 2
+    assert stats["idle_evicted"] == 1
+
+
+def test_redirect_followed_and_status_errors_retried(server):
+    with http_client.HttpSession() as session:
+        assert session.fetch(f"{server}/redirect") == "<html>/page?n=redirected</html>"
+        with pytest.raises(http_client.HttpError):
+            session.fetch(f"{server}/fail", retries=1, backoff_factor=0.0, verbose=False)
+    assert _KeepAliveHandler.hits == 4
+
+
+def test_module_fetch_delegates_to_default_session(server):
+    session = http_client.configure_default_session(pool_size=1)
+    try:
+        http_client.fetch(f"{server}/x")
+        http_client.fetch(f"{server}/y")
+        assert http_client.get_default_session() is session
+        assert session.stats()["connections_reused"] == 1
+    finally:
+        http_client.configure_default_session()
+
+
+def test_meter_counts_only_the_calling_threads_requests(server):
+    with http_client.HttpSession(pool_size=4) as session:
+        other_started = threading.Event()
+
+        def other_caller():
+            other_started.set()
+            for i in range(3):
+                session.fetch(f"{server}/other?n={i}")
+
+        with session.metered() as meter:
+            t = threading.Thread(target=other_caller)
+            t.start()
+            other_started.wait()
+            session.fetch(f"{server}/mine")
+            t.join()
+        session.fetch(f"{server}/after")
+        stats = session.stats()
+    body = len(b"<html>/mine</html>")
+    assert meter["requests"] == 1
+    assert meter["wire_bytes"] == meter["decoded_bytes"] == body
+    assert stats["requests"] == 5
@@ -0,0 +1,71 @@
+import gzip
+import zlib
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from core import http_client
+from db.ingest import hash_html
+
+_PAGE = "<html><head><title>Spielplan</title></head><body>" + "Müller " * 400 + "</body></html>"
+
+
+pytestmark = pytest.mark.usefixtures("isolated_http_state")
+
+
+class _CompressingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    accept_encoding = ""
+
+    def do_GET(self):  # noqa: N802 - stdlib naming
+        type(self).accept_encoding = self.headers.get("Accept-Encoding", "")
+        if self.path.startswith("/latin1"):
+            raw = f'<html><head><meta charset="iso-8859-1"></head>{_PAGE}</html>'.encode("latin-1")
+            body, encoding = raw, None
+        elif self.path.startswith("/raw-deflate"):
+            raw = _PAGE.encode("utf-8")
+            comp = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+            body, encoding = comp.compress(raw) + comp.flush(), "deflate"
+        elif self.path.startswith("/deflate"):
+            body, encoding = zlib.compress(_PAGE.encode("utf-8")), "deflate"
+        else:
+            body, encoding = gzip.compress(_PAGE.encode("utf-8")), "gzip"
+        self.send_response(200)
+        if not self.path.startswith("/latin1"):
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # silence test output
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(_CompressingHandler)
+
+
+@pytest.mark.parametrize("path", ["/gzip", "/deflate", "/raw-deflate"])
+def test_compressed_body_is_decoded(server, path):
+    with http_client.HttpSession(conditional_cache=False) as session:
+        page = session.fetch_page(f"{server}{path}")
+        stats = session.stats()
+    assert "gzip" in _CompressingHandler.accept_encoding
+    assert page.text() == _PAGE
+    assert page.charset == "utf-8"
+    assert page.wire_bytes < len(page.body)
+    assert stats["wire_bytes"] < stats["decoded_bytes"]
+
+
+def test_charset_sniffed_from_meta_tag(server):
+    with http_client.HttpSession(conditional_cache=False) as session:
+        page = session.fetch_page(f"{server}/latin1")
+    assert page.charset == "iso8859-1"
+    assert "Müller" in page.text()
+
+
+def test_hash_html_accepts_bytes():
+    assert hash_html(_PAGE) == hash_html(_PAGE.encode("utf-8"))
@@ -0,0 +1,178 @@
+import json
+import os
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from core import http_client
+from domain.models import Division, Match, Team, TrackingState
+from gui.services.ingestion_coordinator import IngestionCoordinator
+from services import pipeline, scrape_journal, scrape_manifest, scrape_planner
+from tracking import rescrape_policy, tracking_store
+
+from tests.test_ingestion_coordinator import SCHEMA_SQL
+
+CLUB_ID = 2294
+NOW = datetime(2025, 10, 4, 18, 0)
+
+
+def _roster_link(div_id: str, team_id: str) -> str:
+    return f"?L1=Ergebnisse&L2=TTStaffeln&L2P={div_id}&L3=Mannschaften&L3P={team_id}"
+
+
+def _ranking_html(title: str, div_id: str, team_ids) -> str:
+    items = "".join(
+        f'<li><a href="{_roster_link(div_id, t)}">T</a><span>Team {t}</span></li>' for t in team_ids
+    )
+    return (
+        f"<html><head><title>TischtennisLive - {title} - Tabelle</title></head>"
+        f"<body><a>Teams</a><ul>{items}</ul></body></html>"
+    )
+
+
+DIVISIONS = {
+    "Liga A": ("11", ["101", "102"]),
+    "Liga B": ("22", ["201", "202"]),
+}
+
+
+def _fake_fetch(url: str) -> str:
+    if "L2=Verein" in url:
+        links = "".join(
+            f'<a href="{_roster_link(div_id, tids[0])}">x</a>'
+            for div_id, tids in DIVISIONS.values()
+        )
+        return f"<html><body>{links}</body></html>"
+    for name, (div_id, tids) in DIVISIONS.items():
+        if f"L2P={div_id}&L3=Tabelle" in url:
+            return _ranking_html(name, div_id, tids)
+    return "<html><body>roster</body></html>"
+
+
+def _match(team_id: str, when: datetime) -> Match:
+    return Match(
+        team_id=team_id,
+        match_number="1",
+        date=when.strftime("%d.%m.%y"),  # the site's format
+        time=when.strftime("%H:%M"),
+        weekday=None,
+        home_team=f"Team {team_id}",
+        guest_team="Gast",
+    )
+
+
+def _seed(data_dir: str) -> None:
+    """Data dir as left by a full scrape one day before NOW."""
+    divisions = {}
+    for name, (div_id, tids) in DIVISIONS.items():
+        slug = name.replace(" ", "_")
+        div_dir = os.path.join(data_dir, slug)
+        os.makedirs(div_dir)
+        with open(os.path.join(div_dir, f"ranking_table_{slug}.html"), "w") as fh:
+            fh.write(_ranking_html(name, div_id, tids))
+        for t in tids:
+            with open(os.path.join(div_dir, f"team_roster_{slug}_Team_{t}_{t}.html"), "w") as fh:
+                fh.write("<html>old</html>")
+        teams = [Team(id=t, name=f"Team {t}", division_name=name) for t in tids]
+        divisions[name] = Division(name=name, teams=teams)
+    tracking_store.save_state(
+        TrackingState(
+            last_scrape=NOW - timedelta(days=1),
+            divisions=divisions,
+            upcoming_matches=[
+                _match("101", NOW - timedelta(hours=3)),  # played since last fetch
+                _match("201", NOW + timedelta(days=3)),  # not yet played
+            ],
+        ),
+        data_dir,
+    )
+    stamp = time.mktime((NOW - timedelta(days=1)).timetuple())
+    for root, _dirs, files in os.walk(data_dir):
+        for f in files:
+            os.utime(os.path.join(root, f), (stamp, stamp))
+
+
+def test_rescrape_reason_window_and_team_filter():
+    state = TrackingState(
+        last_scrape=NOW - timedelta(days=1),
+        divisions={},
+        upcoming_matches=[_match("101", NOW - timedelta(hours=3))],
+    )
+    assert rescrape_policy.rescrape_reason("Liga A", state, team_ids=["101"], now=NOW)
+    assert rescrape_policy.rescrape_reason("Liga B", state, team_ids=["201"], now=NOW) is None
+    stale = NOW - timedelta(hours=rescrape_policy.MAX_AGE_HOURS + 1)
+    assert "older than" in rescrape_policy.rescrape_reason(
+        "Liga B", state, team_ids=["201"], last_fetch=stale, now=NOW
+    )
+
+
+def test_dry_run_lists_due_division_only(tmp_path, monkeypatch):
+    data_dir = str(tmp_path)
+    _seed(data_dir)
+    requested = Counter()
+    monkeypatch.setattr(http_client, "fetch", lambda u: requested.update([u]) or "")
+    result = pipeline.run_incremental(CLUB_ID, 2025, data_dir, dry_run=True, now=NOW)
+    assert not requested
+    plan = result["plan"]
+    assert plan["skipped_divisions"] == ["Liga B"]
+    kinds = [(f["kind"], f["division"], f["team_id"]) for f in plan["fetches"]]
+    assert ("ranking_table", "Liga A", None) in kinds
+    assert ("roster", "Liga A", "101") in kinds and ("roster", "Liga A", "102") in kinds
+    assert not any(f["division"] == "Liga B" for f in plan["fetches"])
+    assert all("Team 101 - Gast" in f["reason"] for f in plan["fetches"] if f["division"])
+    assert any(line.startswith("skip") for line in result["plan_lines"])
+
+
+def test_incremental_run_fetches_only_planned_pages(tmp_path, monkeypatch):
+    data_dir = str(tmp_path)
+    _seed(data_dir)
+    requested = Counter()
+
+    def fetch(url):
+        requested[url] += 1
+        return _fake_fetch(url)
+
+    monkeypatch.setattr(http_client, "fetch", fetch)
+    result = pipeline.run_incremental(CLUB_ID, 2025, data_dir, now=NOW)
+    assert result["divisions_skipped"] == ["Liga B"]
+    assert result["rosters_refreshed"] == 2
+    assert not any("L2P=22&" in u for u in requested)  # nothing of the skipped division
+    assert result["requests"] == len(requested) == 4  # landing, ranking A, two rosters
+    with open(os.path.join(data_dir, "Liga_A", "team_roster_Liga_A_Team_101_101.html")) as fh:
+        assert "roster" in fh.read()
+    state = tracking_store.load_state(data_dir)
+    assert state.last_scrape > NOW - timedelta(days=1)
+    # the refreshed team's stale entry is replaced; the skipped team's kept
+    assert [m.team_id for m in state.upcoming_matches] == ["201"]
+
+
+def test_new_division_is_recorded_for_manifest_ingest(tmp_path, monkeypatch):
+    data_dir = str(tmp_path)
+    _seed(data_dir)
+    monkeypatch.setitem(DIVISIONS, "Liga C", ("33", ["301", "302"]))
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    result = pipeline.run_incremental(CLUB_ID, 2025, data_dir, now=NOW)
+    assert result["new_divisions"] == ["Liga C"] and result["errors"] == []
+
+    manifest = scrape_manifest.load(data_dir)
+    assert manifest.relpaths("ranking_table") == [
+        "Liga_A/ranking_table_Liga_A.html",
+        "Liga_C/ranking_table_Liga_C.html",
+    ]
+    assert len(manifest.relpaths("team_roster")) == 4  # Liga A refreshed, Liga C new
+    with open(os.path.join(data_dir, scrape_journal.FILENAME), encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh]
+    assert len([r for r in records if r["type"] == "fetched"]) == 6
+    assert records[-1] == {"type": "end", "status": "completed"}
+
+    conn = sqlite3.connect(":memory:")
+    for stmt in SCHEMA_SQL:
+        conn.execute(stmt)
+    summary = IngestionCoordinator(data_dir, conn).run(manifest=manifest)
+    assert summary.divisions_ingested == 2 and summary.teams_ingested == 4
+
+
+def test_without_previous_scrape_plan_is_full(tmp_path):
+    plan = scrape_planner.build_plan(str(tmp_path), "https://example.invalid/")
+    assert plan.is_full
@@ -0,0 +1,118 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from db import parse_cache
+from db.ingest import ingest_path
+from db.migration_manager import apply_pending_migrations
+from db.schema import apply_schema
+from gui.services.ingestion_coordinator import IngestionCoordinator
+from services import ingest_benchmark
+
+DIVISION = Path("data") / "1_Stadtliga_Gruppe_1"
+
+
+def _corpus(tmp_path):
+    root = tmp_path / "data"
+    shutil.copytree(DIVISION, root / DIVISION.name)
+    return root
+
+
+def _db():
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    apply_pending_migrations(conn)
+    return conn
+
+
+def _rows(conn):
+    return (
+        conn.execute("SELECT team_id, division_id, name FROM team ORDER BY 1").fetchall(),
+        conn.execute(
+            "SELECT player_id, team_id, full_name, live_pz FROM player ORDER BY 1"
+        ).fetchall(),
+    )
+
+
+@pytest.mark.timeout(120)
+def test_parallel_ingest_path_matches_serial(tmp_path):
+    root = _corpus(tmp_path)
+    serial, parallel = _db(), _db()
+    ingest_path(serial, root, workers=0)
+    report = ingest_path(parallel, root, workers=2)
+    assert _rows(parallel) == _rows(serial) and _rows(serial)[1]
+    # Worker results are primed into the cache: a first use is still a miss
+    pages = len(list(root.rglob("*.html")))
+    assert (report.parse_cache_hits, report.parse_cache_misses) == (0, pages)
+
+
+@pytest.mark.timeout(120)
+def test_pages_are_parsed_in_the_worker_processes(tmp_path, monkeypatch):
+    root = _corpus(tmp_path)
+    expected = _db()
+    ingest_path(expected, root, parse_cache=False)
+
+    def fail(*_a, **_k):
+        raise AssertionError("page parsed in the writer process")
+
+    monkeypatch.setattr(parse_cache, "extract_roster", fail)
+    monkeypatch.setattr(parse_cache, "parse_ranking_table", fail)
+    conn = _db()
+    ingest_path(conn, root, parse_cache=False, workers=2)
+    assert _rows(conn) == _rows(expected)
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "parse_cache" not in tables
+
+
+@pytest.mark.timeout(180)
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parallel_coordinator_matches_serial(tmp_path, streaming):
+    root = _corpus(tmp_path)
+    results = []
+    for workers in (0, 2):
+        conn = _db()
+        summary = IngestionCoordinator(
+            str(root), conn, streaming_parser=streaming, parse_cache=False, parse_workers=workers
+        ).run()
+        results.append(
+            (summary.teams_ingested, summary.players_ingested, len(summary.errors), _rows(conn))
+        )
+    assert results[0] == results[1] and results[0][1] > 0
+
+
+def test_replicate_corpus_prefixes_folders_and_files(tmp_path):
+    pages = ingest_benchmark.replicate_corpus(_corpus(tmp_path), tmp_path / "x", factor=2)
+    assert pages == 2 * len(list(DIVISION.glob("*.html")))
+    replica = tmp_path / "x" / f"x1_{DIVISION.name}"
+    assert (replica / f"ranking_table_x1_{DIVISION.name}.html").exists()
+    prefixes = ("ranking_table_x1_", "team_roster_x1_")
+    assert all(p.name.startswith(prefixes) for p in replica.iterdir())
+
+
+@pytest.mark.performance
+@pytest.mark.timeout(180)
+def test_ingest_benchmark_reports_identical_rows(tmp_path):
+    result = ingest_benchmark.run_ingest_benchmark(
+        str(_corpus(tmp_path)), replicas=2, workers=(0, 2), targets=("ingest_path",)
+    )
+    assert [r["workers"] for r in result["rows"]] == [0, 2]
+    assert all(r["identical"] for r in result["rows"])
+    assert result["rows"][0]["speedup"] == 1.0
+    assert ingest_benchmark.format_report(result)[0].startswith("corpus ")
+
+
+def test_single_worker_is_reported_as_the_serial_run(tmp_path, monkeypatch):
+    runs = []
+
+    def fake_run(target, corpus_dir, workers):
+        runs.append(workers)
+        return {"seconds": 1.0, "errors": 0, "rows": {}}
+
+    monkeypatch.setattr(ingest_benchmark, "_run_once", fake_run)
+    result = ingest_benchmark.run_ingest_benchmark(
+        str(_corpus(tmp_path)), replicas=1, workers=(0, 1, 2, 2), targets=("ingest_path",)
+    )
+    assert runs == [0, 2] and [r["workers"] for r in result["rows"]] == [0, 2]
+    assert 1 not in ingest_benchmark.DEFAULT_WORKERS
@@ -0,0 +1,145 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from db import parse_cache
+from db.ingest import ingest_path
+from db.migration_manager import apply_pending_migrations
+from db.schema import apply_schema
+from gui.services.ingestion_coordinator import IngestionCoordinator
+
+DIVISION = Path("data") / "1_Stadtliga_Gruppe_1"
+
+
+def _corpus(tmp_path):
+    root = tmp_path / "data"
+    shutil.copytree(DIVISION, root / DIVISION.name)
+    return root
+
+
+def _db():
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    apply_pending_migrations(conn)
+    return conn
+
+
+def _players(conn):
+    return conn.execute(
+        "SELECT t.name, p.full_name, p.live_pz FROM player p JOIN team t USING(team_id) "
+        "ORDER BY 1, 2"
+    ).fetchall()
+
+
+def _no_parsing(monkeypatch):
+    def fail(*_a, **_k):
+        raise AssertionError("page parsed despite a cached result")
+
+    monkeypatch.setattr(parse_cache, "extract_roster", fail)
+    monkeypatch.setattr(parse_cache, "parse_ranking_table", fail)
+
+
+def test_reingest_of_unchanged_corpus_is_served_from_the_cache(tmp_path, monkeypatch):
+    root = _corpus(tmp_path)
+    conn = _db()
+    first = ingest_path(conn, root)
+    pages = len(list(root.rglob("*.html")))
+    assert (first.parse_cache_hits, first.parse_cache_misses) == (0, pages)
+
+    rebuilt = _db()
+    rebuilt.execute(parse_cache.PARSE_CACHE_DDL)
+    rebuilt.executemany(
+        "INSERT INTO parse_cache VALUES (?,?,?,?,?)",
+        conn.execute("SELECT * FROM parse_cache").fetchall(),
+    )
+    _no_parsing(monkeypatch)
+    second = ingest_path(rebuilt, root)
+    assert (second.parse_cache_hits, second.parse_cache_misses) == (pages, 0)
+    assert _players(rebuilt) == _players(conn)
+
+
+def test_streaming_and_tree_extraction_share_an_entry(tmp_path):
+    root = _corpus(tmp_path)
+    conn = _db()
+    tree = ingest_path(conn, root, streaming=False)
+    streamed = ingest_path(conn, root, streaming=True)
+    assert streamed.parse_cache_misses == 0 and streamed.parse_cache_hits == tree.parse_cache_misses
+
+
+def test_parser_version_change_invalidates_results(tmp_path):
+    root = _corpus(tmp_path)
+    conn = _db()
+    ingest_path(conn, root)
+    cache = parse_cache.ParseCache(conn, "v2")
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0}
+    assert conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0] == 0
+    report = ingest_path(conn, root, parser_version="v2")
+    assert report.parse_cache_hits == 0 and report.parse_cache_misses > 0
+
+
+def test_versions_are_purged_once_so_two_callers_can_share_a_database(tmp_path):
+    root = _corpus(tmp_path)
+    conn = _db()
+    ingest_path(conn, root)  # v1
+    ingest_path(conn, root, parser_version="v2")  # first use of v2: v1 entries purged
+    ingest_path(conn, root)  # v1 again
+    parse_cache.ParseCache(conn, "v2")
+    counts = dict(
+        conn.execute("SELECT parser_version, COUNT(*) FROM parse_cache GROUP BY 1").fetchall()
+    )
+    assert counts["v1"] == counts["v2"] > 0
+
+
+def test_results_of_changed_pages_are_pruned(tmp_path):
+    root = _corpus(tmp_path)
+    conn = _db()
+    ingest_path(conn, root)
+    roster = sorted(root.rglob("team_roster_*.html"))[0]
+    old_hash = parse_cache.content_sha256(roster.read_text(encoding="utf-8"))
+    roster.write_text(roster.read_text(encoding="utf-8") + "<!-- rescraped -->", encoding="utf-8")
+    report = ingest_path(conn, root)
+    assert report.parse_cache_misses == 1
+    assert parse_cache.cached_parsers(conn, old_hash, "v1") == []
+    pages = len(list(root.rglob("*.html")))
+    assert conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0] == pages
+
+
+def test_ranking_entry_is_reused_only_for_the_same_source_hint():
+    conn = sqlite3.connect(":memory:")
+    cache = parse_cache.ParseCache(conn, "v1")
+    html = "<html><body><ul><li>x</li></ul></body></html>"
+    assert cache.ranking(html, "ranking_table_A.html")[0] == "A"
+    assert cache.ranking(html, "ranking_table_A.html")[0] == "A"
+    assert cache.ranking(html, "ranking_table_B.html")[0] == "B"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_disabled_cache_leaves_no_table(tmp_path):
+    conn = _db()
+    report = ingest_path(conn, _corpus(tmp_path), parse_cache=False)
+    assert (report.parse_cache_hits, report.parse_cache_misses) == (0, 0)
+    assert parse_cache.cached_parsers(conn, "x", "v1") == []
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "parse_cache" not in tables
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_coordinator_reuses_cached_roster_results(tmp_path, streaming):
+    roster = sorted(DIVISION.glob("team_roster_*.html"))[0]
+    conn = _db()
+    counts = []
+    for _ in range(2):
+        coordinator = IngestionCoordinator(str(tmp_path), conn, streaming_parser=streaming)
+        coordinator._prepare_tables()
+        conn.execute("DELETE FROM player")
+        inserted = coordinator._parse_and_upsert_players(1, "Team", roster_paths=[roster])
+        stats = coordinator.parse_cache_stats()
+        counts.append((inserted, stats["hits"], stats["misses"]))
+    assert counts[0][0] == counts[1][0] > 0
+    assert counts[0][1:] == (0, 1) and counts[1][1:] == (1, 0)
+    parsers = parse_cache.cached_parsers(
+        conn, parse_cache.content_sha256(roster.read_text(encoding="utf-8")), "v1"
+    )
+    assert parsers == (["roster_parser"] if streaming else ["coordinator_roster"])
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from parsing import html_backend, roster_parser
+from parsing.roster_parser import ParsedRoster
+
+ROSTERS = sorted(Path("data").rglob("team_roster_*.html"))[:5]
+
+
+class _CountingSoup:
+    def __init__(self, real):
+        self.real = real
+        self.builds = 0
+
+    def __call__(self, *args, **kwargs):
+        self.builds += 1
+        return self.real(*args, **kwargs)
+
+
+@pytest.fixture
+def soup_builds(monkeypatch):
+    counter = _CountingSoup(html_backend.BeautifulSoup)
+    monkeypatch.setattr(html_backend, "BeautifulSoup", counter)
+    return counter
+
+
+@pytest.mark.parametrize("path", ROSTERS, ids=lambda p: p.name)
+def test_parsed_roster_matches_the_wrappers(path):
+    html = path.read_text(encoding="utf-8")
+    page = ParsedRoster(html)
+    assert page.matches(team_id="t") == roster_parser.extract_matches(html, team_id="t")
+    assert page.players(team_id="t") == roster_parser.extract_players(html, team_id="t")
+    assert page.club_link() == roster_parser.extract_club_link(html)
+    assert roster_parser.extract_players(page, team_id="t") == page.players(team_id="t")
+
+
+def test_one_tree_per_page(soup_builds):
+    html = ROSTERS[0].read_text(encoding="utf-8")
+    page = ParsedRoster(html)
+    assert page.club_and_team() is not None and soup_builds.builds == 0  # title needs no tree
+    page.matches(team_id="t")
+    page.players(team_id="t")
+    page.club_link()
+    assert soup_builds.builds == 1
+
+
+def test_club_and_team_from_title():
+    html = "<html><head><title>Liga - Team SV Grün-Weiß, Herren II</title></head></html>"
+    assert roster_parser.club_and_team_from_title(html) == ("SV Grün-Weiß", "Herren II")
+    assert roster_parser.club_and_team_from_title("<title>Liga</title>") is None
@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+
+from config import settings
+from parsing import html_backend, ranking_parser
+from services import parser_benchmark
+
+
+@pytest.mark.performance
+@pytest.mark.timeout(180)
+@pytest.mark.parametrize("backend", [b for b in html_backend.BACKENDS if b != "html.parser"])
+def test_backend_parity_over_data_corpus(backend):
+    if backend not in html_backend.available_backends():
+        pytest.skip(f"{backend} not installed")
+    reference = parser_benchmark.parse_corpus("data", "html.parser")
+    assert reference  # the corpus is not empty
+    outputs = parser_benchmark.parse_corpus("data", backend)
+    assert [k for k in reference if outputs[k] != reference[k]] == []
+
+
+def test_resolve_backend_follows_setting_and_falls_back(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "HTML_PARSER_BACKEND", "lxml")
+    monkeypatch.setattr(html_backend, "_installed", lambda name: name == "html.parser")
+    html_backend._warn_fallback.cache_clear()
+    with caplog.at_level(logging.WARNING, logger=html_backend.__name__):
+        assert html_backend.resolve_backend() == "html.parser"
+        assert html_backend.resolve_backend() == "html.parser"
+    assert [r.getMessage() for r in caplog.records] == [
+        "HTML parser backend 'lxml' is not installed; falling back to 'html.parser'"
+    ]
+    monkeypatch.setattr(html_backend, "_installed", lambda name: True)
+    assert html_backend.resolve_backend() == "lxml"
+    assert html_backend.resolve_backend("html.parser") == "html.parser"
+    with pytest.raises(ValueError):
+        html_backend.resolve_backend("html5")
+
+
+def test_parsers_build_trees_with_configured_backend(monkeypatch):
+    used = []
+    real = html_backend.BeautifulSoup
+
+    def recording_soup(html, features, **kwargs):
+        used.append(features)
+        return real(html, features, **kwargs)
+
+    monkeypatch.setattr(html_backend, "BeautifulSoup", recording_soup)
+    html = "<html><head><title>X - 1. Kreisliga - Tabelle</title></head></html>"
+    assert ranking_parser.parse_ranking_table(html, restricted=False)[0] == "1. Kreisliga"
+    assert used == ["html.parser"]
+
+
+def test_benchmark_reports_each_parser(tmp_path):
+    liga = tmp_path / "Liga"
+    liga.mkdir()
+    (liga / "ranking_table_Liga.html").write_text(
+        "<html><head><title>X - Liga - Tabelle</title></head></html>", encoding="utf-8"
+    )
+    (liga / "team_roster_Liga_A_1.html").write_text(
+        "<table><tr><td><a href='?Spieler=1'>Anna</a></td>"
+        "<td class='tooltip' title='LivePZ-Wert'>1500</td></tr></table>",
+        encoding="utf-8",
+    )
+    result = parser_benchmark.run_benchmark(str(tmp_path), backends=["html.parser", "lxml"])
+    rows = {(r["parser"], r["backend"]): r for r in result["rows"]}
+    assert rows[("ranking_parser", "html.parser")]["pages"] == 1
+    assert rows[("roster_parser", "html.parser")]["mismatches"] == []
+    assert set(result["config"]["backends"]) | set(result["config"]["unavailable"]) == {
+        "html.parser",
+        "lxml",
+    }
+    report = "\n".join(parser_benchmark.format_report(result))
+    assert "roster_parser" in report and "speedup" in report
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from core import concurrent_fetch
+from core.fetch_memo import FetchMemo
+from services import pipeline
+
+from tests.test_pipeline_club_team_coverage import PRIMARY_CLUB_ID, _fake_http_fetch
+
+pytestmark = pytest.mark.usefixtures("isolated_http_state")
+
+
+def _mock_transport(delay: float = 0.0, in_flight: dict | None = None):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if in_flight is not None:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            return httpx.Response(200, text=_fake_http_fetch(str(request.url)))
+        finally:
+            if in_flight is not None:
+                in_flight["now"] -= 1
+
+    return httpx.MockTransport(handler)
+
+
+def test_iter_fetch_preserves_order_and_bounds_per_host():
+    in_flight = {"now": 0, "peak": 0}
+    urls = [f"https://example.invalid/?L1=Ergebnisse&L3=Mannschaften&n={i}" for i in range(12)]
+    with concurrent_fetch.ConcurrentFetcher(
+        max_per_host=3, transport=_mock_transport(0.02, in_flight)
+    ) as fetcher:
+        outcomes = list(fetcher.iter_fetch(urls))
+        stats = fetcher.stats()
+    assert [o.url for o in outcomes] == urls
+    assert all(o.ok for o in outcomes)
+    assert 1 < in_flight["peak"] <= 3
+    assert stats["requests"] == 12 and stats["failures"] == 0
+
+
+def test_iter_fetch_schedules_a_bounded_window_ahead_of_the_consumer():
+    urls = [f"https://example.invalid/?L1=Ergebnisse&L3=Mannschaften&n={i}" for i in range(40)]
+    with concurrent_fetch.ConcurrentFetcher(max_per_host=2, transport=_mock_transport()) as fetcher:
+        outcomes = fetcher.iter_fetch(urls, window=4)
+        first = next(outcomes)
+        time.sleep(0.1)  # a stalled consumer: nothing beyond the window is requested
+        assert first.ok and fetcher.stats()["requests"] <= 5
+        assert [o.url for o in outcomes] == urls[1:]
+        assert fetcher.stats()["requests"] == 40
+
+
+def test_cancelled_token_skips_requests():
+    class _Cancelled:
+        def is_cancelled(self):
+            return True
+
+    with concurrent_fetch.ConcurrentFetcher(
+        cancel_token=_Cancelled(), transport=_mock_transport()
+    ) as fetcher:
+        outcomes = list(fetcher.iter_fetch(["https://example.invalid/a"]))
+    assert isinstance(outcomes[0].error, concurrent_fetch.FetchCancelled)
+
+
+def test_aborting_target_does_not_cancel_pages_another_target_waits_for():
+    memo = FetchMemo()
+    urls = [f"https://example.invalid/?L1=Ergebnisse&L3=Mannschaften&n={i}" for i in range(8)]
+    aborting = concurrent_fetch.ConcurrentFetcher(
+        max_per_host=2, transport=_mock_transport(0.02), memo=memo
+    )
+    with concurrent_fetch.ConcurrentFetcher(
+        max_per_host=2, transport=_mock_transport(0.02), memo=memo
+    ) as other:
+        first = aborting.iter_fetch(urls, window=8)
+        next(first)  # every URL is now in flight for the first target
+        second = other.iter_fetch(urls, window=8)
+        outcomes = [next(second)]
+        first.close()  # e.g. the first target's run raised
+        aborting.close()
+        outcomes.extend(second)
+    assert [o.url for o in outcomes] == urls
+    assert all(o.ok and o.shared for o in outcomes)
+    assert memo.stats()["unique_requests"] == 8
+
+
+def test_run_full_async_mode_matches_layout(tmp_path, monkeypatch):
+    transport = _mock_transport(0.005)
+
+    class _MockedFetcher(concurrent_fetch.ConcurrentFetcher):
+        def __init__(self, **kwargs):
+            kwargs.setdefault("transport", transport)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(concurrent_fetch, "ConcurrentFetcher", _MockedFetcher)
+    data_dir = tmp_path / "data"
+    events = []
+    result = pipeline.run_full(
+        PRIMARY_CLUB_ID,
+        season=2025,
+        data_dir=str(data_dir),
+        progress=lambda e, p: events.append((e, p.get("key"))),
+        async_mode=True,
+        max_per_host=4,
+    )
+    club_team_files = [f for f in os.listdir(data_dir / "club_teams") if f.endswith(".html")]
+    assert len(club_team_files) == 5
+    assert result["fetch_stats"]["requests"] > 0
+    # landing / primary club overview are shared instead of re-requested
+    assert result["fetch_dedup"]["duplicates_avoided"] > 0
+    assert result["fetch_stats"]["requests"] == result["fetch_dedup"]["unique_requests"]
+    assert ("phase_complete", "__all__") in events
@@ -0,0 +1,133 @@
+import json
+import os
+import threading
+import time
+
+from core import filesystem, http_client
+from services import pipeline
+from tracking import history_freshness
+
+from tests.test_pipeline_club_team_coverage import PRIMARY_CLUB_ID, _fake_http_fetch
+
+PLAYERS = {"11": "Anna Alpha", "12": "Bert Beta"}
+
+
+class _Site:
+    """Fake site: team 5000 lists two players with LivePZ; histories are counted."""
+
+    def __init__(self):
+        self.live_pz = {"11": 1500, "12": 1400}
+        self.history_requests: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str):
+        if "Page=EntwicklungTTR" in url:
+            with self._lock:
+                self.history_requests.append(url)
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            time.sleep(0.05)
+            with self._lock:
+                self.in_flight -= 1
+            return f"<html>history {url}</html>"
+        if "L3=Mannschaften&L3P=5000" in url:
+            rows = "".join(
+                f'<tr><td><a href="?L1=Ergebnisse&L2=TTStaffeln&L2P=5000&L3=Spieler&L3P={pid}'
+                f'&Page=Vorrunde">{name}</a></td>'
+                f'<td class="tooltip" title="LivePZ-Wert: {self.live_pz[pid]}">'
+                f"{self.live_pz[pid]}</td></tr>"
+                for pid, name in PLAYERS.items()
+            )
+            return (
+                '<html><a href="?L1=Public&L2=Verein&L2P=9999&Page=Spielbetrieb"></a>'
+                f"<table>{rows}</table></html>"
+            )
+        return _fake_http_fetch(url)
+
+
+def _run(data_dir):
+    return pipeline.run_full(PRIMARY_CLUB_ID, season=2025, data_dir=data_dir, parse_workers=0)
+
+
+def test_histories_fetched_concurrently_then_refreshed_only_when_due(tmp_path, monkeypatch):
+    site = _Site()
+    monkeypatch.setattr(http_client, "fetch", site.fetch)
+    data_dir = str(tmp_path / "data")
+
+    first = _run(data_dir)
+    assert first["player_histories"]["fetched"] == 2
+    assert first["player_histories"]["new"] == 2
+    assert site.peak_in_flight == 2
+    root = os.path.join(data_dir, "club_players")
+    index = history_freshness.load_index(root)
+    assert sorted(entry["live_pz"] for entry in index.values()) == [1400, 1500]
+
+    site.history_requests.clear()
+    second = _run(data_dir)
+    assert second["player_histories"]["skipped"] == 2
+    assert second["player_histories"]["fetched"] == 0
+    assert site.history_requests == []
+
+    # Anna's LivePZ changed, Bert's history is older than the max age
+    site.live_pz["11"] = 1510
+    bert = next(os.path.join(root, k) for k in index if k.endswith("Bert_Beta.html"))
+    old = time.time() - 30 * 86400
+    os.utime(bert, (old, old))
+    third = _run(data_dir)
+    counts = third["player_histories"]
+    assert counts["fetched"] == 2 and counts["skipped"] == 0
+    assert counts["livepz_changed"] == 1 and counts["stale"] == 1
+    with open(os.path.join(root, history_freshness.INDEX_FILENAME), encoding="utf-8") as fh:
+        assert 1510 in [entry["live_pz"] for entry in json.load(fh).values()]
+
+
+def test_refresh_reason(tmp_path):
+    path = tmp_path / "p.html"
+    reason = history_freshness.refresh_reason
+    assert reason(str(path), previous_live_pz=None, current_live_pz=1) == "new"
+    path.write_text("x")
+    assert reason(str(path), previous_live_pz=1, current_live_pz=1) is None
+    assert reason(str(path), previous_live_pz=None, current_live_pz=1) is None
+    assert reason(str(path), previous_live_pz=1, current_live_pz=2) == "livepz_changed"
+    later = time.time() + 2 * 86400
+    assert reason(str(path), previous_live_pz=1, current_live_pz=1, max_age_days=1, now=later) == (
+        "stale"
+    )
+
+
+def test_failed_history_write_is_a_recoverable_error(tmp_path, monkeypatch):
+    site = _Site()
+    monkeypatch.setattr(http_client, "fetch", site.fetch)
+    real_write = filesystem._write_atomic
+
+    def failing_write(path, *args, **kwargs):
+        if path.endswith("Bert_Beta.html"):
+            raise OSError("disk full")
+        return real_write(path, *args, **kwargs)
+
+    monkeypatch.setattr(filesystem, "_write_atomic", failing_write)
+    data_dir = str(tmp_path / "data")
+    events = []
+    result = pipeline.run_full(
+        PRIMARY_CLUB_ID,
+        season=2025,
+        data_dir=data_dir,
+        parse_workers=0,
+        progress=lambda e, p: events.append((e, p)),
+    )
+    counts = result["player_histories"]
+    assert counts["fetched"] == 1 and counts["failed"] == 1
+    assert [e for e in result["errors"] if "Bert_Beta.html" in e and "disk full" in e]
+    assert [p for e, p in events if e == "recoverable_error"] == [
+        {"phase": "player_histories", "message": result["errors"][-1]}
+    ]
+    # only the page on disk is indexed, so the failed one is fetched again next run
+    index = history_freshness.load_index(os.path.join(data_dir, "club_players"))
+    assert [k.rsplit("/", 1)[-1] for k in index] == ["Anna_Alpha.html"]
+    assert not [e for e in result["manifest"] if e["path"].endswith("Bert_Beta.html")]
+    monkeypatch.setattr(filesystem, "_write_atomic", real_write)
+    site.history_requests.clear()
+    assert _run(data_dir)["player_histories"]["new"] == 1
+    assert len(site.history_requests) == 1
@@ -123,3 +123,50 @@ def test_post_scrape_ingestion_triggers_ingest_and_events(tmp_path):
     assert summary.divisions_ingested == 1
     # processed_files should be >= roster count (ranking + 2 rosters) minus any skipped
     assert summary.processed_files >= 2
+
+
+class _FakeProgressRunner(_FakeRunner):
+    def __init__(self):
+        super().__init__()
+        self.scrape_progress = _FakeSignal()
+
+    def emit_progress(self, event, payload):
+        for h in list(self.scrape_progress._handlers):
+            h(event, payload)
+
+
+def test_partial_ready_ingests_primary_slice_immediately(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "ranking_table_1_Bezirksliga_Erwachsene.html").write_text(
+        "<html><body>Rank</body></html>", encoding="utf-8"
+    )
+    (data_dir / "team_roster_1_Bezirksliga_Erwachsene_SV_Arzberg_129095.html").write_text(
+        "<html><body>Roster B</body></html>", encoding="utf-8"
+    )
+    # on disk from an earlier scrape but not part of the slice: left to the final ingestion
+    (data_dir / "ranking_table_2_Stadtklasse.html").write_text("<html></html>", encoding="utf-8")
+    (data_dir / "team_roster_2_Stadtklasse_Other_1_222.html").write_text(
+        "<html></html>", encoding="utf-8"
+    )
+    files = [
+        str(data_dir / "ranking_table_1_Bezirksliga_Erwachsene.html"),
+        str(data_dir / "team_roster_1_Bezirksliga_Erwachsene_SV_Arzberg_129095.html"),
+    ]
+    bus = EventBus()
+    services.register("event_bus", bus, allow_override=True)
+    conn = sqlite3.connect(":memory:")
+    _create_minimal_gui_ingest_schema(conn)
+    services.register("sqlite_conn", conn, allow_override=True)
+    completed = []
+    bus.subscribe(GUIEvent.DATA_REFRESH_COMPLETED, lambda evt: completed.append(evt.payload))
+
+    runner = _FakeProgressRunner()
+    PostScrapeIngestionHook(runner, lambda: "unused")
+    runner.emit_progress("phase_progress", {"key": "division_rosters"})
+    assert not completed
+    runner.emit_progress("partial_ready", {"data_dir": str(data_dir), "files": files})
+
+    assert conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == 1
+    assert conn.execute("SELECT COUNT(*) FROM divisions").fetchone()[0] == 1
+    assert completed and completed[0]["partial"] is True
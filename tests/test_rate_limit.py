@@ -0,0 +1,113 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from core import http_client, rate_limit
+
+
+def test_bucket_paces_beyond_burst():
+    gov = rate_limit.RateGovernor(rps=50, burst=5)
+    start = time.monotonic()
+    for _ in range(15):
+        gov.acquire()
+    elapsed = time.monotonic() - start
+    # 5 banked tokens, the remaining 10 arrive at 50/s
+    assert 0.15 <= elapsed < 1.0
+    m = gov.metrics()
+    assert m["acquired"] == 15 and m["delayed"] >= 9
+
+
+def test_throttle_halves_rate_and_success_recovers_additively():
+    gov = rate_limit.RateGovernor(rps=10, burst=2, min_rps=1, increase_step=1.0, cooldown=0.0)
+    gov.on_throttle()
+    assert gov.current_rate == pytest.approx(5.0)
+    gov.on_throttle()
+    gov.on_throttle()
+    gov.on_throttle()
+    assert gov.current_rate == pytest.approx(1.0)  # clamped at min_rps
+    for _ in range(3):
+        gov.on_success()
+    assert gov.current_rate == pytest.approx(4.0)
+    for _ in range(20):
+        gov.on_success()
+    assert gov.current_rate == pytest.approx(10.0)
+    assert gov.metrics()["throttle_events"] == 4
+
+
+def test_cooldown_collapses_failure_bursts():
+    gov = rate_limit.RateGovernor(rps=8, burst=2, cooldown=60.0)
+    for _ in range(5):
+        gov.on_throttle()
+    assert gov.current_rate == pytest.approx(4.0)
+    assert gov.metrics()["throttle_events"] == 1
+
+
+def test_queue_depth_reported_while_threads_wait():
+    gov = rate_limit.RateGovernor(rps=20, burst=1)
+    peak = []
+    threads = [threading.Thread(target=gov.acquire) for _ in range(6)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    peak.append(gov.metrics()["queue_depth"])
+    for t in threads:
+        t.join()
+    assert peak[0] >= 1
+    assert gov.metrics()["queue_depth"] == 0
+    assert gov.metrics()["peak_queue_depth"] >= peak[0]
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    remaining_429 = 0
+
+    def do_GET(self):  # noqa: N802 - stdlib naming
+        cls = type(self)
+        if cls.remaining_429 > 0:
+            cls.remaining_429 -= 1
+            body = b"slow down"
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        else:
+            body = b"<html>ok</html>"
+            self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # silence test output
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(_ThrottlingHandler)
+
+
+def test_session_feeds_429_back_to_governor(server):
+    _ThrottlingHandler.remaining_429 = 1
+    gov = rate_limit.RateGovernor(rps=40, burst=4, increase_step=0.5)
+    with http_client.HttpSession(governor=gov, conditional_cache=False) as session:
+        text = session.fetch(f"{server}/page", retries=2, backoff_factor=0.0, verbose=False)
+    assert text == "<html>ok</html>"
+    m = gov.metrics()
+    assert m["throttle_events"] == 1
+    assert m["acquired"] == 2
+    assert m["current_rps"] == pytest.approx(20.5)
+
+
+def test_socket_timeout_counts_as_throttle(monkeypatch):
+    gov = rate_limit.RateGovernor(rps=40, burst=4, cooldown=0.0)
+    session = http_client.HttpSession(governor=gov, conditional_cache=False)
+
+    def timeout(*_a, **_k):
+        raise socket.timeout("timed out")  # not a TimeoutError subclass before 3.10
+
+    monkeypatch.setattr(session, "request", timeout)
+    with pytest.raises(http_client.HttpError):
+        session.fetch("http://example.invalid/", retries=1, backoff_factor=0.0, verbose=False)
+    assert gov.metrics()["throttle_events"] == 2
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+from parsing import html_backend, ranking_parser
+from parsing.roster_parser import ROSTER_PARSE_ONLY, ParsedRoster
+from services import parser_benchmark
+
+ROSTERS = sorted(Path("data").rglob("team_roster_*.html"))
+RANKINGS = sorted(Path("data").rglob("ranking_table_*.html"))
+
+
+def _roster(html, restricted):
+    page = ParsedRoster(html, restricted=restricted)
+    return page.matches(team_id="t"), page.players(team_id="t"), page.club_link()
+
+
+@pytest.mark.parametrize("path", ROSTERS[::20], ids=lambda p: p.name)
+def test_restricted_roster_parse_matches_full_tree(path):
+    html = path.read_text(encoding="utf-8")
+    assert _roster(html, True) == _roster(html, False)
+
+
+def test_restricted_trees_are_a_fraction_of_the_full_tree():
+    pairs = ((ROSTERS[0], ROSTER_PARSE_ONLY), (RANKINGS[0], ranking_parser.RANKING_PARSE_ONLY))
+    for path, parse_only in pairs:
+        html = path.read_text(encoding="utf-8")
+        full = html_backend.measure_parse(html)
+        restricted = html_backend.measure_parse(html, parse_only=parse_only)
+        assert restricted.node_count * 2 < full.node_count
+        assert restricted.memory_delta_kb < full.memory_delta_kb
+    html = RANKINGS[0].read_text(encoding="utf-8")
+    assert ranking_parser.parse_ranking_table(
+        html, RANKINGS[0].name, restricted=True
+    ) == ranking_parser.parse_ranking_table(html, RANKINGS[0].name, restricted=False)
+
+
+def test_pages_outside_the_site_layout_fall_back_to_the_full_tree():
+    roster = (
+        "<table><tr><td><a href='?Spieler=1'>Anna</a></td>"
+        "<td class='tooltip' title='LivePZ-Wert'>1500</td></tr></table>"
+    )
+    assert _roster(roster, True) == _roster(roster, False)
+    assert _roster(roster, True)[1][0].live_pz == 1500
+    ranking = (
+        "<html><head><title>X - Liga - Tabelle</title></head><body>"
+        "<a>Teams</a><ul><li><a href='?L2P=1&L3P=2'><span>A</span></a></li></ul></body></html>"
+    )
+    division, teams = ranking_parser.parse_ranking_table(ranking, restricted=True)
+    assert division == "Liga" and [t["team_id"] for t in teams] == ["2"]
+
+
+@pytest.mark.performance
+@pytest.mark.timeout(180)
+def test_restricted_parse_parity_over_data_corpus():
+    full = parser_benchmark.parse_corpus("data", "html.parser")
+    restricted = parser_benchmark.parse_corpus("data", "html.parser", restricted=True)
+    assert [k for k in full if restricted[k] != full[k]] == []
@@ -0,0 +1,104 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from db.ingest import ingest_path
+from db.migration_manager import apply_pending_migrations
+from db.schema import apply_schema
+from domain.models import Match
+from gui.services.ingestion_coordinator import IngestionCoordinator
+from parsing import roster_parser, roster_stream
+
+PAGES = sorted(Path("data").rglob("team_roster_*.html")) + sorted(
+    Path("data").rglob("club_team_*.html")
+)
+
+
+def _tree(html):
+    page = roster_parser.ParsedRoster(html, restricted=False)
+    return page.matches(team_id="t"), page.players(team_id="t")
+
+
+@pytest.mark.parametrize("path", PAGES[::25], ids=lambda p: p.name)
+def test_stream_matches_tree_extractors(path):
+    html = path.read_text(encoding="utf-8")
+    assert roster_stream.stream_roster(html, team_id="t") == _tree(html)
+    records = list(roster_stream.iter_roster_file(str(path), team_id="t", chunk_size=997))
+    matches = [r for r in records if isinstance(r, Match)]
+    assert (matches, [r for r in records if not isinstance(r, Match)]) == _tree(html)
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        # positional fallback: anchors outside rows paired with tooltip cells
+        "<div><a href='?Spieler=1'>Anna</a> <a href='?Spieler=2'>Ben</a></div>"
+        "<span><td class='x tooltip' title='LivePZ-Wert'>LivePZ 1500</td></span>",
+        # tooltip after the anchor, unclosed cells, stray end tags, script and comments
+        "<table><tr><td><a href='?Spieler=1'>An<!-- c -->na</a></b><td>x<script>9</script>"
+        "<td class='tooltip' title='LivePZ-Wert vom'>1&nbsp;512</table>"
+        "<table><tr><td><a href='?Spieler=3'>Anna</a></td></tr></table>",
+        # nested rows: outer anchor precedes the inner row
+        "<table><tr><td><a href='?Spieler=1'>Outer</a><table><tr><td>"
+        "<a href='?Spieler=2'>Inner</a></td><td class='tooltip' title='LivePZ-Wert'>1400</td>"
+        "</tr></table></td></tr></table>",
+        "<table><tr id='Spiel7'>" + "".join(f"<td> c{i} </td>" for i in range(9)) + "<td>9:6"
+        "</tr><tr id='Spiel8'><td>1<td>2</tr></table>",
+    ],
+)
+def test_stream_follows_tree_semantics_on_odd_markup(html):
+    assert roster_stream.stream_roster(html, team_id="t") == _tree(html)
+
+
+def test_records_are_yielded_as_rows_complete():
+    html = PAGES[0].read_text(encoding="utf-8")
+    fed = []
+
+    def chunks():
+        for i in range(0, len(html), 1000):
+            fed.append(i)
+            yield html[i : i + 1000]
+
+    first = next(roster_stream.iter_roster_records(chunks(), team_id="t"))
+    assert len(fed) * 1000 < len(html)  # before the whole page was read
+    assert first in _tree(html)[0] + _tree(html)[1]
+
+
+@pytest.mark.performance
+@pytest.mark.timeout(180)
+def test_stream_parity_over_data_corpus():
+    for path in PAGES:
+        html = path.read_text(encoding="utf-8")
+        assert roster_stream.stream_roster(html, team_id="t") == _tree(html), path.name
+
+
+RANKING_HTML = """<html><head><title>TischtennisLive - Division X - Tabelle</title></head>
+<body><a>Teams</a><ul><li><a href="team1.html">T1</a><span>Team Alpha</span></li></ul>
+</body></html>"""
+
+
+def test_ingest_path_streaming_opt_in(tmp_path):
+    (tmp_path / "ranking_table_division_x.html").write_text(RANKING_HTML, encoding="utf-8")
+    roster = PAGES[0].read_text(encoding="utf-8")
+    (tmp_path / "team_roster_division_x_Team_Alpha_1.html").write_text(roster, encoding="utf-8")
+    rows = []
+    for streaming in (False, True):
+        conn = sqlite3.connect(":memory:")
+        apply_schema(conn)
+        apply_pending_migrations(conn)
+        ingest_path(conn, tmp_path, streaming=streaming)
+        rows.append(conn.execute("SELECT full_name, live_pz FROM player ORDER BY 1").fetchall())
+    assert rows[0] == rows[1] and len(rows[1]) == len(_tree(roster)[1])
+
+
+def test_coordinator_streaming_parser(tmp_path):
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    apply_pending_migrations(conn)
+    coordinator = IngestionCoordinator(str(tmp_path), conn, streaming_parser=True)
+    coordinator._prepare_tables()
+    inserted = coordinator._parse_and_upsert_players(1, "Team", roster_paths=[PAGES[0]])
+    rows = conn.execute("SELECT full_name, live_pz FROM player WHERE team_id=1").fetchall()
+    expected = [(p.name, p.live_pz) for p in _tree(PAGES[0].read_text(encoding="utf-8"))[1]]
+    assert inserted == len(expected) and sorted(rows) == sorted(expected)
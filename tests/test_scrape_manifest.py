@@ -0,0 +1,110 @@
+"""Scrape manifest: written by run_full, consumed by the coordinator and incremental_refresh."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from core import http_client
+from db.ingest import hash_html, incremental_refresh
+from db.migration_manager import apply_pending_migrations
+from db.schema import apply_schema
+from gui.services import data_audit
+from gui.services.ingestion_coordinator import IngestionCoordinator
+from services import pipeline, scrape_manifest
+
+from tests.test_crawl_frontier import CLUB_ID, _fake_fetch
+from tests.test_ingestion_coordinator import SCHEMA_SQL
+
+
+def _scrape(tmp_path, monkeypatch) -> tuple[str, dict]:
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    data_dir = str(tmp_path / "data")
+    return data_dir, pipeline.run_full(CLUB_ID, season=2025, data_dir=data_dir)
+
+
+def test_run_full_records_every_written_file(tmp_path, monkeypatch):
+    data_dir, result = _scrape(tmp_path, monkeypatch)
+    entries = result["manifest"]
+    kinds = {e["kind"] for e in entries}
+    assert {"landing", "ranking_table", "team_roster", "club_overview", "club_team"} <= kinds
+    for e in entries:
+        path = os.path.join(data_dir, *e["path"].split("/"))
+        raw = Path(path).read_bytes()
+        assert e["size"] == len(raw)
+        assert e["sha1"] == hashlib.sha1(raw).hexdigest()
+        assert e["sha256"] == hash_html(Path(path).read_text(encoding="utf-8"))
+    rosters = [e for e in entries if e["kind"] == "team_roster"]
+    assert sorted(e["team_id"] for e in rosters) == ["5000", "6000", "6001"]
+    assert {e["division"] for e in rosters} == {"Stadtliga"}
+    with open(os.path.join(data_dir, scrape_manifest.FILENAME), encoding="utf-8") as fh:
+        persisted = {e["path"] for e in json.load(fh)["entries"]}
+    assert {e["path"] for e in entries} <= persisted
+
+
+def test_manifest_is_cumulative_and_drops_deleted_files(tmp_path):
+    (tmp_path / "a.html").write_text("a", encoding="utf-8")
+    (tmp_path / "b.html").write_text("b", encoding="utf-8")
+    first = scrape_manifest.load(str(tmp_path))
+    first.record(str(tmp_path / "a.html"), "a", kind="team_roster")
+    first.record(str(tmp_path / "b.html"), "b", kind="team_roster")
+    first.save()
+    (tmp_path / "b.html").unlink()
+    second = scrape_manifest.load(str(tmp_path))
+    assert second.relpaths() == ["a.html", "b.html"]
+    second.save()
+    assert scrape_manifest.load(str(tmp_path)).relpaths() == ["a.html"]
+    (tmp_path / "a.html").write_text("changed", encoding="utf-8")
+    assert second.entry_for("a.html", str(tmp_path / "a.html")) is None
+
+
+def test_coordinator_audits_from_manifest_without_walking(tmp_path, monkeypatch):
+    data_dir, _result = _scrape(tmp_path, monkeypatch)
+    manifest = scrape_manifest.load(data_dir)
+    walked = data_audit.DataAuditService(data_dir).run()
+    hashed = []
+    monkeypatch.setattr(data_audit, "_sha1", lambda p: hashed.append(p) or "")
+
+    def _no_walk(self, base):
+        raise AssertionError("manifest audit must not walk the tree")
+
+    monkeypatch.setattr(data_audit.DataAuditService, "_os_walk", _no_walk)
+    audited = data_audit.DataAuditService(data_dir).run_manifest(manifest)
+    assert audited.to_dict() == walked.to_dict()
+    assert hashed == []
+
+    conn = sqlite3.connect(":memory:")
+    for stmt in SCHEMA_SQL:
+        conn.execute(stmt)
+    summary = IngestionCoordinator(data_dir, conn).run(manifest=manifest)
+    assert summary.divisions_ingested == 1 and summary.teams_ingested == 3
+
+    # a file changed after the scrape is hashed from disk again
+    roster = next(r for r in manifest.relpaths("team_roster"))
+    Path(data_dir, roster).write_text("<html>edited</html>", encoding="utf-8")
+    data_audit.DataAuditService(data_dir).run_manifest(manifest)
+    assert [p.name for p in hashed] == [Path(roster).name]
+
+
+def test_incremental_refresh_reuses_manifest_hashes(tmp_path, monkeypatch):
+    data_dir, _result = _scrape(tmp_path, monkeypatch)
+    manifest = scrape_manifest.load(data_dir)
+
+    def _fresh():
+        conn = sqlite3.connect(":memory:")
+        conn.execute("PRAGMA foreign_keys=ON")
+        apply_schema(conn)
+        apply_pending_migrations(conn)
+        return conn
+
+    walked = incremental_refresh(_fresh(), data_dir)
+    conn = _fresh()
+    first = incremental_refresh(conn, data_dir, manifest=manifest)
+    assert first.manifest_hits == first.processed_files == walked.processed_files
+    assert (first.new_files, first.parsed_files) == (walked.new_files, walked.parsed_files)
+    # the recorded hashes equal what a walking refresh computes from disk
+    again = incremental_refresh(conn, data_dir)
+    assert again.parsed_files == 0 and again.skipped_unchanged == again.processed_files
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from core import http_client
+from services import pipeline, scrape_benchmark
+from services.scrape_replay import ReplayCorpus, ReplayServer, url_key
+
+ROOT = "https://leipzig.tischtennislive.de/"
+DIVISION_ID = "20459"
+TEAM_IDS = ["128859", "128861"]
+
+
+pytestmark = pytest.mark.usefixtures("isolated_http_state")
+
+
+def _roster_link(team_id: str) -> str:
+    return f"?L1=Ergebnisse&L2=TTStaffeln&L2P={DIVISION_ID}&L3=Mannschaften&L3P={team_id}"
+
+
+def _corpus_dir(tmp_path) -> str:
+    data_dir = tmp_path / "corpus"
+    div_dir = data_dir / "1_Stadtliga"
+    div_dir.mkdir(parents=True)
+    items = "".join(
+        f'<li><a href="{_roster_link(t)}">T</a><span>Team {t}</span></li>' for t in TEAM_IDS
+    )
+    (div_dir / "ranking_table_1_Stadtliga.html").write_text(
+        "<html><head><title>TischtennisLive - 1. Stadtliga - Tabelle</title></head>"
+        f"<body><a>Teams</a><ul>{items}</ul></body></html>",
+        encoding="utf-8",
+    )
+    for t in TEAM_IDS:
+        (div_dir / f"team_roster_1_Stadtliga_Team_{t}_{t}.html").write_text(
+            f'<html><a href="{_roster_link(t)}&amp;LogIn=true">self</a>Spieler {t}</html>',
+            encoding="utf-8",
+        )
+    return str(data_dir)
+
+
+def test_url_key_ignores_order_login_and_default_page():
+    a = url_key(f"{ROOT}?L1=Ergebnisse&L2=TTStaffeln&L2P=1&L3=Mannschaften&L3P=2&Page=Vorrunde")
+    b = url_key("/?L3P=2&L3=Mannschaften&L2P=1&L2=TTStaffeln&L1=Ergebnisse&LogIn=true")
+    assert a == b
+    assert url_key("?L3P=2&Page=EntwicklungTTR") != url_key("?L3P=2")
+
+
+def test_corpus_indexes_files_and_synthesizes_landing(tmp_path):
+    landing = pipeline.LANDING_URL_TEMPLATE.format(club_id=2294, season=2025)
+    corpus = ReplayCorpus.from_dir(_corpus_dir(tmp_path), landing_url=landing)
+    assert corpus.sources() == {"file_name": 3, "synthesized": 1}
+    page = corpus.lookup(f"{ROOT}{_roster_link(TEAM_IDS[0])}&Page=Vorrunde")
+    assert page is not None and page.path.endswith(f"_{TEAM_IDS[0]}.html")
+    assert corpus.lookup(f"{ROOT}?L1=Ergebnisse&L2=TTStaffeln&L2P={DIVISION_ID}&L3=Tabelle")
+    assert _roster_link(TEAM_IDS[0]).encode() in corpus.lookup(landing).read()
+
+
+def test_server_replays_revalidates_and_injects_errors(tmp_path):
+    corpus = ReplayCorpus.from_dir(_corpus_dir(tmp_path))
+    url = f"{ROOT}{_roster_link(TEAM_IDS[1])}"
+    with ReplayServer(corpus) as server, server.redirect():
+        assert f"Spieler {TEAM_IDS[1]}" in http_client.fetch(url, use_cache=True)
+        assert f"Spieler {TEAM_IDS[1]}" in http_client.fetch(url, use_cache=True)
+        with pytest.raises(http_client.HttpError):
+            http_client.fetch(f"{ROOT}?L1=Unknown", retries=0, verbose=False)
+        stats = server.stats()
+    assert stats["requests"] == 3 and stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["not_modified"] == 1
+    # the route is removed again
+    assert http_client.routed_url(url) == url
+
+    with ReplayServer(corpus, error_rate=1.0, error_status=503) as server, server.redirect():
+        with pytest.raises(http_client.HttpError):
+            http_client.fetch(url, retries=0, verbose=False, use_cache=False)
+        assert server.stats()["injected_errors"] == 1
+
+
+def test_benchmark_runs_pipeline_against_replay(tmp_path):
+    result = scrape_benchmark.run_benchmark(_corpus_dir(tmp_path), latency=0.001, repeat=2)
+    assert len(result["runs"]) == 2
+    first = result["runs"][0]
+    assert first["requests"]["server"]["hits"] >= 1 + 1 + len(TEAM_IDS)
+    assert "division_rosters" in first["phase_durations"]
+    assert set(first["net_latency"]) >= {"landing", "ranking_tables", "division_rosters"}
+    assert first["throughput"]["pages_per_second"] > 0
+    assert any(line.startswith("wall seconds") for line in scrape_benchmark.format_report(result))
+    assert not os.path.exists(os.path.join(str(tmp_path), "corpus", "scrape_journal.jsonl"))
@@ -0,0 +1,78 @@
+import os
+from collections import Counter
+
+import pytest
+
+from core import http_client
+from services import pipeline, scrape_journal
+
+from tests.test_pipeline_club_team_coverage import PRIMARY_CLUB_ID, _fake_http_fetch
+
+
+class _CancelAfter:
+    def __init__(self, requested: Counter, limit: int):
+        self.requested = requested
+        self.limit = limit
+
+    def is_cancelled(self):
+        return sum(self.requested.values()) >= self.limit
+
+
+def _counting(monkeypatch):
+    requested = Counter()
+
+    def fetch(url):
+        requested[url] += 1
+        return _fake_http_fetch(url)
+
+    monkeypatch.setattr(http_client, "fetch", fetch)
+    return requested
+
+
+def test_journal_records_phases_and_completion(tmp_path, monkeypatch):
+    _counting(monkeypatch)
+    data_dir = str(tmp_path / "data")
+    pipeline.run_full(PRIMARY_CLUB_ID, season=2025, data_dir=data_dir)
+    state = scrape_journal.load(data_dir)
+    assert state.status == "completed"
+    assert "landing" in state.completed_phases and "tracking_state" in state.completed_phases
+    assert state.fetched
+    assert all(os.path.exists(os.path.join(data_dir, p)) for p in state.fetched.values())
+    assert scrape_journal.resumable(data_dir) is None
+
+
+def test_resume_continues_interrupted_run(tmp_path, monkeypatch):
+    reference = _counting(monkeypatch)
+    clean = pipeline.run_full(PRIMARY_CLUB_ID, season=2025, data_dir=str(tmp_path / "clean"))
+
+    data_dir = str(tmp_path / "data")
+    first = _counting(monkeypatch)
+    with pytest.raises(pipeline.PipelineCancelled):
+        pipeline.run_full(
+            PRIMARY_CLUB_ID,
+            season=2025,
+            data_dir=data_dir,
+            cancel_token=_CancelAfter(first, limit=4),
+        )
+    pending = scrape_journal.resumable(data_dir)
+    assert pending is not None and pending.status == "cancelled"
+    assert pending.club_id == PRIMARY_CLUB_ID
+
+    second = _counting(monkeypatch)
+    result = pipeline.run_full(PRIMARY_CLUB_ID, season=2025, data_dir=data_dir, resume=True)
+    assert result["resume"]["resumed"] is True
+    assert result["resume"]["restored_fetches"] > 0
+    # pages persisted before the interruption are not requested again
+    assert not set(first) & set(second)
+    assert set(first) | set(second) == set(reference)
+    assert result["players_total"] == clean["players_total"]
+    assert result["total_matches"] == clean["total_matches"]
+    assert scrape_journal.load(data_dir).status == "completed"
+
+
+def test_resume_without_interrupted_run_is_a_full_scrape(tmp_path, monkeypatch):
+    _counting(monkeypatch)
+    result = pipeline.run_full(
+        PRIMARY_CLUB_ID, season=2025, data_dir=str(tmp_path / "data"), resume=True
+    )
+    assert result["resume"]["resumed"] is False
@@ -0,0 +1,94 @@
+import os
+import time
+
+from config import settings
+from core import http_client
+from services import pipeline, snapshot_archive
+from services.compare_scrapes import compare_snapshots, snapshot_diff
+from services.snapshot_archive import LANDING_KEY, SnapshotArchive
+
+from tests.test_crawl_frontier import CLUB_ID, _fake_fetch
+
+
+def _page(rows: int, changed: int | None = None) -> str:
+    lines = [
+        f"<tr><td>Player {i}</td><td>{1500 + (7 if i == changed else 0)}</td></tr>\n"
+        for i in range(rows)
+    ]
+    return "<html><table>\n" + "".join(lines) + "</table></html>\n"
+
+
+def test_versions_are_deltas_and_reconstruct_exactly(tmp_path):
+    archive = SnapshotArchive(str(tmp_path / "a"))
+    versions = [_page(400), _page(400, changed=3), _page(400, changed=250), _page(400)]
+    scrapes = []
+    for text in versions:
+        scrapes.append(archive.begin_scrape())
+        archive.put("Liga/team_roster_x.html", text, scrapes[-1])
+    # identical content under another path is stored once
+    archive.put("club_teams/club_team_x.html", versions[1], scrapes[-1])
+
+    for scrape, text in zip(scrapes, versions):
+        assert archive.get("Liga/team_roster_x.html", scrape) == text
+    assert archive.get("club_teams/club_team_x.html") == versions[1]
+    stats = archive.stats()
+    assert stats["versions"] == 5 and stats["blobs"] == 3  # the fourth version dedupes the first
+    assert stats["delta_blobs"] == 2
+    assert stats["stored_bytes"] * 10 < stats["raw_bytes"]
+    assert [v.scrape_id for v in archive.versions("Liga/team_roster_x.html")] == scrapes
+    assert archive.put("Liga/team_roster_x.html", versions[-1], scrapes[-1]) is False
+
+
+def test_prune_keeps_what_remaining_scrapes_need(tmp_path):
+    archive = SnapshotArchive(str(tmp_path / "a"))
+    first = archive.begin_scrape("s1")
+    archive.put("stable.html", _page(50), first)
+    archive.put("moving.html", _page(50), first)
+    second = archive.begin_scrape("s2")
+    archive.put("moving.html", _page(50, changed=1), second)
+    third = archive.begin_scrape("s3")
+    archive.put("moving.html", _page(50, changed=2), third)
+
+    result = archive.prune(1, now=time.time() + 2 * 86400)  # everything but the newest is old
+    assert result.scrapes_removed == 2 and result.versions_removed == 1
+    assert archive.scrapes() == ["s3"]
+    assert archive.get("stable.html", "s3") == _page(50)  # unchanged since s1: still visible
+    assert archive.get("moving.html", "s3") == _page(50, changed=2)
+    assert archive.prune(1).scrapes_removed == 0
+
+
+def test_compare_snapshots(tmp_path):
+    archive = SnapshotArchive(str(tmp_path / "a"))
+    old = archive.begin_scrape("old")
+    archive.put("a.html", _page(5), old)
+    archive.put("gone.html", "x", old)
+    new = archive.begin_scrape("new")
+    archive.put("a.html", _page(5, changed=0), new)
+    archive.put("added.html", "y", new)
+    res = compare_snapshots(archive, "old", "new")
+    assert res["changed"] == ["a.html"]
+    assert res["extra_in_new"] == ["added.html"]
+    assert res["missing_in_new"] == []  # an archive only adds versions
+    assert "+<tr><td>Player 0</td><td>1507</td></tr>" in snapshot_diff(archive, "a.html", old, new)
+
+
+def test_run_full_archives_pages_and_keeps_one_landing_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    monkeypatch.setattr(settings, "SNAPSHOT_ARCHIVE", True)
+    data_dir = str(tmp_path / "data")
+    first = pipeline.run_full(CLUB_ID, season=2025, data_dir=data_dir)["snapshot_archive"]
+    assert first["stored"] > 0 and first["unchanged"] == 0
+    (snapshot,) = [f for f in os.listdir(data_dir) if f.startswith("website_source_")]
+    os.rename(
+        os.path.join(data_dir, snapshot),
+        os.path.join(data_dir, "website_source_20000101_000000.html"),
+    )
+
+    second = pipeline.run_full(CLUB_ID, season=2025, data_dir=data_dir)["snapshot_archive"]
+    assert second["stored"] == 0 and second["unchanged"] == first["stored"]
+    assert second["snapshots_removed"] == 1
+    assert len([f for f in os.listdir(data_dir) if f.startswith("website_source_")]) == 1
+    archive = SnapshotArchive(os.path.join(data_dir, snapshot_archive.DIRNAME))
+    assert archive.get(LANDING_KEY, first["scrape_id"]) == _fake_fetch(
+        pipeline.LANDING_URL_TEMPLATE.format(club_id=CLUB_ID, season=2025)
+    )
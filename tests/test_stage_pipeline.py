@@ -0,0 +1,145 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from core import http_client
+from services import pipeline
+from services.stage_pipeline import ParseFailed, StagedPipeline
+
+from tests.test_pipeline_club_team_coverage import PRIMARY_CLUB_ID, _fake_http_fetch
+
+ROSTER = (
+    '<html><a href="?L1=Public&L2=Verein&L2P=77&Page=Spielbetrieb">Verein</a>'
+    "<table></table></html>"
+)
+
+
+def _parse_or_fail(html: str, team_id: str):
+    if team_id == "1":
+        raise ValueError("unparseable roster")
+    return pipeline._parse_roster_page(html, team_id)
+
+
+def _crash_parse_worker(html: str, team_id: str):
+    if multiprocessing.current_process().name != "MainProcess":
+        os._exit(1)  # a parser process dies: the pool is broken
+    return pipeline._parse_roster_page(html, team_id)
+
+
+def _items(n: int, fail_at: int | None = None):
+    for i in range(n):
+        if i == fail_at:
+            raise RuntimeError("fetch stage failed")
+        yield (i, str(i)), ROSTER, None
+
+
+def test_results_arrive_in_input_order_with_stats():
+    events = []
+    progress = lambda e, p: events.append(p)  # noqa: E731
+    with StagedPipeline(parse_workers=0, queue_size=2, progress=progress) as st:
+        out = list(st.run("rosters", _items(6), pipeline._parse_roster_page, lambda job: (job[1],)))
+    assert [job[0] for job, _html, _err, _parsed in out] == list(range(6))
+    matches, players, link = out[0][3]
+    assert link.endswith("L2P=77&Page=Spielbetrieb")
+    stats = st.phase_stats["rosters"]
+    assert stats["items"] == 6 and stats["mode"] == "thread"
+    assert set(stats["utilisation"]) == {"fetch", "parse", "write"}
+    assert events and events[-1]["phase"] == "rosters"
+
+
+def test_failed_fetches_skip_parsing():
+    items = [((0, "0"), None, RuntimeError("boom")), ((1, "1"), ROSTER, None)]
+    with StagedPipeline(parse_workers=0) as st:
+        out = list(st.run("rosters", iter(items), pipeline._parse_roster_page, lambda j: (j[1],)))
+    assert out[0][3] is None and isinstance(out[0][2], RuntimeError)
+    assert out[1][3] is not None
+
+
+def test_fetch_exception_follows_already_fetched_items():
+    seen = []
+    with StagedPipeline(parse_workers=0) as st:
+        with pytest.raises(RuntimeError, match="fetch stage failed"):
+            for job, *_rest in st.run(
+                "rosters", _items(5, fail_at=3), pipeline._parse_roster_page, lambda j: (j[1],)
+            ):
+                seen.append(job[0])
+    assert seen == [0, 1, 2]
+
+
+def test_bounded_queues_apply_backpressure():
+    produced = []
+    lock = threading.Lock()
+
+    def items():
+        for i in range(20):
+            with lock:
+                produced.append(i)
+            yield (i, str(i)), ROSTER, None
+
+    with StagedPipeline(parse_workers=0, queue_size=2) as st:
+        stream = st.run("rosters", items(), pipeline._parse_roster_page, lambda j: (j[1],))
+        next(stream)
+        time.sleep(0.3)  # slow writer: fetcher must stall on the full queues
+        with lock:
+            ahead = len(produced)
+        rest = list(stream)
+    assert ahead <= 2 + 2 + 3  # two queues, one parse in flight, one item per thread
+    assert len(rest) == 19
+    peak = st.phase_stats["rosters"]["peak_queue_depth"]
+    assert peak["fetched"] <= 2 and peak["parsed"] <= 2
+
+
+def test_closing_a_phase_early_cancels_pending_parses():
+    with StagedPipeline(parse_workers=0, queue_size=4) as st:
+        stream = st.run("rosters", _items(20), pipeline._parse_roster_page, lambda j: (j[1],))
+        next(stream)
+        stream.close()
+        time.sleep(0.2)  # a parse already running finishes on its own
+        assert not st._pending
+
+
+def test_process_pool_matches_thread_parsing():
+    with StagedPipeline(parse_workers=0) as st:
+        threaded = [
+            r[3] for r in st.run("a", _items(3), pipeline._parse_roster_page, lambda j: (j[1],))
+        ]
+    with StagedPipeline(parse_workers=1, process_min_pages=0) as st:
+        processed = [
+            r[3] for r in st.run("a", _items(3), pipeline._parse_roster_page, lambda j: (j[1],))
+        ]
+        assert st.phase_stats["a"]["mode"] == "process"
+    assert processed == threaded
+
+
+def test_parse_failure_is_yielded_as_the_items_error():
+    with StagedPipeline(parse_workers=0) as st:
+        out = list(st.run("rosters", _items(3), _parse_or_fail, lambda j: (j[1],)))
+    assert [job[0] for job, *_rest in out] == [0, 1, 2]
+    assert isinstance(out[1][2], ParseFailed) and out[1][3] is None
+    assert out[0][2] is None and out[2][3] is not None
+
+
+def test_broken_process_pool_falls_back_to_thread_parsing():
+    with StagedPipeline(parse_workers=1, process_min_pages=0) as st:
+        out = list(st.run("a", _items(3), _crash_parse_worker, lambda j: (j[1],)))
+        assert [err for _job, _html, err, _parsed in out] == [None, None, None]
+        assert all(parsed is not None for *_rest, parsed in out)
+        later = list(st.run("b", _items(2), pipeline._parse_roster_page, lambda j: (j[1],)))
+        assert len(later) == 2 and st.phase_stats["b"]["mode"] == "thread"
+
+
+def test_run_full_reports_stage_stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_http_fetch)
+    events = []
+    result = pipeline.run_full(
+        PRIMARY_CLUB_ID,
+        season=2025,
+        data_dir=str(tmp_path / "data"),
+        progress=lambda e, p: events.append((e, p)),
+        parse_workers=0,
+    )
+    assert "division_rosters" in result["stage_stats"]
+    assert any(e == "stage_stats" and p["phase"] == "ranking_tables" for e, p in events)
@@ -0,0 +1,150 @@
+"""Streaming per-division ingestion: pipeline event, coordinator, hook and navigation tree."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+
+from PyQt6.QtCore import Qt
+
+from core import http_client
+from db.schema import apply_schema
+from gui.models import TeamEntry
+from gui.navigation_tree_model import NavigationTreeModel
+from gui.services.event_bus import EventBus
+from gui.services.ingestion_coordinator import IngestionCoordinator
+from gui.services.post_scrape_ingest import PostScrapeIngestionHook
+from gui.services.service_locator import services
+from services import pipeline
+
+from tests.test_crawl_frontier import CLUB_ID, _fake_fetch
+from tests.test_ingestion_coordinator import SCHEMA_SQL
+from tests.test_post_scrape_ingestion import _FakeProgressRunner
+
+
+def _prepare_db():
+    conn = sqlite3.connect(":memory:")
+    for stmt in SCHEMA_SQL:
+        conn.execute(stmt)
+    conn.commit()
+    return conn
+
+
+def _two_divisions(tmp_path: Path) -> dict[str, list[str]]:
+    files = {
+        "1_Stadtliga": ["ranking_table_1_Stadtliga.html", "team_roster_1_Stadtliga_A_1_111.html"],
+        "2_Stadtklasse": [
+            "ranking_table_2_Stadtklasse.html",
+            "team_roster_2_Stadtklasse_B_1_222.html",
+        ],
+    }
+    for names in files.values():
+        for name in names:
+            (tmp_path / name).write_text("<html></html>", encoding="utf-8")
+    return {div: [str(tmp_path / n) for n in names] for div, names in files.items()}
+
+
+def test_pipeline_announces_each_division_with_its_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "fetch", _fake_fetch)
+    data_dir = str(tmp_path / "data")
+    events = []
+    pipeline.run_full(
+        CLUB_ID, season=2025, data_dir=data_dir, progress=lambda e, p: events.append((e, p))
+    )
+    complete = [p for e, p in events if e == "division_complete"]
+    assert [p["division"] for p in complete] == ["Stadtliga"]
+    files = [os.path.basename(f) for f in complete[0]["files"]]
+    assert files[0] == "ranking_table_Stadtliga.html"
+    team_ids = sorted(f.rsplit("_", 1)[-1] for f in files[1:])
+    assert team_ids == ["5000.html", "6000.html", "6001.html"]
+    assert all(os.path.exists(f) for f in complete[0]["files"])
+    keys = [e if e != "phase_complete" else p["key"] for e, p in events]
+    assert keys.index("division_complete") < keys.index("division_rosters")
+
+
+def test_ingest_division_only_touches_given_files_and_run_skips_it(tmp_path):
+    divisions = _two_divisions(tmp_path)
+    conn = _prepare_db()
+    coordinator = IngestionCoordinator(str(tmp_path), conn)
+
+    first = coordinator.ingest_division(divisions["1_Stadtliga"], division="1. Stadtliga")
+    assert first.divisions_ingested == 1 and first.teams_ingested == 1
+    assert conn.execute("SELECT name FROM divisions").fetchall() == [("1 Stadtliga",)]
+
+    final = coordinator.run()
+    assert final.divisions_ingested == 1  # only the division not streamed before
+    assert final.skipped_files >= 2
+    assert conn.execute("SELECT COUNT(*) FROM divisions").fetchone()[0] == 2
+
+    # a rescraped (changed) division is ingested again by the final run
+    Path(divisions["1_Stadtliga"][1]).write_text("<html>changed</html>", encoding="utf-8")
+    assert coordinator.run().divisions_ingested == 2
+
+
+def test_streaming_on_the_real_schema_commits_each_division_and_run_skips_them(tmp_path):
+    root = tmp_path / "data"
+    folders = ["1_Stadtliga_Gruppe_1", "2_Stadtklasse_Gruppe_1", "1_Bezirksliga_Erwachsene"]
+    for name in folders:
+        shutil.copytree(Path("data") / name, root / name)
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    coordinator = IngestionCoordinator(str(root), conn, parse_cache=False)
+    for name in folders:
+        streamed = coordinator.ingest_division([str(p) for p in sorted((root / name).iterdir())])
+        assert streamed.errors == [] and streamed.players_ingested > 0
+    assert not conn.in_transaction
+    players = conn.execute("SELECT COUNT(*) FROM player").fetchone()[0]
+
+    final = coordinator.run()
+    assert final.errors == [] and final.divisions_ingested == 0
+    assert final.processed_files == 0 and final.skipped_files > 0
+    assert conn.execute("SELECT COUNT(*) FROM player").fetchone()[0] == players
+
+
+def test_hook_streams_divisions_when_enabled(tmp_path):
+    divisions = _two_divisions(tmp_path)
+    bus = EventBus()
+    services.register("event_bus", bus, allow_override=True)
+    conn = _prepare_db()
+    services.register("sqlite_conn", conn, allow_override=True)
+    ingested = []
+    bus.subscribe("DIVISION_INGESTED", lambda evt: ingested.append(evt.payload))
+
+    runner = _FakeProgressRunner()
+    PostScrapeIngestionHook(
+        runner, lambda: str(tmp_path), ingest_partial=False, stream_divisions=True
+    )
+    for div, files in divisions.items():
+        runner.emit_progress(
+            "division_complete", {"division": div, "files": files, "data_dir": str(tmp_path)}
+        )
+    assert [p["divisions"] for p in ingested] == [["1_Stadtliga"], ["2_Stadtklasse"]]
+    assert conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == 2
+
+
+def test_navigation_model_upserts_single_division(qtbot):
+    model = NavigationTreeModel(2025, [TeamEntry(team_id="t1", name="Alpha", division="DivB")])
+    div_b = model.index(0, 0)
+    assert model.rowCount(div_b) == 1  # loaded
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    model.upsert_division("DivA", [TeamEntry(team_id="t2", name="Beta", division="DivA")])
+    assert [model.data(model.index(r, 0), Qt.ItemDataRole.DisplayRole) for r in range(2)] == [
+        "DivA",
+        "DivB",
+    ]
+    assert inserted == [(0, 0)]
+
+    model.upsert_division(
+        "DivB",
+        [
+            TeamEntry(team_id="t1", name="Alpha", division="DivB"),
+            TeamEntry(team_id="t3", name="Gamma", division="DivB"),
+        ],
+    )
+    div_b = model.index(1, 0)
+    assert model.rowCount(div_b) == 2
+    assert model.get_team_entry(model.index(1, 0, div_b)).name == "Gamma"